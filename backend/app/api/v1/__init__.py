@@ -5,7 +5,6 @@ from .roles import router as role_router
 from .departments import router as department_router
 from .stages import router as stage_router
 from .permissions import router as permission_router
-from .admin import router as admin_router
 
 from .goals import router as goal_router
 from .supervisor_reviews import router as supervisor_review_router
@@ -35,7 +34,6 @@ org_api_router.include_router(role_router)
 org_api_router.include_router(department_router)
 org_api_router.include_router(stage_router)
 org_api_router.include_router(permission_router)
-org_api_router.include_router(admin_router)
 org_api_router.include_router(viewer_router)
 org_api_router.include_router(goal_router)
 org_api_router.include_router(supervisor_review_router)
@@ -52,6 +50,12 @@ org_api_router.include_router(support_document_router)
 
 # api_router.include_router(reports_router)
 
+# Rarely used routers imported on first use (see app.core.startup.DeferredRouter).
+# The admin router is mounted under the same org prefix as org_api_router.
+DEFERRED_ORG_ROUTERS = [
+    ("app.api.v1.admin", "router", r"^/api/org/[^/]+/admin(/|$)"),
+]
+
 # Webhooks should be registered without the /api/v1 prefix
 webhooks_router_root = APIRouter()
 # webhooks_router_root.include_router(webhooks_router)
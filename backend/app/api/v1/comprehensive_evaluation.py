@@ -12,11 +12,21 @@ from ...schemas.comprehensive_evaluation import (
     ComprehensiveEvaluationListResponse,
     ComprehensiveEvaluationExportRequest,
     ComprehensiveEvaluationSettingsWorkspace,
+    ComprehensiveEvaluationProcessPeriodRequest,
+    ComprehensiveEvaluationProcessPeriodResponse,
     ComprehensiveEvaluationProcessUserRequest,
     ComprehensiveEvaluationProcessUserResponse,
     ComprehensiveManualDecisionHistoryResponse,
     ComprehensiveManualDecisionResponse,
     ComprehensiveManualDecisionUpsertRequest,
+    ComprehensivePeriodComparisonResponse,
+    ComprehensiveSettingsSimulationRequest,
+    ComprehensiveSettingsSimulationResponse,
+    ComprehensiveSnapshotExportRequest,
+    ComprehensiveSnapshotRefreshRequest,
+    ComprehensiveSnapshotRefreshResponse,
+    ComprehensiveTrendResponse,
+    TrendGroupBy,
     MyComprehensiveEvaluationResponse,
     ComprehensiveDefaultAssignmentUpdateRequest,
     ComprehensiveDepartmentAssignmentUpdateRequest,
@@ -190,6 +200,38 @@ async def get_comprehensive_evaluation_settings_workspace(
         ) from exc
 
 
+@router.post("/settings/simulate", response_model=ComprehensiveSettingsSimulationResponse)
+async def simulate_comprehensive_evaluation_settings(
+    payload: ComprehensiveSettingsSimulationRequest,
+    context: AuthContext = Depends(get_auth_context),
+    session: AsyncSession = Depends(get_db_session),
+):
+    try:
+        service = ComprehensiveEvaluationService(session)
+        return await service.simulate_settings(
+            context=context,
+            period_id=payload.period_id,
+            settings=payload.settings,
+            department_id=payload.department_id,
+            stage_id=payload.stage_id,
+            refresh_snapshot=payload.refresh_snapshot,
+            changed_users_limit=payload.changed_users_limit,
+        )
+    except PermissionDeniedError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except BadRequestError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to simulate comprehensive evaluation settings",
+        ) from exc
+
+
 @router.put("/settings/default-assignment", response_model=ComprehensiveRulesetAssignment)
 async def update_comprehensive_evaluation_default_assignment(
     payload: ComprehensiveDefaultAssignmentUpdateRequest,
@@ -365,6 +407,7 @@ async def finalize_comprehensive_evaluation_period(
         return await service.finalize_evaluation_period(
             context=context,
             period_id=payload.period_id,
+            process_remaining=payload.process_remaining,
         )
     except NotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
@@ -381,6 +424,133 @@ async def finalize_comprehensive_evaluation_period(
         ) from exc
 
 
+@router.post("/snapshots/refresh", response_model=ComprehensiveSnapshotRefreshResponse)
+async def refresh_comprehensive_period_snapshots(
+    payload: ComprehensiveSnapshotRefreshRequest,
+    context: AuthContext = Depends(get_auth_context),
+    session: AsyncSession = Depends(get_db_session),
+):
+    try:
+        service = ComprehensiveEvaluationService(session)
+        return await service.refresh_period_snapshots(
+            context=context,
+            period_id=payload.period_id,
+        )
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except PermissionDeniedError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+    except BadRequestError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to refresh period snapshots",
+        ) from exc
+
+
+@router.post("/snapshots/export")
+async def export_comprehensive_period_snapshots_csv(
+    payload: ComprehensiveSnapshotExportRequest,
+    context: AuthContext = Depends(get_auth_context),
+    session: AsyncSession = Depends(get_db_session),
+):
+    try:
+        service = ComprehensiveEvaluationService(session)
+        csv_content = await service.export_period_snapshots_csv(
+            context=context,
+            payload=payload,
+        )
+        return Response(
+            content=f"\ufeff{csv_content}",
+            media_type="text/csv; charset=utf-8",
+            headers={
+                "Content-Disposition": 'attachment; filename="comprehensive-evaluation-history.csv"',
+            },
+        )
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except PermissionDeniedError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+    except BadRequestError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to export period snapshots csv",
+        ) from exc
+
+
+@router.get("/snapshots/compare", response_model=ComprehensivePeriodComparisonResponse)
+async def compare_comprehensive_periods(
+    period_ids: List[UUID] = Query(..., alias="periodIds", description="Completed evaluation periods, in display order"),
+    user_ids: Optional[List[UUID]] = Query(None, alias="userIds", description="Limit to these users"),
+    context: AuthContext = Depends(get_auth_context),
+    session: AsyncSession = Depends(get_db_session),
+):
+    try:
+        service = ComprehensiveEvaluationService(session)
+        return await service.compare_periods(
+            context=context,
+            period_ids=period_ids,
+            user_ids=user_ids,
+        )
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except PermissionDeniedError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+    except BadRequestError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to compare evaluation periods",
+        ) from exc
+
+
+@router.get("/analytics/trends", response_model=ComprehensiveTrendResponse)
+async def get_comprehensive_trends(
+    period_ids: Optional[List[UUID]] = Query(
+        None,
+        alias="periodIds",
+        description="Evaluation periods in display order (default: most recent completed periods)",
+    ),
+    group_by: TrendGroupBy = Query("period", alias="groupBy", description="period, department or stage"),
+    department_name: Optional[str] = Query(None, alias="departmentName", description="Department filter"),
+    stage_name: Optional[str] = Query(None, alias="stageName", description="Stage filter"),
+    context: AuthContext = Depends(get_auth_context),
+    session: AsyncSession = Depends(get_db_session),
+):
+    try:
+        service = ComprehensiveEvaluationService(session)
+        return await service.get_trends(
+            context=context,
+            period_ids=period_ids,
+            group_by=group_by,
+            department_name=department_name,
+            stage_name=stage_name,
+        )
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except PermissionDeniedError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+    except BadRequestError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch comprehensive evaluation trends",
+        ) from exc
+
+
 @router.post("/process-user", response_model=ComprehensiveEvaluationProcessUserResponse)
 async def process_comprehensive_evaluation_user(
     payload: ComprehensiveEvaluationProcessUserRequest,
@@ -409,6 +579,40 @@ async def process_comprehensive_evaluation_user(
         ) from exc
 
 
+@router.post("/process-period", response_model=ComprehensiveEvaluationProcessPeriodResponse)
+async def process_comprehensive_evaluation_period(
+    payload: ComprehensiveEvaluationProcessPeriodRequest,
+    context: AuthContext = Depends(get_auth_context),
+    session: AsyncSession = Depends(get_db_session),
+):
+    try:
+        service = ComprehensiveEvaluationService(session)
+        return await service.process_period_evaluations(
+            context=context,
+            period_id=payload.period_id,
+            user_ids=payload.user_ids,
+            department_id=payload.department_id,
+            stage_id=payload.stage_id,
+            employment_type=payload.employment_type,
+            search=payload.search,
+            include_processed=payload.include_processed,
+            chunk_size=payload.chunk_size,
+        )
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except PermissionDeniedError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+    except BadRequestError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to process comprehensive evaluation period",
+        ) from exc
+
+
 @router.put("/manual-decisions/{user_id}", response_model=ComprehensiveManualDecisionResponse)
 async def upsert_comprehensive_manual_decision(
     user_id: UUID,
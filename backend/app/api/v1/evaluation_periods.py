@@ -12,10 +12,10 @@ from ...schemas.evaluation import (
     EvaluationPeriod, EvaluationPeriodDetail, EvaluationPeriodList,
     EvaluationPeriodCreate, EvaluationPeriodUpdate, EvaluationPeriodStatus
 )
-from ...schemas.goal import GoalStatistics
+from ...schemas.goal import GoalStatistics, UserActivity
 from ...schemas.supervisor_feedback import SupervisorFeedback
 from ...schemas.supervisor_review import SupervisorReview
-from ...schemas.common import PaginationParams
+from ...schemas.common import PaginationParams, PaginatedResponse
 from ...core.exceptions import NotFoundError, ConflictError, PermissionDeniedError, BadRequestError
 
 router = APIRouter(prefix="/evaluation-periods", tags=["evaluation-periods"])
@@ -200,6 +200,11 @@ async def delete_evaluation_period(
 @router.get("/{period_id}/goal-statistics", response_model=GoalStatistics)
 async def get_evaluation_period_goal_statistics(
     period_id: UUID,
+    include_user_activities: bool = Query(
+        True,
+        alias="includeUserActivities",
+        description="Include every user's activity row. Set false for totals only and page users via /goal-statistics/user-activities"
+    ),
     context: AuthContext = Depends(require_admin),
     session: AsyncSession = Depends(get_db_session)
 ):
@@ -209,7 +214,8 @@ async def get_evaluation_period_goal_statistics(
 
         result = await service.get_evaluation_period_goal_statistics(
             current_user_context=context,
-            period_id=period_id
+            period_id=period_id,
+            include_user_activities=include_user_activities
         )
 
         return result
@@ -225,6 +231,34 @@ async def get_evaluation_period_goal_statistics(
         )
 
 
+@router.get("/{period_id}/goal-statistics/user-activities", response_model=PaginatedResponse[UserActivity])
+async def get_evaluation_period_user_activities(
+    period_id: UUID,
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(50, ge=1, le=200, description="Items per page"),
+    context: AuthContext = Depends(require_admin),
+    session: AsyncSession = Depends(get_db_session)
+):
+    """Get a page of per-user goal activity for an evaluation period (admin only)."""
+    try:
+        service = EvaluationPeriodService(session)
+
+        return await service.get_evaluation_period_user_activities(
+            current_user_context=context,
+            period_id=period_id,
+            pagination=PaginationParams(page=page, limit=limit)
+        )
+
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except PermissionDeniedError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception:
+        raise HTTPException(
+            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
 # @router.put("/{period_id}/status", response_model=EvaluationPeriod)
 # async def update_evaluation_period_status(
 #     period_id: UUID,
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi import status as http_status
+from fastapi.responses import StreamingResponse
 from typing import Optional, List
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,12 +16,13 @@ from ...schemas.peer_review import (
     PeerReviewEvaluationResponse,
     PeerReviewAveragedScores,
     CoreValueSummaryResponse,
+    CoreValueSummaryItem,
     EvaluationProgressEntry,
     EvaluationDetailResponse,
     BulkAssignReviewersItem,
     BulkAssignReviewersResponse,
 )
-from ...schemas.common import BaseResponse
+from ...schemas.common import BaseResponse, PaginatedResponse, PaginationParams
 from ...services.peer_review_service import PeerReviewService
 from ...core.exceptions import NotFoundError, PermissionDeniedError, ConflictError, ValidationError, BadRequestError
 
@@ -114,19 +116,90 @@ async def remove_assignment(
 @router.get("/progress", response_model=List[EvaluationProgressEntry])
 async def get_evaluation_progress(
     period_id: UUID = Query(..., alias="periodId", description="Evaluation period ID"),
+    department_ids: Optional[List[UUID]] = Query(None, alias="departmentIds", description="Filter by department IDs"),
+    sort_by: str = Query("name", alias="sortBy", description="name, employeeCode, department, selfStatus or supervisorStatus"),
+    sort_order: str = Query("asc", alias="sortOrder", pattern="^(asc|desc)$"),
     context: AuthContext = Depends(get_auth_context),
     session: AsyncSession = Depends(get_db_session)
 ):
     """Get evaluation progress for all users in a period (admin)."""
     try:
         service = PeerReviewService(session)
-        return await service.get_evaluation_progress(context, period_id)
+        return await service.get_evaluation_progress(
+            context, period_id, department_ids=department_ids, sort_by=sort_by, descending=sort_order == "desc"
+        )
     except PermissionDeniedError as e:
         raise HTTPException(status_code=http_status.HTTP_403_FORBIDDEN, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error fetching evaluation progress: {str(e)}")
+
+
+@router.get("/progress/page", response_model=PaginatedResponse[EvaluationProgressEntry])
+async def get_evaluation_progress_page(
+    period_id: UUID = Query(..., alias="periodId", description="Evaluation period ID"),
+    department_ids: Optional[List[UUID]] = Query(None, alias="departmentIds", description="Filter by department IDs"),
+    search: Optional[str] = Query(None, description="Search by name or employee code"),
+    sort_by: str = Query("name", alias="sortBy", description="name, employeeCode, department, selfStatus or supervisorStatus"),
+    sort_order: str = Query("asc", alias="sortOrder", pattern="^(asc|desc)$"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(50, ge=1, le=200, description="Items per page"),
+    context: AuthContext = Depends(get_auth_context),
+    session: AsyncSession = Depends(get_db_session)
+):
+    """Get one page of evaluation progress with the total count (admin)."""
+    try:
+        service = PeerReviewService(session)
+        return await service.get_evaluation_progress_page(
+            context,
+            period_id,
+            department_ids=department_ids,
+            search=search,
+            sort_by=sort_by,
+            descending=sort_order == "desc",
+            pagination=PaginationParams(page=page, limit=limit),
+        )
+    except PermissionDeniedError as e:
+        raise HTTPException(status_code=http_status.HTTP_403_FORBIDDEN, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error fetching evaluation progress: {str(e)}")
 
 
+@router.get("/progress/export")
+async def export_evaluation_progress(
+    period_id: UUID = Query(..., alias="periodId", description="Evaluation period ID"),
+    department_ids: Optional[List[UUID]] = Query(None, alias="departmentIds", description="Filter by department IDs"),
+    search: Optional[str] = Query(None, description="Search by name or employee code"),
+    sort_by: str = Query("name", alias="sortBy", description="name, employeeCode, department, selfStatus or supervisorStatus"),
+    sort_order: str = Query("asc", alias="sortOrder", pattern="^(asc|desc)$"),
+    context: AuthContext = Depends(get_auth_context),
+    session: AsyncSession = Depends(get_db_session)
+):
+    """Stream evaluation progress for all users in a period as CSV (admin)."""
+    try:
+        service = PeerReviewService(session)
+        lines = await service.export_evaluation_progress_csv(
+            context,
+            period_id,
+            department_ids=department_ids,
+            search=search,
+            sort_by=sort_by,
+            descending=sort_order == "desc",
+        )
+    except PermissionDeniedError as e:
+        raise HTTPException(status_code=http_status.HTTP_403_FORBIDDEN, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return StreamingResponse(
+        lines,
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": 'attachment; filename="evaluation-progress.csv"'},
+    )
+
+
 # ========================================
 # REVIEWER - EVALUATIONS
 # ========================================
@@ -274,6 +347,34 @@ async def get_evaluation_detail(
         raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error fetching evaluation detail: {str(e)}")
 
 
+@router.get("/summary", response_model=PaginatedResponse[CoreValueSummaryItem])
+async def get_core_value_summaries(
+    period_id: UUID = Query(..., alias="periodId", description="Evaluation period ID"),
+    user_ids: Optional[List[UUID]] = Query(None, alias="userIds", description="Limit to these users"),
+    department_ids: Optional[List[UUID]] = Query(None, alias="departmentIds", description="Filter by department IDs"),
+    search: str = Query("", description="Search by name, employee code or job title"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(50, ge=1, le=200, description="Items per page"),
+    context: AuthContext = Depends(get_auth_context),
+    session: AsyncSession = Depends(get_db_session)
+):
+    """Get core value summaries (総合評価) for all active users in a period, paged (admin only)."""
+    try:
+        service = PeerReviewService(session)
+        return await service.get_core_value_summaries(
+            context,
+            period_id,
+            user_ids=user_ids,
+            department_ids=department_ids,
+            search_term=search,
+            pagination=PaginationParams(page=page, limit=limit),
+        )
+    except PermissionDeniedError as e:
+        raise HTTPException(status_code=http_status.HTTP_403_FORBIDDEN, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error fetching core value summaries: {str(e)}")
+
+
 @router.get("/summary/user", response_model=CoreValueSummaryResponse)
 async def get_core_value_summary(
     period_id: UUID = Query(..., alias="periodId", description="Evaluation period ID"),
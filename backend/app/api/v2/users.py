@@ -1,7 +1,7 @@
 from typing import Optional, Set
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,12 +12,14 @@ from ...schemas.user import (
     BulkUserStatusUpdateItem,
     BulkUserStatusUpdateResponse,
     UserDetailResponse,
+    UserImportResponse,
     UserStatus,
 )
 from ...schemas.user_page import UserListPageResponse
 from ...security import AuthContext, get_auth_context
 from ...services.user_service_v2 import UserServiceV2
 from ...services.user_service import UserService
+from ...services.user_import_service import UserImportService
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -257,3 +259,26 @@ async def bulk_update_status(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to bulk update user statuses",
         ) from exc
+
+
+@router.post("/import", response_model=UserImportResponse)
+async def import_users(
+    org_slug: str,
+    file: UploadFile = File(..., description="CSV with a header row (employee_code, name, email, clerk_user_id, ...)"),
+    encoding: str = Query("utf-8-sig", description="CSV encoding, e.g. cp932 for Excel exports"),
+    dry_run: bool = Query(False, alias="dryRun", description="Validate and report without writing"),
+    context: AuthContext = Depends(get_auth_context),
+    session: AsyncSession = Depends(get_db_session),
+):
+    try:
+        service = UserImportService(session)
+        return await service.import_users_csv(file.file, context, encoding=encoding, dry_run=dry_run)
+    except PermissionDeniedError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+    except BadRequestError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except Exception as exc:  # pragma: no cover
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to import users",
+        ) from exc
@@ -1,10 +1,9 @@
-from fastapi import APIRouter, Request, HTTPException, Depends, status, BackgroundTasks
+from fastapi import APIRouter, Request, HTTPException, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 import json
 import logging
 from typing import Dict, Any
 from svix import Webhook, WebhookVerificationError
-import asyncio
 from datetime import datetime
 
 from ...database.session import get_db_session
@@ -13,6 +12,7 @@ from ...database.repositories.organization_repo import OrganizationRepository
 from ...database.repositories.webhook_event_repo import WebhookEventRepository
 from ...core.config import settings
 from ...services.org_bootstrap_service import OrgBootstrapService
+from .inbox_worker import inbox_worker
 
 logger = logging.getLogger(__name__)
 
@@ -48,17 +48,19 @@ class WebhookProcessor:
                 detail="Invalid webhook signature"
             )
 
-    async def ensure_idempotency(self, event_id: str, event_type: str) -> bool:
-        """Check if event has already been processed to ensure idempotency."""
+    async def ensure_idempotency(self, event_id: str, event_type: str, event_data: Dict[str, Any]) -> bool:
+        """
+        Record the event in the webhook inbox.
+
+        Returns False if the event has already been received (idempotent redelivery).
+        The payload is persisted so processing survives worker restarts.
+        """
         try:
-            existing_event = await self.event_repo.get_by_event_id(event_id)
-            if existing_event:
-                logger.info(f"Event {event_id} ({event_type}) already processed, skipping")
-                return False
-            
-            # Record the event to prevent duplicate processing
-            await self.event_repo.create_event_record(event_id, event_type)
-            return True
+            subject_id = event_data.get("data", {}).get("id")
+            enqueued = await self.event_repo.enqueue_event(event_id, event_type, event_data, subject_id)
+            if not enqueued:
+                logger.info(f"Event {event_id} ({event_type}) already received, skipping")
+            return enqueued
         except Exception as e:
             logger.error(f"Error checking event idempotency: {e}")
             raise
@@ -210,42 +212,29 @@ class WebhookProcessor:
             logger.error(f"Error processing organization.updated webhook: {e}")
             raise
 
-async def process_webhook_with_retry(processor: WebhookProcessor, event_type: str, event_data: Dict[str, Any], max_retries: int = 3):
-    """Process webhook with exponential backoff retry logic."""
-    for attempt in range(max_retries):
-        try:
-            if event_type == "user.created":
-                await processor.process_user_created(event_data)
-            elif event_type == "user.updated":
-                await processor.process_user_updated(event_data)
-            elif event_type == "organization.created":
-                await processor.process_organization_created(event_data)
-            elif event_type == "organization.updated":
-                await processor.process_organization_updated(event_data)
-            else:
-                logger.warning(f"Unhandled webhook event type: {event_type}")
-            
-            # Success - exit retry loop
-            break
-            
-        except Exception as e:
-            logger.error(f"Webhook processing attempt {attempt + 1} failed: {e}")
-            if attempt == max_retries - 1:
-                # Final attempt failed
-                logger.error(f"Webhook processing failed after {max_retries} attempts")
-                raise
-            
-            # Exponential backoff: 1s, 2s, 4s, etc.
-            await asyncio.sleep(2 ** attempt)
+async def dispatch_webhook_event(processor: WebhookProcessor, event_type: str, event_data: Dict[str, Any]) -> None:
+    """Apply a single webhook event. Retries are handled by the inbox worker."""
+    if event_type == "user.created":
+        await processor.process_user_created(event_data)
+    elif event_type == "user.updated":
+        await processor.process_user_updated(event_data)
+    elif event_type == "organization.created":
+        await processor.process_organization_created(event_data)
+    elif event_type == "organization.updated":
+        await processor.process_organization_updated(event_data)
+    else:
+        logger.warning(f"Unhandled webhook event type: {event_type}")
 
 @router.post("/")
 async def handle_clerk_webhook(
     request: Request,
-    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_db_session)
 ):
     """
-    Handle Clerk webhook events with security, idempotency, and retry logic.
+    Handle Clerk webhook events with security and idempotency.
+
+    Verified events are persisted to the webhook inbox and applied by the
+    inbox worker (see ``inbox_worker.py``), which retries with backoff.
     
     Supported events:
     - user.created: New user registration
@@ -266,7 +255,13 @@ async def handle_clerk_webhook(
         # Parse webhook data
         webhook_data = json.loads(payload.decode())
         event_type = webhook_data.get("type")
-        event_id = webhook_data.get("data", {}).get("id", webhook_data.get("id"))
+        # svix-id is unique per delivery of a message; data.id alone would collapse
+        # every user.updated for the same user into a single "already processed" event.
+        event_id = (
+            headers.get("svix-id")
+            or webhook_data.get("id")
+            or webhook_data.get("data", {}).get("id")
+        )
         
         if not event_type or not event_id:
             raise HTTPException(
@@ -275,18 +270,14 @@ async def handle_clerk_webhook(
             )
         
         # Ensure idempotency
-        should_process = await processor.ensure_idempotency(event_id, event_type)
+        should_process = await processor.ensure_idempotency(event_id, event_type, webhook_data)
         if not should_process:
             return {"status": "already_processed", "event_id": event_id}
-        
-        # Process webhook in background with retry logic
-        background_tasks.add_task(
-            process_webhook_with_retry,
-            processor,
-            event_type,
-            webhook_data
-        )
-        
+
+        # Persist the inbox row before acknowledging, then nudge the local worker
+        await session.commit()
+        inbox_worker.wake()
+
         logger.info(f"Webhook queued for processing: {event_type} ({event_id})")
         
         return {
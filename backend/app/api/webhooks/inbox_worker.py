@@ -0,0 +1,219 @@
+"""
+Durable webhook inbox worker.
+
+The Clerk webhook handler only verifies, records and acknowledges events. This
+worker drains ``webhook_events`` rows in ``pending`` state in batches, each event
+in its own session, so that:
+
+- retries survive process restarts (attempts / next_attempt_at live in the DB)
+- bulk imports do not pin request workers on in-request backoff sleeps
+- repeated ``user.updated`` events for the same user are coalesced to the newest
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...core.config import settings
+from ...database.repositories.webhook_event_repo import (
+    ClaimedWebhookEvent,
+    WebhookEventRepository,
+)
+from ...database.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Events whose payload is a full snapshot of the subject; only the newest matters.
+COALESCIBLE_EVENT_TYPES = ("user.updated", "organization.updated")
+
+_MAX_BACKOFF_SECONDS = 15 * 60
+
+
+def compute_retry_at(attempts: int, now: Optional[datetime] = None) -> datetime:
+    """Exponential backoff for failed attempts: 2s, 4s, 8s, ... capped at 15 minutes."""
+    now = now or datetime.utcnow()
+    delay = min(_MAX_BACKOFF_SECONDS, 2 ** max(1, attempts))
+    return now + timedelta(seconds=delay)
+
+
+class WebhookInboxWorker:
+    """Drains the webhook inbox in batches using its own sessions."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        *,
+        batch_size: int = settings.WEBHOOK_INBOX_BATCH_SIZE,
+        max_attempts: int = settings.WEBHOOK_INBOX_MAX_ATTEMPTS,
+        lease_seconds: int = settings.WEBHOOK_INBOX_LEASE_SECONDS,
+        poll_seconds: float = settings.WEBHOOK_INBOX_POLL_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+        self._wake_event: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._metrics: Dict[str, Any] = {
+            "batches": 0,
+            "processed": 0,
+            "failed": 0,
+            "dead": 0,
+            "superseded": 0,
+            "last_batch_ms": 0.0,
+            "last_drain_at": None,
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """Start the background drain loop on the running event loop."""
+        if self._task and not self._task.done():
+            return
+        self._stopping = False
+        self._wake_event = asyncio.Event()
+        self._task = asyncio.create_task(self.run_forever(), name="webhook-inbox-worker")
+        logger.info("Webhook inbox worker started")
+
+    async def stop(self) -> None:
+        """Stop the drain loop; in-flight events are retried after their lease expires."""
+        self._stopping = True
+        if self._wake_event is not None:
+            self._wake_event.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("Webhook inbox worker stopped")
+
+    def wake(self) -> None:
+        """Signal that new events were enqueued so the loop skips its poll sleep."""
+        if self._wake_event is not None:
+            self._wake_event.set()
+
+    async def run_forever(self) -> None:
+        while not self._stopping:
+            try:
+                handled = await self.drain_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pragma: no cover - defensive, keep loop alive
+                logger.error(f"Webhook inbox drain failed: {exc}")
+                handled = 0
+
+            if handled >= self.batch_size:
+                continue  # Backlog remains; drain the next batch immediately
+
+            if self._wake_event is None:
+                self._wake_event = asyncio.Event()
+            try:
+                await asyncio.wait_for(self._wake_event.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake_event.clear()
+
+    # ------------------------------------------------------------------
+    # Draining
+    # ------------------------------------------------------------------
+    async def drain_once(self) -> int:
+        """Claim and apply one batch. Returns the number of events claimed."""
+        started = asyncio.get_running_loop().time()
+
+        async with self.session_factory() as session:
+            repo = WebhookEventRepository(session)
+            superseded = await repo.coalesce_pending(COALESCIBLE_EVENT_TYPES)
+            claimed = await repo.claim_batch(self.batch_size, self.lease_seconds)
+            await session.commit()
+
+        self._metrics["superseded"] += superseded
+        if not claimed:
+            return 0
+
+        succeeded: List[UUID] = []
+        failures: List[tuple[ClaimedWebhookEvent, str]] = []
+        for event in claimed:
+            error = await self._apply_event(event)
+            if error is None:
+                succeeded.append(event.id)
+            else:
+                failures.append((event, error))
+
+        dead = 0
+        async with self.session_factory() as session:
+            repo = WebhookEventRepository(session)
+            await repo.mark_processed(succeeded)
+            for event, error in failures:
+                retry_at = None if event.attempts >= self.max_attempts else compute_retry_at(event.attempts)
+                if retry_at is None:
+                    dead += 1
+                    logger.error(
+                        f"Webhook event {event.event_id} ({event.event_type}) moved to dead state "
+                        f"after {event.attempts} attempts: {error}"
+                    )
+                await repo.mark_failed(event.id, error, retry_at=retry_at)
+            await session.commit()
+
+        elapsed_ms = (asyncio.get_running_loop().time() - started) * 1000
+        self._metrics["batches"] += 1
+        self._metrics["processed"] += len(succeeded)
+        self._metrics["failed"] += len(failures)
+        self._metrics["dead"] += dead
+        self._metrics["last_batch_ms"] = round(elapsed_ms, 2)
+        self._metrics["last_drain_at"] = datetime.utcnow().isoformat()
+
+        logger.info(
+            "webhook_inbox.batch",
+            extra={
+                "event": "webhook_inbox.batch",
+                "claimed": len(claimed),
+                "processed": len(succeeded),
+                "failed": len(failures),
+                "superseded": superseded,
+                "duration_ms": round(elapsed_ms, 2),
+            },
+        )
+        return len(claimed)
+
+    async def _apply_event(self, event: ClaimedWebhookEvent) -> Optional[str]:
+        """Apply one event in a dedicated session. Returns an error message on failure."""
+        from .clerk import WebhookProcessor, dispatch_webhook_event
+
+        async with self.session_factory() as session:
+            try:
+                processor = WebhookProcessor(session)
+                await dispatch_webhook_event(processor, event.event_type, event.payload)
+                await session.commit()
+                return None
+            except Exception as exc:
+                await session.rollback()
+                logger.warning(
+                    f"Webhook event {event.event_id} ({event.event_type}) attempt {event.attempts} failed: {exc}"
+                )
+                return str(exc) or exc.__class__.__name__
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return in-process worker counters."""
+        return dict(self._metrics)
+
+    async def get_queue_metrics(self) -> Dict[str, Any]:
+        """Return inbox depth / lag from the DB merged with in-process worker counters."""
+        async with self.session_factory() as session:
+            stats = await WebhookEventRepository(session).get_queue_stats()
+        return {**stats, "worker": self.get_metrics()}
+
+
+# Process-wide worker instance started from the application startup hook
+inbox_worker = WebhookInboxWorker()
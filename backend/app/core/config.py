@@ -41,7 +41,18 @@ class Settings:
     CLERK_ORGANIZATION_ENABLED: bool = os.getenv("CLERK_ORGANIZATION_ENABLED", "True").lower() == "true"
     # Allow small clock skew between Clerk and backend containers (nbf/exp validation).
     CLERK_JWT_LEEWAY_SECONDS: int = int(os.getenv("CLERK_JWT_LEEWAY_SECONDS", "10"))
-    
+
+    # Webhook inbox worker (drains persisted webhook_events in batches)
+    WEBHOOK_INBOX_WORKER_ENABLED: bool = os.getenv("WEBHOOK_INBOX_WORKER_ENABLED", "True").lower() == "true"
+    WEBHOOK_INBOX_BATCH_SIZE: int = int(os.getenv("WEBHOOK_INBOX_BATCH_SIZE", "50"))
+    WEBHOOK_INBOX_POLL_SECONDS: float = float(os.getenv("WEBHOOK_INBOX_POLL_SECONDS", "5"))
+    WEBHOOK_INBOX_MAX_ATTEMPTS: int = int(os.getenv("WEBHOOK_INBOX_MAX_ATTEMPTS", "5"))
+    WEBHOOK_INBOX_LEASE_SECONDS: int = int(os.getenv("WEBHOOK_INBOX_LEASE_SECONDS", "120"))
+
+    # Clerk sync queue (rate-limited metadata updates, e.g. after a bulk user import)
+    CLERK_SYNC_REQUESTS_PER_SECOND: float = float(os.getenv("CLERK_SYNC_REQUESTS_PER_SECOND", "10"))
+    CLERK_SYNC_CONCURRENCY: int = int(os.getenv("CLERK_SYNC_CONCURRENCY", "4"))
+
     # =============================================================================
     # DATABASE SETTINGS (Supabase)
     # =============================================================================
@@ -158,6 +169,23 @@ class Settings:
     # =============================================================================
     SENTRY_DSN: Optional[str] = os.getenv("SENTRY_DSN")
     ANALYTICS_ENABLED: bool = os.getenv("ANALYTICS_ENABLED", "False").lower() == "true"
+
+    # Per-request SQL profiling (Server-Timing header + request.db_profile log line)
+    QUERY_PROFILER_ENABLED: bool = os.getenv("QUERY_PROFILER_ENABLED", "True").lower() == "true"
+    QUERY_PROFILER_WARN_QUERIES: int = int(os.getenv("QUERY_PROFILER_WARN_QUERIES", "50"))
+    QUERY_PROFILER_N_PLUS_ONE_THRESHOLD: int = int(os.getenv("QUERY_PROFILER_N_PLUS_ONE_THRESHOLD", "5"))
+
+    # Cold-start handling (see app.core.startup)
+    STARTUP_DEFER_ROUTERS: bool = os.getenv("STARTUP_DEFER_ROUTERS", "True").lower() == "true"
+    STARTUP_WARMUP_ENABLED: bool = os.getenv("STARTUP_WARMUP_ENABLED", "True").lower() == "true"
+    STARTUP_WARMUP_TIMEOUT_SECONDS: float = float(os.getenv("STARTUP_WARMUP_TIMEOUT_SECONDS", "10"))
+    STARTUP_WARMUP_MAX_ORGS: int = int(os.getenv("STARTUP_WARMUP_MAX_ORGS", "20"))
+
+    # Prometheus /metrics endpoint (set PROMETHEUS_MULTIPROC_DIR when running under gunicorn)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "True").lower() == "true"
+    # Bearer token required to scrape /metrics; when unset, only development allows
+    # open scraping and other environments accept loopback clients only
+    METRICS_AUTH_TOKEN: Optional[str] = os.getenv("METRICS_AUTH_TOKEN")
     
     # =============================================================================
     # COMPUTED PROPERTIES
@@ -232,6 +260,9 @@ class Settings:
         
         if self.is_production and not self.email_configured:
             issues.append("Email not configured for production environment")
+
+        if self.is_production and self.METRICS_ENABLED and not self.METRICS_AUTH_TOKEN:
+            issues.append("METRICS_AUTH_TOKEN not set; /metrics only accepts loopback scrapers")
         
         return issues
 
@@ -0,0 +1,310 @@
+"""
+Prometheus metrics.
+
+Every metric is declared here so names/labels stay consistent across modules. The
+``/metrics`` endpoint renders them in the Prometheus text format.
+
+Multi-process mode: gunicorn runs several uvicorn workers, each with its own memory.
+When ``PROMETHEUS_MULTIPROC_DIR`` is set, prometheus_client writes samples to per-process
+mmap files in that directory and ``render_latest`` aggregates them with a
+``MultiProcessCollector`` (see ``gunicorn.conf.py`` for the directory reset / dead-worker
+cleanup). Without it (local uvicorn, tests) the default in-process registry is used.
+
+Sources:
+    - HTTP latency per route template          -> MetricsMiddleware
+    - DB pool checkout wait / connections used -> instrument_engine_pool()
+    - TTL cache hits / misses / entries         -> InstrumentedTTLCache, record_cache_lookup()
+    - JWKS refreshes                            -> AuthService._fetch_jwks
+    - Webhook inbox backlog                     -> refresh_webhook_inbox_metrics() at scrape time
+    - Comprehensive evaluation query durations  -> @timed_query on the repository
+"""
+
+import functools
+import hmac
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Optional, Tuple, TypeVar
+
+from cachetools import Cache, TTLCache
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from sqlalchemy import event
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Time spent obtaining a DB connection from the pool (connect time under NullPool).",
+    buckets=POOL_WAIT_BUCKETS,
+)
+DB_POOL_CHECKOUTS = Counter(
+    "db_pool_checkouts_total",
+    "DB connection checkouts by outcome.",
+    ["result"],
+)
+DB_POOL_CONNECTIONS_IN_USE = Gauge(
+    "db_pool_connections_in_use",
+    "DB connections currently checked out.",
+    multiprocess_mode="livesum",
+)
+
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total",
+    "In-process cache lookups by cache and result (hit/miss).",
+    ["cache", "result"],
+)
+CACHE_ENTRIES = Gauge(
+    "cache_entries",
+    "Entries currently held by an in-process cache.",
+    ["cache"],
+    multiprocess_mode="livesum",
+)
+
+JWKS_REFRESHES = Counter(
+    "jwks_refresh_total",
+    "JWKS fetches from the identity provider by result.",
+    ["result"],
+)
+
+WEBHOOK_INBOX_EVENTS = Gauge(
+    "webhook_inbox_events",
+    "Webhook inbox rows by status (sampled at scrape time).",
+    ["status"],
+    multiprocess_mode="mostrecent",
+)
+WEBHOOK_INBOX_LAG_SECONDS = Gauge(
+    "webhook_inbox_lag_seconds",
+    "Age of the oldest unprocessed webhook event (sampled at scrape time).",
+    multiprocess_mode="mostrecent",
+)
+
+COMPREHENSIVE_EVALUATION_QUERY_SECONDS = Histogram(
+    "comprehensive_evaluation_query_seconds",
+    "Comprehensive evaluation repository query durations.",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+def is_multiprocess_mode() -> bool:
+    return bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+
+LOOPBACK_HOSTS = frozenset({"127.0.0.1", "::1", "localhost"})
+
+
+def is_scrape_allowed(
+    authorization: Optional[str],
+    client_host: Optional[str],
+    *,
+    token: Optional[str],
+    allow_unauthenticated: bool,
+) -> bool:
+    """
+    Decide whether a ``/metrics`` request may scrape.
+
+    With a token configured, the bearer token must match (constant-time compare).
+    Without one, scraping is open only when ``allow_unauthenticated`` (development)
+    and otherwise restricted to loopback clients, e.g. a sidecar scraper.
+    """
+    if token:
+        expected = f"Bearer {token}".encode()
+        return hmac.compare_digest((authorization or "").encode(), expected)
+    return allow_unauthenticated or client_host in LOOPBACK_HOSTS
+
+
+def render_latest() -> Tuple[bytes, str]:
+    """Return (payload, content type) for the ``/metrics`` response."""
+    if is_multiprocess_mode():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+# -----------------------------------------------------------------------------
+# Caches
+# -----------------------------------------------------------------------------
+
+def record_cache_lookup(cache_name: str, hit: bool) -> None:
+    """Count a lookup for caches that are not TTLCache instances (plain dict caches)."""
+    CACHE_LOOKUPS.labels(cache=cache_name, result="hit" if hit else "miss").inc()
+
+
+_MISSING = object()
+
+
+class InstrumentedTTLCache(TTLCache):
+    """
+    ``TTLCache`` that reports hits, misses and entry count under ``name``.
+
+    Drop-in replacement: ``cache.get(key)``, ``cache[key]`` and ``key in cache`` behave
+    exactly like TTLCache. Hits are counted on successful reads, misses on ``get``
+    returning the default or ``cache[key]`` raising ``KeyError``. A bare ``key in cache``
+    check is not a lookup and is not counted.
+
+    Cachetools evicts through ``popitem() -> pop() -> self[key]`` and expires through
+    ``Cache.__delitem__`` directly, so ``pop`` reads without counting and ``expire``
+    refreshes the entry gauge.
+    """
+
+    def __init__(self, name: str, maxsize: float, ttl: float, **kwargs: Any):
+        super().__init__(maxsize=maxsize, ttl=ttl, **kwargs)
+        self.name = name
+        self._hit_counter = CACHE_LOOKUPS.labels(cache=name, result="hit")
+        self._miss_counter = CACHE_LOOKUPS.labels(cache=name, result="miss")
+        self._size_gauge = CACHE_ENTRIES.labels(cache=name)
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self._hit_counter.inc()
+        return value
+
+    def __missing__(self, key):
+        self._miss_counter.inc()
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        # One lookup: an entry expiring between a ``key in self`` check and the read
+        # would otherwise raise KeyError instead of counting a miss.
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._size_gauge.set(len(self))
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._size_gauge.set(len(self))
+
+    def pop(self, key, default=_MISSING):
+        if key in self:
+            # Cache.__getitem__ skips the TTL check, so the entry just seen cannot expire here.
+            value = Cache.__getitem__(self, key)
+            del self[key]
+            return value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        if expired:
+            self._size_gauge.set(len(self))
+        return expired
+
+    def clear(self):
+        super().clear()
+        self._size_gauge.set(0)
+
+
+# -----------------------------------------------------------------------------
+# DB pool
+# -----------------------------------------------------------------------------
+
+def instrument_engine_pool(engine) -> None:
+    """
+    Record pool checkout wait time and connections in use for ``engine``.
+
+    Pool events fire only after a connection has been handed out, so the wait is
+    measured by wrapping the pool's ``_do_get`` (the call that blocks on QueuePool
+    exhaustion and opens a fresh connection under NullPool). Idempotent per pool.
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    pool = sync_engine.pool
+    if getattr(pool, "_metrics_instrumented", False):
+        return
+
+    original_do_get = pool._do_get
+
+    def _timed_do_get():
+        start = time.perf_counter()
+        try:
+            connection = original_do_get()
+        except Exception:
+            DB_POOL_CHECKOUTS.labels(result="error").inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - start)
+        DB_POOL_CHECKOUTS.labels(result="ok").inc()
+        return connection
+
+    pool._do_get = _timed_do_get
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_CONNECTIONS_IN_USE.inc()
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        DB_POOL_CONNECTIONS_IN_USE.dec()
+
+    pool._metrics_instrumented = True
+
+
+# -----------------------------------------------------------------------------
+# Query timing / scrape-time collectors
+# -----------------------------------------------------------------------------
+
+def timed_query(
+    operation: str,
+    histogram: Histogram = COMPREHENSIVE_EVALUATION_QUERY_SECONDS,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Decorate an async repository method to observe its duration under ``operation``."""
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        observer = histogram.labels(operation=operation)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                observer.observe(time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+async def refresh_webhook_inbox_metrics(worker: Optional[Any] = None) -> None:
+    """Sample the webhook inbox backlog into gauges; failures never break the scrape."""
+    if worker is None:
+        from ..api.webhooks.inbox_worker import inbox_worker as worker
+
+    try:
+        stats = await worker.get_queue_metrics()
+    except Exception as exc:
+        logger.warning(f"Failed to sample webhook inbox metrics: {exc}")
+        return
+
+    for status in ("pending", "processing", "dead"):
+        WEBHOOK_INBOX_EVENTS.labels(status=status).set(stats.get(status, 0))
+    WEBHOOK_INBOX_LAG_SECONDS.set(stats.get("lag_seconds", 0.0))
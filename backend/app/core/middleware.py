@@ -4,7 +4,6 @@ import time
 import os
 from typing import Callable
 
-from cachetools import TTLCache
 from fastapi import HTTPException, Request, Response
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -13,13 +12,15 @@ from starlette.datastructures import Headers
 from ..database.repositories.organization_repo import OrganizationRepository
 from ..services.auth_service import AuthService
 from .config import settings
+from .metrics import HTTP_REQUEST_DURATION, InstrumentedTTLCache
+from .query_profiler import profile_queries
 
 
 logger = logging.getLogger(__name__)
 
 # Short TTL caches to avoid repeated DB lookups for the same org slug and
 # repeated JWT decoding in rapid, successive calls hitting this middleware.
-_org_slug_cache: TTLCache = TTLCache(maxsize=256, ttl=120)
+_org_slug_cache: InstrumentedTTLCache = InstrumentedTTLCache("org_slug", maxsize=256, ttl=120)
 
 
 class OrgSlugValidationMiddleware(BaseHTTPMiddleware):
@@ -38,6 +39,7 @@ class OrgSlugValidationMiddleware(BaseHTTPMiddleware):
             '/docs',
             '/redoc',
             '/openapi.json',
+            '/metrics',
         }
 
         # Public route prefixes (for pattern matching)
@@ -245,6 +247,77 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             raise
 
 
+class QueryProfilingMiddleware(BaseHTTPMiddleware):
+    """
+    Attribute SQL statements to the current request.
+
+    Adds a ``Server-Timing`` header (DB time + statement count) and logs a structured
+    ``request.db_profile`` line. Requests that exceed the query threshold or repeat a
+    statement shape (likely N+1) are logged at WARNING, everything else at DEBUG.
+    """
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.n_plus_one_threshold = settings.QUERY_PROFILER_N_PLUS_ONE_THRESHOLD
+        self.query_warn_threshold = settings.QUERY_PROFILER_WARN_QUERIES
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        start_time = time.perf_counter()
+        with profile_queries(label=f"{request.method} {request.url.path}") as profile:
+            response = await call_next(request)
+        app_time_ms = (time.perf_counter() - start_time) * 1000
+
+        response.headers["Server-Timing"] = profile.server_timing(app_time_ms)
+
+        route = request.scope.get("route")
+        details = profile.to_log_dict(self.n_plus_one_threshold)
+        log_extra = {
+            "event": "request.db_profile",
+            "method": request.method,
+            "path": request.url.path,
+            "route": getattr(route, "path", None),
+            "status_code": response.status_code,
+            "duration_ms": round(app_time_ms, 2),
+            **details,
+        }
+        if details["n_plus_one_suspects"] or profile.query_count >= self.query_warn_threshold:
+            logger.warning(
+                f"DB profile: {request.method} {request.url.path} - "
+                f"{profile.query_count} queries, {profile.db_time_ms:.1f}ms DB, "
+                f"{len(details['n_plus_one_suspects'])} repeated statement shape(s)",
+                extra=log_extra,
+            )
+        else:
+            logger.debug("request.db_profile", extra=log_extra)
+
+        return response
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """
+    Observe request latency per route template.
+
+    The route template (``/api/org/{org_slug}/goals/{goal_id}``) is used as the label
+    instead of the raw path to keep label cardinality bounded; unmatched paths share
+    a single ``<unmatched>`` series.
+    """
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        start_time = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            route = request.scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                method=request.method,
+                route=getattr(route, "path", None) or "<unmatched>",
+                status=str(status_code),
+            ).observe(time.perf_counter() - start_time)
+
+
 # Custom handler for HTTP exceptions
 async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
     # Avoid treating expected 4xx client errors as server errors in logs.
@@ -0,0 +1,141 @@
+"""
+Per-request SQL profiling.
+
+SQLAlchemy engine events attribute every executed statement to the profile bound to
+the current context (request or test). A profile records the statement count, total
+DB time and how often each *statement shape* (SQL with literals / bind parameters
+collapsed) was executed, which is how N+1 patterns show up: the same shape repeated
+once per row of an earlier result.
+
+Usage:
+    install_query_profiler()              # once per process (idempotent)
+    with profile_queries() as profile:    # request middleware / tests
+        ...
+    profile.query_count, profile.db_time_ms, profile.repeated_shapes()
+"""
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+DEFAULT_N_PLUS_ONE_THRESHOLD = 5
+
+_current_profile: ContextVar[Optional["QueryProfile"]] = ContextVar("query_profile", default=None)
+_installed = False
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_BIND_RE = re.compile(r"\$\d+|%\([^)]+\)s|%s|(?<![:\w]):\w+|\?")
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_POSTCOMPILE_RE = re.compile(r"\(?\s*\[POSTCOMPILE_\w+\]\s*\)?|__\[POSTCOMPILE_\w+\]")
+
+
+def normalize_statement(statement: str) -> str:
+    """Collapse literals, bind markers and IN-lists so equivalent queries share one shape."""
+    shape = _STRING_LITERAL_RE.sub("?", statement)
+    shape = _BIND_RE.sub("?", shape)
+    shape = _POSTCOMPILE_RE.sub("(?)", shape)
+    shape = _NUMBER_LITERAL_RE.sub("?", shape)
+    shape = _PARAM_LIST_RE.sub("(?)", shape)
+    return _WHITESPACE_RE.sub(" ", shape).strip()
+
+
+@dataclass
+class QueryProfile:
+    """Statements attributed to one request / test."""
+
+    label: str = ""
+    query_count: int = 0
+    db_time_ms: float = 0.0
+    shape_counts: Counter = field(default_factory=Counter)
+    shape_time_ms: Dict[str, float] = field(default_factory=dict)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        shape = normalize_statement(statement)
+        self.query_count += 1
+        self.db_time_ms += elapsed_ms
+        self.shape_counts[shape] += 1
+        self.shape_time_ms[shape] = self.shape_time_ms.get(shape, 0.0) + elapsed_ms
+
+    def repeated_shapes(
+        self, threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD
+    ) -> List[Tuple[str, int]]:
+        """Shapes executed at least ``threshold`` times, most frequent first (likely N+1)."""
+        return [(shape, count) for shape, count in self.shape_counts.most_common() if count >= threshold]
+
+    def to_log_dict(self, threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD, max_shapes: int = 3) -> Dict[str, object]:
+        suspects = self.repeated_shapes(threshold)[:max_shapes]
+        return {
+            "query_count": self.query_count,
+            "db_time_ms": round(self.db_time_ms, 2),
+            "distinct_statements": len(self.shape_counts),
+            "n_plus_one_suspects": [
+                {"statement": shape[:300], "count": count, "db_time_ms": round(self.shape_time_ms[shape], 2)}
+                for shape, count in suspects
+            ],
+        }
+
+    def server_timing(self, app_time_ms: Optional[float] = None) -> str:
+        """Render a ``Server-Timing`` header value."""
+        parts = [f'db;dur={self.db_time_ms:.1f};desc="{self.query_count} queries"']
+        if app_time_ms is not None:
+            parts.append(f"app;dur={app_time_ms:.1f}")
+        return ", ".join(parts)
+
+
+def get_current_profile() -> Optional[QueryProfile]:
+    return _current_profile.get()
+
+
+@contextmanager
+def profile_queries(label: str = "") -> Iterator[QueryProfile]:
+    """Bind a fresh QueryProfile to the current context for the duration of the block."""
+    profile = QueryProfile(label=label)
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is None:
+        return
+    conn.info.setdefault("query_profiler_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    if profile is None:
+        return
+    starts = conn.info.get("query_profiler_start")
+    if not starts:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+    profile.record(statement, elapsed_ms)
+
+
+def _handle_error(exception_context):
+    starts = exception_context.connection.info.get("query_profiler_start") if exception_context.connection else None
+    if starts:
+        starts.pop()
+
+
+def install_query_profiler() -> None:
+    """Attach the profiling hooks to every Engine (sync engines behind async ones included)."""
+    global _installed
+    if _installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    _installed = True
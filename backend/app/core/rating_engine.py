@@ -0,0 +1,169 @@
+"""
+Rating-code lookup tables shared by Python services and SQL.
+
+Rating math used to be spelled out wherever it was needed: dict lookups and an
+``if`` chain in ``rating_utils``, a linear threshold scan in the comprehensive
+evaluation service, and ``CASE`` expressions inside ``ComprehensiveEvaluationRepository.list_rows``.
+This module holds each table once:
+
+- ``RatingScale``: numeric value per rating code. ``average_many`` averages many score
+  dicts in one pass.
+- ``ThresholdTable``: rank boundaries as a sorted array, classified with ``bisect``
+  (settings-driven thresholds; the fixed display chain stays in ``rating_utils``).
+- ``render_sql_functions``: the scales rendered as ``IMMUTABLE`` SQL functions
+  (``rating_code_value``, ``rating_code_mbo_points``). Migration
+  ``033_rating_code_functions.sql`` is generated from it and a test keeps the two equal,
+  so SQL and Python read the same numbers.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from ..schemas.core_value import CORE_VALUE_RATING_VALUES
+
+# Canonical rank order, best first. Indexes into every table below.
+RATING_CODES: Tuple[str, ...] = ("SS", "S", "A+", "A", "A-", "B", "C", "D")
+CODE_INDEX: Dict[str, int] = {code: index for index, code in enumerate(RATING_CODES)}
+
+
+class RatingScale:
+    """Numeric value per rating code; codes without a value are ignored."""
+
+    def __init__(self, name: str, values: Mapping[str, float], default: Optional[float] = None):
+        self.name = name
+        self.default = default
+        # Rank order so the rendered SQL CASE is stable.
+        self.by_code: Dict[str, float] = {
+            code: values[code] for code in RATING_CODES if values.get(code) is not None
+        }
+
+    def value_of(self, code: Optional[str]) -> Optional[float]:
+        if code is None:
+            return self.default
+        return self.by_code.get(code, self.default)
+
+    def average(self, scores: Optional[Mapping[str, str]]) -> Optional[float]:
+        """Mean value of the codes in one ``{key: code}`` dict (None when nothing counts)."""
+        return self.average_many((scores,))[0]
+
+    def average_many(self, score_dicts: Iterable[Optional[Mapping[str, str]]]) -> List[Optional[float]]:
+        """``average`` for many dicts in one pass with the lookup bound once."""
+        lookup = self.by_code.get
+        default = self.default
+        averages: List[Optional[float]] = []
+        for scores in score_dicts:
+            if not scores:
+                averages.append(None)
+                continue
+            total = 0.0
+            count = 0
+            for code in scores.values():
+                value = lookup(code, default)
+                if value is not None:
+                    total += value
+                    count += 1
+            averages.append(total / count if count else None)
+        return averages
+
+    def sql_case(self, argument: str) -> str:
+        branches = " ".join(f"WHEN '{code}' THEN {value!r}" for code, value in self.by_code.items())
+        fallback = "NULL" if self.default is None else repr(self.default)
+        return f"CASE {argument} {branches} ELSE {fallback} END"
+
+
+class ThresholdTable:
+    """
+    Minimum score per rank, classified by binary search.
+
+    Equivalent to scanning ranks best-first and returning the first whose minimum the
+    score reaches, falling back to the worst rank. Boundaries that are not strictly
+    descending (unvalidated settings) keep that linear scan so results never change.
+    """
+
+    def __init__(self, thresholds: Mapping[str, float], ranks: Sequence[str] = RATING_CODES):
+        self.ranks = tuple(ranks)
+        self.minimums = tuple(float(thresholds[rank]) for rank in self.ranks)
+        self.monotonic = all(high > low for high, low in zip(self.minimums, self.minimums[1:]))
+        # Ascending boundaries; ``_lookup[bisect_right(_boundaries, score)]`` is the rank
+        # (position 0 = below every boundary = worst rank).
+        self._boundaries = self.minimums[::-1]
+        self._lookup = (self.ranks[-1],) + self.ranks[::-1]
+
+    def classify(self, score: Optional[float]) -> Optional[str]:
+        if score is None:
+            return None
+        if not self.monotonic or score != score:  # NaN reaches no minimum
+            for rank, minimum in zip(self.ranks, self.minimums):
+                if score >= minimum:
+                    return rank
+            return self.ranks[-1]
+        return self._lookup[bisect_right(self._boundaries, score)]
+
+    def classify_many(self, scores: Iterable[Optional[float]]) -> List[Optional[str]]:
+        if not self.monotonic:
+            return [self.classify(score) for score in scores]
+        boundaries, lookup, classify = self._boundaries, self._lookup, self.classify
+        return [
+            lookup[bisect_right(boundaries, score)] if score is not None and score == score else classify(score)
+            for score in scores
+        ]
+
+
+@lru_cache(maxsize=64)
+def _threshold_table(items: Tuple[Tuple[str, float], ...]) -> ThresholdTable:
+    return ThresholdTable(dict(items))
+
+
+def threshold_table(thresholds: Mapping[str, float]) -> ThresholdTable:
+    """Cached ``ThresholdTable`` for a settings-provided ``{rank: minimum}`` mapping."""
+    return _threshold_table(tuple((rank, float(thresholds[rank])) for rank in RATING_CODES))
+
+
+# ----------------------------------------------------------------------
+# Shared tables
+# ----------------------------------------------------------------------
+
+# Core value 0-7 scale; D (not a core value grade) counts as 0 for overall normalization.
+CORE_VALUE_SCALE = RatingScale(
+    "rating_code_value",
+    {code.value: value for code, value in CORE_VALUE_RATING_VALUES.items()} | {"D": 0.0},
+)
+
+# MBO points per performance goal (weight / 5 × points sums to 0-100). A+/A- earn 0.
+MBO_POINTS_SCALE = RatingScale(
+    "rating_code_mbo_points",
+    {"SS": 5.0, "S": 4.0, "A": 3.0, "B": 2.0, "C": 1.0, "D": 0.0},
+    default=0.0,
+)
+
+# MBO final rating thresholds on the 0-100 scale (spec section 4-3).
+MBO_THRESHOLDS: Dict[str, float] = {
+    "SS": 86.0,
+    "S": 70.0,
+    "A+": 64.0,
+    "A": 56.0,
+    "A-": 50.0,
+    "B": 34.0,
+    "C": 20.0,
+    "D": 0.0,
+}
+MBO_THRESHOLD_TABLE = ThresholdTable(MBO_THRESHOLDS)
+
+SQL_SCALES: Tuple[RatingScale, ...] = (CORE_VALUE_SCALE, MBO_POINTS_SCALE)
+
+
+def render_sql_functions(scales: Sequence[RatingScale] = SQL_SCALES) -> str:
+    """``CREATE OR REPLACE FUNCTION`` statements exposing ``scales`` to SQL."""
+    statements = []
+    for scale in scales:
+        statements.append(
+            f"CREATE OR REPLACE FUNCTION {scale.name}(code text)\n"
+            f"RETURNS numeric\n"
+            f"LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$\n"
+            f"    SELECT {scale.sql_case('code')}::numeric\n"
+            f"$$;\n"
+        )
+    return "\n".join(statements)
@@ -7,15 +7,13 @@ peer review, core value evaluation, and comprehensive evaluation services.
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Iterable, List, Optional
 
-from ..schemas.core_value import CORE_VALUE_RATING_VALUES
+from .rating_engine import CORE_VALUE_SCALE
 
 # String-keyed lookup from the canonical CORE_VALUE_RATING_VALUES
 # D=0.0 added for overall normalization (D not in core value scale but needed for comprehensive evaluation)
-RATING_CODE_TO_NUMERIC: dict[str, float] = {
-    code.value: val for code, val in CORE_VALUE_RATING_VALUES.items()
-} | {"D": 0.0}
+RATING_CODE_TO_NUMERIC: dict[str, float] = CORE_VALUE_SCALE.by_code
 
 
 def score_to_final_rating(score: float) -> str:
@@ -39,16 +37,12 @@ def score_to_final_rating(score: float) -> str:
 
 def calculate_source_average(scores: dict) -> Optional[float]:
     """Calculate the average numeric score from a scores JSONB dict."""
-    if not scores:
-        return None
-    values = []
-    for rating_code in scores.values():
-        numeric = RATING_CODE_TO_NUMERIC.get(rating_code)
-        if numeric is not None:
-            values.append(numeric)
-    if not values:
-        return None
-    return sum(values) / len(values)
+    return CORE_VALUE_SCALE.average(scores)
+
+
+def calculate_source_averages(score_dicts: Iterable[Optional[dict]]) -> List[Optional[float]]:
+    """``calculate_source_average`` for many scores dicts at once."""
+    return CORE_VALUE_SCALE.average_many(score_dicts)
 
 
 def to_circled_number(n: int) -> str:
@@ -0,0 +1,310 @@
+"""
+Cold-start support: import profiling, deferred routers and cache warmup.
+
+Cloud Run starts a fresh container for traffic spikes, so everything done at import
+time or on the first requests is user-visible latency. This module provides:
+
+- ``ImportTimer``: records cumulative / self import time per module while the app is
+  being imported, logged once at startup (``startup.import_profile``).
+- ``DeferredRouter`` + ``DeferredRouterMiddleware``: routers for rarely used endpoints
+  (webhooks, admin) are not imported with the app. They are included on the first
+  request that targets them, or by the background warmup, whichever comes first.
+- ``run_startup_warmup``: a bounded background task that pre-fetches the JWKS, the most
+  recently active organizations' slugs and their role permissions so the first user
+  requests hit warm caches.
+"""
+
+import asyncio
+import importlib
+import importlib.abc
+import logging
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:  # fastapi is imported by the app itself; keep it out of the timed window
+    from fastapi import FastAPI
+
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------------------------------------------------------
+# Import profiling
+# -----------------------------------------------------------------------------
+
+class _TimedLoader(importlib.abc.Loader):
+    """Loader proxy that times ``exec_module`` and then gets out of the way."""
+
+    def __init__(self, loader, timer: "ImportTimer", fullname: str):
+        self._loader = loader
+        self._timer = timer
+        self._fullname = fullname
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Restore the real loader so nothing downstream ever sees the proxy
+        # (importlib.resources, inspect and pkgutil look at __loader__).
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        self._timer._enter(self._fullname)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer._exit(self._fullname)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """
+    Measure how long each module takes to import while installed.
+
+    ``cumulative_ms`` includes nested imports, ``self_ms`` excludes them (the same split
+    as ``python -X importtime``). Only modules imported for the first time are seen.
+    """
+
+    def __init__(self) -> None:
+        self.cumulative_ms: Dict[str, float] = {}
+        self.self_ms: Dict[str, float] = {}
+        self._stack: List[List[float]] = []
+        self._local = threading.local()
+        self.started_at: Optional[float] = None
+        self.total_ms: float = 0.0
+
+    def install(self) -> "ImportTimer":
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+            self.started_at = time.perf_counter()
+        return self
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+        if self.started_at is not None:
+            self.total_ms = (time.perf_counter() - self.started_at) * 1000
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._local, "searching", False):
+            return None
+        self._local.searching = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.searching = False
+        if spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    def _enter(self, fullname: str) -> None:
+        # [start, time spent in nested imports]
+        self._stack.append([time.perf_counter(), 0.0])
+
+    def _exit(self, fullname: str) -> None:
+        start, nested = self._stack.pop()
+        elapsed = (time.perf_counter() - start) * 1000
+        self.cumulative_ms[fullname] = elapsed
+        self.self_ms[fullname] = elapsed - nested
+        if self._stack:
+            self._stack[-1][1] += elapsed
+
+    def slowest(self, limit: int = 15, by: str = "cumulative") -> List[Dict[str, Any]]:
+        """Top modules, heaviest first; top-level packages dominate ``cumulative``."""
+        source = self.cumulative_ms if by == "cumulative" else self.self_ms
+        ranked = sorted(source.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [
+            {
+                "module": name,
+                "cumulative_ms": round(self.cumulative_ms[name], 1),
+                "self_ms": round(self.self_ms[name], 1),
+            }
+            for name, _ in ranked
+        ]
+
+    def to_log_dict(self, limit: int = 15) -> Dict[str, Any]:
+        return {
+            "modules_imported": len(self.cumulative_ms),
+            "import_total_ms": round(self.total_ms, 1),
+            "slowest_self": self.slowest(limit, by="self"),
+        }
+
+
+# -----------------------------------------------------------------------------
+# Deferred routers
+# -----------------------------------------------------------------------------
+
+@dataclass
+class DeferredRouter:
+    """A router imported on demand: ``module:attribute`` serving paths that match ``path_pattern``."""
+
+    module: str
+    attribute: str
+    path_pattern: str
+    prefix: str = ""
+    loaded: bool = False
+    _compiled: Optional["re.Pattern[str]"] = field(default=None, repr=False)
+
+    def matches(self, path: str) -> bool:
+        if self._compiled is None:
+            self._compiled = re.compile(self.path_pattern)
+        return bool(self._compiled.match(path))
+
+
+class DeferredRouterRegistry:
+    """Tracks deferred routers for one app and includes them at most once."""
+
+    def __init__(self) -> None:
+        self.routers: List[DeferredRouter] = []
+        self._lock = threading.Lock()
+
+    def defer(self, module: str, attribute: str, path_pattern: str, prefix: str = "") -> None:
+        self.routers.append(DeferredRouter(module, attribute, path_pattern, prefix))
+
+    @property
+    def pending(self) -> List[DeferredRouter]:
+        return [router for router in self.routers if not router.loaded]
+
+    def load(self, app: "FastAPI", deferred: DeferredRouter) -> None:
+        with self._lock:
+            if deferred.loaded:
+                return
+            start = time.perf_counter()
+            router = getattr(importlib.import_module(deferred.module), deferred.attribute)
+            app.include_router(router, prefix=deferred.prefix)
+            # New routes change the schema; let it be rebuilt on next access.
+            app.openapi_schema = None
+            deferred.loaded = True
+            logger.info(
+                "startup.deferred_router_loaded",
+                extra={
+                    "event": "startup.deferred_router_loaded",
+                    "router_module": deferred.module,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+                },
+            )
+
+    def load_for_path(self, app: "FastAPI", path: str) -> None:
+        for deferred in self.pending:
+            if deferred.matches(path):
+                self.load(app, deferred)
+
+    def load_all(self, app: "FastAPI") -> None:
+        for deferred in self.pending:
+            self.load(app, deferred)
+
+
+class DeferredRouterMiddleware:
+    """
+    Pure ASGI middleware that includes a deferred router before routing the first
+    request for it. Once every deferred router is loaded this is a single list check.
+    """
+
+    def __init__(self, app, fastapi_app: "FastAPI", registry: DeferredRouterRegistry):
+        self.app = app
+        self.fastapi_app = fastapi_app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and self.registry.pending:
+            self.registry.load_for_path(self.fastapi_app, scope["path"])
+        await self.app(scope, receive, send)
+
+
+# -----------------------------------------------------------------------------
+# Cache warmup
+# -----------------------------------------------------------------------------
+
+async def warm_jwks() -> int:
+    """Fetch the Clerk JWKS into the auth service cache."""
+    from .config import settings
+    from ..services.auth_service import AuthService
+
+    if not settings.CLERK_ISSUER:
+        return 0
+    jwks = await AuthService(None)._fetch_jwks(settings.CLERK_ISSUER)
+    return len(jwks.get("keys", []))
+
+
+async def warm_organizations(session_factory: Callable[[], Any], max_orgs: int) -> int:
+    """Populate the org slug cache and role permission cache for the most active orgs."""
+    from .middleware import _org_slug_cache
+    from ..database.repositories.organization_repo import OrganizationRepository
+    from ..database.repositories.role_repo import RoleRepository
+    from ..security.role_permission_cache import get_cached_permissions_for_roles
+
+    async with session_factory() as session:
+        organizations = await OrganizationRepository(session).get_recently_active(max_orgs)
+        role_repo = RoleRepository(session)
+        for organization in organizations:
+            _org_slug_cache[organization.slug.lower()] = (organization.id, organization.slug)
+            roles = await role_repo.get_all(organization.id)
+            await get_cached_permissions_for_roles(session, organization.id, roles)
+    return len(organizations)
+
+
+async def run_startup_warmup(
+    session_factory: Callable[[], Any],
+    *,
+    app: Optional["FastAPI"] = None,
+    registry: Optional[DeferredRouterRegistry] = None,
+    timeout_seconds: float = 10.0,
+    max_orgs: int = 20,
+) -> Dict[str, Any]:
+    """
+    Warm caches in the background, bounded by ``timeout_seconds`` overall.
+
+    Steps are independent: a failing or slow step is logged and never delays serving.
+    Deferred routers are loaded last so their import does not compete with the warmup
+    queries for the event loop.
+    """
+    report: Dict[str, Any] = {}
+
+    async def _step(name: str, coro) -> None:
+        start = time.perf_counter()
+        try:
+            result = await coro
+            report[name] = {"ok": True, "result": result}
+        except Exception as exc:
+            report[name] = {"ok": False, "error": str(exc)[:200]}
+        report[name]["duration_ms"] = round((time.perf_counter() - start) * 1000, 2)
+
+    async def _warm() -> None:
+        await asyncio.gather(
+            _step("jwks", warm_jwks()),
+            _step("organizations", warm_organizations(session_factory, max_orgs)),
+        )
+        if app is not None and registry is not None:
+            await _step("deferred_routers", asyncio.to_thread(registry.load_all, app))
+
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(_warm(), timeout=timeout_seconds)
+        timed_out = False
+    except asyncio.TimeoutError:
+        timed_out = True
+
+    logger.info(
+        "startup.warmup",
+        extra={
+            "event": "startup.warmup",
+            "timed_out": timed_out,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+            "steps": report,
+        },
+    )
+    return {"timed_out": timed_out, "steps": report}
@@ -0,0 +1,42 @@
+-- Migration: Turn webhook_events into a durable processing inbox
+-- Purpose:
+-- - Persist the raw webhook payload so processing survives worker restarts
+-- - Track status / attempts / next retry time per event
+-- - Allow coalescing of repeated user.updated events for the same Clerk user
+--
+-- Existing rows were processed inline by the previous BackgroundTasks flow,
+-- so they are backfilled as 'processed'. New rows default to 'pending'.
+
+BEGIN;
+
+ALTER TABLE webhook_events
+    ADD COLUMN IF NOT EXISTS status VARCHAR(20) NOT NULL DEFAULT 'processed',
+    ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS payload JSONB,
+    ADD COLUMN IF NOT EXISTS subject_id VARCHAR(255),
+    ADD COLUMN IF NOT EXISTS last_error TEXT,
+    ADD COLUMN IF NOT EXISTS received_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    ADD COLUMN IF NOT EXISTS next_attempt_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    ADD COLUMN IF NOT EXISTS locked_until TIMESTAMP;
+
+ALTER TABLE webhook_events ALTER COLUMN status SET DEFAULT 'pending';
+ALTER TABLE webhook_events ALTER COLUMN processed_at DROP NOT NULL;
+ALTER TABLE webhook_events ALTER COLUMN processed_at DROP DEFAULT;
+
+ALTER TABLE webhook_events
+    DROP CONSTRAINT IF EXISTS chk_webhook_events_status;
+ALTER TABLE webhook_events
+    ADD CONSTRAINT chk_webhook_events_status
+    CHECK (status IN ('pending', 'processing', 'processed', 'superseded', 'dead'));
+
+-- Worker claim path: oldest due events first, only rows that still need work
+CREATE INDEX IF NOT EXISTS idx_webhook_events_inbox_due
+    ON webhook_events (next_attempt_at, received_at)
+    WHERE status IN ('pending', 'processing');
+
+-- Coalescing lookup: pending events of a type for the same subject
+CREATE INDEX IF NOT EXISTS idx_webhook_events_type_subject
+    ON webhook_events (event_type, subject_id)
+    WHERE status IN ('pending', 'processing');
+
+COMMIT;
@@ -0,0 +1,15 @@
+-- Migration: Track which permission catalog version has been seeded
+-- Purpose:
+-- - Let PermissionService / OrgBootstrapService skip catalog seeding entirely
+--   once the current in-code catalog (PERMISSION_CATALOG_METADATA) is stored.
+-- - The version is a content hash computed by the application.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS permission_catalog_versions (
+    version VARCHAR(64) PRIMARY KEY,
+    permission_count INTEGER NOT NULL,
+    seeded_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+COMMIT;
@@ -0,0 +1,33 @@
+-- Migration: Performance indexes for hot org-scoped list endpoints
+-- Purpose:
+-- - Previously created by app/database/index_bootstrap.py in the FastAPI startup
+--   event, which ran DDL against the live database on every cold start.
+-- - Statements are IF NOT EXISTS so databases that already have them are unaffected.
+-- - Target endpoints: users list/search, role filters, supervisor review pending
+--   queue and the stages admin list.
+
+BEGIN;
+
+-- Users list/search
+CREATE INDEX IF NOT EXISTS ix_users_org_name
+    ON users (clerk_organization_id, name);
+
+CREATE INDEX IF NOT EXISTS ix_users_org_status
+    ON users (clerk_organization_id, status);
+
+CREATE INDEX IF NOT EXISTS ix_users_org_stage
+    ON users (clerk_organization_id, stage_id);
+
+-- Role filters
+CREATE INDEX IF NOT EXISTS ix_user_roles_role_id
+    ON user_roles (role_id);
+
+-- Supervisor review pending queue
+CREATE INDEX IF NOT EXISTS ix_supervisor_reviews_supervisor_status_period_subordinate
+    ON supervisor_reviews (supervisor_id, status, period_id, subordinate_id);
+
+-- Stages admin list
+CREATE INDEX IF NOT EXISTS ix_stages_org_name
+    ON stages (organization_id, name);
+
+COMMIT;
@@ -0,0 +1,25 @@
+-- Migration: Rating code lookup functions
+-- Purpose:
+-- - Expose the rating code tables from app/core/rating_engine.py to SQL so queries
+--   (ComprehensiveEvaluationRepository.list_rows) stop repeating CASE mappings.
+-- - rating_code_value: 0-7 core value scale (D = 0 for overall normalization).
+-- - rating_code_mbo_points: MBO points per performance goal (unlisted codes = 0).
+-- - The function bodies below are generated by rating_engine.render_sql_functions();
+--   tests/test_rating_engine.py fails if they drift. Regenerate with:
+--     python -c "from app.core.rating_engine import render_sql_functions; print(render_sql_functions())"
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION rating_code_value(code text)
+RETURNS numeric
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT CASE code WHEN 'SS' THEN 7.0 WHEN 'S' THEN 6.0 WHEN 'A+' THEN 5.0 WHEN 'A' THEN 4.0 WHEN 'A-' THEN 3.0 WHEN 'B' THEN 2.0 WHEN 'C' THEN 1.0 WHEN 'D' THEN 0.0 ELSE NULL END::numeric
+$$;
+
+CREATE OR REPLACE FUNCTION rating_code_mbo_points(code text)
+RETURNS numeric
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT CASE code WHEN 'SS' THEN 5.0 WHEN 'S' THEN 4.0 WHEN 'A' THEN 3.0 WHEN 'B' THEN 2.0 WHEN 'C' THEN 1.0 WHEN 'D' THEN 0.0 ELSE 0.0 END::numeric
+$$;
+
+COMMIT;
@@ -0,0 +1,14 @@
+-- Migration: Covering index for evaluation period goal statistics
+-- Purpose:
+-- - Goal statistics are now aggregated in SQL (GROUP BY status and
+--   GROUP BY user_id, status with max(updated_at)) instead of loading every
+--   goal of the period into the API process.
+-- - (period_id, user_id, status) INCLUDE (updated_at) lets both aggregates run
+--   as index-only scans for a period, and for a page of users within it.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_goals_period_user_status
+    ON goals (period_id, user_id, status) INCLUDE (updated_at);
+
+COMMIT;
@@ -0,0 +1,176 @@
+-- Migration: Denormalized organization_id on goals, self_assessments and supervisor_feedback
+-- Purpose:
+-- - Org-scoped queries on these tables reached the organization through users
+--   (goals -> users, self_assessments -> goals -> users,
+--   supervisor_feedback -> self_assessments -> goals -> users), which rules out
+--   org-leading composite indexes and index-only scans.
+-- - Each table gets an organization_id column copied from its parent, backfilled
+--   here and maintained by triggers:
+--     * BEFORE INSERT / UPDATE OF the parent key: the row takes its parent's org
+--       (whatever the application sent is overwritten).
+--     * AFTER UPDATE OF users.clerk_organization_id: the change cascades to the
+--       user's goals, their self assessments and their supervisor feedback.
+-- - The backfill is verified before COMMIT; any mismatch aborts the migration.
+-- - organization_id_consistency_issues lists drifted rows for ongoing checks
+--   (expected to be empty):
+--     SELECT table_name, count(*) FROM organization_id_consistency_issues GROUP BY 1;
+
+BEGIN;
+
+-- ------------------------------------------------------------------
+-- 1. Columns
+-- ------------------------------------------------------------------
+ALTER TABLE goals
+    ADD COLUMN IF NOT EXISTS organization_id VARCHAR(50) REFERENCES organizations(id);
+ALTER TABLE self_assessments
+    ADD COLUMN IF NOT EXISTS organization_id VARCHAR(50) REFERENCES organizations(id);
+ALTER TABLE supervisor_feedback
+    ADD COLUMN IF NOT EXISTS organization_id VARCHAR(50) REFERENCES organizations(id);
+
+-- ------------------------------------------------------------------
+-- 2. Backfill (parents first)
+-- ------------------------------------------------------------------
+UPDATE goals g
+SET organization_id = u.clerk_organization_id
+FROM users u
+WHERE u.id = g.user_id
+  AND g.organization_id IS DISTINCT FROM u.clerk_organization_id;
+
+UPDATE self_assessments sa
+SET organization_id = g.organization_id
+FROM goals g
+WHERE g.id = sa.goal_id
+  AND sa.organization_id IS DISTINCT FROM g.organization_id;
+
+UPDATE supervisor_feedback sf
+SET organization_id = sa.organization_id
+FROM self_assessments sa
+WHERE sa.id = sf.self_assessment_id
+  AND sf.organization_id IS DISTINCT FROM sa.organization_id;
+
+-- ------------------------------------------------------------------
+-- 3. Maintenance triggers
+-- ------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION set_goal_organization_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    SELECT u.clerk_organization_id INTO NEW.organization_id
+    FROM users u
+    WHERE u.id = NEW.user_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION set_self_assessment_organization_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    SELECT g.organization_id INTO NEW.organization_id
+    FROM goals g
+    WHERE g.id = NEW.goal_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION set_supervisor_feedback_organization_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    SELECT sa.organization_id INTO NEW.organization_id
+    FROM self_assessments sa
+    WHERE sa.id = NEW.self_assessment_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION cascade_user_organization_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE goals
+    SET organization_id = NEW.clerk_organization_id
+    WHERE user_id = NEW.id;
+
+    UPDATE self_assessments sa
+    SET organization_id = NEW.clerk_organization_id
+    FROM goals g
+    WHERE g.id = sa.goal_id
+      AND g.user_id = NEW.id;
+
+    UPDATE supervisor_feedback sf
+    SET organization_id = NEW.clerk_organization_id
+    FROM self_assessments sa
+    JOIN goals g ON g.id = sa.goal_id
+    WHERE sa.id = sf.self_assessment_id
+      AND g.user_id = NEW.id;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS set_goals_organization_id ON goals;
+CREATE TRIGGER set_goals_organization_id
+    BEFORE INSERT OR UPDATE OF user_id, organization_id ON goals
+    FOR EACH ROW EXECUTE FUNCTION set_goal_organization_id();
+
+DROP TRIGGER IF EXISTS set_self_assessments_organization_id ON self_assessments;
+CREATE TRIGGER set_self_assessments_organization_id
+    BEFORE INSERT OR UPDATE OF goal_id, organization_id ON self_assessments
+    FOR EACH ROW EXECUTE FUNCTION set_self_assessment_organization_id();
+
+DROP TRIGGER IF EXISTS set_supervisor_feedback_organization_id ON supervisor_feedback;
+CREATE TRIGGER set_supervisor_feedback_organization_id
+    BEFORE INSERT OR UPDATE OF self_assessment_id, organization_id ON supervisor_feedback
+    FOR EACH ROW EXECUTE FUNCTION set_supervisor_feedback_organization_id();
+
+DROP TRIGGER IF EXISTS cascade_users_organization_id ON users;
+CREATE TRIGGER cascade_users_organization_id
+    AFTER UPDATE OF clerk_organization_id ON users
+    FOR EACH ROW
+    WHEN (OLD.clerk_organization_id IS DISTINCT FROM NEW.clerk_organization_id)
+    EXECUTE FUNCTION cascade_user_organization_id();
+
+-- ------------------------------------------------------------------
+-- 4. Consistency checks
+-- ------------------------------------------------------------------
+CREATE OR REPLACE VIEW organization_id_consistency_issues AS
+SELECT 'goals' AS table_name, g.id AS row_id, g.organization_id, u.clerk_organization_id AS expected_organization_id
+FROM goals g
+JOIN users u ON u.id = g.user_id
+WHERE g.organization_id IS DISTINCT FROM u.clerk_organization_id
+UNION ALL
+SELECT 'self_assessments', sa.id, sa.organization_id, g.organization_id
+FROM self_assessments sa
+JOIN goals g ON g.id = sa.goal_id
+WHERE sa.organization_id IS DISTINCT FROM g.organization_id
+UNION ALL
+SELECT 'supervisor_feedback', sf.id, sf.organization_id, sa.organization_id
+FROM supervisor_feedback sf
+JOIN self_assessments sa ON sa.id = sf.self_assessment_id
+WHERE sf.organization_id IS DISTINCT FROM sa.organization_id;
+
+DO $$
+DECLARE
+    issue_count BIGINT;
+BEGIN
+    SELECT count(*) INTO issue_count FROM organization_id_consistency_issues;
+    IF issue_count > 0 THEN
+        RAISE EXCEPTION 'organization_id backfill left % inconsistent rows', issue_count;
+    END IF;
+END;
+$$;
+
+ALTER TABLE goals ALTER COLUMN organization_id SET NOT NULL;
+ALTER TABLE self_assessments ALTER COLUMN organization_id SET NOT NULL;
+ALTER TABLE supervisor_feedback ALTER COLUMN organization_id SET NOT NULL;
+
+-- ------------------------------------------------------------------
+-- 5. Org-leading composite indexes for the hot filters
+-- ------------------------------------------------------------------
+CREATE INDEX IF NOT EXISTS idx_goals_org_period_status
+    ON goals (organization_id, period_id, status);
+CREATE INDEX IF NOT EXISTS idx_self_assessments_org_period_status
+    ON self_assessments (organization_id, period_id, status);
+CREATE INDEX IF NOT EXISTS idx_supervisor_feedback_org_period_status
+    ON supervisor_feedback (organization_id, period_id, status);
+CREATE INDEX IF NOT EXISTS idx_supervisor_feedback_org_supervisor_period
+    ON supervisor_feedback (organization_id, supervisor_id, period_id);
+
+COMMIT;
@@ -0,0 +1,391 @@
+-- Migration: List-partition period-scoped evaluation tables by period_id
+-- Purpose:
+-- - Evaluation tables grow with every period while nearly every hot query filters
+--   by period_id. Partitioning them by period keeps active-period scans, index
+--   sizes and (auto)vacuum work bounded to the periods that are still in use.
+-- - Periods belong to one organization, so one LIST partition per period is also
+--   a partition per (organization, period).
+-- - convert_to_period_partitioned(table) rebuilds a table as
+--   PARTITION BY LIST (period_id) with one partition per evaluation period plus a
+--   DEFAULT partition, keeping index/constraint/trigger names, grants and
+--   dependent views. Primary keys and unique keys gain period_id (PostgreSQL
+--   requires the partition key in them); a row's period never changes, so the
+--   existing uniqueness rules are unchanged.
+-- - Only tables that no foreign key points to can be converted (PostgreSQL would
+--   need the referencing side to carry period_id in a composite key). Converted
+--   here: supervisor_reviews, supervisor_feedback, core_value_feedback,
+--   peer_review_evaluations, comprehensive_processing_statuses. goals,
+--   self_assessments, core_value_evaluations and peer_review_assignments stay
+--   unpartitioned until their referencing foreign keys carry period_id.
+-- - New periods get their partitions from a trigger on evaluation_periods.
+-- - Archive workflow for closed periods (see app/database/scripts/archive_period_partitions.py):
+--     SELECT detach_period_partitions('<period uuid>');   -- completed/cancelled only
+--     SELECT attach_period_partitions('<period uuid>');   -- restore
+--   Detached partitions move to the evaluation_archive schema and are listed in
+--   period_partition_archive. Rows of an archived period are not visible to the
+--   application until the period is attached again.
+-- - Requires PostgreSQL 13+ (row triggers on partitioned tables).
+
+BEGIN;
+
+CREATE SCHEMA IF NOT EXISTS evaluation_archive;
+
+CREATE TABLE IF NOT EXISTS period_partitioned_tables (
+    table_name TEXT PRIMARY KEY,
+    converted_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS period_partition_archive (
+    period_id UUID NOT NULL,
+    table_name TEXT NOT NULL REFERENCES period_partitioned_tables(table_name),
+    partition_name TEXT NOT NULL,
+    archive_schema TEXT NOT NULL,
+    archived_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (period_id, table_name)
+);
+
+-- ------------------------------------------------------------------
+-- 1. Partition naming and creation
+-- ------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION period_partition_name(p_table TEXT, p_period_id UUID)
+RETURNS TEXT
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT left(p_table, 28) || '_' || replace(p_period_id::text, '-', '')
+$$;
+
+CREATE OR REPLACE FUNCTION period_default_partition_name(p_table TEXT)
+RETURNS TEXT
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT left(p_table, 55) || '_default'
+$$;
+
+-- Create the partition of p_table for p_period_id unless it exists or is archived.
+-- Rows that already landed in the DEFAULT partition are moved into the new one.
+CREATE OR REPLACE FUNCTION ensure_period_partition(p_table TEXT, p_period_id UUID)
+RETURNS TEXT
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_partition TEXT := period_partition_name(p_table, p_period_id);
+    v_default TEXT := period_default_partition_name(p_table);
+    v_has_default_rows BOOLEAN;
+BEGIN
+    IF to_regclass(format('public.%I', v_partition)) IS NOT NULL
+       OR EXISTS (
+           SELECT 1 FROM period_partition_archive
+           WHERE period_id = p_period_id AND table_name = p_table
+       ) THEN
+        RETURN v_partition;
+    END IF;
+
+    EXECUTE format('SELECT EXISTS (SELECT 1 FROM public.%I WHERE period_id = %L)', v_default, p_period_id)
+        INTO v_has_default_rows;
+
+    IF NOT v_has_default_rows THEN
+        EXECUTE format(
+            'CREATE TABLE public.%I PARTITION OF public.%I FOR VALUES IN (%L)',
+            v_partition, p_table, p_period_id
+        );
+    ELSE
+        EXECUTE format(
+            'CREATE TABLE public.%I (LIKE public.%I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+            v_partition, p_table
+        );
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM public.%I WHERE period_id = %L RETURNING *) '
+            'INSERT INTO public.%I SELECT * FROM moved',
+            v_default, p_period_id, v_partition
+        );
+        EXECUTE format(
+            'ALTER TABLE public.%I ATTACH PARTITION public.%I FOR VALUES IN (%L)',
+            p_table, v_partition, p_period_id
+        );
+    END IF;
+
+    RETURN v_partition;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION ensure_period_partitions(p_period_id UUID)
+RETURNS VOID
+LANGUAGE plpgsql AS $$
+DECLARE
+    r RECORD;
+BEGIN
+    FOR r IN SELECT table_name FROM period_partitioned_tables ORDER BY table_name LOOP
+        PERFORM ensure_period_partition(r.table_name, p_period_id);
+    END LOOP;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION create_evaluation_period_partitions()
+RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM ensure_period_partitions(NEW.id);
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS create_evaluation_period_partitions ON evaluation_periods;
+CREATE TRIGGER create_evaluation_period_partitions
+    AFTER INSERT ON evaluation_periods
+    FOR EACH ROW EXECUTE FUNCTION create_evaluation_period_partitions();
+
+-- ------------------------------------------------------------------
+-- 2. Table conversion
+-- ------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION convert_to_period_partitioned(p_table TEXT)
+RETURNS VOID
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_oid OID;
+    v_legacy TEXT := left(p_table, 49) || '_unpartitioned';
+    v_drop TEXT[] := '{}';
+    v_create TEXT[] := '{}';
+    v_views TEXT[] := '{}';
+    v_columns NAME[];
+    v_stmt TEXT;
+    r RECORD;
+BEGIN
+    IF EXISTS (SELECT 1 FROM period_partitioned_tables WHERE table_name = p_table) THEN
+        RETURN;
+    END IF;
+
+    v_oid := to_regclass(format('public.%I', p_table));
+    IF v_oid IS NULL THEN
+        RAISE EXCEPTION 'table % does not exist', p_table;
+    END IF;
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_attribute
+        WHERE attrelid = v_oid AND attname = 'period_id' AND NOT attisdropped
+    ) THEN
+        RAISE EXCEPTION 'table % has no period_id column', p_table;
+    END IF;
+    IF EXISTS (SELECT 1 FROM pg_constraint WHERE confrelid = v_oid AND contype = 'f') THEN
+        RAISE EXCEPTION 'table % is referenced by foreign keys and cannot be partitioned by period', p_table;
+    END IF;
+
+    EXECUTE format('LOCK TABLE public.%I IN ACCESS EXCLUSIVE MODE', p_table);
+
+    -- Dependent views: dropped before the swap, recreated on the new table.
+    FOR r IN
+        SELECT DISTINCT v.oid, v.relname, pg_get_viewdef(v.oid) AS definition
+        FROM pg_depend d
+        JOIN pg_rewrite rw ON rw.oid = d.objid
+        JOIN pg_class v ON v.oid = rw.ev_class
+        WHERE d.classid = 'pg_rewrite'::regclass
+          AND d.refobjid = v_oid
+          AND v.oid <> v_oid
+          AND v.relkind = 'v'
+    LOOP
+        v_drop := v_drop || format('DROP VIEW public.%I', r.relname);
+        v_views := v_views || format('CREATE VIEW public.%I AS %s', r.relname, r.definition);
+        v_views := v_views || ARRAY(
+            SELECT format(
+                'GRANT %s ON public.%I TO %s',
+                acl.privilege_type, r.relname,
+                CASE WHEN acl.grantee = 0 THEN 'PUBLIC' ELSE quote_ident(pg_get_userbyid(acl.grantee)) END
+            )
+            FROM pg_class c, aclexplode(c.relacl) acl
+            WHERE c.oid = r.oid
+        );
+    END LOOP;
+
+    -- Primary key and unique constraints, with period_id appended when missing.
+    FOR r IN
+        SELECT c.conname, c.contype,
+               ARRAY(
+                   SELECT a.attname
+                   FROM unnest(c.conkey) WITH ORDINALITY AS k(attnum, ord)
+                   JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = k.attnum
+                   ORDER BY k.ord
+               ) AS columns
+        FROM pg_constraint c
+        WHERE c.conrelid = v_oid AND c.contype IN ('p', 'u')
+    LOOP
+        v_columns := r.columns;
+        IF NOT 'period_id' = ANY (v_columns) THEN
+            v_columns := v_columns || 'period_id'::name;
+        END IF;
+        v_drop := v_drop || format('ALTER TABLE public.%I DROP CONSTRAINT %I', p_table, r.conname);
+        v_create := v_create || format(
+            'ALTER TABLE public.%I ADD CONSTRAINT %I %s (%s)',
+            p_table, r.conname,
+            CASE r.contype WHEN 'p' THEN 'PRIMARY KEY' ELSE 'UNIQUE' END,
+            (SELECT string_agg(quote_ident(col), ', ' ORDER BY ord) FROM unnest(v_columns) WITH ORDINALITY AS t(col, ord))
+        );
+    END LOOP;
+
+    -- Standalone indexes. Unique ones are rebuilt with period_id appended.
+    FOR r IN
+        SELECT i.indexrelid, ci.relname AS index_name, i.indisunique, i.indnkeyatts, i.indnatts,
+               am.amname, pg_get_indexdef(i.indexrelid) AS definition,
+               pg_get_expr(i.indpred, i.indrelid) AS predicate,
+               EXISTS (
+                   SELECT 1 FROM unnest(i.indkey::int2[]) AS k(attnum)
+                   JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = k.attnum
+                   WHERE a.attname = 'period_id'
+               ) AS has_period
+        FROM pg_index i
+        JOIN pg_class ci ON ci.oid = i.indexrelid
+        JOIN pg_am am ON am.oid = ci.relam
+        WHERE i.indrelid = v_oid
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid AND c.conrelid = v_oid)
+    LOOP
+        v_drop := v_drop || format('DROP INDEX public.%I', r.index_name);
+        IF NOT r.indisunique OR r.has_period THEN
+            v_create := v_create || r.definition;
+        ELSE
+            v_stmt := format(
+                'CREATE UNIQUE INDEX %I ON public.%I USING %s (%s, period_id)',
+                r.index_name, p_table, r.amname,
+                (SELECT string_agg(pg_get_indexdef(r.indexrelid, k, true), ', ' ORDER BY k)
+                 FROM generate_series(1, r.indnkeyatts) AS k)
+            );
+            IF r.indnatts > r.indnkeyatts THEN
+                v_stmt := v_stmt || format(
+                    ' INCLUDE (%s)',
+                    (SELECT string_agg(pg_get_indexdef(r.indexrelid, k, true), ', ' ORDER BY k)
+                     FROM generate_series(r.indnkeyatts + 1, r.indnatts) AS k)
+                );
+            END IF;
+            IF r.predicate IS NOT NULL THEN
+                v_stmt := v_stmt || ' WHERE ' || r.predicate;
+            END IF;
+            v_create := v_create || v_stmt;
+        END IF;
+    END LOOP;
+
+    -- Outbound foreign keys (CHECK constraints are copied by LIKE).
+    v_create := v_create || ARRAY(
+        SELECT format('ALTER TABLE public.%I ADD CONSTRAINT %I %s', p_table, c.conname, pg_get_constraintdef(c.oid))
+        FROM pg_constraint c
+        WHERE c.conrelid = v_oid AND c.contype = 'f'
+        ORDER BY c.conname
+    );
+
+    -- Triggers, added after the data copy so they do not fire for it.
+    v_create := v_create || ARRAY(
+        SELECT pg_get_triggerdef(t.oid)
+        FROM pg_trigger t
+        WHERE t.tgrelid = v_oid AND NOT t.tgisinternal
+        ORDER BY t.tgname
+    );
+
+    -- Table privileges.
+    v_create := v_create || ARRAY(
+        SELECT format(
+            'GRANT %s ON public.%I TO %s',
+            acl.privilege_type, p_table,
+            CASE WHEN acl.grantee = 0 THEN 'PUBLIC' ELSE quote_ident(pg_get_userbyid(acl.grantee)) END
+        )
+        FROM pg_class c, aclexplode(c.relacl) acl
+        WHERE c.oid = v_oid
+    );
+
+    FOREACH v_stmt IN ARRAY v_drop LOOP
+        EXECUTE v_stmt;
+    END LOOP;
+
+    EXECUTE format('ALTER TABLE public.%I RENAME TO %I', p_table, v_legacy);
+    EXECUTE format(
+        'CREATE TABLE public.%I (LIKE public.%I INCLUDING ALL EXCLUDING INDEXES) PARTITION BY LIST (period_id)',
+        p_table, v_legacy
+    );
+    EXECUTE format(
+        'CREATE TABLE public.%I PARTITION OF public.%I DEFAULT',
+        period_default_partition_name(p_table), p_table
+    );
+    FOR r IN SELECT id FROM evaluation_periods ORDER BY start_date, id LOOP
+        PERFORM ensure_period_partition(p_table, r.id);
+    END LOOP;
+
+    EXECUTE format('INSERT INTO public.%I SELECT * FROM public.%I', p_table, v_legacy);
+
+    FOREACH v_stmt IN ARRAY v_create || v_views LOOP
+        EXECUTE v_stmt;
+    END LOOP;
+
+    EXECUTE format('DROP TABLE public.%I', v_legacy);
+
+    INSERT INTO period_partitioned_tables (table_name) VALUES (p_table);
+END;
+$$;
+
+-- ------------------------------------------------------------------
+-- 3. Archive workflow
+-- ------------------------------------------------------------------
+-- Detach every partition of a completed/cancelled period into p_archive_schema.
+CREATE OR REPLACE FUNCTION detach_period_partitions(p_period_id UUID, p_archive_schema TEXT DEFAULT 'evaluation_archive')
+RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_status TEXT;
+    v_partition TEXT;
+    v_count INTEGER := 0;
+    r RECORD;
+BEGIN
+    SELECT status INTO v_status FROM evaluation_periods WHERE id = p_period_id;
+    IF v_status IS NULL THEN
+        RAISE EXCEPTION 'evaluation period % not found', p_period_id;
+    END IF;
+    IF v_status NOT IN ('completed', 'cancelled') THEN
+        RAISE EXCEPTION 'evaluation period % is %; only completed or cancelled periods can be archived',
+            p_period_id, v_status;
+    END IF;
+
+    EXECUTE format('CREATE SCHEMA IF NOT EXISTS %I', p_archive_schema);
+
+    FOR r IN SELECT table_name FROM period_partitioned_tables ORDER BY table_name LOOP
+        v_partition := period_partition_name(r.table_name, p_period_id);
+        CONTINUE WHEN to_regclass(format('public.%I', v_partition)) IS NULL;
+
+        EXECUTE format('ALTER TABLE public.%I DETACH PARTITION public.%I', r.table_name, v_partition);
+        EXECUTE format('ALTER TABLE public.%I SET SCHEMA %I', v_partition, p_archive_schema);
+        INSERT INTO period_partition_archive (period_id, table_name, partition_name, archive_schema)
+        VALUES (p_period_id, r.table_name, v_partition, p_archive_schema);
+        v_count := v_count + 1;
+    END LOOP;
+
+    RETURN v_count;
+END;
+$$;
+
+-- Move archived partitions of a period back and re-attach them.
+CREATE OR REPLACE FUNCTION attach_period_partitions(p_period_id UUID)
+RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_count INTEGER := 0;
+    r RECORD;
+BEGIN
+    FOR r IN
+        SELECT table_name, partition_name, archive_schema
+        FROM period_partition_archive
+        WHERE period_id = p_period_id
+        ORDER BY table_name
+    LOOP
+        EXECUTE format('ALTER TABLE %I.%I SET SCHEMA public', r.archive_schema, r.partition_name);
+        EXECUTE format(
+            'ALTER TABLE public.%I ATTACH PARTITION public.%I FOR VALUES IN (%L)',
+            r.table_name, r.partition_name, p_period_id
+        );
+        DELETE FROM period_partition_archive
+        WHERE period_id = p_period_id AND table_name = r.table_name;
+        v_count := v_count + 1;
+    END LOOP;
+
+    RETURN v_count;
+END;
+$$;
+
+-- ------------------------------------------------------------------
+-- 4. Convert the leaf tables (nothing references them)
+-- ------------------------------------------------------------------
+SELECT convert_to_period_partitioned('supervisor_reviews');
+SELECT convert_to_period_partitioned('supervisor_feedback');
+SELECT convert_to_period_partitioned('core_value_feedback');
+SELECT convert_to_period_partitioned('peer_review_evaluations');
+SELECT convert_to_period_partitioned('comprehensive_processing_statuses');
+
+COMMIT;
@@ -0,0 +1,33 @@
+-- Migration: Per-user result snapshots of finalized evaluation periods
+-- Purpose:
+-- - Once a period is completed its results only change through manual decisions,
+--   yet every history view recomputed them from the live joins (list_rows and the
+--   dashboard history counts). Later level/stage changes of the user also leaked
+--   into those recomputations.
+-- - comprehensive_period_snapshots keeps one compact JSONB document per
+--   (period, user): the applied comprehensive evaluation row plus the activity
+--   counts shown in the history views. Written on finalization, refreshed for a
+--   user when a manual decision changes, and read by the history endpoints.
+-- - Periods finalized before this migration have no snapshot yet; readers fall
+--   back to the live computation until POST
+--   /evaluation/comprehensive-evaluation/snapshots/refresh is called for them.
+-- - The document is stored as JSONB; values above the TOAST threshold are
+--   compressed by PostgreSQL.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS comprehensive_period_snapshots (
+    organization_id VARCHAR(50) NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    period_id UUID NOT NULL REFERENCES evaluation_periods(id) ON DELETE CASCADE,
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    document JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    CONSTRAINT pk_comprehensive_period_snapshots PRIMARY KEY (organization_id, period_id, user_id)
+);
+
+-- Cross-period reads of one user (history, comparison)
+CREATE INDEX IF NOT EXISTS idx_comprehensive_period_snapshots_org_user
+    ON comprehensive_period_snapshots (organization_id, user_id);
+
+COMMIT;
@@ -0,0 +1,108 @@
+-- Migration: Pre-aggregated comprehensive evaluation facts per finalized period
+-- Purpose:
+-- - Cross-period trends (rank distribution, MBO / total score percentiles,
+--   promotion rate, assessment completion) per department and stage otherwise
+--   need list_rows for every period plus client-side aggregation.
+-- - comprehensive_period_facts holds one row per (organization, period,
+--   department, stage) aggregated from comprehensive_period_snapshots (037).
+--   The application rebuilds a period's facts whenever its snapshots are
+--   written (finalization, manual decisions, snapshot refresh).
+-- - Department and stage are the names frozen in the snapshot, so renamed or
+--   deleted departments keep their history. The stage is the snapshot's
+--   currentStage, i.e. the stage the user was evaluated in; a promoted user
+--   counts toward the stage they were promoted from, not the destination.
+--   Snapshots of users processed before 039 hold the live stage at snapshot
+--   time; POST /evaluation/comprehensive-evaluation/snapshots/refresh cannot
+--   recover an earlier stage for them.
+-- - Score columns keep the sorted values of the group so percentiles stay exact
+--   when groups are merged (per period, per department across stages, ...).
+-- - Backfilled here from the snapshots that already exist.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS comprehensive_period_facts (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    organization_id VARCHAR(50) NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    period_id UUID NOT NULL REFERENCES evaluation_periods(id) ON DELETE CASCADE,
+    department_name TEXT,
+    stage_name TEXT,
+    user_count INTEGER NOT NULL,
+    processed_count INTEGER NOT NULL,
+    unranked_count INTEGER NOT NULL,
+    rank_counts JSONB NOT NULL DEFAULT '{}'::jsonb,
+    promotion_count INTEGER NOT NULL,
+    demotion_count INTEGER NOT NULL,
+    performance_scores REAL[] NOT NULL DEFAULT '{}',
+    total_scores REAL[] NOT NULL DEFAULT '{}',
+    goals_count INTEGER NOT NULL,
+    completed_assessments_count INTEGER NOT NULL,
+    received_feedbacks_count INTEGER NOT NULL,
+    refreshed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_comprehensive_period_facts_org_period
+    ON comprehensive_period_facts (organization_id, period_id);
+
+-- Same aggregation as ComprehensiveEvaluationRepository.refresh_period_facts, over every snapshot.
+WITH snapshot_rows AS (
+    SELECT
+        s.organization_id,
+        s.period_id,
+        s.document->'row'->>'departmentName' AS department_name,
+        s.document->'row'->>'currentStage' AS stage_name,
+        s.document->'row'->>'processingStatus' AS processing_status,
+        s.document->'row'->'applied'->>'overallRank' AS overall_rank,
+        s.document->'row'->'applied'->>'decision' AS decision,
+        CAST(s.document->'row'->>'performanceScore' AS REAL) AS performance_score,
+        CAST(s.document->'row'->'applied'->>'totalScore' AS REAL) AS total_score,
+        CAST(s.document->'activity'->>'goalsCount' AS INTEGER) AS goals_count,
+        CAST(s.document->'activity'->>'completedAssessmentsCount' AS INTEGER) AS completed_assessments_count,
+        CAST(s.document->'activity'->>'receivedFeedbacksCount' AS INTEGER) AS received_feedbacks_count
+    FROM comprehensive_period_snapshots s
+),
+rank_counts AS (
+    SELECT organization_id, period_id, department_name, stage_name,
+           jsonb_object_agg(overall_rank, rank_count) AS rank_counts
+    FROM (
+        SELECT organization_id, period_id, department_name, stage_name, overall_rank, COUNT(*) AS rank_count
+        FROM snapshot_rows
+        WHERE overall_rank IS NOT NULL
+        GROUP BY organization_id, period_id, department_name, stage_name, overall_rank
+    ) per_rank
+    GROUP BY organization_id, period_id, department_name, stage_name
+)
+INSERT INTO comprehensive_period_facts (
+    organization_id, period_id, department_name, stage_name,
+    user_count, processed_count, unranked_count, rank_counts,
+    promotion_count, demotion_count, performance_scores, total_scores,
+    goals_count, completed_assessments_count, received_feedbacks_count
+)
+SELECT
+    r.organization_id,
+    r.period_id,
+    r.department_name,
+    r.stage_name,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE r.processing_status = 'processed'),
+    COUNT(*) FILTER (WHERE r.overall_rank IS NULL),
+    COALESCE(rc.rank_counts, '{}'::jsonb),
+    COUNT(*) FILTER (WHERE r.decision = '昇格'),
+    COUNT(*) FILTER (WHERE r.decision = '降格'),
+    COALESCE(array_agg(r.performance_score ORDER BY r.performance_score) FILTER (WHERE r.performance_score IS NOT NULL), '{}'),
+    COALESCE(array_agg(r.total_score ORDER BY r.total_score) FILTER (WHERE r.total_score IS NOT NULL), '{}'),
+    COALESCE(SUM(r.goals_count), 0),
+    COALESCE(SUM(r.completed_assessments_count), 0),
+    COALESCE(SUM(r.received_feedbacks_count), 0)
+FROM snapshot_rows r
+LEFT JOIN rank_counts rc
+  ON rc.organization_id = r.organization_id
+ AND rc.period_id = r.period_id
+ AND rc.department_name IS NOT DISTINCT FROM r.department_name
+ AND rc.stage_name IS NOT DISTINCT FROM r.stage_name
+WHERE NOT EXISTS (
+    SELECT 1 FROM comprehensive_period_facts f
+    WHERE f.organization_id = r.organization_id AND f.period_id = r.period_id
+)
+GROUP BY r.organization_id, r.period_id, r.department_name, r.stage_name, rc.rank_counts;
+
+COMMIT;
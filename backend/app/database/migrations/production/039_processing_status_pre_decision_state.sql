@@ -0,0 +1,49 @@
+-- Migration: Record the pre-decision stage and level of processed users
+-- Purpose:
+-- - Processing a user applies the period's level delta and stage change to the
+--   users row. list_rows then read the already-updated u.level / u.stage_id, so
+--   processed rows (and the snapshots frozen from them, 037) reported the
+--   post-decision values as currentLevel / currentStage and applied the level
+--   delta a second time in auto.newLevel / applied.newLevel.
+-- - comprehensive_processing_statuses now keeps the stage and level the user had
+--   when the period was first processed. list_rows reports them for processed
+--   users; re-processing and manual decisions keep the first recorded values.
+-- - pre_decision_recorded distinguishes "recorded as NULL" (no stage/level) from
+--   rows processed before this migration, which keep falling back to the live
+--   values. pre_decision_stage_id has no foreign key so archived partitions
+--   (036) re-attach without constraint validation against stages.
+-- - The table is partitioned by period (036): columns added to the parent reach
+--   every attached partition; archived partitions are altered here as well so
+--   attach_period_partitions keeps matching the parent.
+
+BEGIN;
+
+ALTER TABLE comprehensive_processing_statuses
+    ADD COLUMN IF NOT EXISTS pre_decision_stage_id UUID,
+    ADD COLUMN IF NOT EXISTS pre_decision_level INTEGER,
+    ADD COLUMN IF NOT EXISTS pre_decision_recorded BOOLEAN NOT NULL DEFAULT FALSE;
+
+DO $$
+DECLARE
+    r RECORD;
+BEGIN
+    IF to_regclass('public.period_partition_archive') IS NULL THEN
+        RETURN;
+    END IF;
+    FOR r IN
+        SELECT partition_name, archive_schema
+        FROM period_partition_archive
+        WHERE table_name = 'comprehensive_processing_statuses'
+    LOOP
+        EXECUTE format(
+            'ALTER TABLE %I.%I '
+            'ADD COLUMN IF NOT EXISTS pre_decision_stage_id UUID, '
+            'ADD COLUMN IF NOT EXISTS pre_decision_level INTEGER, '
+            'ADD COLUMN IF NOT EXISTS pre_decision_recorded BOOLEAN NOT NULL DEFAULT FALSE',
+            r.archive_schema, r.partition_name
+        );
+    END LOOP;
+END;
+$$;
+
+COMMIT;
@@ -23,6 +23,8 @@ from .comprehensive_evaluation import (
     ComprehensiveRulesetAssignment,
     ComprehensiveSettingsAuditLog,
     ComprehensiveProcessingStatus,
+    ComprehensivePeriodSnapshot,
+    ComprehensivePeriodFact,
 )
 from .viewer_visibility import (
     ViewerVisibilityDepartment,
@@ -59,6 +61,8 @@ __all__ = [
     "ComprehensiveRulesetAssignment",
     "ComprehensiveSettingsAuditLog",
     "ComprehensiveProcessingStatus",
+    "ComprehensivePeriodSnapshot",
+    "ComprehensivePeriodFact",
     "PermissionModel",
     "RolePermissionModel",
     "ViewerVisibilityUser",
@@ -7,12 +7,13 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Integer,
+    REAL,
     String,
     Text,
     UniqueConstraint,
     DECIMAL,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID as PostgreSQLUUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PostgreSQLUUID
 from sqlalchemy.schema import Index
 
 from .base import Base
@@ -286,10 +287,15 @@ class ComprehensiveProcessingStatus(Base):
 
     id = Column(PostgreSQLUUID(as_uuid=True), primary_key=True)
     organization_id = Column(String(50), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
-    period_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("evaluation_periods.id", ondelete="CASCADE"), nullable=False)
+    # Part of the primary key: the table is list-partitioned by period (migration 036)
+    period_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("evaluation_periods.id", ondelete="CASCADE"), primary_key=True, nullable=False)
     user_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     processed_by_user_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     processed_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    # Stage/level before the period's decision was applied (first processing wins).
+    pre_decision_stage_id = Column(PostgreSQLUUID(as_uuid=True), nullable=True)
+    pre_decision_level = Column(Integer, nullable=True)
+    pre_decision_recorded = Column(Boolean, nullable=False, default=False)
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(
         DateTime(timezone=True),
@@ -308,3 +314,61 @@ class ComprehensiveProcessingStatus(Base):
         Index("idx_comprehensive_processing_statuses_org_period", "organization_id", "period_id"),
         Index("idx_comprehensive_processing_statuses_org_user", "organization_id", "user_id"),
     )
+
+
+class ComprehensivePeriodSnapshot(Base):
+    __tablename__ = "comprehensive_period_snapshots"
+
+    organization_id = Column(
+        String(50), ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True, nullable=False
+    )
+    period_id = Column(
+        PostgreSQLUUID(as_uuid=True),
+        ForeignKey("evaluation_periods.id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    user_id = Column(
+        PostgreSQLUUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    document = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("idx_comprehensive_period_snapshots_org_user", "organization_id", "user_id"),
+    )
+
+
+class ComprehensivePeriodFact(Base):
+    __tablename__ = "comprehensive_period_facts"
+
+    id = Column(PostgreSQLUUID(as_uuid=True), primary_key=True)
+    organization_id = Column(String(50), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    period_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("evaluation_periods.id", ondelete="CASCADE"), nullable=False)
+    department_name = Column(Text, nullable=True)
+    stage_name = Column(Text, nullable=True)
+    user_count = Column(Integer, nullable=False)
+    processed_count = Column(Integer, nullable=False)
+    unranked_count = Column(Integer, nullable=False)
+    rank_counts = Column(JSONB, nullable=False, default=dict)
+    promotion_count = Column(Integer, nullable=False)
+    demotion_count = Column(Integer, nullable=False)
+    performance_scores = Column(ARRAY(REAL), nullable=False, default=list)
+    total_scores = Column(ARRAY(REAL), nullable=False, default=list)
+    goals_count = Column(Integer, nullable=False)
+    completed_assessments_count = Column(Integer, nullable=False)
+    received_feedbacks_count = Column(Integer, nullable=False)
+    refreshed_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    __table_args__ = (
+        Index("idx_comprehensive_period_facts_org_period", "organization_id", "period_id"),
+    )
@@ -98,7 +98,8 @@ class CoreValueFeedback(Base):
 
     id = Column(PostgreSQLUUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     core_value_evaluation_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("core_value_evaluations.id", ondelete="CASCADE"), nullable=False)
-    period_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("evaluation_periods.id", ondelete="CASCADE"), nullable=False)
+    # Part of the primary key: the table is list-partitioned by period (migration 036)
+    period_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("evaluation_periods.id", ondelete="CASCADE"), primary_key=True, nullable=False)
     supervisor_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     subordinate_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
 
@@ -131,7 +132,7 @@ class CoreValueFeedback(Base):
             "(action != 'APPROVED') OR (reviewed_at IS NOT NULL)",
             name='chk_cvf_approval'
         ),
-        Index('idx_cvf_evaluation_unique', 'core_value_evaluation_id', unique=True),
+        Index('idx_cvf_evaluation_unique', 'core_value_evaluation_id', 'period_id', unique=True),
         Index('idx_cvf_period_status', 'period_id', 'status'),
         Index('idx_cvf_supervisor', 'supervisor_id'),
         Index('idx_cvf_subordinate', 'subordinate_id'),
@@ -20,6 +20,8 @@ class Goal(Base):
     # Core fields
     id = Column(PostgreSQLUUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     user_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    # Denormalized from users.clerk_organization_id; kept in sync by trigger (migration 035)
+    organization_id = Column(String(50), ForeignKey("organizations.id"), nullable=False)
     period_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("evaluation_periods.id", ondelete="CASCADE"), nullable=False)
     goal_category = Column(String(100), nullable=False)
     target_data = Column(JSONB, nullable=False)  # Validated JSON structure per category
@@ -65,6 +67,7 @@ class Goal(Base):
         Index('idx_goals_user_period', 'user_id', 'period_id'),
         Index('idx_goals_status_category', 'status', 'goal_category'),
         Index('idx_goals_previous_goal_id', 'previous_goal_id'),
+        Index('idx_goals_org_period_status', 'organization_id', 'period_id', 'status'),
     )
 
     # Relationships
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, text, CheckConstraint
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, text, CheckConstraint, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID as PostgreSQLUUID, JSONB
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy.schema import Index
@@ -66,7 +66,8 @@ class PeerReviewEvaluation(Base):
 
     id = Column(PostgreSQLUUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     assignment_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("peer_review_assignments.id", ondelete="CASCADE"), nullable=False)
-    period_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("evaluation_periods.id", ondelete="CASCADE"), nullable=False)
+    # Part of the primary key: the table is list-partitioned by period (migration 036)
+    period_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("evaluation_periods.id", ondelete="CASCADE"), primary_key=True, nullable=False)
     reviewee_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     reviewer_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     scores = Column(JSONB, nullable=True)
@@ -87,7 +88,7 @@ class PeerReviewEvaluation(Base):
             "(status = 'draft') OR (submitted_at IS NOT NULL)",
             name='chk_pre_submission'
         ),
-        Index('uq_peer_eval_assignment', 'assignment_id', unique=True),
+        UniqueConstraint('assignment_id', 'period_id', name='uq_peer_eval_assignment'),
         Index('idx_pre_period_reviewee', 'period_id', 'reviewee_id'),
         Index('idx_pre_period_reviewer', 'period_id', 'reviewer_id'),
         Index('idx_pre_status', 'status'),
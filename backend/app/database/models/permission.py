@@ -4,6 +4,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Integer,
     String,
     Text,
     UniqueConstraint,
@@ -48,3 +49,13 @@ class RolePermission(Base):
             name="uq_role_permissions_unique",
         ),
     )
+
+
+class PermissionCatalogVersion(Base):
+    """Content hash of a seeded permission catalog; lets seeding be skipped once applied."""
+
+    __tablename__ = "permission_catalog_versions"
+
+    version = Column(String(64), primary_key=True)
+    permission_count = Column(Integer, nullable=False)
+    seeded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
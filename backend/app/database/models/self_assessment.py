@@ -22,6 +22,8 @@ class SelfAssessment(Base):
     # Core fields
     id = Column(PostgreSQLUUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     goal_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("goals.id", ondelete="CASCADE"), nullable=False)
+    # Denormalized from goals.organization_id; kept in sync by trigger (migration 035)
+    organization_id = Column(String(50), ForeignKey("organizations.id"), nullable=False)
     period_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("evaluation_periods.id", ondelete="CASCADE"), nullable=False)
     self_rating_code = Column(String(3), nullable=True)  # SS, S, A, B, C, D
     self_rating = Column(DECIMAL(5, 2), nullable=True)  # 0-100 numeric value, auto-calculated
@@ -64,6 +66,7 @@ class SelfAssessment(Base):
 
         # Performance indexes
         Index('idx_self_assessments_period_status', 'period_id', 'status'),
+        Index('idx_self_assessments_org_period_status', 'organization_id', 'period_id', 'status'),
         Index('idx_self_assessments_created_at', 'created_at'),
         Index('idx_self_assessments_rating_code', 'self_rating_code'),
     )
@@ -23,7 +23,10 @@ class SupervisorFeedback(Base):
     # Core fields
     id = Column(PostgreSQLUUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     self_assessment_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("self_assessments.id", ondelete="CASCADE"), nullable=False)
-    period_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("evaluation_periods.id", ondelete="CASCADE"), nullable=False)
+    # Denormalized from self_assessments.organization_id; kept in sync by trigger (migration 035)
+    organization_id = Column(String(50), ForeignKey("organizations.id"), nullable=False)
+    # Part of the primary key: the table is list-partitioned by period (migration 036)
+    period_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("evaluation_periods.id", ondelete="CASCADE"), primary_key=True, nullable=False)
     supervisor_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     subordinate_id = Column(PostgreSQLUUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
 
@@ -82,11 +85,13 @@ class SupervisorFeedback(Base):
             name='chk_supervisor_feedback_approval'
         ),
 
-        # Unique constraint: one feedback per self assessment
-        Index('idx_supervisor_feedback_assessment_unique', 'self_assessment_id', unique=True),
+        # Unique constraint: one feedback per self assessment (period_id appended by migration 036)
+        Index('idx_supervisor_feedback_assessment_unique', 'self_assessment_id', 'period_id', unique=True),
 
         # Performance indexes
         Index('idx_supervisor_feedback_period_status', 'period_id', 'status'),
+        Index('idx_supervisor_feedback_org_period_status', 'organization_id', 'period_id', 'status'),
+        Index('idx_supervisor_feedback_org_supervisor_period', 'organization_id', 'supervisor_id', 'period_id'),
         Index('idx_supervisor_feedback_supervisor', 'supervisor_id'),
         Index('idx_supervisor_feedback_subordinate', 'subordinate_id'),
         Index('idx_supervisor_feedback_action', 'action'),
@@ -1,22 +1,41 @@
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID as PostgreSQLUUID
+from enum import Enum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PostgreSQLUUID
 from sqlalchemy.orm import relationship
 
 from .base import Base
 
+
+class WebhookEventStatus(str, Enum):
+    """Lifecycle of a webhook inbox entry."""
+    PENDING = "pending"
+    PROCESSING = "processing"
+    PROCESSED = "processed"
+    SUPERSEDED = "superseded"  # Coalesced into a newer event for the same subject
+    DEAD = "dead"  # Retries exhausted
+
+
 class WebhookEvent(Base):
-    """Model for tracking processed webhook events to ensure idempotency."""
-    
+    """Webhook inbox entry: idempotency record plus durable processing state."""
+
     __tablename__ = "webhook_events"
-    
+
     id = Column(PostgreSQLUUID(as_uuid=True), primary_key=True, server_default="gen_random_uuid()")
     organization_id = Column(String(50), ForeignKey("organizations.id"), nullable=True)  # Nullable for system-wide events
     event_id = Column(String(255), unique=True, nullable=False, index=True)
     event_type = Column(String(100), nullable=False)
-    processed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    status = Column(String(20), nullable=False, default=WebhookEventStatus.PENDING.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    payload = Column(JSONB, nullable=True)
+    subject_id = Column(String(255), nullable=True)  # Clerk user/org id the event is about
+    last_error = Column(Text, nullable=True)
+    received_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    locked_until = Column(DateTime, nullable=True)
+    processed_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    organization = relationship("Organization")
\ No newline at end of file
+    organization = relationship("Organization")
@@ -1,14 +1,38 @@
 from abc import ABC
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import Select
-from typing import Optional, TypeVar, Generic
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, TypeVar, Generic
+import json
 import logging
 
+if TYPE_CHECKING:
+    from ...schemas.common import PaginationParams
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Label of the window-function total added by BaseRepository.paginate().
+_TOTAL_COUNT_LABEL = "_page_total_count"
+
+
+class _ExplainJSON(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON) <select>``; used for planner row estimates."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_ExplainJSON)
+def _compile_explain_json(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
 class BaseRepository(ABC, Generic[T]):
     """
     Base repository with organization filtering capabilities following task 5.1 specification.
@@ -60,9 +84,28 @@ class BaseRepository(ABC, Generic[T]):
         logger.debug(f"Applying organization scope via user: org_id = {org_id}")
         return query.join(User, user_fk_col == User.id).where(User.clerk_organization_id == org_id)
 
+    def apply_user_scope(self, query: Select, user_fk_col, user_ids) -> Select:
+        """
+        Apply an RBAC user scope to a query.
+        
+        Args:
+            query: SQLAlchemy query to filter
+            user_fk_col: User column to restrict (e.g., Goal.user_id or User.id)
+            user_ids: AccessScope, or the legacy list form (None = all users)
+            
+        Returns:
+            Filtered query; unchanged for an all-users scope
+        """
+        from ...security.rbac_scope import AccessScope
+
+        predicate = AccessScope.coerce(user_ids).predicate(user_fk_col)
+        if predicate is None:
+            return query
+        return query.where(predicate)
+
     def apply_org_scope_via_goal(self, query: Select, goal_fk_col, org_id: str) -> Select:
         """
-        Apply organization scope via goal→user relationship for tables accessed through goals.
+        Apply organization scope via the goal's organization_id for tables accessed through goals.
         
         Args:
             query: SQLAlchemy query to filter
@@ -70,22 +113,20 @@ class BaseRepository(ABC, Generic[T]):
             org_id: Organization ID to filter by
             
         Returns:
-            Filtered query: query.join(Goal).join(User).where(User.clerk_organization_id == org_id)
+            Filtered query: query.join(Goal).where(Goal.organization_id == org_id)
         """
         if not org_id:
             raise ValueError("org_id is required and cannot be None")
             
         from ..models.goal import Goal
-        from ..models.user import User
         logger.debug(f"Applying organization scope via goal: org_id = {org_id}")
         return (query
                 .join(Goal, goal_fk_col == Goal.id)
-                .join(User, Goal.user_id == User.id)
-                .where(User.clerk_organization_id == org_id))
+                .where(Goal.organization_id == org_id))
 
     def apply_org_scope_via_goal_with_status(self, query: Select, goal_fk_col, org_id: str, goal_status: str) -> Select:
         """
-        Apply organization scope via goal→user relationship with goal status filter.
+        Apply organization scope via the goal's organization_id with goal status filter.
 
         Args:
             query: SQLAlchemy query to filter
@@ -100,17 +141,15 @@ class BaseRepository(ABC, Generic[T]):
             raise ValueError("org_id is required and cannot be None")
 
         from ..models.goal import Goal
-        from ..models.user import User
         logger.debug(f"Applying organization scope via goal with status {goal_status}: org_id = {org_id}")
         return (query
                 .join(Goal, goal_fk_col == Goal.id)
-                .join(User, Goal.user_id == User.id)
-                .where(User.clerk_organization_id == org_id)
+                .where(Goal.organization_id == org_id)
                 .where(Goal.status == goal_status))
 
     def apply_org_scope_via_goal_with_owner(self, query: Select, goal_fk_col, org_id: str, owner_user_id) -> Select:
         """
-        Apply organization scope via goal→user relationship with goal owner filter.
+        Apply organization scope via the goal's organization_id with goal owner filter.
 
         Args:
             query: SQLAlchemy query to filter
@@ -125,12 +164,10 @@ class BaseRepository(ABC, Generic[T]):
             raise ValueError("org_id is required and cannot be None")
 
         from ..models.goal import Goal
-        from ..models.user import User
         logger.debug(f"Applying organization scope via goal with owner {owner_user_id}: org_id = {org_id}")
         return (query
                 .join(Goal, goal_fk_col == Goal.id)
-                .join(User, Goal.user_id == User.id)
-                .where(User.clerk_organization_id == org_id)
+                .where(Goal.organization_id == org_id)
                 .where(Goal.user_id == owner_user_id))
 
     def verify_org_consistency_direct(self, org_id: str, target_org_id: Optional[str], entity_description: str = "record") -> None:
@@ -188,7 +225,7 @@ class BaseRepository(ABC, Generic[T]):
 
     async def verify_org_consistency_via_goal(self, org_id: str, goal_id: str, entity_description: str = "record") -> None:
         """
-        Verify organization consistency via goal→user relationship.
+        Verify organization consistency via the goal's organization_id.
         
         Args:
             org_id: Expected organization ID
@@ -202,16 +239,13 @@ class BaseRepository(ABC, Generic[T]):
             raise ValueError("org_id is required for organization consistency verification")
             
         from ..models.goal import Goal
-        from ..models.user import User
         result = await self.session.execute(
-            select(User.clerk_organization_id)
-            .join(Goal, Goal.user_id == User.id)
-            .where(Goal.id == goal_id)
+            select(Goal.organization_id).where(Goal.id == goal_id)
         )
         goal_org_id = result.scalar()
         
         if not goal_org_id:
-            raise ValueError(f"Goal {goal_id} not found or has no associated user/organization")
+            raise ValueError(f"Goal {goal_id} not found")
             
         if goal_org_id != org_id:
             error_msg = f"Organization mismatch: {entity_description} belongs to goal in org {goal_org_id}, expected {org_id}"
@@ -220,6 +254,81 @@ class BaseRepository(ABC, Generic[T]):
             
         logger.debug(f"Goal-based organization consistency verified for {entity_description}: {org_id}")
 
+    async def paginate(
+        self,
+        query: Select,
+        pagination: Optional["PaginationParams"],
+        *,
+        estimate: bool = False,
+    ) -> Tuple[List[Any], int]:
+        """
+        Fetch one page of ``query`` and the total number of matching rows in one round trip.
+        
+        The total comes from ``COUNT(*) OVER()`` evaluated before OFFSET/LIMIT, so the
+        page and the count always see the same filters. Single-entity selects return
+        model instances, anything else returns row mappings (without the count column).
+        
+        Args:
+            query: Filtered and ordered select, without offset/limit
+            pagination: Page to fetch; None returns every row
+            estimate: Skip the exact count and use the planner's row estimate instead
+                (for large tables where an approximate total is acceptable)
+            
+        Returns:
+            (items, total)
+        """
+        descriptions = query.column_descriptions
+        single_entity = len(descriptions) == 1 and descriptions[0].get("entity") is not None \
+            and descriptions[0].get("type") is descriptions[0].get("entity")
+
+        page_query = query if estimate else query.add_columns(
+            func.count().over().label(_TOTAL_COUNT_LABEL)
+        )
+        if pagination:
+            page_query = page_query.offset(pagination.offset).limit(pagination.limit)
+
+        result = await self.session.execute(page_query)
+        rows = result.all()
+
+        if single_entity:
+            items = [row[0] for row in rows]
+        else:
+            items = [
+                {key: value for key, value in row._mapping.items() if key != _TOTAL_COUNT_LABEL}
+                for row in rows
+            ]
+
+        offset = pagination.offset if pagination else 0
+        if not estimate:
+            if rows:
+                return items, int(rows[0]._mapping[_TOTAL_COUNT_LABEL])
+            if offset == 0:
+                return items, 0
+            # Past the last page the window has no row to report the total on.
+            return items, await self._count_rows(query)
+
+        # A short page is the last one: its total is exact.
+        if pagination is None or len(rows) < pagination.limit:
+            if rows or offset == 0:
+                return items, offset + len(rows)
+        estimated = await self._estimate_rows(query)
+        return items, max(estimated, offset + len(rows))
+
+    async def _count_rows(self, query: Select) -> int:
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        result = await self.session.execute(count_query)
+        return int(result.scalar() or 0)
+
+    async def _estimate_rows(self, query: Select) -> int:
+        """Planner row estimate for ``query`` (PostgreSQL); exact count elsewhere."""
+        if self.session.bind is not None and self.session.bind.dialect.name != "postgresql":
+            return await self._count_rows(query)
+        result = await self.session.execute(_ExplainJSON(query.order_by(None)))
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
     def ensure_org_filter_applied(self, query_description: str, org_id: Optional[str]) -> None:
         """
         Audit logging for organization filter application.
@@ -1,7 +1,8 @@
 import logging
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 from sqlalchemy import select, delete, func
 from sqlalchemy.orm import joinedload
@@ -127,6 +128,21 @@ class CompetencyRepository(BaseRepository[Competency]):
             logger.error(f"Error fetching competencies for stage {stage_id} in org {org_id}: {e}")
             raise
 
+    async def get_by_stage_ids(self, stage_ids: List[UUID], org_id: str) -> list[Competency]:
+        """Get the competencies of several stages in one query, ordered per stage like get_by_stage_id."""
+        if not stage_ids:
+            return []
+        try:
+            query = select(Competency).filter(Competency.stage_id.in_(stage_ids)).order_by(
+                Competency.stage_id, Competency.display_order.nullslast(), Competency.name
+            )
+            query = self.apply_org_scope_direct(query, Competency.organization_id, org_id)
+            result = await self.session.execute(query)
+            return result.scalars().all()
+        except SQLAlchemyError as e:
+            logger.error(f"Error batch fetching competencies for stages in org {org_id}: {e}")
+            raise
+
     async def get_all(self, org_id: str) -> list[Competency]:
         """Get all competencies with stage information within organization scope."""
         try:
@@ -248,6 +264,24 @@ class CompetencyRepository(BaseRepository[Competency]):
             logger.error(f"Error counting competencies: {e}")
             raise
 
+    async def get_catalog_fingerprint(self, org_id: str) -> Tuple[int, Optional[datetime]]:
+        """
+        (row count, latest updated_at) of the organization's competencies.
+
+        Changes with every create, update (ORM onupdate) and delete, so it serves as a
+        catalog version every worker reads from the same source.
+        """
+        try:
+            result = await self.session.execute(
+                select(func.count(Competency.id), func.max(Competency.updated_at))
+                .where(Competency.organization_id == org_id)
+            )
+            count, latest = result.one()
+            return int(count or 0), latest
+        except SQLAlchemyError as e:
+            logger.error(f"Error reading competency catalog fingerprint for org {org_id}: {e}")
+            raise
+
     async def check_competency_name_exists(self, name: str, exclude_id: Optional[UUID] = None) -> bool:
         """Check if a competency name already exists, optionally excluding a specific ID."""
         try:
@@ -1,15 +1,44 @@
 import json
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 from uuid import UUID
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...core.metrics import timed_query
+
+# ON CONFLICT targets matching the partial unique indexes of comprehensive_ruleset_assignments.
+_DEFAULT_ASSIGNMENT_CONFLICT = "(organization_id, period_id) WHERE department_id IS NULL AND stage_id IS NULL"
+_DEPARTMENT_ASSIGNMENT_CONFLICT = (
+    "(organization_id, period_id, department_id) WHERE department_id IS NOT NULL AND stage_id IS NULL"
+)
+_STAGE_ASSIGNMENT_CONFLICT = "(organization_id, period_id, stage_id) WHERE department_id IS NULL AND stage_id IS NOT NULL"
+# Re-processing and manual decisions keep the stage/level recorded when the user was first processed.
+_KEEP_PRE_DECISION_STATE = """
+                    pre_decision_stage_id = CASE
+                        WHEN comprehensive_processing_statuses.pre_decision_recorded
+                            THEN comprehensive_processing_statuses.pre_decision_stage_id
+                        ELSE EXCLUDED.pre_decision_stage_id
+                    END,
+                    pre_decision_level = CASE
+                        WHEN comprehensive_processing_statuses.pre_decision_recorded
+                            THEN comprehensive_processing_statuses.pre_decision_level
+                        ELSE EXCLUDED.pre_decision_level
+                    END,
+                    pre_decision_recorded = comprehensive_processing_statuses.pre_decision_recorded
+                        OR EXCLUDED.pre_decision_recorded,"""
+
+PreDecisionState = Tuple[Optional[UUID], Optional[int]]
+# (assignment count, assignments updated_at, ruleset count, rulesets updated_at)
+SettingsFingerprint = Tuple[int, Optional[datetime], int, Optional[datetime]]
+
+
 class ComprehensiveEvaluationRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    @timed_query("list_rows")
     async def list_rows(
         self,
         *,
@@ -22,9 +51,11 @@ class ComprehensiveEvaluationRepository:
         search: Optional[str],
         processing_status: Optional[str],
         page: int,
-        limit: int,
+        limit: Optional[int],
+        user_ids: Optional[Sequence[UUID]] = None,
     ) -> Tuple[List[Dict[str, Any]], int]:
-        offset = (page - 1) * limit
+        # limit=None returns every matching row (LIMIT NULL), used by bulk processing.
+        offset = (page - 1) * limit if limit else 0
         search_value = search.strip().lower() if search else None
         search_like = f"%{search_value}%" if search_value else None
 
@@ -56,6 +87,7 @@ class ComprehensiveEvaluationRepository:
                 LEFT JOIN stages s ON s.id = u.stage_id
                 WHERE u.clerk_organization_id = :org_id
                   AND (CAST(:user_id AS uuid) IS NULL OR u.id = CAST(:user_id AS uuid))
+                  AND (CAST(:user_ids AS uuid[]) IS NULL OR u.id = ANY(CAST(:user_ids AS uuid[])))
                   AND (CAST(:department_id AS uuid) IS NULL OR u.department_id = CAST(:department_id AS uuid))
                   AND (CAST(:stage_id AS uuid) IS NULL OR u.stage_id = CAST(:stage_id AS uuid))
                   AND (
@@ -140,12 +172,7 @@ class ComprehensiveEvaluationRepository:
                     )::numeric AS performance_raw_score,
                     SUM(
                         (gf.weight / 5.0) *
-                        CASE gf.supervisor_rating_code
-                            WHEN 'SS' THEN 5.0 WHEN 'S' THEN 4.0
-                            WHEN 'A'  THEN 3.0 WHEN 'B' THEN 2.0
-                            WHEN 'C'  THEN 1.0 WHEN 'D' THEN 0.0
-                            ELSE 0.0
-                        END
+                        rating_code_mbo_points(gf.supervisor_rating_code)
                     )
                         FILTER (
                             WHERE gf.goal_category = '業績目標'
@@ -168,14 +195,7 @@ class ComprehensiveEvaluationRepository:
                     (
                         SELECT AVG(source_avg) FROM (
                             -- Supervisor evaluation
-                            SELECT AVG(
-                                CASE j.value
-                                    WHEN 'SS' THEN 7.0 WHEN 'S' THEN 6.0
-                                    WHEN 'A+' THEN 5.0 WHEN 'A' THEN 4.0
-                                    WHEN 'A-' THEN 3.0 WHEN 'B' THEN 2.0
-                                    WHEN 'C' THEN 1.0
-                                END
-                            ) AS source_avg
+                            SELECT AVG(rating_code_value(j.value)) AS source_avg
                             FROM core_value_evaluations cve_sup
                             JOIN core_value_feedback cvf
                               ON cvf.core_value_evaluation_id = cve_sup.id
@@ -188,14 +208,7 @@ class ComprehensiveEvaluationRepository:
                             UNION ALL
 
                             -- Peer evaluations (each peer = separate row)
-                            SELECT AVG(
-                                CASE j.value
-                                    WHEN 'SS' THEN 7.0 WHEN 'S' THEN 6.0
-                                    WHEN 'A+' THEN 5.0 WHEN 'A' THEN 4.0
-                                    WHEN 'A-' THEN 3.0 WHEN 'B' THEN 2.0
-                                    WHEN 'C' THEN 1.0
-                                END
-                            ) AS source_avg
+                            SELECT AVG(rating_code_value(j.value)) AS source_avg
                             FROM peer_review_assignments pra
                             JOIN peer_review_evaluations pre
                               ON pre.assignment_id = pra.id
@@ -227,7 +240,9 @@ class ComprehensiveEvaluationRepository:
                     a.employee_code,
                     a.name,
                     a.department_id,
-                    a.stage_id,
+                    -- Processed users report the stage/level the period's decision started from;
+                    -- the users row already carries the applied values.
+                    CASE WHEN cps.pre_decision_recorded THEN cps.pre_decision_stage_id ELSE a.stage_id END AS stage_id,
                     a.department_name,
                     a.employment_type,
                     CASE
@@ -244,8 +259,8 @@ class ComprehensiveEvaluationRepository:
                     ROUND(a.competency_raw_score, 2)::numeric AS competency_raw_score,
                     ROUND(a.core_value_score, 2)::numeric AS core_value_score,
                     ROUND(a.core_value_raw_score, 2)::numeric AS core_value_raw_score,
-                    a.current_stage,
-                    a.current_level,
+                    CASE WHEN cps.pre_decision_recorded THEN pds.name ELSE a.current_stage END AS current_stage,
+                    CASE WHEN cps.pre_decision_recorded THEN cps.pre_decision_level ELSE a.current_level END AS current_level,
                     md.decision AS manual_decision,
                     md.stage_after AS manual_stage_after,
                     md.level_after AS manual_level_after,
@@ -258,6 +273,8 @@ class ComprehensiveEvaluationRepository:
                   ON cps.organization_id = :org_id
                  AND cps.period_id = :period_id
                  AND cps.user_id = a.user_id
+                LEFT JOIN stages pds
+                  ON pds.id = cps.pre_decision_stage_id
                 LEFT JOIN comprehensive_manual_decisions md
                   ON md.organization_id = :org_id
                  AND md.period_id = :period_id
@@ -304,6 +321,7 @@ class ComprehensiveEvaluationRepository:
             "org_id": org_id,
             "period_id": period_id,
             "user_id": user_id,
+            "user_ids": list(user_ids) if user_ids else None,
             "department_id": department_id,
             "stage_id": stage_id,
             "employment_type": employment_type,
@@ -561,6 +579,7 @@ class ComprehensiveEvaluationRepository:
         )
         return bool(result.rowcount)
 
+    @timed_query("list_period_assignments")
     async def list_period_assignments(self, *, org_id: str, period_id: UUID) -> List[Dict[str, Any]]:
         result = await self.session.execute(
             text(
@@ -598,6 +617,49 @@ class ComprehensiveEvaluationRepository:
         )
         return [self._normalize_record(dict(row._mapping)) for row in result.fetchall()]
 
+    @timed_query("get_period_settings_fingerprint")
+    async def get_period_settings_fingerprint(self, *, org_id: str, period_id: UUID) -> SettingsFingerprint:
+        """
+        (count, latest updated_at) of the period's assignments and of the org's rulesets.
+
+        Every assignment/ruleset write sets updated_at and deletes change the counts, so the
+        tuple moves with any change the period settings are built from (rulesets feed the
+        fallback default) and every worker reads it from the same source.
+        """
+        result = await self.session.execute(
+            text(
+                """
+                SELECT
+                    (
+                        SELECT COUNT(*)
+                        FROM comprehensive_ruleset_assignments
+                        WHERE organization_id = :organization_id
+                          AND period_id = :period_id
+                    ) AS assignment_count,
+                    (
+                        SELECT MAX(updated_at)
+                        FROM comprehensive_ruleset_assignments
+                        WHERE organization_id = :organization_id
+                          AND period_id = :period_id
+                    ) AS assignments_updated_at,
+                    (
+                        SELECT COUNT(*)
+                        FROM comprehensive_rulesets
+                        WHERE organization_id = :organization_id
+                    ) AS ruleset_count,
+                    (
+                        SELECT MAX(updated_at)
+                        FROM comprehensive_rulesets
+                        WHERE organization_id = :organization_id
+                    ) AS rulesets_updated_at
+                """
+            ),
+            {"organization_id": org_id, "period_id": period_id},
+        )
+        assignment_count, assignments_updated_at, ruleset_count, rulesets_updated_at = result.one()
+        return int(assignment_count or 0), assignments_updated_at, int(ruleset_count or 0), rulesets_updated_at
+
+    @timed_query("get_assignment")
     async def get_assignment(
         self,
         *,
@@ -760,50 +822,88 @@ class ComprehensiveEvaluationRepository:
         settings_json: Dict[str, Any],
         source_ruleset_id: Optional[UUID],
         source_ruleset_name_snapshot: Optional[str],
+        audit: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        now = datetime.now(timezone.utc)
-        settings_payload = json.dumps(settings_json)
+        return await self._upsert_assignment(
+            conflict_target=_DEFAULT_ASSIGNMENT_CONFLICT,
+            org_id=org_id,
+            period_id=period_id,
+            department_id=None,
+            stage_id=None,
+            settings_json=settings_json,
+            source_ruleset_id=source_ruleset_id,
+            source_ruleset_name_snapshot=source_ruleset_name_snapshot,
+            audit=audit,
+        )
 
-        update_result = await self.session.execute(
-            text(
-                """
-                UPDATE comprehensive_ruleset_assignments
-                SET settings_json = CAST(:settings_json AS jsonb),
-                    source_ruleset_id = :source_ruleset_id,
-                    source_ruleset_name_snapshot = :source_ruleset_name_snapshot,
-                    updated_at = :updated_at
-                WHERE organization_id = :organization_id
-                  AND period_id = :period_id
-                  AND department_id IS NULL
-                  AND stage_id IS NULL
-                RETURNING
-                    id,
-                    period_id,
-                    department_id,
-                    stage_id,
-                    settings_json,
-                    source_ruleset_id,
-                    source_ruleset_name_snapshot,
-                    created_at,
-                    updated_at
-                """
-            ),
-            {
-                "organization_id": org_id,
-                "period_id": period_id,
-                "settings_json": settings_payload,
-                "source_ruleset_id": source_ruleset_id,
-                "source_ruleset_name_snapshot": source_ruleset_name_snapshot,
-                "updated_at": now,
-            },
+    async def upsert_department_assignment(
+        self,
+        *,
+        org_id: str,
+        period_id: UUID,
+        department_id: UUID,
+        settings_json: Dict[str, Any],
+        source_ruleset_id: Optional[UUID],
+        source_ruleset_name_snapshot: Optional[str],
+        audit: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        return await self._upsert_assignment(
+            conflict_target=_DEPARTMENT_ASSIGNMENT_CONFLICT,
+            org_id=org_id,
+            period_id=period_id,
+            department_id=department_id,
+            stage_id=None,
+            settings_json=settings_json,
+            source_ruleset_id=source_ruleset_id,
+            source_ruleset_name_snapshot=source_ruleset_name_snapshot,
+            audit=audit,
         )
-        row = update_result.fetchone()
-        if row is not None:
-            return self._normalize_record(dict(row._mapping))
 
-        insert_result = await self.session.execute(
-            text(
-                """
+    async def upsert_stage_assignment(
+        self,
+        *,
+        org_id: str,
+        period_id: UUID,
+        stage_id: UUID,
+        settings_json: Dict[str, Any],
+        source_ruleset_id: Optional[UUID],
+        source_ruleset_name_snapshot: Optional[str],
+        audit: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        return await self._upsert_assignment(
+            conflict_target=_STAGE_ASSIGNMENT_CONFLICT,
+            org_id=org_id,
+            period_id=period_id,
+            department_id=None,
+            stage_id=stage_id,
+            settings_json=settings_json,
+            source_ruleset_id=source_ruleset_id,
+            source_ruleset_name_snapshot=source_ruleset_name_snapshot,
+            audit=audit,
+        )
+
+    async def _upsert_assignment(
+        self,
+        *,
+        conflict_target: str,
+        org_id: str,
+        period_id: UUID,
+        department_id: Optional[UUID],
+        stage_id: Optional[UUID],
+        settings_json: Dict[str, Any],
+        source_ruleset_id: Optional[UUID],
+        source_ruleset_name_snapshot: Optional[str],
+        audit: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Insert or update one assignment in a single statement.
+
+        audit ({"actor_user_id", "action", "before_json"}) writes the settings audit entry in the
+        same statement; its after_json, period/department/stage and ruleset come from the stored row.
+        """
+        now = datetime.now(timezone.utc)
+        statement = (
+            """
+            WITH upserted AS (
                 INSERT INTO comprehensive_ruleset_assignments (
                     id,
                     organization_id,
@@ -819,14 +919,22 @@ class ComprehensiveEvaluationRepository:
                     gen_random_uuid(),
                     :organization_id,
                     :period_id,
-                    NULL,
-                    NULL,
+                    :department_id,
+                    :stage_id,
                     CAST(:settings_json AS jsonb),
                     :source_ruleset_id,
                     :source_ruleset_name_snapshot,
                     :created_at,
                     :updated_at
                 )
+                ON CONFLICT """
+            + conflict_target
+            + """
+                DO UPDATE SET
+                    settings_json = EXCLUDED.settings_json,
+                    source_ruleset_id = EXCLUDED.source_ruleset_id,
+                    source_ruleset_name_snapshot = EXCLUDED.source_ruleset_name_snapshot,
+                    updated_at = EXCLUDED.updated_at
                 RETURNING
                     id,
                     period_id,
@@ -837,279 +945,113 @@ class ComprehensiveEvaluationRepository:
                     source_ruleset_name_snapshot,
                     created_at,
                     updated_at
-                """
-            ),
-            {
-                "organization_id": org_id,
-                "period_id": period_id,
-                "settings_json": settings_payload,
-                "source_ruleset_id": source_ruleset_id,
-                "source_ruleset_name_snapshot": source_ruleset_name_snapshot,
-                "created_at": now,
-                "updated_at": now,
-            },
+            )
+            """
         )
-        row = insert_result.fetchone()
+        params: Dict[str, Any] = {
+            "organization_id": org_id,
+            "period_id": period_id,
+            "department_id": department_id,
+            "stage_id": stage_id,
+            "settings_json": json.dumps(settings_json),
+            "source_ruleset_id": source_ruleset_id,
+            "source_ruleset_name_snapshot": source_ruleset_name_snapshot,
+            "created_at": now,
+            "updated_at": now,
+        }
+        if audit is not None:
+            statement += """
+            , audit AS (
+                INSERT INTO comprehensive_settings_audit_log (
+                    id,
+                    organization_id,
+                    actor_user_id,
+                    action,
+                    period_id,
+                    department_id,
+                    stage_id,
+                    ruleset_id,
+                    before_json,
+                    after_json,
+                    changed_at
+                )
+                SELECT
+                    gen_random_uuid(),
+                    :organization_id,
+                    :audit_actor_user_id,
+                    :audit_action,
+                    upserted.period_id,
+                    upserted.department_id,
+                    upserted.stage_id,
+                    upserted.source_ruleset_id,
+                    CAST(:audit_before_json AS jsonb),
+                    upserted.settings_json,
+                    :updated_at
+                FROM upserted
+            )
+            """
+            params.update(self._settings_audit_params(audit))
+        statement += """
+            SELECT * FROM upserted
+            """
+
+        result = await self.session.execute(text(statement), params)
+        row = result.fetchone()
         return self._normalize_record(dict(row._mapping))
 
-    async def upsert_department_assignment(
+    async def delete_department_assignment(
         self,
         *,
         org_id: str,
         period_id: UUID,
         department_id: UUID,
-        settings_json: Dict[str, Any],
-        source_ruleset_id: Optional[UUID],
-        source_ruleset_name_snapshot: Optional[str],
-    ) -> Dict[str, Any]:
-        now = datetime.now(timezone.utc)
-        settings_payload = json.dumps(settings_json)
-
-        update_result = await self.session.execute(
+    ) -> bool:
+        result = await self.session.execute(
             text(
                 """
-                UPDATE comprehensive_ruleset_assignments
-                SET settings_json = CAST(:settings_json AS jsonb),
-                    source_ruleset_id = :source_ruleset_id,
-                    source_ruleset_name_snapshot = :source_ruleset_name_snapshot,
-                    updated_at = :updated_at
+                DELETE FROM comprehensive_ruleset_assignments
                 WHERE organization_id = :organization_id
                   AND period_id = :period_id
                   AND department_id = :department_id
                   AND stage_id IS NULL
-                RETURNING
-                    id,
-                    period_id,
-                    department_id,
-                    stage_id,
-                    settings_json,
-                    source_ruleset_id,
-                    source_ruleset_name_snapshot,
-                    created_at,
-                    updated_at
-                """
-            ),
-            {
-                "organization_id": org_id,
-                "period_id": period_id,
-                "department_id": department_id,
-                "settings_json": settings_payload,
-                "source_ruleset_id": source_ruleset_id,
-                "source_ruleset_name_snapshot": source_ruleset_name_snapshot,
-                "updated_at": now,
-            },
-        )
-        row = update_result.fetchone()
-        if row is not None:
-            return self._normalize_record(dict(row._mapping))
-
-        insert_result = await self.session.execute(
-            text(
-                """
-                INSERT INTO comprehensive_ruleset_assignments (
-                    id,
-                    organization_id,
-                    period_id,
-                    department_id,
-                    stage_id,
-                    settings_json,
-                    source_ruleset_id,
-                    source_ruleset_name_snapshot,
-                    created_at,
-                    updated_at
-                ) VALUES (
-                    gen_random_uuid(),
-                    :organization_id,
-                    :period_id,
-                    :department_id,
-                    NULL,
-                    CAST(:settings_json AS jsonb),
-                    :source_ruleset_id,
-                    :source_ruleset_name_snapshot,
-                    :created_at,
-                    :updated_at
-                )
-                RETURNING
-                    id,
-                    period_id,
-                    department_id,
-                    stage_id,
-                    settings_json,
-                    source_ruleset_id,
-                    source_ruleset_name_snapshot,
-                    created_at,
-                    updated_at
                 """
             ),
             {
                 "organization_id": org_id,
                 "period_id": period_id,
                 "department_id": department_id,
-                "settings_json": settings_payload,
-                "source_ruleset_id": source_ruleset_id,
-                "source_ruleset_name_snapshot": source_ruleset_name_snapshot,
-                "created_at": now,
-                "updated_at": now,
             },
         )
-        row = insert_result.fetchone()
-        return self._normalize_record(dict(row._mapping))
+        return bool(result.rowcount)
 
-    async def upsert_stage_assignment(
+    async def delete_stage_assignment(
         self,
         *,
         org_id: str,
         period_id: UUID,
         stage_id: UUID,
-        settings_json: Dict[str, Any],
-        source_ruleset_id: Optional[UUID],
-        source_ruleset_name_snapshot: Optional[str],
-    ) -> Dict[str, Any]:
-        now = datetime.now(timezone.utc)
-        settings_payload = json.dumps(settings_json)
-
-        update_result = await self.session.execute(
+    ) -> bool:
+        result = await self.session.execute(
             text(
                 """
-                UPDATE comprehensive_ruleset_assignments
-                SET settings_json = CAST(:settings_json AS jsonb),
-                    source_ruleset_id = :source_ruleset_id,
-                    source_ruleset_name_snapshot = :source_ruleset_name_snapshot,
-                    updated_at = :updated_at
+                DELETE FROM comprehensive_ruleset_assignments
                 WHERE organization_id = :organization_id
                   AND period_id = :period_id
                   AND department_id IS NULL
                   AND stage_id = :stage_id
-                RETURNING
-                    id,
-                    period_id,
-                    department_id,
-                    stage_id,
-                    settings_json,
-                    source_ruleset_id,
-                    source_ruleset_name_snapshot,
-                    created_at,
-                    updated_at
                 """
             ),
             {
                 "organization_id": org_id,
                 "period_id": period_id,
                 "stage_id": stage_id,
-                "settings_json": settings_payload,
-                "source_ruleset_id": source_ruleset_id,
-                "source_ruleset_name_snapshot": source_ruleset_name_snapshot,
-                "updated_at": now,
             },
         )
-        row = update_result.fetchone()
-        if row is not None:
-            return self._normalize_record(dict(row._mapping))
+        return bool(result.rowcount)
 
-        insert_result = await self.session.execute(
-            text(
-                """
-                INSERT INTO comprehensive_ruleset_assignments (
-                    id,
-                    organization_id,
-                    period_id,
-                    department_id,
-                    stage_id,
-                    settings_json,
-                    source_ruleset_id,
-                    source_ruleset_name_snapshot,
-                    created_at,
-                    updated_at
-                ) VALUES (
-                    gen_random_uuid(),
-                    :organization_id,
-                    :period_id,
-                    NULL,
-                    :stage_id,
-                    CAST(:settings_json AS jsonb),
-                    :source_ruleset_id,
-                    :source_ruleset_name_snapshot,
-                    :created_at,
-                    :updated_at
-                )
-                RETURNING
-                    id,
-                    period_id,
-                    department_id,
-                    stage_id,
-                    settings_json,
-                    source_ruleset_id,
-                    source_ruleset_name_snapshot,
-                    created_at,
-                    updated_at
-                """
-            ),
-            {
-                "organization_id": org_id,
-                "period_id": period_id,
-                "stage_id": stage_id,
-                "settings_json": settings_payload,
-                "source_ruleset_id": source_ruleset_id,
-                "source_ruleset_name_snapshot": source_ruleset_name_snapshot,
-                "created_at": now,
-                "updated_at": now,
-            },
-        )
-        row = insert_result.fetchone()
-        return self._normalize_record(dict(row._mapping))
-
-    async def delete_department_assignment(
-        self,
-        *,
-        org_id: str,
-        period_id: UUID,
-        department_id: UUID,
-    ) -> bool:
-        result = await self.session.execute(
-            text(
-                """
-                DELETE FROM comprehensive_ruleset_assignments
-                WHERE organization_id = :organization_id
-                  AND period_id = :period_id
-                  AND department_id = :department_id
-                  AND stage_id IS NULL
-                """
-            ),
-            {
-                "organization_id": org_id,
-                "period_id": period_id,
-                "department_id": department_id,
-            },
-        )
-        return bool(result.rowcount)
-
-    async def delete_stage_assignment(
-        self,
-        *,
-        org_id: str,
-        period_id: UUID,
-        stage_id: UUID,
-    ) -> bool:
-        result = await self.session.execute(
-            text(
-                """
-                DELETE FROM comprehensive_ruleset_assignments
-                WHERE organization_id = :organization_id
-                  AND period_id = :period_id
-                  AND department_id IS NULL
-                  AND stage_id = :stage_id
-                """
-            ),
-            {
-                "organization_id": org_id,
-                "period_id": period_id,
-                "stage_id": stage_id,
-            },
-        )
-        return bool(result.rowcount)
-
-    async def get_settings_rules(self, org_id: str) -> Dict[str, List[Dict[str, Any]]]:
-        overall_result = await self.session.execute(
+    @timed_query("get_settings_rules")
+    async def get_settings_rules(self, org_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        overall_result = await self.session.execute(
             text(
                 """
                 SELECT
@@ -1163,144 +1105,263 @@ class ComprehensiveEvaluationRepository:
         overall_rules: Sequence[Dict[str, Any]],
         promotion_groups: Sequence[Dict[str, Any]],
         demotion_groups: Sequence[Dict[str, Any]],
-    ) -> None:
-        await self.session.execute(
-            text("DELETE FROM comprehensive_decision_rules WHERE organization_id = :org_id"),
-            {"org_id": org_id},
-        )
-        await self.session.execute(
-            text("DELETE FROM comprehensive_decision_rule_groups WHERE organization_id = :org_id"),
-            {"org_id": org_id},
-        )
-        await self.session.execute(
-            text("DELETE FROM comprehensive_overall_rank_rules WHERE organization_id = :org_id"),
-            {"org_id": org_id},
-        )
-
-        now = datetime.now(timezone.utc)
+        audit: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Bring the stored rules in line with the given ones in a single statement.
+
+        Rows are matched on their natural keys (overall_rank, (decision_type, display_order),
+        (group, condition_order)); only rows that are new, changed or gone are written, with
+        multi-row inserts/updates. audit ({"actor_user_id", "action", "before_json", "after_json"})
+        is written in the same statement when anything changed. Returns the number of rows changed.
+        """
+        groups = [("promotion", group) for group in promotion_groups] + [
+            ("demotion", group) for group in demotion_groups
+        ]
+        conditions = [
+            (decision_type, group["display_order"], condition)
+            for decision_type, group in groups
+            for condition in group["conditions"]
+        ]
+        params: Dict[str, Any] = {
+            "organization_id": org_id,
+            "overall_ranks": [item["overall_rank"] for item in overall_rules],
+            "min_scores": [item["min_score"] for item in overall_rules],
+            "max_scores": [item["max_score"] for item in overall_rules],
+            "level_deltas": [item["level_delta"] for item in overall_rules],
+            "overall_orders": [item["display_order"] for item in overall_rules],
+            "group_types": [decision_type for decision_type, _ in groups],
+            "group_orders": [group["display_order"] for _, group in groups],
+            "group_names": [group.get("group_name") for _, group in groups],
+            "condition_types": [decision_type for decision_type, _, _ in conditions],
+            "condition_group_orders": [group_order for _, group_order, _ in conditions],
+            "condition_orders": [condition["condition_order"] for _, _, condition in conditions],
+            "field_names": [condition["field_name"] for _, _, condition in conditions],
+            "operators": [condition["operator"] for _, _, condition in conditions],
+            "threshold_ranks": [condition["threshold_rank"] for _, _, condition in conditions],
+            "now": datetime.now(timezone.utc),
+        }
 
-        for item in overall_rules:
-            await self.session.execute(
-                text(
-                    """
-                    INSERT INTO comprehensive_overall_rank_rules (
-                        id,
-                        organization_id,
-                        overall_rank,
-                        min_score,
-                        max_score,
-                        level_delta,
-                        display_order,
-                        is_active,
-                        created_at,
-                        updated_at
-                    ) VALUES (
-                        gen_random_uuid(),
-                        :organization_id,
-                        :overall_rank,
-                        :min_score,
-                        :max_score,
-                        :level_delta,
-                        :display_order,
-                        TRUE,
-                        :created_at,
-                        :updated_at
-                    )
-                    """
-                ),
-                {
-                    "organization_id": org_id,
-                    "overall_rank": item["overall_rank"],
-                    "min_score": item["min_score"],
-                    "max_score": item["max_score"],
-                    "level_delta": item["level_delta"],
-                    "display_order": item["display_order"],
-                    "created_at": now,
-                    "updated_at": now,
-                },
+        statement = """
+            WITH incoming_overall AS (
+                SELECT *
+                FROM unnest(
+                    CAST(:overall_ranks AS text[]),
+                    CAST(:min_scores AS numeric[]),
+                    CAST(:max_scores AS numeric[]),
+                    CAST(:level_deltas AS integer[]),
+                    CAST(:overall_orders AS integer[])
+                ) AS incoming(overall_rank, min_score, max_score, level_delta, display_order)
+            ),
+            deleted_overall AS (
+                DELETE FROM comprehensive_overall_rank_rules stored
+                WHERE stored.organization_id = :organization_id
+                  AND NOT EXISTS (
+                      SELECT 1 FROM incoming_overall incoming
+                      WHERE incoming.overall_rank = stored.overall_rank
+                  )
+                RETURNING 1
+            ),
+            upserted_overall AS (
+                INSERT INTO comprehensive_overall_rank_rules AS stored (
+                    id,
+                    organization_id,
+                    overall_rank,
+                    min_score,
+                    max_score,
+                    level_delta,
+                    display_order,
+                    is_active,
+                    created_at,
+                    updated_at
+                )
+                SELECT
+                    gen_random_uuid(),
+                    :organization_id,
+                    overall_rank,
+                    min_score,
+                    max_score,
+                    level_delta,
+                    display_order,
+                    TRUE,
+                    :now,
+                    :now
+                FROM incoming_overall
+                ON CONFLICT (organization_id, overall_rank)
+                DO UPDATE SET
+                    min_score = EXCLUDED.min_score,
+                    max_score = EXCLUDED.max_score,
+                    level_delta = EXCLUDED.level_delta,
+                    display_order = EXCLUDED.display_order,
+                    is_active = TRUE,
+                    updated_at = EXCLUDED.updated_at
+                WHERE (stored.min_score, stored.max_score, stored.level_delta, stored.display_order, stored.is_active)
+                    IS DISTINCT FROM (EXCLUDED.min_score, EXCLUDED.max_score, EXCLUDED.level_delta, EXCLUDED.display_order, TRUE)
+                RETURNING 1
+            ),
+            incoming_groups AS (
+                SELECT *
+                FROM unnest(
+                    CAST(:group_types AS text[]),
+                    CAST(:group_orders AS integer[]),
+                    CAST(:group_names AS text[])
+                ) AS incoming(decision_type, display_order, group_name)
+            ),
+            kept_groups AS (
+                SELECT stored.id, stored.decision_type, stored.display_order
+                FROM comprehensive_decision_rule_groups stored
+                JOIN incoming_groups incoming
+                  ON incoming.decision_type = stored.decision_type
+                 AND incoming.display_order = stored.display_order
+                WHERE stored.organization_id = :organization_id
+            ),
+            deleted_groups AS (
+                DELETE FROM comprehensive_decision_rule_groups stored
+                WHERE stored.organization_id = :organization_id
+                  AND NOT EXISTS (SELECT 1 FROM kept_groups kept WHERE kept.id = stored.id)
+                RETURNING 1
+            ),
+            upserted_groups AS (
+                INSERT INTO comprehensive_decision_rule_groups AS stored (
+                    id,
+                    organization_id,
+                    decision_type,
+                    group_name,
+                    display_order,
+                    is_active,
+                    created_at,
+                    updated_at
+                )
+                SELECT
+                    gen_random_uuid(),
+                    :organization_id,
+                    decision_type,
+                    group_name,
+                    display_order,
+                    TRUE,
+                    :now,
+                    :now
+                FROM incoming_groups
+                ON CONFLICT (organization_id, decision_type, display_order)
+                DO UPDATE SET
+                    group_name = EXCLUDED.group_name,
+                    is_active = TRUE,
+                    updated_at = EXCLUDED.updated_at
+                WHERE (stored.group_name, stored.is_active) IS DISTINCT FROM (EXCLUDED.group_name, TRUE)
+                RETURNING id, decision_type, display_order
+            ),
+            group_ids AS (
+                SELECT id, decision_type, display_order FROM kept_groups
+                UNION
+                SELECT id, decision_type, display_order FROM upserted_groups
+            ),
+            incoming_conditions AS (
+                SELECT
+                    group_ids.id AS group_id,
+                    incoming.condition_order,
+                    incoming.field_name,
+                    incoming.operator,
+                    incoming.threshold_rank
+                FROM unnest(
+                    CAST(:condition_types AS text[]),
+                    CAST(:condition_group_orders AS integer[]),
+                    CAST(:condition_orders AS integer[]),
+                    CAST(:field_names AS text[]),
+                    CAST(:operators AS text[]),
+                    CAST(:threshold_ranks AS text[])
+                ) AS incoming(decision_type, group_order, condition_order, field_name, operator, threshold_rank)
+                JOIN group_ids
+                  ON group_ids.decision_type = incoming.decision_type
+                 AND group_ids.display_order = incoming.group_order
+            ),
+            deleted_conditions AS (
+                DELETE FROM comprehensive_decision_rules stored
+                USING kept_groups kept
+                WHERE stored.organization_id = :organization_id
+                  AND stored.group_id = kept.id
+                  AND NOT EXISTS (
+                      SELECT 1 FROM incoming_conditions incoming
+                      WHERE incoming.group_id = stored.group_id
+                        AND incoming.condition_order = stored.condition_order
+                  )
+                RETURNING 1
+            ),
+            upserted_conditions AS (
+                INSERT INTO comprehensive_decision_rules AS stored (
+                    id,
+                    organization_id,
+                    group_id,
+                    condition_order,
+                    field_name,
+                    operator,
+                    threshold_rank,
+                    is_active,
+                    created_at,
+                    updated_at
+                )
+                SELECT
+                    gen_random_uuid(),
+                    :organization_id,
+                    group_id,
+                    condition_order,
+                    field_name,
+                    operator,
+                    threshold_rank,
+                    TRUE,
+                    :now,
+                    :now
+                FROM incoming_conditions
+                ON CONFLICT (group_id, condition_order)
+                DO UPDATE SET
+                    field_name = EXCLUDED.field_name,
+                    operator = EXCLUDED.operator,
+                    threshold_rank = EXCLUDED.threshold_rank,
+                    is_active = TRUE,
+                    updated_at = EXCLUDED.updated_at
+                WHERE (stored.field_name, stored.operator, stored.threshold_rank, stored.is_active)
+                    IS DISTINCT FROM (EXCLUDED.field_name, EXCLUDED.operator, EXCLUDED.threshold_rank, TRUE)
+                RETURNING 1
+            ),
+            changes AS (
+                SELECT
+                    (SELECT COUNT(*) FROM deleted_overall)
+                    + (SELECT COUNT(*) FROM upserted_overall)
+                    + (SELECT COUNT(*) FROM deleted_groups)
+                    + (SELECT COUNT(*) FROM upserted_groups)
+                    + (SELECT COUNT(*) FROM deleted_conditions)
+                    + (SELECT COUNT(*) FROM upserted_conditions) AS changed_count
             )
-
-        async def _insert_groups(groups: Sequence[Dict[str, Any]], decision_type: str) -> None:
-            for group in groups:
-                group_result = await self.session.execute(
-                    text(
-                        """
-                        INSERT INTO comprehensive_decision_rule_groups (
-                            id,
-                            organization_id,
-                            decision_type,
-                            group_name,
-                            display_order,
-                            is_active,
-                            created_at,
-                            updated_at
-                        ) VALUES (
-                            gen_random_uuid(),
-                            :organization_id,
-                            :decision_type,
-                            :group_name,
-                            :display_order,
-                            TRUE,
-                            :created_at,
-                            :updated_at
-                        )
-                        RETURNING id
-                        """
-                    ),
-                    {
-                        "organization_id": org_id,
-                        "decision_type": decision_type,
-                        "group_name": group.get("group_name"),
-                        "display_order": group["display_order"],
-                        "created_at": now,
-                        "updated_at": now,
-                    },
+            """
+        if audit is not None:
+            statement += """
+            , audit AS (
+                INSERT INTO comprehensive_settings_audit_log (
+                    id,
+                    organization_id,
+                    actor_user_id,
+                    action,
+                    before_json,
+                    after_json,
+                    changed_at
                 )
-                group_id = group_result.scalar_one()
-
-                for condition in group["conditions"]:
-                    await self.session.execute(
-                        text(
-                            """
-                            INSERT INTO comprehensive_decision_rules (
-                                id,
-                                organization_id,
-                                group_id,
-                                condition_order,
-                                field_name,
-                                operator,
-                                threshold_rank,
-                                is_active,
-                                created_at,
-                                updated_at
-                            ) VALUES (
-                                gen_random_uuid(),
-                                :organization_id,
-                                :group_id,
-                                :condition_order,
-                                :field_name,
-                                :operator,
-                                :threshold_rank,
-                                TRUE,
-                                :created_at,
-                                :updated_at
-                            )
-                            """
-                        ),
-                        {
-                            "organization_id": org_id,
-                            "group_id": group_id,
-                            "condition_order": condition["condition_order"],
-                            "field_name": condition["field_name"],
-                            "operator": condition["operator"],
-                            "threshold_rank": condition["threshold_rank"],
-                            "created_at": now,
-                            "updated_at": now,
-                        },
-                    )
+                SELECT
+                    gen_random_uuid(),
+                    :organization_id,
+                    :audit_actor_user_id,
+                    :audit_action,
+                    CAST(:audit_before_json AS jsonb),
+                    CAST(:audit_after_json AS jsonb),
+                    :now
+                FROM changes
+                WHERE changed_count > 0
+            )
+            """
+            params.update(self._settings_audit_params(audit))
+        statement += """
+            SELECT changed_count FROM changes
+            """
 
-        await _insert_groups(promotion_groups, "promotion")
-        await _insert_groups(demotion_groups, "demotion")
+        result = await self.session.execute(text(statement), params)
+        return int(result.scalar_one())
 
     async def insert_settings_audit(
         self,
@@ -1362,6 +1423,7 @@ class ComprehensiveEvaluationRepository:
             },
         )
 
+    @timed_query("get_user_employment_profile")
     async def get_user_employment_profile(self, *, org_id: str, user_id: UUID) -> Optional[Dict[str, Any]]:
         result = await self.session.execute(
             text(
@@ -1399,11 +1461,14 @@ class ComprehensiveEvaluationRepository:
         period_id: UUID,
         user_id: UUID,
         processed_by_user_id: UUID,
+        pre_decision: Optional[PreDecisionState] = None,
     ) -> None:
+        """pre_decision is the user's (stage_id, level) before the period's decision was applied."""
         now = datetime.now(timezone.utc)
+        pre_decision_stage_id, pre_decision_level = pre_decision or (None, None)
         await self.session.execute(
             text(
-                """
+                f"""
                 INSERT INTO comprehensive_processing_statuses (
                     id,
                     organization_id,
@@ -1411,6 +1476,9 @@ class ComprehensiveEvaluationRepository:
                     user_id,
                     processed_by_user_id,
                     processed_at,
+                    pre_decision_stage_id,
+                    pre_decision_level,
+                    pre_decision_recorded,
                     created_at,
                     updated_at
                 ) VALUES (
@@ -1420,11 +1488,14 @@ class ComprehensiveEvaluationRepository:
                     :user_id,
                     :processed_by_user_id,
                     :processed_at,
+                    :pre_decision_stage_id,
+                    :pre_decision_level,
+                    :pre_decision_recorded,
                     :created_at,
                     :updated_at
                 )
                 ON CONFLICT (organization_id, period_id, user_id)
-                DO UPDATE SET
+                DO UPDATE SET{_KEEP_PRE_DECISION_STATE}
                     processed_by_user_id = EXCLUDED.processed_by_user_id,
                     processed_at = EXCLUDED.processed_at,
                     updated_at = EXCLUDED.updated_at
@@ -1435,11 +1506,90 @@ class ComprehensiveEvaluationRepository:
                 "period_id": period_id,
                 "user_id": user_id,
                 "processed_by_user_id": processed_by_user_id,
+                "pre_decision_stage_id": pre_decision_stage_id,
+                "pre_decision_level": pre_decision_level,
+                "pre_decision_recorded": pre_decision is not None,
+                "processed_at": now,
+                "created_at": now,
+                "updated_at": now,
+            },
+        )
+
+    async def upsert_processing_statuses(
+        self,
+        *,
+        org_id: str,
+        period_id: UUID,
+        user_ids: Sequence[UUID],
+        processed_by_user_id: UUID,
+        pre_decision: Optional[Mapping[UUID, PreDecisionState]] = None,
+    ) -> int:
+        """
+        Multi-row upsert_processing_status: mark every user in user_ids processed in one statement.
+
+        pre_decision maps user ids to their (stage_id, level) before the decision was applied;
+        users missing from it are marked processed without a recorded pre-decision state.
+        """
+        if not user_ids:
+            return 0
+        now = datetime.now(timezone.utc)
+        unique_user_ids = list(dict.fromkeys(user_ids))
+        pre_decision = pre_decision or {}
+        result = await self.session.execute(
+            text(
+                f"""
+                INSERT INTO comprehensive_processing_statuses (
+                    id,
+                    organization_id,
+                    period_id,
+                    user_id,
+                    processed_by_user_id,
+                    processed_at,
+                    pre_decision_stage_id,
+                    pre_decision_level,
+                    pre_decision_recorded,
+                    created_at,
+                    updated_at
+                )
+                SELECT
+                    gen_random_uuid(),
+                    :organization_id,
+                    :period_id,
+                    target.user_id,
+                    :processed_by_user_id,
+                    :processed_at,
+                    target.stage_id,
+                    target.level,
+                    target.recorded,
+                    :created_at,
+                    :updated_at
+                FROM unnest(
+                    CAST(:user_ids AS uuid[]),
+                    CAST(:stage_ids AS uuid[]),
+                    CAST(:levels AS integer[]),
+                    CAST(:recorded AS boolean[])
+                ) AS target(user_id, stage_id, level, recorded)
+                ON CONFLICT (organization_id, period_id, user_id)
+                DO UPDATE SET{_KEEP_PRE_DECISION_STATE}
+                    processed_by_user_id = EXCLUDED.processed_by_user_id,
+                    processed_at = EXCLUDED.processed_at,
+                    updated_at = EXCLUDED.updated_at
+                """
+            ),
+            {
+                "organization_id": org_id,
+                "period_id": period_id,
+                "user_ids": unique_user_ids,
+                "stage_ids": [pre_decision.get(uid, (None, None))[0] for uid in unique_user_ids],
+                "levels": [pre_decision.get(uid, (None, None))[1] for uid in unique_user_ids],
+                "recorded": [uid in pre_decision for uid in unique_user_ids],
+                "processed_by_user_id": processed_by_user_id,
                 "processed_at": now,
                 "created_at": now,
                 "updated_at": now,
             },
         )
+        return result.rowcount
 
     async def clear_processing_status(
         self,
@@ -1581,6 +1731,7 @@ class ComprehensiveEvaluationRepository:
         row = result.fetchone()
         return dict(row._mapping)
 
+    @timed_query("get_manual_decision")
     async def get_manual_decision(
         self,
         *,
@@ -1764,6 +1915,339 @@ class ComprehensiveEvaluationRepository:
 
         return records, total
 
+    @timed_query("list_period_activity_counts")
+    async def list_period_activity_counts(
+        self,
+        *,
+        org_id: str,
+        period_id: UUID,
+        user_ids: Optional[Sequence[UUID]] = None,
+    ) -> Dict[UUID, Dict[str, int]]:
+        """Goals, submitted self assessments and received submitted feedback per user of the period."""
+        result = await self.session.execute(
+            text(
+                """
+                WITH goal_counts AS (
+                    SELECT user_id, COUNT(*)::integer AS goals_count
+                    FROM goals
+                    WHERE organization_id = :organization_id
+                      AND period_id = :period_id
+                      AND (CAST(:user_ids AS uuid[]) IS NULL OR user_id = ANY(CAST(:user_ids AS uuid[])))
+                    GROUP BY user_id
+                ),
+                assessment_counts AS (
+                    SELECT user_id, COUNT(*)::integer AS completed_assessments_count
+                    FROM self_assessments
+                    WHERE organization_id = :organization_id
+                      AND period_id = :period_id
+                      AND status = 'submitted'
+                      AND (CAST(:user_ids AS uuid[]) IS NULL OR user_id = ANY(CAST(:user_ids AS uuid[])))
+                    GROUP BY user_id
+                ),
+                feedback_counts AS (
+                    SELECT employee_id AS user_id, COUNT(*)::integer AS received_feedbacks_count
+                    FROM supervisor_feedback
+                    WHERE organization_id = :organization_id
+                      AND period_id = :period_id
+                      AND status = 'submitted'
+                      AND (CAST(:user_ids AS uuid[]) IS NULL OR employee_id = ANY(CAST(:user_ids AS uuid[])))
+                    GROUP BY employee_id
+                )
+                SELECT
+                    user_id,
+                    COALESCE(g.goals_count, 0) AS goals_count,
+                    COALESCE(a.completed_assessments_count, 0) AS completed_assessments_count,
+                    COALESCE(f.received_feedbacks_count, 0) AS received_feedbacks_count
+                FROM goal_counts g
+                FULL JOIN assessment_counts a USING (user_id)
+                FULL JOIN feedback_counts f USING (user_id)
+                """
+            ),
+            {
+                "organization_id": org_id,
+                "period_id": period_id,
+                "user_ids": list(user_ids) if user_ids else None,
+            },
+        )
+        counts: Dict[UUID, Dict[str, int]] = {}
+        for row in result.fetchall():
+            record = dict(row._mapping)
+            counts[record.pop("user_id")] = record
+        return counts
+
+    async def upsert_period_snapshots(
+        self,
+        *,
+        org_id: str,
+        period_id: UUID,
+        documents: Dict[UUID, Dict[str, Any]],
+        prune: bool = False,
+    ) -> int:
+        """Write one snapshot document per user; prune=True also drops users not in documents."""
+        if prune:
+            await self.session.execute(
+                text(
+                    """
+                    DELETE FROM comprehensive_period_snapshots
+                    WHERE organization_id = :organization_id
+                      AND period_id = :period_id
+                      AND NOT (user_id = ANY(CAST(:user_ids AS uuid[])))
+                    """
+                ),
+                {
+                    "organization_id": org_id,
+                    "period_id": period_id,
+                    "user_ids": list(documents),
+                },
+            )
+        if not documents:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        result = await self.session.execute(
+            text(
+                """
+                INSERT INTO comprehensive_period_snapshots (
+                    organization_id,
+                    period_id,
+                    user_id,
+                    document,
+                    created_at,
+                    updated_at
+                )
+                SELECT
+                    :organization_id,
+                    :period_id,
+                    target.user_id,
+                    CAST(target.document AS jsonb),
+                    :created_at,
+                    :updated_at
+                FROM unnest(CAST(:user_ids AS uuid[]), CAST(:documents AS text[])) AS target(user_id, document)
+                ON CONFLICT (organization_id, period_id, user_id)
+                DO UPDATE SET
+                    document = EXCLUDED.document,
+                    updated_at = EXCLUDED.updated_at
+                """
+            ),
+            {
+                "organization_id": org_id,
+                "period_id": period_id,
+                "user_ids": list(documents),
+                "documents": [json.dumps(document, ensure_ascii=False) for document in documents.values()],
+                "created_at": now,
+                "updated_at": now,
+            },
+        )
+        return result.rowcount
+
+    async def get_period_snapshot(
+        self,
+        *,
+        org_id: str,
+        period_id: UUID,
+        user_id: UUID,
+    ) -> Optional[Dict[str, Any]]:
+        result = await self.session.execute(
+            text(
+                """
+                SELECT document
+                FROM comprehensive_period_snapshots
+                WHERE organization_id = :organization_id
+                  AND period_id = :period_id
+                  AND user_id = :user_id
+                """
+            ),
+            {
+                "organization_id": org_id,
+                "period_id": period_id,
+                "user_id": user_id,
+            },
+        )
+        return self._normalize_json_document(result.scalar_one_or_none())
+
+    @timed_query("list_period_snapshots")
+    async def list_period_snapshots(
+        self,
+        *,
+        org_id: str,
+        period_ids: Sequence[UUID],
+        user_ids: Optional[Sequence[UUID]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Snapshot documents of the periods, in period_ids order then employee code."""
+        result = await self.session.execute(
+            text(
+                """
+                SELECT period_id, user_id, document
+                FROM comprehensive_period_snapshots
+                WHERE organization_id = :organization_id
+                  AND period_id = ANY(CAST(:period_ids AS uuid[]))
+                  AND (CAST(:user_ids AS uuid[]) IS NULL OR user_id = ANY(CAST(:user_ids AS uuid[])))
+                ORDER BY
+                    array_position(CAST(:period_ids AS uuid[]), period_id),
+                    document->'row'->>'employeeCode'
+                """
+            ),
+            {
+                "organization_id": org_id,
+                "period_ids": list(period_ids),
+                "user_ids": list(user_ids) if user_ids else None,
+            },
+        )
+        records = [dict(row._mapping) for row in result.fetchall()]
+        for record in records:
+            record["document"] = self._normalize_json_document(record["document"])
+        return records
+
+    @timed_query("refresh_period_facts")
+    async def refresh_period_facts(self, *, org_id: str, period_id: UUID) -> int:
+        """
+        Re-aggregate comprehensive_period_facts of the period from its snapshots (one row per department/stage).
+
+        The stage is the snapshot's currentStage: the stage the user was evaluated in, recorded
+        before the period's promotion/demotion was applied (see upsert_processing_status).
+        """
+        params = {"organization_id": org_id, "period_id": period_id}
+        await self.session.execute(
+            text(
+                """
+                DELETE FROM comprehensive_period_facts
+                WHERE organization_id = :organization_id
+                  AND period_id = :period_id
+                """
+            ),
+            params,
+        )
+        result = await self.session.execute(
+            text(
+                """
+                WITH snapshot_rows AS (
+                    SELECT
+                        s.document->'row'->>'departmentName' AS department_name,
+                        s.document->'row'->>'currentStage' AS stage_name,
+                        s.document->'row'->>'processingStatus' AS processing_status,
+                        s.document->'row'->'applied'->>'overallRank' AS overall_rank,
+                        s.document->'row'->'applied'->>'decision' AS decision,
+                        CAST(s.document->'row'->>'performanceScore' AS REAL) AS performance_score,
+                        CAST(s.document->'row'->'applied'->>'totalScore' AS REAL) AS total_score,
+                        CAST(s.document->'activity'->>'goalsCount' AS INTEGER) AS goals_count,
+                        CAST(s.document->'activity'->>'completedAssessmentsCount' AS INTEGER)
+                            AS completed_assessments_count,
+                        CAST(s.document->'activity'->>'receivedFeedbacksCount' AS INTEGER) AS received_feedbacks_count
+                    FROM comprehensive_period_snapshots s
+                    WHERE s.organization_id = :organization_id
+                      AND s.period_id = :period_id
+                ),
+                rank_counts AS (
+                    SELECT department_name, stage_name, jsonb_object_agg(overall_rank, rank_count) AS rank_counts
+                    FROM (
+                        SELECT department_name, stage_name, overall_rank, COUNT(*) AS rank_count
+                        FROM snapshot_rows
+                        WHERE overall_rank IS NOT NULL
+                        GROUP BY department_name, stage_name, overall_rank
+                    ) per_rank
+                    GROUP BY department_name, stage_name
+                )
+                INSERT INTO comprehensive_period_facts (
+                    id,
+                    organization_id,
+                    period_id,
+                    department_name,
+                    stage_name,
+                    user_count,
+                    processed_count,
+                    unranked_count,
+                    rank_counts,
+                    promotion_count,
+                    demotion_count,
+                    performance_scores,
+                    total_scores,
+                    goals_count,
+                    completed_assessments_count,
+                    received_feedbacks_count,
+                    refreshed_at
+                )
+                SELECT
+                    gen_random_uuid(),
+                    :organization_id,
+                    :period_id,
+                    r.department_name,
+                    r.stage_name,
+                    COUNT(*),
+                    COUNT(*) FILTER (WHERE r.processing_status = 'processed'),
+                    COUNT(*) FILTER (WHERE r.overall_rank IS NULL),
+                    COALESCE(rc.rank_counts, '{}'::jsonb),
+                    COUNT(*) FILTER (WHERE r.decision = '昇格'),
+                    COUNT(*) FILTER (WHERE r.decision = '降格'),
+                    COALESCE(
+                        array_agg(r.performance_score ORDER BY r.performance_score)
+                            FILTER (WHERE r.performance_score IS NOT NULL),
+                        '{}'
+                    ),
+                    COALESCE(
+                        array_agg(r.total_score ORDER BY r.total_score) FILTER (WHERE r.total_score IS NOT NULL),
+                        '{}'
+                    ),
+                    COALESCE(SUM(r.goals_count), 0),
+                    COALESCE(SUM(r.completed_assessments_count), 0),
+                    COALESCE(SUM(r.received_feedbacks_count), 0),
+                    NOW()
+                FROM snapshot_rows r
+                LEFT JOIN rank_counts rc
+                  ON rc.department_name IS NOT DISTINCT FROM r.department_name
+                 AND rc.stage_name IS NOT DISTINCT FROM r.stage_name
+                GROUP BY r.department_name, r.stage_name, rc.rank_counts
+                """
+            ),
+            params,
+        )
+        return result.rowcount
+
+    @timed_query("list_period_facts")
+    async def list_period_facts(self, *, org_id: str, period_ids: Sequence[UUID]) -> List[Dict[str, Any]]:
+        result = await self.session.execute(
+            text(
+                """
+                SELECT
+                    period_id,
+                    department_name,
+                    stage_name,
+                    user_count,
+                    processed_count,
+                    unranked_count,
+                    rank_counts,
+                    promotion_count,
+                    demotion_count,
+                    performance_scores,
+                    total_scores,
+                    goals_count,
+                    completed_assessments_count,
+                    received_feedbacks_count
+                FROM comprehensive_period_facts
+                WHERE organization_id = :organization_id
+                  AND period_id = ANY(CAST(:period_ids AS uuid[]))
+                """
+            ),
+            {
+                "organization_id": org_id,
+                "period_ids": list(period_ids),
+            },
+        )
+        records = [dict(row._mapping) for row in result.fetchall()]
+        for record in records:
+            record["rank_counts"] = self._normalize_json_document(record["rank_counts"]) or {}
+        return records
+
+    @staticmethod
+    def _settings_audit_params(audit: Dict[str, Any]) -> Dict[str, Any]:
+        before_json = audit.get("before_json")
+        after_json = audit.get("after_json")
+        return {
+            "audit_actor_user_id": audit["actor_user_id"],
+            "audit_action": audit["action"],
+            "audit_before_json": json.dumps(before_json) if before_json is not None else None,
+            "audit_after_json": json.dumps(after_json) if after_json is not None else None,
+        }
+
     @staticmethod
     def _normalize_record(record: Dict[str, Any]) -> Dict[str, Any]:
         normalized = dict(record)
@@ -47,6 +47,29 @@ class CoreValueEvaluationRepository(BaseRepository[CoreValueEvaluation]):
             logger.error(f"Error fetching core value evaluation for period {period_id}, user {user_id}: {e}")
             raise
 
+    async def get_evaluations_for_users(
+        self, period_id: UUID, user_ids: List[UUID], org_id: str
+    ) -> Dict[UUID, CoreValueEvaluation]:
+        """Core value evaluations (with feedback) for many users in one query, keyed by user_id."""
+        if not user_ids:
+            return {}
+        try:
+            query = (
+                select(CoreValueEvaluation)
+                .options(joinedload(CoreValueEvaluation.feedback))
+                .join(User, CoreValueEvaluation.user_id == User.id)
+                .filter(
+                    CoreValueEvaluation.period_id == period_id,
+                    CoreValueEvaluation.user_id.in_(user_ids),
+                    User.clerk_organization_id == org_id
+                )
+            )
+            result = await self.session.execute(query)
+            return {evaluation.user_id: evaluation for evaluation in result.scalars().unique().all()}
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching core value evaluations for period {period_id}: {e}")
+            raise
+
     async def get_by_id(self, eval_id: UUID, org_id: str) -> Optional[CoreValueEvaluation]:
         """Get a core value evaluation by ID within organization scope."""
         try:
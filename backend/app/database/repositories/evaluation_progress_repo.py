@@ -0,0 +1,215 @@
+"""
+Read model for the admin evaluation progress (評価進捗) screen.
+
+One statement returns, per active user in the organization, the five source statuses
+shown on the page: self assessment, the first two peer reviewers (by assignment order)
+and the supervisor. Peers and supervisor are resolved with LATERAL subqueries so the
+cost is one index probe per user rather than loading every assignment and feedback
+row of the period into Python.
+"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...core.metrics import timed_query
+
+logger = logging.getLogger(__name__)
+
+# Public sort keys → SQL expressions. Every ordering ends with u.id for a stable page order.
+PROGRESS_SORT_COLUMNS: Dict[str, str] = {
+    "name": "u.name",
+    "employeeCode": "u.employee_code",
+    "department": "d.name",
+    "selfStatus": "self_status",
+    "supervisorStatus": "supervisor_status",
+}
+
+_PROGRESS_SELECT = """
+    SELECT
+        u.id AS user_id,
+        u.name AS user_name,
+        u.employee_code,
+        d.name AS department_name,
+        CASE
+            WHEN cve.status IN ('submitted', 'approved') THEN 'submitted'
+            ELSE cve.status
+        END AS self_status,
+        peers.peer1_name,
+        peers.peer1_status,
+        peers.peer2_name,
+        peers.peer2_status,
+        COALESCE(fb.supervisor_name, rel.supervisor_name) AS supervisor_name,
+        fb.status AS supervisor_status{total_column}
+    FROM users u
+    LEFT JOIN departments d
+      ON d.id = u.department_id
+    LEFT JOIN core_value_evaluations cve
+      ON cve.user_id = u.id
+     AND cve.period_id = :period_id
+    LEFT JOIN LATERAL (
+        SELECT
+            (array_agg(r.name ORDER BY pra.created_at, pra.id))[1] AS peer1_name,
+            (array_agg(pre.status ORDER BY pra.created_at, pra.id))[1] AS peer1_status,
+            (array_agg(r.name ORDER BY pra.created_at, pra.id))[2] AS peer2_name,
+            (array_agg(pre.status ORDER BY pra.created_at, pra.id))[2] AS peer2_status
+        FROM peer_review_assignments pra
+        LEFT JOIN users r
+          ON r.id = pra.reviewer_id
+        LEFT JOIN peer_review_evaluations pre
+          ON pre.assignment_id = pra.id
+        WHERE pra.period_id = :period_id
+          AND pra.reviewee_id = u.id
+    ) peers ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT cvf.status, s.name AS supervisor_name
+        FROM core_value_feedback cvf
+        JOIN users s
+          ON s.id = cvf.supervisor_id
+        WHERE cvf.period_id = :period_id
+          AND cvf.subordinate_id = u.id
+          AND s.clerk_organization_id = :org_id
+        ORDER BY cvf.updated_at DESC
+        LIMIT 1
+    ) fb ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT s.name AS supervisor_name
+        FROM users_supervisors us
+        JOIN users s
+          ON s.id = us.supervisor_id
+        WHERE us.user_id = u.id
+        ORDER BY (us.valid_to IS NULL) DESC, us.valid_from DESC
+        LIMIT 1
+    ) rel ON TRUE
+    WHERE u.clerk_organization_id = :org_id
+      AND u.status = 'active'
+      AND (CAST(:department_ids AS uuid[]) IS NULL OR u.department_id = ANY(CAST(:department_ids AS uuid[])))
+      AND (
+          CAST(:search_like AS text) IS NULL
+          OR lower(concat_ws(' ', coalesce(u.employee_code, ''), coalesce(u.name, ''))) LIKE CAST(:search_like AS text)
+      )
+    ORDER BY {order_by}
+"""
+
+
+class EvaluationProgressRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def _build(
+        *,
+        org_id: str,
+        period_id: UUID,
+        department_ids: Optional[Sequence[UUID]],
+        search: Optional[str],
+        sort_by: str,
+        descending: bool,
+        with_total: bool,
+    ) -> Tuple[str, Dict[str, Any]]:
+        column = PROGRESS_SORT_COLUMNS.get(sort_by)
+        if column is None:
+            raise ValueError(f"Unsupported sort key: {sort_by}")
+        direction = "DESC" if descending else "ASC"
+        sql = _PROGRESS_SELECT.format(
+            total_column=",\n        COUNT(*) OVER () AS total_count" if with_total else "",
+            order_by=f"{column} {direction} NULLS LAST, u.id",
+        )
+        search_value = search.strip().lower() if search else None
+        params = {
+            "org_id": org_id,
+            "period_id": period_id,
+            "department_ids": list(department_ids) if department_ids else None,
+            "search_like": f"%{search_value}%" if search_value else None,
+        }
+        return sql, params
+
+    @timed_query("evaluation_progress_page")
+    async def list_page(
+        self,
+        *,
+        org_id: str,
+        period_id: UUID,
+        department_ids: Optional[Sequence[UUID]] = None,
+        search: Optional[str] = None,
+        sort_by: str = "name",
+        descending: bool = False,
+        page: int = 1,
+        limit: int = 50,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """One page of progress rows and the total row count, in one statement."""
+        sql, params = self._build(
+            org_id=org_id,
+            period_id=period_id,
+            department_ids=department_ids,
+            search=search,
+            sort_by=sort_by,
+            descending=descending,
+            with_total=True,
+        )
+        params.update({"limit": limit, "offset": (page - 1) * limit})
+        try:
+            result = await self.session.execute(text(f"{sql} LIMIT :limit OFFSET :offset"), params)
+            rows = [dict(row) for row in result.mappings().all()]
+            if rows:
+                total = int(rows[0]["total_count"])
+            else:
+                total = await self._count(params)
+            for row in rows:
+                row.pop("total_count", None)
+            return rows, total
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching evaluation progress for period {period_id}: {e}")
+            raise
+
+    async def stream_rows(
+        self,
+        *,
+        org_id: str,
+        period_id: UUID,
+        department_ids: Optional[Sequence[UUID]] = None,
+        search: Optional[str] = None,
+        sort_by: str = "name",
+        descending: bool = False,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """All matching rows as chunks from a server-side cursor (exports, full lists)."""
+        sql, params = self._build(
+            org_id=org_id,
+            period_id=period_id,
+            department_ids=department_ids,
+            search=search,
+            sort_by=sort_by,
+            descending=descending,
+            with_total=False,
+        )
+        try:
+            result = await self.session.stream(text(sql), params)
+            async for partition in result.mappings().partitions(chunk_size):
+                yield [dict(row) for row in partition]
+        except SQLAlchemyError as e:
+            logger.error(f"Error streaming evaluation progress for period {period_id}: {e}")
+            raise
+
+    async def _count(self, params: Dict[str, Any]) -> int:
+        result = await self.session.execute(
+            text(
+                """
+                SELECT COUNT(*)
+                FROM users u
+                WHERE u.clerk_organization_id = :org_id
+                  AND u.status = 'active'
+                  AND (CAST(:department_ids AS uuid[]) IS NULL OR u.department_id = ANY(CAST(:department_ids AS uuid[])))
+                  AND (
+                      CAST(:search_like AS text) IS NULL
+                      OR lower(concat_ws(' ', coalesce(u.employee_code, ''), coalesce(u.name, ''))) LIKE CAST(:search_like AS text)
+                  )
+                """
+            ),
+            {key: params[key] for key in ("org_id", "department_ids", "search_like")},
+        )
+        return int(result.scalar_one())
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from uuid import UUID
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -18,6 +18,7 @@ from ...schemas.goal import (
     PerformanceGoalTargetData, CompetencyGoalTargetData, CoreValueGoalTargetData,
 )
 from ...schemas.common import PaginationParams
+from ...security.rbac_scope import AccessScope
 from ...core.exceptions import (
     NotFoundError, ConflictError, ValidationError
 )
@@ -59,6 +60,7 @@ class GoalRepository(BaseRepository[Goal]):
             # Create goal with provided data
             goal = Goal(
                 user_id=user_id,
+                organization_id=org_id,
                 period_id=period_id,
                 goal_category=goal_category,
                 target_data=target_data,
@@ -109,6 +111,7 @@ class GoalRepository(BaseRepository[Goal]):
             # Create goal with validated data
             goal = Goal(
                 user_id=user_id,
+                organization_id=org_id,
                 period_id=goal_data.period_id,
                 goal_category=goal_data.goal_category,
                 target_data=target_data,
@@ -143,7 +146,7 @@ class GoalRepository(BaseRepository[Goal]):
         """Get goal by ID within organization scope."""
         try:
             query = select(Goal).filter(Goal.id == goal_id)
-            query = self.apply_org_scope_via_user(query, Goal.user_id, org_id)
+            query = self.apply_org_scope_direct(query, Goal.organization_id, org_id)
             result = await self.session.execute(query)
             return result.scalars().first()
         except SQLAlchemyError as e:
@@ -168,7 +171,7 @@ class GoalRepository(BaseRepository[Goal]):
                     Goal.status == GoalStatus.DRAFT.value,
                 )
             )
-            query = self.apply_org_scope_via_user(query, Goal.user_id, org_id)
+            query = self.apply_org_scope_direct(query, Goal.organization_id, org_id)
             result = await self.session.execute(query)
             return result.scalars().first()
         except SQLAlchemyError as e:
@@ -194,7 +197,7 @@ class GoalRepository(BaseRepository[Goal]):
 
         try:
             query = select(Goal).filter(Goal.id.in_(goal_ids))
-            query = self.apply_org_scope_via_user(query, Goal.user_id, org_id)
+            query = self.apply_org_scope_direct(query, Goal.organization_id, org_id)
             result = await self.session.execute(query)
             goals = result.scalars().all()
 
@@ -215,7 +218,7 @@ class GoalRepository(BaseRepository[Goal]):
                 joinedload(Goal.period),
                 joinedload(Goal.approver)
             ).filter(Goal.id == goal_id)
-            query = self.apply_org_scope_via_user(query, Goal.user_id, org_id)
+            query = self.apply_org_scope_direct(query, Goal.organization_id, org_id)
             result = await self.session.execute(query)
             return result.scalars().unique().first()
         except SQLAlchemyError as e:
@@ -232,8 +235,8 @@ class GoalRepository(BaseRepository[Goal]):
         try:
             query = select(Goal).filter(Goal.user_id == user_id)
             
-            # Apply organization filter via user relationship (required)
-            query = self.apply_org_scope_via_user(query, Goal.user_id, org_id)
+            # Apply organization filter (required)
+            query = self.apply_org_scope_direct(query, Goal.organization_id, org_id)
             self.ensure_org_filter_applied("get_goals_by_user_and_period", org_id)
             
             if period_id:
@@ -256,8 +259,8 @@ class GoalRepository(BaseRepository[Goal]):
         try:
             query = select(Goal).filter(Goal.period_id == period_id)
 
-            # Apply organization filter via user relationship (required)
-            query = self.apply_org_scope_via_user(query, Goal.user_id, org_id)
+            # Apply organization filter (required)
+            query = self.apply_org_scope_direct(query, Goal.organization_id, org_id)
             self.ensure_org_filter_applied("get_goals_by_period", org_id)
 
             query = query.order_by(Goal.created_at.desc())
@@ -268,10 +271,113 @@ class GoalRepository(BaseRepository[Goal]):
             logger.error(f"Error fetching goals for period {period_id} in org {org_id}: {e}")
             raise
 
+    async def get_period_status_counts(self, period_id: UUID, org_id: str) -> Dict[str, int]:
+        """Goal counts per status for a period, aggregated in the database."""
+        try:
+            query = (
+                select(Goal.status, func.count(Goal.id))
+                .filter(Goal.period_id == period_id)
+                .group_by(Goal.status)
+            )
+            query = self.apply_org_scope_direct(query, Goal.organization_id, org_id)
+            self.ensure_org_filter_applied("get_period_status_counts", org_id)
+
+            result = await self.session.execute(query)
+            return {status: count for status, count in result.all()}
+        except SQLAlchemyError as e:
+            logger.error(f"Error counting goals by status for period {period_id} in org {org_id}: {e}")
+            raise
+
+    async def get_period_user_goal_counts(
+        self,
+        period_id: UUID,
+        user_ids: List[UUID],
+        org_id: str,
+    ) -> Dict[UUID, Dict[str, Any]]:
+        """
+        Per-user goal aggregates for a period:
+        user_id -> {"goal_count", "goal_statuses", "last_goal_submission"}.
+        Users without goals are absent from the result.
+        """
+        if not user_ids:
+            return {}
+        try:
+            query = (
+                select(
+                    Goal.user_id,
+                    Goal.status,
+                    func.count(Goal.id),
+                    func.max(Goal.updated_at),
+                )
+                .filter(Goal.period_id == period_id, Goal.user_id.in_(user_ids))
+                .group_by(Goal.user_id, Goal.status)
+            )
+            query = self.apply_org_scope_direct(query, Goal.organization_id, org_id)
+            self.ensure_org_filter_applied("get_period_user_goal_counts", org_id)
+
+            result = await self.session.execute(query)
+            aggregates: Dict[UUID, Dict[str, Any]] = {}
+            for user_id, status, count, last_updated in result.all():
+                entry = aggregates.setdefault(
+                    user_id, {"goal_count": 0, "goal_statuses": {}, "last_goal_submission": None}
+                )
+                entry["goal_count"] += count
+                entry["goal_statuses"][status] = count
+                if last_updated and (
+                    entry["last_goal_submission"] is None or last_updated > entry["last_goal_submission"]
+                ):
+                    entry["last_goal_submission"] = last_updated
+            return aggregates
+        except SQLAlchemyError as e:
+            logger.error(f"Error aggregating user goals for period {period_id} in org {org_id}: {e}")
+            raise
+
+    def _build_goal_search_query(
+        self,
+        query,
+        org_id: str,
+        user_ids: Union[AccessScope, List[UUID], None],
+        period_id: Optional[UUID],
+        department_id: Optional[UUID],
+        goal_category: Optional[str],
+        status: Optional[List[str]],
+        has_previous_goal_id: Optional[bool],
+    ):
+        """Filters shared by search_goals, count_goals and search_goals_page."""
+        # Apply organization filter first (required)
+        query = self.apply_org_scope_direct(query, Goal.organization_id, org_id)
+
+        # Apply filters
+        query = self.apply_user_scope(query, Goal.user_id, user_ids)
+
+        if period_id:
+            query = query.filter(Goal.period_id == period_id)
+
+        # Department filter is the only one that needs the owner row
+        if department_id:
+            query = query.join(User, Goal.user_id == User.id).filter(User.department_id == department_id)
+
+        if goal_category:
+            query = query.filter(Goal.goal_category == goal_category)
+
+        if status:
+            if isinstance(status, list):
+                query = query.filter(Goal.status.in_(status))
+            else:
+                # Backward compatibility for single status
+                query = query.filter(Goal.status == status)
+
+        if has_previous_goal_id is True:
+            query = query.filter(Goal.previous_goal_id.isnot(None))
+        elif has_previous_goal_id is False:
+            query = query.filter(Goal.previous_goal_id.is_(None))
+
+        return query
+
     async def search_goals(
         self,
         org_id: str,
-        user_ids: Optional[List[UUID]] = None,
+        user_ids: Union[AccessScope, List[UUID], None] = None,
         period_id: Optional[UUID] = None,
         department_id: Optional[UUID] = None,
         goal_category: Optional[str] = None,
@@ -280,47 +386,19 @@ class GoalRepository(BaseRepository[Goal]):
         pagination: Optional[PaginationParams] = None
     ) -> List[Goal]:
         """Search goals with various filters within organization scope."""
-        # IMPORTANT: Treat an explicit empty user_ids list as "no accessible users".
+        # IMPORTANT: Treat an explicit empty user_ids list / empty scope as "no accessible users".
         # This prevents accidental data leaks where an empty list would skip filtering.
-        if user_ids is not None and len(user_ids) == 0:
+        if AccessScope.coerce(user_ids).is_empty:
             return []
 
         try:
-            from ..models.user import User
-
             # Keep the base entity lean; relationships are loaded on demand by callers
-            query = select(Goal)
-
-            # Apply organization filter first (required)
-            query = self.apply_org_scope_via_user(query, Goal.user_id, org_id)
+            query = self._build_goal_search_query(
+                select(Goal), org_id, user_ids, period_id, department_id,
+                goal_category, status, has_previous_goal_id,
+            )
             self.ensure_org_filter_applied("search_goals", org_id)
 
-            # Apply filters
-            if user_ids is not None:
-                query = query.filter(Goal.user_id.in_(user_ids))
-
-            if period_id:
-                query = query.filter(Goal.period_id == period_id)
-
-            # NEW: Department filter (requires JOIN with User)
-            if department_id:
-                query = query.join(User, Goal.user_id == User.id).filter(User.department_id == department_id)
-
-            if goal_category:
-                query = query.filter(Goal.goal_category == goal_category)
-
-            if status:
-                if isinstance(status, list):
-                    query = query.filter(Goal.status.in_(status))
-                else:
-                    # Backward compatibility for single status
-                    query = query.filter(Goal.status == status)
-
-            if has_previous_goal_id is True:
-                query = query.filter(Goal.previous_goal_id.isnot(None))
-            elif has_previous_goal_id is False:
-                query = query.filter(Goal.previous_goal_id.is_(None))
-
             # Apply ordering
             query = query.order_by(Goal.created_at.desc())
 
@@ -334,18 +412,45 @@ class GoalRepository(BaseRepository[Goal]):
             logger.error(f"Error searching goals for org {org_id}: {e}")
             raise
 
+    async def search_goals_page(
+        self,
+        org_id: str,
+        user_ids: Union[AccessScope, List[UUID], None] = None,
+        period_id: Optional[UUID] = None,
+        department_id: Optional[UUID] = None,
+        goal_category: Optional[str] = None,
+        status: Optional[List[str]] = None,
+        has_previous_goal_id: Optional[bool] = None,
+        pagination: Optional[PaginationParams] = None
+    ) -> tuple[List[Goal], int]:
+        """search_goals and count_goals in a single statement: (goals, total)."""
+        if AccessScope.coerce(user_ids).is_empty:
+            return [], 0
+
+        try:
+            query = self._build_goal_search_query(
+                select(Goal), org_id, user_ids, period_id, department_id,
+                goal_category, status, has_previous_goal_id,
+            )
+            self.ensure_org_filter_applied("search_goals_page", org_id)
+
+            return await self.paginate(query.order_by(Goal.created_at.desc()), pagination)
+        except SQLAlchemyError as e:
+            logger.error(f"Error searching goals page for org {org_id}: {e}")
+            raise
+
     async def get_goal_list_page(
         self,
         org_id: str,
-        user_ids: Optional[List[UUID]],
+        user_ids: Union[AccessScope, List[UUID], None],
         period_id: Optional[UUID],
         status: Optional[List[str]],
         pagination: Optional[PaginationParams],
     ) -> tuple[list[dict], int]:
         """Optimized read model for the goal list page with joins to user/period/department."""
-        # IMPORTANT: Treat an explicit empty user_ids list as "no accessible users".
+        # IMPORTANT: Treat an explicit empty user_ids list / empty scope as "no accessible users".
         # This prevents accidental data leaks where an empty list would skip filtering.
-        if user_ids is not None and len(user_ids) == 0:
+        if AccessScope.coerce(user_ids).is_empty:
             return [], 0
 
         try:
@@ -371,12 +476,11 @@ class GoalRepository(BaseRepository[Goal]):
                 .join(User, Goal.user_id == User.id)
                 .join(EvaluationPeriod, Goal.period_id == EvaluationPeriod.id)
                 .outerjoin(Department, User.department_id == Department.id)
-                .where(User.clerk_organization_id == org_id)
+                .where(Goal.organization_id == org_id)
             )
 
             # Apply filters
-            if user_ids is not None:
-                base_query = base_query.filter(Goal.user_id.in_(user_ids))
+            base_query = self.apply_user_scope(base_query, Goal.user_id, user_ids)
             if period_id:
                 base_query = base_query.filter(Goal.period_id == period_id)
             if status:
@@ -385,18 +489,7 @@ class GoalRepository(BaseRepository[Goal]):
                 else:
                     base_query = base_query.filter(Goal.status == status)
 
-            count_query = base_query.with_only_columns(func.count())
-
-            if pagination:
-                base_query = base_query.offset(pagination.offset).limit(pagination.limit)
-
-            result = await self.session.execute(base_query.order_by(Goal.updated_at.desc()))
-            rows = list(result.mappings().all())
-
-            total_result = await self.session.execute(count_query)
-            total = total_result.scalar() or 0
-
-            return rows, total
+            return await self.paginate(base_query.order_by(Goal.updated_at.desc()), pagination)
         except SQLAlchemyError as e:
             logger.error(f"Error fetching goal list page for org {org_id}: {e}")
             raise
@@ -404,7 +497,7 @@ class GoalRepository(BaseRepository[Goal]):
     async def count_goals(
         self,
         org_id: str,
-        user_ids: Optional[List[UUID]] = None,
+        user_ids: Union[AccessScope, List[UUID], None] = None,
         period_id: Optional[UUID] = None,
         department_id: Optional[UUID] = None,
         goal_category: Optional[str] = None,
@@ -412,44 +505,16 @@ class GoalRepository(BaseRepository[Goal]):
         has_previous_goal_id: Optional[bool] = None,
     ) -> int:
         """Count goals matching the given filters within organization scope."""
-        # IMPORTANT: Treat an explicit empty user_ids list as "no accessible users".
+        # IMPORTANT: Treat an explicit empty user_ids list / empty scope as "no accessible users".
         # This prevents accidental data leaks where an empty list would skip filtering.
-        if user_ids is not None and len(user_ids) == 0:
+        if AccessScope.coerce(user_ids).is_empty:
             return 0
 
         try:
-            from ..models.user import User
-
-            query = select(func.count(Goal.id))
-
-            # Apply organization filter first (required)
-            query = self.apply_org_scope_via_user(query, Goal.user_id, org_id)
-
-            # Apply same filters as search_goals
-            if user_ids is not None:
-                query = query.filter(Goal.user_id.in_(user_ids))
-
-            if period_id:
-                query = query.filter(Goal.period_id == period_id)
-
-            # NEW: Department filter (requires JOIN with User)
-            if department_id:
-                query = query.join(User, Goal.user_id == User.id).filter(User.department_id == department_id)
-
-            if goal_category:
-                query = query.filter(Goal.goal_category == goal_category)
-
-            if status:
-                if isinstance(status, list):
-                    query = query.filter(Goal.status.in_(status))
-                else:
-                    # Backward compatibility for single status
-                    query = query.filter(Goal.status == status)
-
-            if has_previous_goal_id is True:
-                query = query.filter(Goal.previous_goal_id.isnot(None))
-            elif has_previous_goal_id is False:
-                query = query.filter(Goal.previous_goal_id.is_(None))
+            query = self._build_goal_search_query(
+                select(func.count(Goal.id)), org_id, user_ids, period_id, department_id,
+                goal_category, status, has_previous_goal_id,
+            )
 
             result = await self.session.execute(query)
             return result.scalar() or 0
@@ -477,8 +542,8 @@ class GoalRepository(BaseRepository[Goal]):
                 )
             )
             
-            # Apply organization filtering via user
-            query = self.apply_org_scope_via_user(query, Goal.user_id, org_id)
+            # Apply organization filtering
+            query = self.apply_org_scope_direct(query, Goal.organization_id, org_id)
             
             if exclude_goal_id:
                 query = query.filter(Goal.id != exclude_goal_id)
@@ -524,7 +589,7 @@ class GoalRepository(BaseRepository[Goal]):
                 )
             )
 
-            query = self.apply_org_scope_via_user(query, Goal.user_id, org_id)
+            query = self.apply_org_scope_direct(query, Goal.organization_id, org_id)
 
             if exclude_goal_id:
                 query = query.filter(Goal.id != exclude_goal_id)
@@ -565,8 +630,8 @@ class GoalRepository(BaseRepository[Goal]):
                 )
             )
             
-            # Apply organization filtering via user
-            query = self.apply_org_scope_via_user(query, Goal.user_id, org_id)
+            # Apply organization filtering
+            query = self.apply_org_scope_direct(query, Goal.organization_id, org_id)
             
             if period_id:
                 query = query.filter(Goal.period_id == period_id)
@@ -1,10 +1,11 @@
 import logging
 from typing import Optional, List
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
 from ..models.organization import Organization
+from ..models.user import User
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +46,26 @@ class OrganizationRepository:
             logger.error(f"Error fetching all organizations: {e}")
             raise
 
+    async def get_recently_active(self, limit: int) -> List[Organization]:
+        """Get organizations ordered by most recent user activity (startup cache warmup)."""
+        try:
+            last_activity = (
+                select(func.max(User.updated_at))
+                .where(User.clerk_organization_id == Organization.id)
+                .correlate(Organization)
+                .scalar_subquery()
+            )
+            result = await self.session.execute(
+                select(Organization)
+                .where(Organization.slug.isnot(None))
+                .order_by(last_activity.desc().nulls_last())
+                .limit(limit)
+            )
+            return result.scalars().all()
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching recently active organizations: {e}")
+            raise
+
     async def create_organization(self, org_data: dict) -> Organization:
         """Create a new organization."""
         try:
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, List
+from typing import Dict, Optional, List
 from uuid import UUID
 from datetime import datetime, timezone
 
@@ -83,6 +83,33 @@ class PeerReviewEvaluationRepository(BaseRepository[PeerReviewEvaluation]):
             logger.error(f"Error fetching submitted evaluations for reviewee {reviewee_id}: {e}")
             raise
 
+    async def get_submitted_evaluations_for_reviewees(
+        self, period_id: UUID, reviewee_ids: List[UUID], org_id: str
+    ) -> Dict[UUID, List[PeerReviewEvaluation]]:
+        """Submitted evaluations for many reviewees in one query, keyed by reviewee_id in submission order."""
+        if not reviewee_ids:
+            return {}
+        try:
+            query = (
+                select(PeerReviewEvaluation)
+                .join(User, PeerReviewEvaluation.reviewee_id == User.id)
+                .filter(
+                    PeerReviewEvaluation.period_id == period_id,
+                    PeerReviewEvaluation.reviewee_id.in_(reviewee_ids),
+                    PeerReviewEvaluation.status == PeerReviewStatus.SUBMITTED.value,
+                    User.clerk_organization_id == org_id
+                )
+                .order_by(PeerReviewEvaluation.submitted_at, PeerReviewEvaluation.id)
+            )
+            result = await self.session.execute(query)
+            by_reviewee: Dict[UUID, List[PeerReviewEvaluation]] = {}
+            for evaluation in result.scalars().all():
+                by_reviewee.setdefault(evaluation.reviewee_id, []).append(evaluation)
+            return by_reviewee
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching submitted evaluations for period {period_id}: {e}")
+            raise
+
     # ========================================
     # CREATE OPERATIONS
     # ========================================
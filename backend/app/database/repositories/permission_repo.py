@@ -3,10 +3,14 @@ from datetime import datetime
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models.permission import Permission as PermissionModel, RolePermission as RolePermissionModel
+from ..models.permission import (
+    Permission as PermissionModel,
+    PermissionCatalogVersion,
+    RolePermission as RolePermissionModel,
+)
 from ..models.user import Role as RoleModel
 from .base import BaseRepository
 
@@ -69,6 +73,67 @@ class PermissionRepository(BaseRepository[PermissionModel]):
 
         return list(existing_by_code.values()), bool(created or updated)
 
+    async def is_catalog_version_seeded(self, version: str) -> bool:
+        result = await self.session.execute(
+            select(PermissionCatalogVersion.version).where(PermissionCatalogVersion.version == version)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def bulk_seed_catalog(
+        self,
+        permissions: Sequence[tuple[str, str, str]],
+        version: str,
+    ) -> int:
+        """
+        Upsert the whole permission catalog and record its version in one round trip.
+
+        New codes are inserted, changed metadata is updated, unchanged rows are left
+        untouched (no dead tuples). Returns the number of inserted/updated rows.
+        """
+        if not permissions:
+            return 0
+        codes, descriptions, groups = (list(column) for column in zip(*permissions))
+        result = await self.session.execute(
+            text(
+                """
+                WITH upserted AS (
+                    INSERT INTO permissions (id, code, description, permission_group, created_at, updated_at)
+                    SELECT gen_random_uuid(), v.code, v.description, v.permission_group, NOW(), NOW()
+                    FROM unnest(
+                        CAST(:codes AS TEXT[]),
+                        CAST(:descriptions AS TEXT[]),
+                        CAST(:groups AS TEXT[])
+                    ) AS v(code, description, permission_group)
+                    ON CONFLICT (code) DO UPDATE
+                    SET description = EXCLUDED.description,
+                        permission_group = EXCLUDED.permission_group,
+                        updated_at = NOW()
+                    WHERE permissions.description IS DISTINCT FROM EXCLUDED.description
+                       OR permissions.permission_group IS DISTINCT FROM EXCLUDED.permission_group
+                    RETURNING id
+                ),
+                recorded AS (
+                    INSERT INTO permission_catalog_versions (version, permission_count, seeded_at)
+                    VALUES (:version, :permission_count, NOW())
+                    ON CONFLICT (version) DO NOTHING
+                    RETURNING version
+                )
+                SELECT (SELECT COUNT(*) FROM upserted) AS changed, (SELECT COUNT(*) FROM recorded) AS recorded
+                """
+            ),
+            {
+                "codes": codes,
+                "descriptions": descriptions,
+                "groups": groups,
+                "version": version,
+                "permission_count": len(codes),
+            },
+        )
+        changed = int(result.one().changed or 0)
+        if changed:
+            logger.info("Seeded/updated %d permissions for catalog version %s", changed, version)
+        return changed
+
     async def list_for_role(self, role_id: str, org_id: str) -> List[PermissionModel]:
         permissions_query = (
             select(PermissionModel)
@@ -163,6 +228,41 @@ class RolePermissionRepository(BaseRepository[RolePermissionModel]):
 
         await self.session.flush()
 
+    async def bulk_assign_default_permissions(
+        self,
+        org_id: str,
+        assignments: Sequence[tuple[Union[str, UUID], str]],
+    ) -> int:
+        """
+        Insert (role_id, permission_code) pairs for an organization in one statement.
+
+        Existing assignments are kept (``ON CONFLICT DO NOTHING``), so re-running a
+        bootstrap never strips permissions an admin has added. Returns inserted count.
+        """
+        if not assignments:
+            return 0
+        role_ids = [str(role_id) for role_id, _ in assignments]
+        codes = [code for _, code in assignments]
+        result = await self.session.execute(
+            text(
+                """
+                WITH inserted AS (
+                    INSERT INTO role_permissions (
+                        id, organization_id, role_id, permission_id, created_at, updated_at
+                    )
+                    SELECT gen_random_uuid(), :org_id, v.role_id, p.id, NOW(), NOW()
+                    FROM unnest(CAST(:role_ids AS UUID[]), CAST(:codes AS TEXT[])) AS v(role_id, code)
+                    JOIN permissions p ON p.code = v.code
+                    ON CONFLICT (organization_id, role_id, permission_id) DO NOTHING
+                    RETURNING id
+                )
+                SELECT COUNT(*) FROM inserted
+                """
+            ),
+            {"org_id": org_id, "role_ids": role_ids, "codes": codes},
+        )
+        return int(result.scalar_one() or 0)
+
     async def fetch_permissions_with_version(
         self,
         role_id: str,
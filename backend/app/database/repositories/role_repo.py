@@ -1,8 +1,8 @@
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 from datetime import datetime
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
@@ -61,6 +61,50 @@ class RoleRepository(BaseRepository[Role]):
                 raise ValueError(f"Role name '{role_data.name}' already exists in organization")
             raise
 
+    async def bulk_ensure_roles(
+        self,
+        org_id: str,
+        roles: Sequence[Tuple[str, str, int]],
+    ) -> Dict[str, Tuple[UUID, bool]]:
+        """
+        Ensure (name, description, hierarchy_order) roles exist in one statement.
+
+        Returns ``{name: (role_id, created)}``. Existing roles are left untouched, so
+        the call is idempotent and never reorders an organization's customized hierarchy.
+        """
+        if not roles:
+            return {}
+        names, descriptions, orders = (list(column) for column in zip(*roles))
+        result = await self.session.execute(
+            text(
+                """
+                WITH input AS (
+                    SELECT *
+                    FROM unnest(
+                        CAST(:names AS TEXT[]),
+                        CAST(:descriptions AS TEXT[]),
+                        CAST(:orders AS INTEGER[])
+                    ) AS v(name, description, hierarchy_order)
+                ),
+                inserted AS (
+                    INSERT INTO roles (id, organization_id, name, description, hierarchy_order, created_at, updated_at)
+                    SELECT gen_random_uuid(), :org_id, name, description, hierarchy_order, NOW(), NOW()
+                    FROM input
+                    ON CONFLICT (organization_id, name) DO NOTHING
+                    RETURNING id, name
+                )
+                SELECT id, name, TRUE AS created FROM inserted
+                UNION ALL
+                SELECT r.id, r.name, FALSE AS created
+                FROM roles r
+                JOIN input i ON i.name = r.name
+                WHERE r.organization_id = :org_id
+                """
+            ),
+            {"org_id": org_id, "names": names, "descriptions": descriptions, "orders": orders},
+        )
+        return {row.name: (row.id, bool(row.created)) for row in result}
+
     # ============================================================================
     # READ OPERATIONS
     # ============================================================================
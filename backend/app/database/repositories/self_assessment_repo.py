@@ -21,6 +21,22 @@ from .base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Columns behind the SelfAssessment list response; list pages select only these
+# instead of loading the goal -> user / period graph per row.
+ASSESSMENT_LIST_COLUMNS = (
+    SelfAssessment.id,
+    SelfAssessment.goal_id,
+    SelfAssessment.period_id,
+    SelfAssessment.self_rating_code,
+    SelfAssessment.self_rating,
+    SelfAssessment.self_comment,
+    SelfAssessment.rating_data,
+    SelfAssessment.status,
+    SelfAssessment.submitted_at,
+    SelfAssessment.created_at,
+    SelfAssessment.updated_at,
+)
+
 
 class SelfAssessmentRepository(BaseRepository[SelfAssessment]):
     """Repository for SelfAssessment database operations following established patterns"""
@@ -61,6 +77,7 @@ class SelfAssessmentRepository(BaseRepository[SelfAssessment]):
 
             assessment = SelfAssessment(
                 goal_id=goal_id,
+                organization_id=org_id,
                 period_id=goal.period_id,  # Inherit from goal
                 self_rating_code=assessment_data.self_rating_code.value if assessment_data.self_rating_code else None,
                 self_rating=self_rating,
@@ -100,8 +117,8 @@ class SelfAssessmentRepository(BaseRepository[SelfAssessment]):
         """Get self-assessment by ID within organization scope."""
         try:
             query = select(SelfAssessment).filter(SelfAssessment.id == assessment_id)
-            # Apply organization filtering via goal (SelfAssessment -> Goal -> User)
-            query = self.apply_org_scope_via_goal(query, SelfAssessment.goal_id, org_id)
+            # Apply organization filtering
+            query = self.apply_org_scope_direct(query, SelfAssessment.organization_id, org_id)
             result = await self.session.execute(query)
             return result.scalars().first()
         except SQLAlchemyError as e:
@@ -119,8 +136,8 @@ class SelfAssessmentRepository(BaseRepository[SelfAssessment]):
                 )
                 .filter(SelfAssessment.id == assessment_id)
             )
-            # Apply organization filtering via goal (SelfAssessment -> Goal -> User)
-            query = self.apply_org_scope_via_goal(query, SelfAssessment.goal_id, org_id)
+            # Apply organization filtering
+            query = self.apply_org_scope_direct(query, SelfAssessment.organization_id, org_id)
             result = await self.session.execute(query)
             return result.scalars().unique().first()
         except SQLAlchemyError as e:
@@ -131,8 +148,8 @@ class SelfAssessmentRepository(BaseRepository[SelfAssessment]):
         """Get self-assessment by goal ID within organization scope."""
         try:
             query = select(SelfAssessment).filter(SelfAssessment.goal_id == goal_id)
-            # Apply organization filtering via goal (SelfAssessment -> Goal -> User)
-            query = self.apply_org_scope_via_goal(query, SelfAssessment.goal_id, org_id)
+            # Apply organization filtering
+            query = self.apply_org_scope_direct(query, SelfAssessment.organization_id, org_id)
             result = await self.session.execute(query)
             return result.scalars().first()
         except SQLAlchemyError as e:
@@ -159,8 +176,8 @@ class SelfAssessmentRepository(BaseRepository[SelfAssessment]):
                     )
                 )
             )
-            # Apply organization filtering via goal
-            query = self.apply_org_scope_via_goal(query, SelfAssessment.goal_id, org_id)
+            # Apply organization filtering
+            query = self.apply_org_scope_direct(query, SelfAssessment.organization_id, org_id)
             query = query.order_by(SelfAssessment.created_at.desc())
             
             result = await self.session.execute(query)
@@ -182,8 +199,8 @@ class SelfAssessmentRepository(BaseRepository[SelfAssessment]):
                 joinedload(SelfAssessment.goal).joinedload(Goal.user)
             ).filter(SelfAssessment.period_id == period_id)
             
-            # Enforce organization scope via goal -> user
-            query = self.apply_org_scope_via_goal(query, SelfAssessment.goal_id, org_id)
+            # Enforce organization scope
+            query = self.apply_org_scope_direct(query, SelfAssessment.organization_id, org_id)
             
             if status:
                 query = query.filter(SelfAssessment.status == status)
@@ -215,8 +232,8 @@ class SelfAssessmentRepository(BaseRepository[SelfAssessment]):
             if period_id:
                 query = query.filter(SelfAssessment.period_id == period_id)
 
-            # Enforce organization scope via goal -> user
-            query = self.apply_org_scope_via_goal(query, SelfAssessment.goal_id, org_id)
+            # Enforce organization scope
+            query = self.apply_org_scope_direct(query, SelfAssessment.organization_id, org_id)
             
             query = query.order_by(SelfAssessment.created_at.desc())
             
@@ -229,6 +246,36 @@ class SelfAssessmentRepository(BaseRepository[SelfAssessment]):
             logger.error(f"Error fetching self-assessments by status {status} in org {org_id}: {e}")
             raise
 
+    def _build_assessment_search_query(
+        self,
+        query,
+        org_id: str,
+        user_ids: Optional[List[UUID]],
+        period_id: Optional[UUID],
+        status: Optional[str],
+    ):
+        """Filters shared by search_assessments, count_assessments and search_assessments_page."""
+        if user_ids:
+            goal_alias = aliased(Goal)
+            query = query.join(goal_alias, SelfAssessment.goal_id == goal_alias.id)
+            query = self.apply_user_scope(query, goal_alias.user_id, user_ids)
+        
+        if period_id:
+            query = query.filter(SelfAssessment.period_id == period_id)
+        
+        if status:
+            query = query.filter(SelfAssessment.status == status)
+        
+        # Enforce organization scope
+        return self.apply_org_scope_direct(query, SelfAssessment.organization_id, org_id)
+
+    @staticmethod
+    def _assessment_select():
+        return select(SelfAssessment).options(
+            joinedload(SelfAssessment.goal).joinedload(Goal.user),
+            joinedload(SelfAssessment.period)
+        )
+
     async def search_assessments(
         self,
         org_id: str,
@@ -242,25 +289,10 @@ class SelfAssessmentRepository(BaseRepository[SelfAssessment]):
             if user_ids is not None and len(user_ids) == 0:
                 return []
 
-            query = select(SelfAssessment).options(
-                joinedload(SelfAssessment.goal).joinedload(Goal.user),
-                joinedload(SelfAssessment.period)
+            query = self._build_assessment_search_query(
+                self._assessment_select(), org_id, user_ids, period_id, status
             )
 
-            # Apply filters
-            if user_ids:
-                goal_alias = aliased(Goal)
-                query = query.join(goal_alias, SelfAssessment.goal_id == goal_alias.id).filter(goal_alias.user_id.in_(user_ids))
-            
-            if period_id:
-                query = query.filter(SelfAssessment.period_id == period_id)
-            
-            if status:
-                query = query.filter(SelfAssessment.status == status)
-            
-            # Enforce organization scope via goal -> user
-            query = self.apply_org_scope_via_goal(query, SelfAssessment.goal_id, org_id)
-
             # Apply ordering
             query = query.order_by(SelfAssessment.created_at.desc())
             
@@ -274,6 +306,32 @@ class SelfAssessmentRepository(BaseRepository[SelfAssessment]):
             logger.error(f"Error searching self-assessments in org {org_id}: {e}")
             raise
 
+    async def search_assessments_page(
+        self,
+        org_id: str,
+        user_ids: Optional[List[UUID]] = None,
+        period_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        pagination: Optional[PaginationParams] = None
+    ) -> tuple[list[dict], int]:
+        """
+        List page read model: ASSESSMENT_LIST_COLUMNS rows and the total in a single statement.
+
+        Rows are plain mappings (no related entities); use search_assessments when the
+        loaded relationships are needed.
+        """
+        try:
+            if user_ids is not None and len(user_ids) == 0:
+                return [], 0
+
+            query = self._build_assessment_search_query(
+                select(*ASSESSMENT_LIST_COLUMNS), org_id, user_ids, period_id, status
+            )
+            return await self.paginate(query.order_by(SelfAssessment.created_at.desc()), pagination)
+        except SQLAlchemyError as e:
+            logger.error(f"Error searching self-assessments page in org {org_id}: {e}")
+            raise
+
     async def count_assessments(
         self,
         org_id: str,
@@ -286,21 +344,9 @@ class SelfAssessmentRepository(BaseRepository[SelfAssessment]):
             if user_ids is not None and len(user_ids) == 0:
                 return 0
 
-            query = select(func.count(SelfAssessment.id))
-
-            # Apply same filters as search_assessments
-            if user_ids:
-                goal_alias = aliased(Goal)
-                query = query.join(goal_alias, SelfAssessment.goal_id == goal_alias.id).filter(goal_alias.user_id.in_(user_ids))
-            
-            if period_id:
-                query = query.filter(SelfAssessment.period_id == period_id)
-            
-            if status:
-                query = query.filter(SelfAssessment.status == status)
-
-            # Enforce organization scope via goal -> user
-            query = self.apply_org_scope_via_goal(query, SelfAssessment.goal_id, org_id)
+            query = self._build_assessment_search_query(
+                select(func.count(SelfAssessment.id)), org_id, user_ids, period_id, status
+            )
             
             result = await self.session.execute(query)
             return result.scalar() or 0
@@ -508,19 +554,10 @@ class SelfAssessmentRepository(BaseRepository[SelfAssessment]):
 
     async def _validate_goal_exists(self, goal_id: UUID, org_id: str) -> Goal:
         """Validate goal exists within organization and return it, raise NotFoundError if not."""
-        result = await self.session.execute(
-            select(Goal).filter(Goal.id == goal_id)
-        )
-        goal = result.scalars().first()
-        if not goal:
-            raise NotFoundError(f"Goal not found: {goal_id}")
-
-        # Verify goal belongs to organization via user relationship
-        # Use the BaseRepository helper to enforce organization scope
         query = select(Goal).filter(Goal.id == goal_id)
-        query = self.apply_org_scope_via_user(query, Goal.user_id, org_id)
-        org_scoped = (await self.session.execute(query)).scalars().first()
-        if not org_scoped:
+        query = self.apply_org_scope_direct(query, Goal.organization_id, org_id)
+        goal = (await self.session.execute(query)).scalars().first()
+        if not goal:
             raise NotFoundError(f"Goal {goal_id} not found in organization {org_id}")
 
         return goal
@@ -580,7 +617,7 @@ class SelfAssessmentRepository(BaseRepository[SelfAssessment]):
             )
 
             # Apply organization scope
-            query = self.apply_org_scope_via_goal(query, SelfAssessment.goal_id, org_id)
+            query = self.apply_org_scope_direct(query, SelfAssessment.organization_id, org_id)
 
             result = await self.session.execute(query)
             rows = result.all()
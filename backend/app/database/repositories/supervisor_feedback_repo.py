@@ -23,6 +23,27 @@ from .base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Columns behind the SupervisorFeedback list response; list pages select only these
+# instead of loading the self_assessment -> goal -> user / period graph per row.
+FEEDBACK_LIST_COLUMNS = (
+    SupervisorFeedback.id,
+    SupervisorFeedback.self_assessment_id,
+    SupervisorFeedback.period_id,
+    SupervisorFeedback.supervisor_id,
+    SupervisorFeedback.subordinate_id,
+    SupervisorFeedback.supervisor_rating_code,
+    SupervisorFeedback.supervisor_rating,
+    SupervisorFeedback.supervisor_comment,
+    SupervisorFeedback.return_comment,
+    SupervisorFeedback.rating_data,
+    SupervisorFeedback.action,
+    SupervisorFeedback.status,
+    SupervisorFeedback.submitted_at,
+    SupervisorFeedback.reviewed_at,
+    SupervisorFeedback.created_at,
+    SupervisorFeedback.updated_at,
+)
+
 
 class SupervisorFeedbackRepository(BaseRepository[SupervisorFeedback]):
     """Repository for SupervisorFeedback database operations following established patterns"""
@@ -73,6 +94,7 @@ class SupervisorFeedbackRepository(BaseRepository[SupervisorFeedback]):
             # Create feedback with validated data
             feedback = SupervisorFeedback(
                 self_assessment_id=feedback_data.self_assessment_id,
+                organization_id=org_id,
                 period_id=feedback_data.period_id,
                 supervisor_id=supervisor_id,
                 subordinate_id=subordinate_id,
@@ -116,17 +138,11 @@ class SupervisorFeedbackRepository(BaseRepository[SupervisorFeedback]):
     async def get_by_id(self, feedback_id: UUID, org_id: str) -> Optional[SupervisorFeedback]:
         """Get supervisor feedback by ID within organization scope."""
         try:
-            from ..models.goal import Goal
-            from ..models.user import User
-            
             query = (
                 select(SupervisorFeedback)
-                .join(SelfAssessment, SupervisorFeedback.self_assessment_id == SelfAssessment.id)
-                .join(Goal, SelfAssessment.goal_id == Goal.id)
-                .join(User, Goal.user_id == User.id)
                 .filter(
                     SupervisorFeedback.id == feedback_id,
-                    User.clerk_organization_id == org_id
+                    SupervisorFeedback.organization_id == org_id
                 )
             )
             result = await self.session.execute(query)
@@ -138,9 +154,6 @@ class SupervisorFeedbackRepository(BaseRepository[SupervisorFeedback]):
     async def get_by_id_with_details(self, feedback_id: UUID, org_id: str) -> Optional[SupervisorFeedback]:
         """Get supervisor feedback by ID with all related data for SupervisorFeedbackDetail response within organization scope."""
         try:
-            from ..models.goal import Goal
-            from ..models.user import User
-            
             query = (
                 select(SupervisorFeedback)
                 .options(
@@ -151,12 +164,9 @@ class SupervisorFeedbackRepository(BaseRepository[SupervisorFeedback]):
                     # Supervisor user data
                     joinedload(SupervisorFeedback.supervisor)
                 )
-                .join(SelfAssessment, SupervisorFeedback.self_assessment_id == SelfAssessment.id)
-                .join(Goal, SelfAssessment.goal_id == Goal.id)
-                .join(User, Goal.user_id == User.id)
                 .filter(
                     SupervisorFeedback.id == feedback_id,
-                    User.clerk_organization_id == org_id
+                    SupervisorFeedback.organization_id == org_id
                 )
             )
             result = await self.session.execute(query)
@@ -168,17 +178,11 @@ class SupervisorFeedbackRepository(BaseRepository[SupervisorFeedback]):
     async def get_by_self_assessment(self, self_assessment_id: UUID, org_id: str) -> Optional[SupervisorFeedback]:
         """Get supervisor feedback by self-assessment ID within organization scope."""
         try:
-            from ..models.goal import Goal
-            from ..models.user import User
-            
             query = (
                 select(SupervisorFeedback)
-                .join(SelfAssessment, SupervisorFeedback.self_assessment_id == SelfAssessment.id)
-                .join(Goal, SelfAssessment.goal_id == Goal.id)
-                .join(User, Goal.user_id == User.id)
                 .filter(
                     SupervisorFeedback.self_assessment_id == self_assessment_id,
-                    User.clerk_organization_id == org_id
+                    SupervisorFeedback.organization_id == org_id
                 )
             )
             result = await self.session.execute(query)
@@ -195,22 +199,16 @@ class SupervisorFeedbackRepository(BaseRepository[SupervisorFeedback]):
     ) -> List[SupervisorFeedback]:
         """Get all supervisor feedbacks for a supervisor in a specific period within organization scope."""
         try:
-            from ..models.goal import Goal
-            from ..models.user import User
-            
             query = (
                 select(SupervisorFeedback)
                 .options(
                     joinedload(SupervisorFeedback.self_assessment).joinedload(SelfAssessment.goal).joinedload(Goal.user)
                 )
-                .join(SelfAssessment, SupervisorFeedback.self_assessment_id == SelfAssessment.id)
-                .join(Goal, SelfAssessment.goal_id == Goal.id)
-                .join(User, Goal.user_id == User.id)
                 .filter(
                     and_(
                         SupervisorFeedback.supervisor_id == supervisor_id,
                         SupervisorFeedback.period_id == period_id,
-                        User.clerk_organization_id == org_id
+                        SupervisorFeedback.organization_id == org_id
                     )
                 )
                 .order_by(SupervisorFeedback.created_at.desc())
@@ -230,21 +228,15 @@ class SupervisorFeedbackRepository(BaseRepository[SupervisorFeedback]):
     ) -> List[SupervisorFeedback]:
         """Get supervisor feedbacks by period with optional status filter within organization scope."""
         try:
-            from ..models.goal import Goal
-            from ..models.user import User
-            
             query = (
                 select(SupervisorFeedback)
                 .options(
                     joinedload(SupervisorFeedback.self_assessment).joinedload(SelfAssessment.goal).joinedload(Goal.user),
                     joinedload(SupervisorFeedback.supervisor)
                 )
-                .join(SelfAssessment, SupervisorFeedback.self_assessment_id == SelfAssessment.id)
-                .join(Goal, SelfAssessment.goal_id == Goal.id)
-                .join(User, Goal.user_id == User.id)
                 .filter(
                     SupervisorFeedback.period_id == period_id,
-                    User.clerk_organization_id == org_id
+                    SupervisorFeedback.organization_id == org_id
                 )
             )
             
@@ -272,21 +264,15 @@ class SupervisorFeedbackRepository(BaseRepository[SupervisorFeedback]):
     ) -> List[SupervisorFeedback]:
         """Get supervisor feedbacks by status with optional filters within organization scope."""
         try:
-            from ..models.goal import Goal
-            from ..models.user import User
-            
             query = (
                 select(SupervisorFeedback)
                 .options(
                     joinedload(SupervisorFeedback.self_assessment).joinedload(SelfAssessment.goal).joinedload(Goal.user),
                     joinedload(SupervisorFeedback.supervisor)
                 )
-                .join(SelfAssessment, SupervisorFeedback.self_assessment_id == SelfAssessment.id)
-                .join(Goal, SelfAssessment.goal_id == Goal.id)
-                .join(User, Goal.user_id == User.id)
                 .filter(
                     SupervisorFeedback.status == status,
-                    User.clerk_organization_id == org_id
+                    SupervisorFeedback.organization_id == org_id
                 )
             )
             
@@ -307,6 +293,66 @@ class SupervisorFeedbackRepository(BaseRepository[SupervisorFeedback]):
             logger.error(f"Error fetching supervisor feedbacks by status {status} in org {org_id}: {e}")
             raise
 
+    def _build_feedback_search_query(
+        self,
+        query,
+        org_id: str,
+        supervisor_ids: Optional[List[UUID]],
+        subordinate_ids: Optional[List[UUID]],
+        period_id: Optional[UUID],
+        status: Optional[str],
+        action: Optional[str],
+        user_ids: Optional[List[UUID]],
+        has_return_comment: Optional[bool],
+    ):
+        """Joins and filters shared by search_feedbacks, count_feedbacks and search_feedbacks_page."""
+        query = self.apply_org_scope_direct(query, SupervisorFeedback.organization_id, org_id)
+
+        # Apply filters
+        if supervisor_ids is not None:
+            query = query.filter(SupervisorFeedback.supervisor_id.in_(supervisor_ids))
+
+        if subordinate_ids is not None:
+            query = query.filter(SupervisorFeedback.subordinate_id.in_(subordinate_ids))
+
+        if period_id:
+            query = query.filter(SupervisorFeedback.period_id == period_id)
+
+        if status:
+            query = query.filter(SupervisorFeedback.status == status)
+
+        if action:
+            query = query.filter(SupervisorFeedback.action == action)
+
+        if user_ids is not None:
+            # Filter by assessment owners (employees)
+            query = (
+                query
+                .join(SelfAssessment, SupervisorFeedback.self_assessment_id == SelfAssessment.id)
+                .join(Goal, SelfAssessment.goal_id == Goal.id)
+            )
+            query = self.apply_user_scope(query, Goal.user_id, user_ids)
+
+        if has_return_comment is not None:
+            if has_return_comment:
+                query = query.filter(SupervisorFeedback.return_comment.isnot(None))
+            else:
+                query = query.filter(SupervisorFeedback.return_comment.is_(None))
+
+        return query
+
+    @staticmethod
+    def _feedback_search_is_empty(*id_filters: Optional[List[UUID]]) -> bool:
+        return any(ids is not None and len(ids) == 0 for ids in id_filters)
+
+    def _feedback_select(self):
+        return select(SupervisorFeedback).options(
+            joinedload(SupervisorFeedback.self_assessment).joinedload(SelfAssessment.goal).joinedload(Goal.user),
+            joinedload(SupervisorFeedback.supervisor),
+            joinedload(SupervisorFeedback.subordinate),
+            joinedload(SupervisorFeedback.period)
+        )
+
     async def search_feedbacks(
         self,
         org_id: str,
@@ -321,56 +367,14 @@ class SupervisorFeedbackRepository(BaseRepository[SupervisorFeedback]):
     ) -> List[SupervisorFeedback]:
         """Search supervisor feedbacks with various filters within organization scope."""
         try:
-            if supervisor_ids is not None and len(supervisor_ids) == 0:
+            if self._feedback_search_is_empty(supervisor_ids, subordinate_ids, user_ids):
                 return []
-            if subordinate_ids is not None and len(subordinate_ids) == 0:
-                return []
-            if user_ids is not None and len(user_ids) == 0:
-                return []
-
-            from ..models.goal import Goal
-            from ..models.user import User
 
-            query = (
-                select(SupervisorFeedback)
-                .options(
-                    joinedload(SupervisorFeedback.self_assessment).joinedload(SelfAssessment.goal).joinedload(Goal.user),
-                    joinedload(SupervisorFeedback.supervisor),
-                    joinedload(SupervisorFeedback.subordinate),
-                    joinedload(SupervisorFeedback.period)
-                )
-                .join(SelfAssessment, SupervisorFeedback.self_assessment_id == SelfAssessment.id)
-                .join(Goal, SelfAssessment.goal_id == Goal.id)
-                .join(User, Goal.user_id == User.id)
-                .filter(User.clerk_organization_id == org_id)
+            query = self._build_feedback_search_query(
+                self._feedback_select(), org_id, supervisor_ids, subordinate_ids,
+                period_id, status, action, user_ids, has_return_comment,
             )
 
-            # Apply filters
-            if supervisor_ids is not None:
-                query = query.filter(SupervisorFeedback.supervisor_id.in_(supervisor_ids))
-
-            if subordinate_ids is not None:
-                query = query.filter(SupervisorFeedback.subordinate_id.in_(subordinate_ids))
-
-            if period_id:
-                query = query.filter(SupervisorFeedback.period_id == period_id)
-
-            if status:
-                query = query.filter(SupervisorFeedback.status == status)
-
-            if action:
-                query = query.filter(SupervisorFeedback.action == action)
-
-            if user_ids is not None:
-                # Filter by assessment owners (employees) - already joined with Goal
-                query = query.filter(Goal.user_id.in_(user_ids))
-
-            if has_return_comment is not None:
-                if has_return_comment:
-                    query = query.filter(SupervisorFeedback.return_comment.isnot(None))
-                else:
-                    query = query.filter(SupervisorFeedback.return_comment.is_(None))
-
             # Apply ordering
             query = query.order_by(SupervisorFeedback.created_at.desc())
 
@@ -384,6 +388,37 @@ class SupervisorFeedbackRepository(BaseRepository[SupervisorFeedback]):
             logger.error(f"Error searching supervisor feedbacks: {e}")
             raise
 
+    async def search_feedbacks_page(
+        self,
+        org_id: str,
+        supervisor_ids: Optional[List[UUID]] = None,
+        subordinate_ids: Optional[List[UUID]] = None,
+        period_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        action: Optional[str] = None,
+        user_ids: Optional[List[UUID]] = None,
+        has_return_comment: Optional[bool] = None,
+        pagination: Optional[PaginationParams] = None
+    ) -> tuple[list[dict], int]:
+        """
+        List page read model: FEEDBACK_LIST_COLUMNS rows and the total in a single statement.
+
+        Rows are plain mappings (no related entities); use search_feedbacks when the
+        loaded relationships are needed.
+        """
+        try:
+            if self._feedback_search_is_empty(supervisor_ids, subordinate_ids, user_ids):
+                return [], 0
+
+            query = self._build_feedback_search_query(
+                select(*FEEDBACK_LIST_COLUMNS), org_id, supervisor_ids, subordinate_ids,
+                period_id, status, action, user_ids, has_return_comment,
+            )
+            return await self.paginate(query.order_by(SupervisorFeedback.created_at.desc()), pagination)
+        except SQLAlchemyError as e:
+            logger.error(f"Error searching supervisor feedbacks page in org {org_id}: {e}")
+            raise
+
     async def count_feedbacks(
         self,
         org_id: str,
@@ -397,50 +432,14 @@ class SupervisorFeedbackRepository(BaseRepository[SupervisorFeedback]):
     ) -> int:
         """Count supervisor feedbacks matching the given filters within organization scope."""
         try:
-            if supervisor_ids is not None and len(supervisor_ids) == 0:
-                return 0
-            if subordinate_ids is not None and len(subordinate_ids) == 0:
-                return 0
-            if user_ids is not None and len(user_ids) == 0:
+            if self._feedback_search_is_empty(supervisor_ids, subordinate_ids, user_ids):
                 return 0
 
-            from ..models.goal import Goal
-            from ..models.user import User
-
-            query = (
-                select(func.count(SupervisorFeedback.id))
-                .join(SelfAssessment, SupervisorFeedback.self_assessment_id == SelfAssessment.id)
-                .join(Goal, SelfAssessment.goal_id == Goal.id)
-                .join(User, Goal.user_id == User.id)
-                .filter(User.clerk_organization_id == org_id)
+            query = self._build_feedback_search_query(
+                select(func.count(SupervisorFeedback.id)), org_id, supervisor_ids, subordinate_ids,
+                period_id, status, action, user_ids, has_return_comment,
             )
 
-            # Apply same filters as search_feedbacks
-            if supervisor_ids is not None:
-                query = query.filter(SupervisorFeedback.supervisor_id.in_(supervisor_ids))
-
-            if subordinate_ids is not None:
-                query = query.filter(SupervisorFeedback.subordinate_id.in_(subordinate_ids))
-
-            if period_id:
-                query = query.filter(SupervisorFeedback.period_id == period_id)
-
-            if status:
-                query = query.filter(SupervisorFeedback.status == status)
-
-            if action:
-                query = query.filter(SupervisorFeedback.action == action)
-
-            if user_ids is not None:
-                # Filter by assessment owners (employees) - already joined with Goal
-                query = query.filter(Goal.user_id.in_(user_ids))
-
-            if has_return_comment is not None:
-                if has_return_comment:
-                    query = query.filter(SupervisorFeedback.return_comment.isnot(None))
-                else:
-                    query = query.filter(SupervisorFeedback.return_comment.is_(None))
-
             result = await self.session.execute(query)
             return result.scalar() or 0
         except SQLAlchemyError as e:
@@ -807,16 +806,12 @@ class SupervisorFeedbackRepository(BaseRepository[SupervisorFeedback]):
 
     async def _validate_self_assessment_exists(self, self_assessment_id: UUID, org_id: str) -> SelfAssessment:
         """Validate self-assessment exists within organization scope and return it with goal loaded."""
-        from ..models.user import User
-
         result = await self.session.execute(
             select(SelfAssessment)
             .options(joinedload(SelfAssessment.goal))
-            .join(Goal, SelfAssessment.goal_id == Goal.id)
-            .join(User, Goal.user_id == User.id)
             .filter(
                 SelfAssessment.id == self_assessment_id,
-                User.clerk_organization_id == org_id
+                SelfAssessment.organization_id == org_id
             )
         )
         self_assessment = result.scalars().first()
@@ -1,9 +1,9 @@
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID, uuid4
 
-from sqlalchemy import select, update as sa_update, delete as sa_delete, and_, func
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, update as sa_update, delete as sa_delete, and_, func, literal_column
+from sqlalchemy.orm import aliased, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.supervisor_review import SupervisorReview
@@ -13,6 +13,22 @@ from .base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Columns behind the SupervisorReview list response; the *_page read models select
+# only these and return plain mappings instead of ORM instances.
+REVIEW_LIST_COLUMNS = (
+    SupervisorReview.id,
+    SupervisorReview.goal_id,
+    SupervisorReview.period_id,
+    SupervisorReview.supervisor_id,
+    SupervisorReview.subordinate_id,
+    SupervisorReview.action,
+    SupervisorReview.comment,
+    SupervisorReview.status,
+    SupervisorReview.reviewed_at,
+    SupervisorReview.created_at,
+    SupervisorReview.updated_at,
+)
+
 
 class SupervisorReviewRepository(BaseRepository[SupervisorReview]):
     """Repository for SupervisorReview database operations following established patterns."""
@@ -157,6 +173,84 @@ class SupervisorReviewRepository(BaseRepository[SupervisorReview]):
         logger.info(f"Batch fetched {len(reviews_map)} rejection reviews for {len(goal_ids)} goals in org {org_id}")
         return reviews_map
 
+    async def get_rejection_histories_for_chains(
+        self,
+        start_goal_ids: List[UUID],
+        org_id: str,
+        max_depth: int = 10,
+    ) -> dict[UUID, List[SupervisorReview]]:
+        """
+        Fetch rejection histories for whole previous_goal_id chains in a single SQL query.
+
+        A recursive CTE walks each chain from its start goal (depth 0) back through
+        previous_goal_id, up to max_depth goals, and the rejection reviews of every goal
+        on every chain are joined in the same statement.
+
+        Args:
+            start_goal_ids: Goal IDs each chain starts from (a resubmitted goal's previous_goal_id)
+            org_id: Organization ID for scoping
+            max_depth: Maximum number of goals followed per chain
+
+        Returns:
+            Dictionary mapping start goal ID to its rejection reviews, oldest first.
+            Chains without any rejection review are absent.
+        """
+        if not start_goal_ids or max_depth < 1:
+            return {}
+
+        chain = (
+            select(
+                Goal.id.label("start_id"),
+                Goal.id.label("goal_id"),
+                Goal.previous_goal_id.label("previous_goal_id"),
+                literal_column("0").label("depth"),
+            )
+            .where(Goal.id.in_(start_goal_ids), Goal.organization_id == org_id)
+            .cte("goal_chain", recursive=True)
+        )
+        previous = aliased(Goal)
+        chain = chain.union_all(
+            select(
+                chain.c.start_id,
+                previous.id,
+                previous.previous_goal_id,
+                chain.c.depth + 1,
+            )
+            .join(previous, previous.id == chain.c.previous_goal_id)
+            .where(previous.organization_id == org_id, chain.c.depth < max_depth - 1)
+        )
+
+        query = (
+            select(chain.c.start_id, chain.c.depth, SupervisorReview)
+            .join(SupervisorReview, SupervisorReview.goal_id == chain.c.goal_id)
+            .options(joinedload(SupervisorReview.supervisor))
+            .where(SupervisorReview.action == 'REJECTED')
+            .order_by(
+                chain.c.start_id,
+                chain.c.depth,
+                SupervisorReview.reviewed_at.desc().nulls_last(),
+                SupervisorReview.updated_at.desc(),
+            )
+        )
+        result = await self.session.execute(query)
+
+        # Rows arrive newest goal first; keep the most recent rejection per goal, and the
+        # first occurrence of a goal per chain (a circular chain repeats goals).
+        histories: dict[UUID, List[SupervisorReview]] = {}
+        seen: set[Tuple[UUID, UUID]] = set()
+        for start_id, _depth, review in result.all():
+            key = (start_id, review.goal_id)
+            if key in seen:
+                continue
+            seen.add(key)
+            histories.setdefault(start_id, []).append(review)
+
+        for history in histories.values():
+            history.reverse()
+
+        logger.info(f"Fetched rejection histories for {len(start_goal_ids)} goal chains in org {org_id}")
+        return histories
+
     async def get_by_goals_batch(
         self,
         goal_ids: List[UUID],
@@ -263,20 +357,17 @@ class SupervisorReviewRepository(BaseRepository[SupervisorReview]):
         result = await self.session.execute(query)
         return set(result.scalars().all())
 
-    async def get_by_supervisor(
-        self,
-        supervisor_id: UUID,
-        org_id: str,
+    # Query builders shared by the list, count and *_page variants below.
+
+    @staticmethod
+    def _filter_reviews(
+        query,
         *,
         period_id: Optional[UUID] = None,
         goal_id: Optional[UUID] = None,
         subordinate_id: Optional[UUID] = None,
         status: Optional[str] = None,
-        pagination: Optional[PaginationParams] = None,
-    ) -> List[SupervisorReview]:
-        query = select(SupervisorReview).filter(
-            SupervisorReview.supervisor_id == supervisor_id
-        )
+    ):
         if period_id:
             query = query.filter(SupervisorReview.period_id == period_id)
         if goal_id:
@@ -285,17 +376,46 @@ class SupervisorReviewRepository(BaseRepository[SupervisorReview]):
             query = query.filter(SupervisorReview.subordinate_id == subordinate_id)
         if status:
             query = query.filter(SupervisorReview.status == status)
+        return query
 
+    def _by_supervisor_query(self, query, supervisor_id: UUID, org_id: str, **filters):
+        query = self._filter_reviews(query.filter(SupervisorReview.supervisor_id == supervisor_id), **filters)
         # Enforce organization scope via goal -> user
-        query = self.apply_org_scope_via_goal(query, SupervisorReview.goal_id, org_id)
+        return self.apply_org_scope_via_goal(query, SupervisorReview.goal_id, org_id)
 
-        query = query.order_by(SupervisorReview.updated_at.desc())
+    def _for_goal_owner_query(self, query, owner_user_id: UUID, org_id: str, **filters):
+        query = self._filter_reviews(query, **filters)
+        # Apply organization scope and owner filter via single JOIN to avoid duplication
+        return self.apply_org_scope_via_goal_with_owner(query, SupervisorReview.goal_id, org_id, owner_user_id)
+
+    def _pending_query(self, query, supervisor_id: UUID, org_id: str, **filters):
+        # Pending = draft reviews for goals currently pending approval
+        query = query.filter(
+            and_(
+                SupervisorReview.supervisor_id == supervisor_id,
+                SupervisorReview.status == "draft",
+            )
+        )
+        query = self._filter_reviews(query, **filters)
+        # Apply organization scope and goal status filter via single JOIN
+        return self.apply_org_scope_via_goal_with_status(query, SupervisorReview.goal_id, org_id, "submitted")
+
+    def _org_query(self, query, org_id: str, **filters):
+        query = self._filter_reviews(query, **filters)
+        # Enforce organization scope via goal -> user
+        return self.apply_org_scope_via_goal(query, SupervisorReview.goal_id, org_id)
+
+    async def _fetch(self, query, pagination: Optional[PaginationParams]) -> List[SupervisorReview]:
         if pagination:
             query = query.offset(pagination.offset).limit(pagination.limit)
         result = await self.session.execute(query)
         return result.scalars().all()
 
-    async def count_by_supervisor(
+    async def _count(self, query) -> int:
+        result = await self.session.execute(query)
+        return int(result.scalar() or 0)
+
+    async def get_by_supervisor(
         self,
         supervisor_id: UUID,
         org_id: str,
@@ -304,24 +424,46 @@ class SupervisorReviewRepository(BaseRepository[SupervisorReview]):
         goal_id: Optional[UUID] = None,
         subordinate_id: Optional[UUID] = None,
         status: Optional[str] = None,
-    ) -> int:
-        query = select(func.count(SupervisorReview.id)).filter(
-            SupervisorReview.supervisor_id == supervisor_id
+        pagination: Optional[PaginationParams] = None,
+    ) -> List[SupervisorReview]:
+        query = self._by_supervisor_query(
+            select(SupervisorReview), supervisor_id, org_id,
+            period_id=period_id, goal_id=goal_id, subordinate_id=subordinate_id, status=status,
         )
-        if period_id:
-            query = query.filter(SupervisorReview.period_id == period_id)
-        if goal_id:
-            query = query.filter(SupervisorReview.goal_id == goal_id)
-        if subordinate_id:
-            query = query.filter(SupervisorReview.subordinate_id == subordinate_id)
-        if status:
-            query = query.filter(SupervisorReview.status == status)
+        return await self._fetch(query.order_by(SupervisorReview.updated_at.desc()), pagination)
 
-        # Enforce organization scope via goal -> user
-        query = self.apply_org_scope_via_goal(query, SupervisorReview.goal_id, org_id)
+    async def get_by_supervisor_page(
+        self,
+        supervisor_id: UUID,
+        org_id: str,
+        *,
+        period_id: Optional[UUID] = None,
+        goal_id: Optional[UUID] = None,
+        subordinate_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        pagination: Optional[PaginationParams] = None,
+    ) -> Tuple[List[dict], int]:
+        """get_by_supervisor and count_by_supervisor in a single statement, as REVIEW_LIST_COLUMNS rows."""
+        query = self._by_supervisor_query(
+            select(*REVIEW_LIST_COLUMNS), supervisor_id, org_id,
+            period_id=period_id, goal_id=goal_id, subordinate_id=subordinate_id, status=status,
+        )
+        return await self.paginate(query.order_by(SupervisorReview.updated_at.desc()), pagination)
 
-        result = await self.session.execute(query)
-        return result.scalar() or 0
+    async def count_by_supervisor(
+        self,
+        supervisor_id: UUID,
+        org_id: str,
+        *,
+        period_id: Optional[UUID] = None,
+        goal_id: Optional[UUID] = None,
+        subordinate_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+    ) -> int:
+        return await self._count(self._by_supervisor_query(
+            select(func.count(SupervisorReview.id)), supervisor_id, org_id,
+            period_id=period_id, goal_id=goal_id, subordinate_id=subordinate_id, status=status,
+        ))
 
     async def get_for_goal_owner(
         self,
@@ -333,24 +475,28 @@ class SupervisorReviewRepository(BaseRepository[SupervisorReview]):
         status: Optional[str] = None,
         pagination: Optional[PaginationParams] = None,
     ) -> List[SupervisorReview]:
-        # Base query without manual JOIN - apply_org_scope_via_goal_with_owner handles the JOIN
-        query = select(SupervisorReview)
-
-        if period_id:
-            query = query.filter(SupervisorReview.period_id == period_id)
-        if goal_id:
-            query = query.filter(SupervisorReview.goal_id == goal_id)
-        if status:
-            query = query.filter(SupervisorReview.status == status)
-
-        # Apply organization scope and owner filter via single JOIN to avoid duplication
-        query = self.apply_org_scope_via_goal_with_owner(query, SupervisorReview.goal_id, org_id, owner_user_id)
+        query = self._for_goal_owner_query(
+            select(SupervisorReview), owner_user_id, org_id,
+            period_id=period_id, goal_id=goal_id, status=status,
+        )
+        return await self._fetch(query.order_by(SupervisorReview.updated_at.desc()), pagination)
 
-        query = query.order_by(SupervisorReview.updated_at.desc())
-        if pagination:
-            query = query.offset(pagination.offset).limit(pagination.limit)
-        result = await self.session.execute(query)
-        return result.scalars().all()
+    async def get_for_goal_owner_page(
+        self,
+        owner_user_id: UUID,
+        org_id: str,
+        *,
+        period_id: Optional[UUID] = None,
+        goal_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        pagination: Optional[PaginationParams] = None,
+    ) -> Tuple[List[dict], int]:
+        """get_for_goal_owner and count_for_goal_owner in a single statement, as REVIEW_LIST_COLUMNS rows."""
+        query = self._for_goal_owner_query(
+            select(*REVIEW_LIST_COLUMNS), owner_user_id, org_id,
+            period_id=period_id, goal_id=goal_id, status=status,
+        )
+        return await self.paginate(query.order_by(SupervisorReview.updated_at.desc()), pagination)
 
     async def count_for_goal_owner(
         self,
@@ -361,20 +507,10 @@ class SupervisorReviewRepository(BaseRepository[SupervisorReview]):
         goal_id: Optional[UUID] = None,
         status: Optional[str] = None,
     ) -> int:
-        query = select(func.count(SupervisorReview.id))
-
-        if period_id:
-            query = query.filter(SupervisorReview.period_id == period_id)
-        if goal_id:
-            query = query.filter(SupervisorReview.goal_id == goal_id)
-        if status:
-            query = query.filter(SupervisorReview.status == status)
-
-        # Apply organization scope and owner filter via single JOIN to avoid duplication
-        query = self.apply_org_scope_via_goal_with_owner(query, SupervisorReview.goal_id, org_id, owner_user_id)
-
-        result = await self.session.execute(query)
-        return result.scalar() or 0
+        return await self._count(self._for_goal_owner_query(
+            select(func.count(SupervisorReview.id)), owner_user_id, org_id,
+            period_id=period_id, goal_id=goal_id, status=status,
+        ))
 
     async def get_pending_reviews(
         self,
@@ -385,29 +521,27 @@ class SupervisorReviewRepository(BaseRepository[SupervisorReview]):
         subordinate_id: Optional[UUID] = None,
         pagination: Optional[PaginationParams] = None,
     ) -> List[SupervisorReview]:
-        # Pending = draft reviews for goals currently pending approval
-        query = (
-            select(SupervisorReview)
-            .filter(
-                and_(
-                    SupervisorReview.supervisor_id == supervisor_id,
-                    SupervisorReview.status == "draft",
-                )
-            )
+        query = self._pending_query(
+            select(SupervisorReview), supervisor_id, org_id,
+            period_id=period_id, subordinate_id=subordinate_id,
         )
-        if period_id:
-            query = query.filter(SupervisorReview.period_id == period_id)
-        if subordinate_id:
-            query = query.filter(SupervisorReview.subordinate_id == subordinate_id)
-        if pagination:
-            query = query.offset(pagination.offset).limit(pagination.limit)
+        return await self._fetch(query.order_by(SupervisorReview.updated_at.asc()), pagination)
 
-        # Apply organization scope and goal status filter via single JOIN
-        # This replaces the manual JOIN to avoid duplication
-        query = self.apply_org_scope_via_goal_with_status(query, SupervisorReview.goal_id, org_id, "submitted")
-        query = query.order_by(SupervisorReview.updated_at.asc())
-        result = await self.session.execute(query)
-        return result.scalars().all()
+    async def get_pending_reviews_page(
+        self,
+        supervisor_id: UUID,
+        org_id: str,
+        *,
+        period_id: Optional[UUID] = None,
+        subordinate_id: Optional[UUID] = None,
+        pagination: Optional[PaginationParams] = None,
+    ) -> Tuple[List[dict], int]:
+        """get_pending_reviews and count_pending_reviews in a single statement, as REVIEW_LIST_COLUMNS rows."""
+        query = self._pending_query(
+            select(*REVIEW_LIST_COLUMNS), supervisor_id, org_id,
+            period_id=period_id, subordinate_id=subordinate_id,
+        )
+        return await self.paginate(query.order_by(SupervisorReview.updated_at.asc()), pagination)
 
     async def count_pending_reviews(
         self,
@@ -418,23 +552,10 @@ class SupervisorReviewRepository(BaseRepository[SupervisorReview]):
         subordinate_id: Optional[UUID] = None,
     ) -> int:
         """Count pending reviews that need attention (supervisor only)."""
-        query = (
-            select(func.count(SupervisorReview.id))
-            .filter(
-                and_(
-                    SupervisorReview.supervisor_id == supervisor_id,
-                    SupervisorReview.status == "draft",
-                )
-            )
-        )
-        if period_id:
-            query = query.filter(SupervisorReview.period_id == period_id)
-        if subordinate_id:
-            query = query.filter(SupervisorReview.subordinate_id == subordinate_id)
-
-        query = self.apply_org_scope_via_goal_with_status(query, SupervisorReview.goal_id, org_id, "submitted")
-        result = await self.session.execute(query)
-        return int(result.scalar() or 0)
+        return await self._count(self._pending_query(
+            select(func.count(SupervisorReview.id)), supervisor_id, org_id,
+            period_id=period_id, subordinate_id=subordinate_id,
+        ))
 
     async def search(
         self,
@@ -447,24 +568,28 @@ class SupervisorReviewRepository(BaseRepository[SupervisorReview]):
         pagination: Optional[PaginationParams] = None,
     ) -> List[SupervisorReview]:
         """Search reviews for admin across organization-scoped supervisors/goals."""
-        query = select(SupervisorReview)
-        if period_id:
-            query = query.filter(SupervisorReview.period_id == period_id)
-        if goal_id:
-            query = query.filter(SupervisorReview.goal_id == goal_id)
-        if subordinate_id:
-            query = query.filter(SupervisorReview.subordinate_id == subordinate_id)
-        if status:
-            query = query.filter(SupervisorReview.status == status)
-
-        # Enforce organization scope via goal -> user
-        query = self.apply_org_scope_via_goal(query, SupervisorReview.goal_id, org_id)
+        query = self._org_query(
+            select(SupervisorReview), org_id,
+            period_id=period_id, goal_id=goal_id, subordinate_id=subordinate_id, status=status,
+        )
+        return await self._fetch(query.order_by(SupervisorReview.updated_at.desc()), pagination)
 
-        query = query.order_by(SupervisorReview.updated_at.desc())
-        if pagination:
-            query = query.offset(pagination.offset).limit(pagination.limit)
-        result = await self.session.execute(query)
-        return result.scalars().all()
+    async def search_page(
+        self,
+        org_id: str,
+        *,
+        period_id: Optional[UUID] = None,
+        goal_id: Optional[UUID] = None,
+        subordinate_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        pagination: Optional[PaginationParams] = None,
+    ) -> Tuple[List[dict], int]:
+        """search and count_all in a single statement, as REVIEW_LIST_COLUMNS rows."""
+        query = self._org_query(
+            select(*REVIEW_LIST_COLUMNS), org_id,
+            period_id=period_id, goal_id=goal_id, subordinate_id=subordinate_id, status=status,
+        )
+        return await self.paginate(query.order_by(SupervisorReview.updated_at.desc()), pagination)
 
     async def count_all(
         self,
@@ -475,21 +600,10 @@ class SupervisorReviewRepository(BaseRepository[SupervisorReview]):
         subordinate_id: Optional[UUID] = None,
         status: Optional[str] = None,
     ) -> int:
-        query = select(func.count(SupervisorReview.id))
-        if period_id:
-            query = query.filter(SupervisorReview.period_id == period_id)
-        if goal_id:
-            query = query.filter(SupervisorReview.goal_id == goal_id)
-        if subordinate_id:
-            query = query.filter(SupervisorReview.subordinate_id == subordinate_id)
-        if status:
-            query = query.filter(SupervisorReview.status == status)
-
-        # Enforce organization scope via goal -> user
-        query = self.apply_org_scope_via_goal(query, SupervisorReview.goal_id, org_id)
-
-        result = await self.session.execute(query)
-        return result.scalar() or 0
+        return await self._count(self._org_query(
+            select(func.count(SupervisorReview.id)), org_id,
+            period_id=period_id, goal_id=goal_id, subordinate_id=subordinate_id, status=status,
+        ))
 
     # ========================================
     # UPDATE
@@ -0,0 +1,199 @@
+import logging
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+class UserImportRepository:
+    """Set-based writes for bulk user imports (one statement per table and chunk; never commits)."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find_identity_owners(
+        self,
+        *,
+        employee_codes: Sequence[str],
+        emails: Sequence[str],
+        clerk_user_ids: Sequence[str],
+    ) -> List[Dict[str, Any]]:
+        """Users in any organization holding one of the given (globally unique) identifiers."""
+        if not (employee_codes or emails or clerk_user_ids):
+            return []
+        result = await self.session.execute(
+            text(
+                """
+                SELECT id, employee_code, email, clerk_user_id, clerk_organization_id, status
+                FROM users
+                WHERE employee_code = ANY(CAST(:employee_codes AS TEXT[]))
+                   OR email = ANY(CAST(:emails AS TEXT[]))
+                   OR clerk_user_id = ANY(CAST(:clerk_user_ids AS TEXT[]))
+                """
+            ),
+            {
+                "employee_codes": list(employee_codes),
+                "emails": list(emails),
+                "clerk_user_ids": list(clerk_user_ids),
+            },
+        )
+        return [dict(row._mapping) for row in result]
+
+    async def ensure_departments(self, org_id: str, names: Sequence[str]) -> Dict[str, Tuple[UUID, bool]]:
+        """
+        Ensure departments exist by name in one statement.
+
+        Returns ``{name: (department_id, created)}``; existing departments are left untouched.
+        """
+        if not names:
+            return {}
+        result = await self.session.execute(
+            text(
+                """
+                WITH input AS (
+                    SELECT DISTINCT name FROM unnest(CAST(:names AS TEXT[])) AS v(name)
+                ),
+                inserted AS (
+                    INSERT INTO departments (id, organization_id, name, created_at, updated_at)
+                    SELECT gen_random_uuid(), :org_id, name, NOW(), NOW()
+                    FROM input
+                    ON CONFLICT (organization_id, name) DO NOTHING
+                    RETURNING id, name
+                )
+                SELECT id, name, TRUE AS created FROM inserted
+                UNION ALL
+                SELECT d.id, d.name, FALSE AS created
+                FROM departments d
+                JOIN input i ON i.name = d.name
+                WHERE d.organization_id = :org_id
+                """
+            ),
+            {"org_id": org_id, "names": list(names)},
+        )
+        return {row.name: (row.id, bool(row.created)) for row in result}
+
+    async def upsert_users(self, org_id: str, users: Sequence[Mapping[str, Any]]) -> int:
+        """
+        Insert or update users keyed by employee_code in one statement.
+
+        Each mapping carries id, clerk_user_id, employee_code, name, email, status,
+        department_id, stage_id and job_title. On update, clerk_user_id is kept and NULL
+        status/department/stage/job_title keep the stored value. Rows whose employee_code
+        belongs to another organization are not touched.
+        """
+        if not users:
+            return 0
+        result = await self.session.execute(
+            text(
+                """
+                INSERT INTO users (
+                    id,
+                    clerk_user_id,
+                    clerk_organization_id,
+                    employee_code,
+                    name,
+                    email,
+                    status,
+                    department_id,
+                    stage_id,
+                    job_title,
+                    created_at,
+                    updated_at
+                )
+                SELECT
+                    v.id,
+                    v.clerk_user_id,
+                    :org_id,
+                    v.employee_code,
+                    v.name,
+                    v.email,
+                    v.status,
+                    v.department_id,
+                    v.stage_id,
+                    v.job_title,
+                    NOW(),
+                    NOW()
+                FROM unnest(
+                    CAST(:ids AS UUID[]),
+                    CAST(:clerk_user_ids AS TEXT[]),
+                    CAST(:employee_codes AS TEXT[]),
+                    CAST(:names AS TEXT[]),
+                    CAST(:emails AS TEXT[]),
+                    CAST(:statuses AS TEXT[]),
+                    CAST(:department_ids AS UUID[]),
+                    CAST(:stage_ids AS UUID[]),
+                    CAST(:job_titles AS TEXT[])
+                ) AS v(id, clerk_user_id, employee_code, name, email, status, department_id, stage_id, job_title)
+                ON CONFLICT (employee_code) DO UPDATE SET
+                    name = EXCLUDED.name,
+                    email = EXCLUDED.email,
+                    status = COALESCE(EXCLUDED.status, users.status),
+                    department_id = COALESCE(EXCLUDED.department_id, users.department_id),
+                    stage_id = COALESCE(EXCLUDED.stage_id, users.stage_id),
+                    job_title = COALESCE(EXCLUDED.job_title, users.job_title),
+                    updated_at = NOW()
+                WHERE users.clerk_organization_id = EXCLUDED.clerk_organization_id
+                """
+            ),
+            {
+                "org_id": org_id,
+                "ids": [user["id"] for user in users],
+                "clerk_user_ids": [user["clerk_user_id"] for user in users],
+                "employee_codes": [user["employee_code"] for user in users],
+                "names": [user["name"] for user in users],
+                "emails": [user["email"] for user in users],
+                "statuses": [user["status"] for user in users],
+                "department_ids": [user["department_id"] for user in users],
+                "stage_ids": [user["stage_id"] for user in users],
+                "job_titles": [user["job_title"] for user in users],
+            },
+        )
+        return result.rowcount
+
+    async def replace_user_roles(self, assignments: Mapping[UUID, Sequence[UUID]]) -> None:
+        """Replace the role set of each given user (two statements regardless of size)."""
+        if not assignments:
+            return
+        await self.session.execute(
+            text("DELETE FROM user_roles WHERE user_id = ANY(CAST(:user_ids AS UUID[]))"),
+            {"user_ids": list(assignments)},
+        )
+        pairs = [(user_id, role_id) for user_id, role_ids in assignments.items() for role_id in role_ids]
+        if not pairs:
+            return
+        await self.session.execute(
+            text(
+                """
+                INSERT INTO user_roles (user_id, role_id)
+                SELECT user_id, role_id
+                FROM unnest(CAST(:user_ids AS UUID[]), CAST(:role_ids AS UUID[])) AS v(user_id, role_id)
+                ON CONFLICT DO NOTHING
+                """
+            ),
+            {
+                "user_ids": [user_id for user_id, _ in pairs],
+                "role_ids": [role_id for _, role_id in pairs],
+            },
+        )
+
+    async def replace_supervisors(self, relations: Mapping[UUID, UUID]) -> None:
+        """Make ``relations[user_id]`` the only supervisor of each given user, valid from today."""
+        if not relations:
+            return
+        await self.session.execute(
+            text("DELETE FROM users_supervisors WHERE user_id = ANY(CAST(:user_ids AS UUID[]))"),
+            {"user_ids": list(relations)},
+        )
+        await self.session.execute(
+            text(
+                """
+                INSERT INTO users_supervisors (user_id, supervisor_id, valid_from, valid_to, created_at, updated_at)
+                SELECT user_id, supervisor_id, CURRENT_DATE, NULL, NOW(), NOW()
+                FROM unnest(CAST(:user_ids AS UUID[]), CAST(:supervisor_ids AS UUID[])) AS v(user_id, supervisor_id)
+                """
+            ),
+            {"user_ids": list(relations), "supervisor_ids": list(relations.values())},
+        )
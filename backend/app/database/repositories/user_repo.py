@@ -1,13 +1,13 @@
 import logging
-from typing import Dict, Optional, Sequence, Set
+from typing import Dict, Iterable, Optional, Sequence, Set
 from uuid import UUID
 
 from sqlalchemy import case, select, update, func, or_, delete, insert
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, joinedload
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models.user import User, UserSupervisor, Role, user_roles
+from ..models.user import User, UserSupervisor, Role, Department, user_roles
 from ..models.user_goal_weight_history import UserGoalWeightHistory
 from ..models.stage_competency import Stage
 from ...schemas.user import UserStatus, UserCreate, UserUpdate, UserClerkIdUpdate
@@ -17,6 +17,25 @@ from .base import BaseRepository
 logger = logging.getLogger(__name__)
 
 
+def current_subordinate_ids_query(supervisor_id: UUID, org_id: str):
+    """
+    IDs of a supervisor's current team: open supervisor relations to active users of the org.
+
+    Single definition shared by every repository's ``get_subordinates`` and by
+    ``AccessScope.predicate`` so RBAC membership checks and SQL filters agree.
+    """
+    return (
+        select(UserSupervisor.user_id)
+        .join(User, User.id == UserSupervisor.user_id)
+        .where(
+            UserSupervisor.supervisor_id == supervisor_id,
+            UserSupervisor.valid_to.is_(None),
+            User.status == UserStatus.ACTIVE.value,
+            User.clerk_organization_id == org_id,
+        )
+    )
+
+
 class UserRepository(BaseRepository[User]):
 
     def __init__(self, session: AsyncSession):
@@ -172,6 +191,20 @@ class UserRepository(BaseRepository[User]):
             logger.error(f"Error fetching stage_id for user {user_id}: {e}")
             raise
 
+    async def get_user_stage_ids(self, user_ids: Iterable[UUID], org_id: str) -> Dict[UUID, Optional[UUID]]:
+        """Batched get_user_stage_id: user_id -> stage_id for users in the organization."""
+        id_list = list({user_id for user_id in user_ids if user_id})
+        if not id_list:
+            return {}
+        try:
+            query = select(User.id, User.stage_id).filter(User.id.in_(id_list))
+            query = self.apply_org_scope_direct(query, User.clerk_organization_id, org_id)
+            result = await self.session.execute(query)
+            return {user_id: stage_id for user_id, stage_id in result.all()}
+        except SQLAlchemyError as e:
+            logger.error(f"Error batch fetching stage_ids in org {org_id}: {e}")
+            raise
+
     async def check_user_exists_by_clerk_id(self, clerk_user_id: str) -> Optional[dict]:
         """
         Lightweight check if user exists by clerk_id.
@@ -479,18 +512,73 @@ class UserRepository(BaseRepository[User]):
         try:
             result = await self.session.execute(
                 select(User)
+                .where(User.id.in_(current_subordinate_ids_query(supervisor_id, org_id)))
+                .order_by(User.name)
+            )
+            return result.scalars().all()
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching subordinates for supervisor {supervisor_id} in org {org_id}: {e}")
+            raise
+
+    async def get_supervisors_for_users(
+        self, user_ids: Iterable[UUID], org_id: str
+    ) -> Dict[UUID, list[User]]:
+        """
+        Batched get_user_supervisors: user_id -> active current supervisors, most recent first.
+        One query for any number of users.
+        """
+        id_list = list({user_id for user_id in user_ids if user_id})
+        if not id_list:
+            return {}
+        try:
+            query = (
+                select(UserSupervisor.user_id, User)
+                .join(UserSupervisor, User.id == UserSupervisor.supervisor_id)
+                .filter(
+                    UserSupervisor.user_id.in_(id_list),
+                    UserSupervisor.valid_to.is_(None),
+                    User.status == UserStatus.ACTIVE.value,
+                )
+                .order_by(UserSupervisor.user_id, UserSupervisor.valid_from.desc(), User.name)
+            )
+            query = self.apply_org_scope_direct(query, User.clerk_organization_id, org_id)
+            result = await self.session.execute(query)
+            mapping: Dict[UUID, list[User]] = {}
+            for user_id, supervisor in result.all():
+                mapping.setdefault(user_id, []).append(supervisor)
+            return mapping
+        except SQLAlchemyError as e:
+            logger.error(f"Error batch fetching supervisors in org {org_id}: {e}")
+            raise
+
+    async def get_subordinates_for_users(
+        self, supervisor_ids: Iterable[UUID], org_id: str
+    ) -> Dict[UUID, list[User]]:
+        """
+        Batched get_subordinates: supervisor_id -> active current subordinates ordered by name.
+        One query for any number of supervisors.
+        """
+        id_list = list({supervisor_id for supervisor_id in supervisor_ids if supervisor_id})
+        if not id_list:
+            return {}
+        try:
+            result = await self.session.execute(
+                select(UserSupervisor.supervisor_id, User)
                 .join(UserSupervisor, User.id == UserSupervisor.user_id)
                 .filter(
-                    UserSupervisor.supervisor_id == supervisor_id,
+                    UserSupervisor.supervisor_id.in_(id_list),
                     UserSupervisor.valid_to.is_(None),
                     User.status == UserStatus.ACTIVE.value,
                     User.clerk_organization_id == org_id,
                 )
-                .order_by(User.name)
+                .order_by(UserSupervisor.supervisor_id, User.name)
             )
-            return result.scalars().all()
+            mapping: Dict[UUID, list[User]] = {}
+            for supervisor_id, subordinate in result.all():
+                mapping.setdefault(supervisor_id, []).append(subordinate)
+            return mapping
         except SQLAlchemyError as e:
-            logger.error(f"Error fetching subordinates for supervisor {supervisor_id} in org {org_id}: {e}")
+            logger.error(f"Error batch fetching subordinates in org {org_id}: {e}")
             raise
 
     async def get_active_users(self, org_id: str) -> list[User]:
@@ -554,6 +642,48 @@ class UserRepository(BaseRepository[User]):
             logger.error(f"Error fetching all users for org {org_id}: {e}")
             raise
 
+    def _build_user_search_query(
+        self,
+        query,
+        org_id: str,
+        search_term: str = "",
+        statuses: Optional[list[UserStatus]] = None,
+        department_ids: Optional[list[UUID]] = None,
+        stage_ids: Optional[list[UUID]] = None,
+        role_ids: Optional[list[UUID]] = None,
+        user_ids: Optional[list[UUID]] = None,
+    ):
+        """Filters shared by search_users, search_users_page and count_users."""
+        # Apply organization filter (required)
+        query = self.apply_org_scope_direct(query, User.clerk_organization_id, org_id)
+
+        if search_term:
+            search_ilike = f"%{search_term.lower()}%"
+            query = query.filter(
+                or_(
+                    func.lower(User.name).ilike(search_ilike),
+                    func.lower(User.employee_code).ilike(search_ilike),
+                    func.lower(User.job_title).ilike(search_ilike),
+                )
+            )
+
+        if statuses:
+            query = query.filter(User.status.in_([s.value for s in statuses]))
+        if department_ids:
+            query = query.filter(User.department_id.in_(department_ids))
+        if stage_ids:
+            query = query.filter(User.stage_id.in_(stage_ids))
+        if role_ids:
+            # EXISTS rather than a join: one row per user however many roles match
+            query = query.filter(
+                select(user_roles.c.user_id)
+                .where(user_roles.c.user_id == User.id, user_roles.c.role_id.in_(role_ids))
+                .exists()
+            )
+        if user_ids:
+            query = self.apply_user_scope(query, User.id, user_ids)
+        return query
+
     async def search_users(
         self,
         org_id: str,
@@ -575,32 +705,11 @@ class UserRepository(BaseRepository[User]):
                 joinedload(User.stage),
                 joinedload(User.roles)
             )
-
-            # Apply organization filter (required)
-            query = self.apply_org_scope_direct(query, User.clerk_organization_id, org_id)
+            query = self._build_user_search_query(
+                query, org_id, search_term, statuses, department_ids, stage_ids, role_ids, user_ids
+            )
             self.ensure_org_filter_applied("search_users", org_id)
 
-            if search_term:
-                search_ilike = f"%{search_term.lower()}%"
-                query = query.filter(
-                    or_(
-                        func.lower(User.name).ilike(search_ilike),
-                        func.lower(User.employee_code).ilike(search_ilike),
-                        func.lower(User.job_title).ilike(search_ilike),
-                    )
-                )
-
-            if statuses:
-                query = query.filter(User.status.in_([s.value for s in statuses]))
-            if department_ids:
-                query = query.filter(User.department_id.in_(department_ids))
-            if stage_ids:
-                query = query.filter(User.stage_id.in_(stage_ids))
-            if role_ids:
-                query = query.join(user_roles).filter(user_roles.c.role_id.in_(role_ids))
-            if user_ids:
-                query = query.filter(User.id.in_(user_ids))
-
             if pagination:
                 query = query.limit(pagination.limit).offset(pagination.offset)
             
@@ -612,6 +721,93 @@ class UserRepository(BaseRepository[User]):
             logger.error(f"Error searching for users: {e}")
             raise
 
+    async def search_users_page(
+        self,
+        org_id: str,
+        search_term: str = "",
+        statuses: Optional[list[UserStatus]] = None,
+        department_ids: Optional[list[UUID]] = None,
+        stage_ids: Optional[list[UUID]] = None,
+        role_ids: Optional[list[UUID]] = None,
+        user_ids: Optional[list[UUID]] = None,
+        pagination: Optional[PaginationParams] = None,
+    ) -> tuple[list[User], int]:
+        """
+        search_users and count_users in a single statement: (users, total).
+        Relationships are not loaded; UserEnrichmentEngine resolves them in batch.
+        """
+        try:
+            query = self._build_user_search_query(
+                select(User), org_id, search_term, statuses, department_ids, stage_ids, role_ids, user_ids
+            )
+            self.ensure_org_filter_applied("search_users_page", org_id)
+
+            return await self.paginate(query.order_by(User.name, User.id), pagination)
+        except SQLAlchemyError as e:
+            logger.error(f"Error searching users page: {e}")
+            raise
+
+    async def get_user_activity_page(
+        self,
+        org_id: str,
+        pagination: Optional[PaginationParams] = None,
+    ) -> tuple[list[dict], int]:
+        """
+        Flat rows for the goal statistics user list: (rows, total), ordered by name.
+
+        Each row carries id, name, employee_code, department_name, role_name (highest role
+        by hierarchy_order), supervisor_name (current supervisor) and subordinate_name
+        (first current subordinate by name), resolved with scalar subqueries so a page is
+        one statement regardless of size.
+        """
+        try:
+            self.ensure_org_filter_applied("get_user_activity_page", org_id)
+
+            related = aliased(User)
+            role_name = (
+                select(Role.name)
+                .join(user_roles, user_roles.c.role_id == Role.id)
+                .where(user_roles.c.user_id == User.id)
+                .order_by(Role.hierarchy_order, Role.name)
+                .limit(1)
+                .scalar_subquery()
+            )
+            supervisor_name = (
+                select(related.name)
+                .join(UserSupervisor, UserSupervisor.supervisor_id == related.id)
+                .where(UserSupervisor.user_id == User.id, UserSupervisor.valid_to.is_(None))
+                .order_by(UserSupervisor.valid_from.desc(), related.name)
+                .limit(1)
+                .scalar_subquery()
+            )
+            subordinate_name = (
+                select(related.name)
+                .join(UserSupervisor, UserSupervisor.user_id == related.id)
+                .where(UserSupervisor.supervisor_id == User.id, UserSupervisor.valid_to.is_(None))
+                .order_by(related.name)
+                .limit(1)
+                .scalar_subquery()
+            )
+
+            query = (
+                select(
+                    User.id,
+                    User.name,
+                    User.employee_code,
+                    Department.name.label("department_name"),
+                    role_name.label("role_name"),
+                    supervisor_name.label("supervisor_name"),
+                    subordinate_name.label("subordinate_name"),
+                )
+                .outerjoin(Department, Department.id == User.department_id)
+            )
+            query = self.apply_org_scope_direct(query, User.clerk_organization_id, org_id)
+
+            return await self.paginate(query.order_by(User.name, User.id), pagination)
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching user activity page for org {org_id}: {e}")
+            raise
+
     # ========================================
     # UPDATE OPERATIONS
     # ========================================
@@ -949,33 +1145,12 @@ class UserRepository(BaseRepository[User]):
         Count users based on search and filter criteria within organization scope.
         """
         try:
-            query = select(func.count(User.id.distinct()))
-
-            # Apply organization filter (required)
-            query = self.apply_org_scope_direct(query, User.clerk_organization_id, org_id)
+            query = self._build_user_search_query(
+                select(func.count(User.id)), org_id, search_term, statuses,
+                department_ids, stage_ids, role_ids, user_ids,
+            )
             self.ensure_org_filter_applied("count_users", org_id)
 
-            if search_term:
-                search_ilike = f"%{search_term.lower()}%"
-                query = query.filter(
-                    or_(
-                        func.lower(User.name).ilike(search_ilike),
-                        func.lower(User.employee_code).ilike(search_ilike),
-                        func.lower(User.job_title).ilike(search_ilike),
-                    )
-                )
-
-            if statuses:
-                query = query.filter(User.status.in_([s.value for s in statuses]))
-            if department_ids:
-                query = query.filter(User.department_id.in_(department_ids))
-            if stage_ids:
-                query = query.filter(User.stage_id.in_(stage_ids))
-            if role_ids:
-                query = query.join(user_roles).filter(user_roles.c.role_id.in_(role_ids))
-            if user_ids:
-                query = query.filter(User.id.in_(user_ids))
-
             result = await self.session.execute(query)
             return result.scalar_one()
         except SQLAlchemyError as e:
@@ -990,14 +1165,12 @@ class UserRepository(BaseRepository[User]):
         user_ids: Optional[list[UUID]] = None,
     ) -> list[User]:
         """
-        Efficient query for organization chart - single query with necessary joins.
+        Organization chart users (no relationships loaded; departments and roles are
+        resolved in batch by UserEnrichmentEngine).
         Always returns only ACTIVE users within organization scope.
         """
         try:
-            query = select(User).options(
-                joinedload(User.department),
-                joinedload(User.roles)
-            ).filter(User.status == "active")
+            query = select(User).filter(User.status == "active")
             
             # Apply organization filter (required)
             query = self.apply_org_scope_direct(query, User.clerk_organization_id, org_id)
@@ -1008,7 +1181,7 @@ class UserRepository(BaseRepository[User]):
             if role_ids:
                 query = query.join(user_roles).filter(user_roles.c.role_id.in_(role_ids))
             if user_ids:
-                query = query.filter(User.id.in_(user_ids))
+                query = self.apply_user_scope(query, User.id, user_ids)
             
             result = await self.session.execute(query)
             return result.scalars().unique().all()
@@ -11,6 +11,7 @@ from sqlalchemy.sql import Select
 from sqlalchemy.orm import aliased
 
 from .base import BaseRepository
+from .user_repo import current_subordinate_ids_query
 from ..models.user import (
     Department,
     Role,
@@ -97,7 +98,7 @@ class UserRepositoryV2(BaseRepository[User]):
             page: Page number (1-based). Used to iterate keyset when cursor absent.
             search_term / statuses / department_ids / stage_ids / role_ids: Filters
             supervisor_id: Filter by supervisor relationship
-            user_ids: Optional RBAC scoping list
+            user_ids: Optional RBAC scoping list or AccessScope
             sort: Sort definition, e.g. "name:asc" or "created_at:desc"
 
         Returns:
@@ -250,7 +251,7 @@ class UserRepositoryV2(BaseRepository[User]):
             stmt = stmt.where(User.stage_id.in_(list(stage_ids)))
 
         if user_ids:
-            stmt = stmt.where(User.id.in_(list(user_ids)))
+            stmt = self.apply_user_scope(stmt, User.id, user_ids)
 
         if role_ids:
             role_exists = (
@@ -438,13 +439,16 @@ class UserRepositoryV2(BaseRepository[User]):
 
     async def get_subordinates(self, supervisor_id: UUID, org_id: str) -> List[User]:
         """
-        Compatibility helper for RBACHelper. Returns subordinate user models without eager relationships.
+        Compatibility helper for RBACHelper. Returns the current team (same relation as
+        ``UserRepository.get_subordinates`` and ``AccessScope.predicate``) without eager relationships.
         """
-        subordinate_ids = await self.fetch_subordinate_ids(supervisor_id, org_id)
-        if not subordinate_ids:
-            return []
-        subordinate_map = await self.fetch_users_by_ids(subordinate_ids, org_id)
-        return list(subordinate_map.values())
+        stmt = (
+            select(User)
+            .where(User.id.in_(current_subordinate_ids_query(supervisor_id, org_id)))
+            .order_by(User.name)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
 
     async def fetch_subordinates_for_users(self, supervisor_ids: Iterable[UUID], org_id: str) -> Dict[UUID, List[User]]:
         """
@@ -535,7 +539,7 @@ class UserRepositoryV2(BaseRepository[User]):
             stmt = stmt.where(User.stage_id.in_(list(stage_ids)))
 
         if user_ids:
-            stmt = stmt.where(User.id.in_(list(user_ids)))
+            stmt = self.apply_user_scope(stmt, User.id, user_ids)
 
         if role_ids:
             role_exists = (
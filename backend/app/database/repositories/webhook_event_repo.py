@@ -1,17 +1,33 @@
+import json
 import logging
-from typing import Optional
-from sqlalchemy import select
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from ..models.webhook_event import WebhookEvent
+from ..models.webhook_event import WebhookEvent, WebhookEventStatus
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True)
+class ClaimedWebhookEvent:
+    """Lightweight view of an inbox row claimed by a worker."""
+    id: UUID
+    event_id: str
+    event_type: str
+    subject_id: Optional[str]
+    payload: Dict[str, Any]
+    attempts: int
+    received_at: datetime
+
+
 class WebhookEventRepository:
-    """Repository for webhook event tracking and idempotency."""
-    
+    """Repository for webhook event tracking, idempotency and the durable inbox."""
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -26,20 +42,244 @@ class WebhookEventRepository:
             logger.error(f"Error fetching webhook event by ID {event_id}: {e}")
             raise
 
-    async def create_event_record(self, event_id: str, event_type: str) -> WebhookEvent:
-        """Create a webhook event record for idempotency tracking."""
+    async def enqueue_event(
+        self,
+        event_id: str,
+        event_type: str,
+        payload: Dict[str, Any],
+        subject_id: Optional[str] = None,
+    ) -> bool:
+        """
+        Persist a webhook event in the inbox.
+
+        Uses ``ON CONFLICT DO NOTHING`` on ``event_id`` so the idempotency check and
+        the insert are a single statement. Returns False when the event was already known.
+        """
+        now = datetime.utcnow()
         try:
-            webhook_event = WebhookEvent(
-                event_id=event_id,
-                event_type=event_type,
-                processed_at=datetime.utcnow()
+            result = await self.session.execute(
+                text(
+                    """
+                    INSERT INTO webhook_events (
+                        id, event_id, event_type, status, attempts, payload, subject_id,
+                        received_at, next_attempt_at, created_at, updated_at
+                    ) VALUES (
+                        gen_random_uuid(), :event_id, :event_type, :status, 0,
+                        CAST(:payload AS JSONB), :subject_id, :now, :now, :now, :now
+                    )
+                    ON CONFLICT (event_id) DO NOTHING
+                    RETURNING id
+                    """
+                ),
+                {
+                    "event_id": event_id,
+                    "event_type": event_type,
+                    "status": WebhookEventStatus.PENDING.value,
+                    "payload": json.dumps(payload, ensure_ascii=False, default=str),
+                    "subject_id": subject_id,
+                    "now": now,
+                },
+            )
+            inserted = result.scalar_one_or_none() is not None
+            if inserted:
+                logger.info(f"Webhook event enqueued: {event_id} ({event_type})")
+            return inserted
+        except SQLAlchemyError as e:
+            logger.error(f"Error enqueueing webhook event {event_id}: {e}")
+            raise
+
+    async def coalesce_pending(self, event_types: Sequence[str]) -> int:
+        """
+        Mark pending events as superseded when a newer event of the same type exists
+        for the same subject. Only the newest payload needs to be applied for
+        state-snapshot events such as ``user.updated``.
+        """
+        if not event_types:
+            return 0
+        now = datetime.utcnow()
+        try:
+            result = await self.session.execute(
+                text(
+                    """
+                    UPDATE webhook_events e
+                    SET status = :superseded,
+                        processed_at = :now,
+                        updated_at = :now
+                    WHERE e.status = :pending
+                      AND e.event_type = ANY(:event_types)
+                      AND e.subject_id IS NOT NULL
+                      AND EXISTS (
+                          SELECT 1
+                          FROM webhook_events n
+                          WHERE n.event_type = e.event_type
+                            AND n.subject_id = e.subject_id
+                            AND n.status IN (:pending, :processing)
+                            AND (n.received_at, n.id) > (e.received_at, e.id)
+                      )
+                    """
+                ),
+                {
+                    "superseded": WebhookEventStatus.SUPERSEDED.value,
+                    "pending": WebhookEventStatus.PENDING.value,
+                    "processing": WebhookEventStatus.PROCESSING.value,
+                    "event_types": list(event_types),
+                    "now": now,
+                },
+            )
+            return result.rowcount or 0
+        except SQLAlchemyError as e:
+            logger.error(f"Error coalescing pending webhook events: {e}")
+            raise
+
+    async def claim_batch(self, limit: int, lease_seconds: int) -> List[ClaimedWebhookEvent]:
+        """
+        Claim up to ``limit`` due events for processing.
+
+        ``FOR UPDATE SKIP LOCKED`` lets several workers (gunicorn processes / Cloud Run
+        instances) drain the inbox concurrently. Rows whose lease expired (worker died
+        mid-batch) are claimable again.
+        """
+        now = datetime.utcnow()
+        try:
+            result = await self.session.execute(
+                text(
+                    """
+                    WITH due AS (
+                        SELECT id
+                        FROM webhook_events
+                        WHERE (status = :pending AND next_attempt_at <= :now)
+                           OR (status = :processing AND locked_until < :now)
+                        ORDER BY received_at, id
+                        LIMIT :limit
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    UPDATE webhook_events e
+                    SET status = :processing,
+                        attempts = e.attempts + 1,
+                        locked_until = :lease_until,
+                        updated_at = :now
+                    FROM due
+                    WHERE e.id = due.id
+                    RETURNING e.id, e.event_id, e.event_type, e.subject_id, e.payload,
+                              e.attempts, e.received_at
+                    """
+                ),
+                {
+                    "pending": WebhookEventStatus.PENDING.value,
+                    "processing": WebhookEventStatus.PROCESSING.value,
+                    "now": now,
+                    "limit": limit,
+                    "lease_until": now + timedelta(seconds=lease_seconds),
+                },
             )
-            
-            self.session.add(webhook_event)
-            await self.session.flush()
-            
-            logger.info(f"Webhook event recorded: {event_id} ({event_type})")
-            return webhook_event
+            claimed = [
+                ClaimedWebhookEvent(
+                    id=row.id,
+                    event_id=row.event_id,
+                    event_type=row.event_type,
+                    subject_id=row.subject_id,
+                    payload=row.payload or {},
+                    attempts=row.attempts,
+                    received_at=row.received_at,
+                )
+                for row in result
+            ]
+            claimed.sort(key=lambda event: (event.received_at, str(event.id)))
+            return claimed
         except SQLAlchemyError as e:
-            logger.error(f"Error creating webhook event record: {e}")
-            raise
\ No newline at end of file
+            logger.error(f"Error claiming webhook events: {e}")
+            raise
+
+    async def mark_processed(self, ids: Sequence[UUID]) -> None:
+        """Mark a set of claimed events as processed in one statement."""
+        if not ids:
+            return
+        now = datetime.utcnow()
+        try:
+            await self.session.execute(
+                text(
+                    """
+                    UPDATE webhook_events
+                    SET status = :processed,
+                        processed_at = :now,
+                        locked_until = NULL,
+                        last_error = NULL,
+                        updated_at = :now
+                    WHERE id = ANY(:ids)
+                    """
+                ),
+                {"processed": WebhookEventStatus.PROCESSED.value, "now": now, "ids": list(ids)},
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error marking webhook events processed: {e}")
+            raise
+
+    async def mark_failed(
+        self,
+        event_id: UUID,
+        error: str,
+        *,
+        retry_at: Optional[datetime],
+    ) -> None:
+        """Record a failed attempt; ``retry_at=None`` moves the event to the dead state."""
+        now = datetime.utcnow()
+        status = WebhookEventStatus.PENDING if retry_at is not None else WebhookEventStatus.DEAD
+        try:
+            await self.session.execute(
+                text(
+                    """
+                    UPDATE webhook_events
+                    SET status = :status,
+                        last_error = :error,
+                        next_attempt_at = COALESCE(:retry_at, next_attempt_at),
+                        locked_until = NULL,
+                        updated_at = :now
+                    WHERE id = :id
+                    """
+                ),
+                {
+                    "status": status.value,
+                    "error": error[:2000],
+                    "retry_at": retry_at,
+                    "now": now,
+                    "id": event_id,
+                },
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error recording webhook failure for {event_id}: {e}")
+            raise
+
+    async def get_queue_stats(self) -> Dict[str, Any]:
+        """Return inbox depth per state and the age of the oldest unprocessed event."""
+        now = datetime.utcnow()
+        try:
+            result = await self.session.execute(
+                text(
+                    """
+                    SELECT
+                        COUNT(*) FILTER (WHERE status = :pending) AS pending,
+                        COUNT(*) FILTER (WHERE status = :processing) AS processing,
+                        COUNT(*) FILTER (WHERE status = :dead) AS dead,
+                        MIN(received_at) FILTER (WHERE status IN (:pending, :processing)) AS oldest_received_at
+                    FROM webhook_events
+                    WHERE status IN (:pending, :processing, :dead)
+                    """
+                ),
+                {
+                    "pending": WebhookEventStatus.PENDING.value,
+                    "processing": WebhookEventStatus.PROCESSING.value,
+                    "dead": WebhookEventStatus.DEAD.value,
+                },
+            )
+            row = result.one()
+            oldest = row.oldest_received_at
+            return {
+                "pending": int(row.pending or 0),
+                "processing": int(row.processing or 0),
+                "dead": int(row.dead or 0),
+                "lag_seconds": max(0.0, (now - oldest).total_seconds()) if oldest else 0.0,
+            }
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching webhook inbox stats: {e}")
+            raise
+
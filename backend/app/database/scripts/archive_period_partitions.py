@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Archive / restore the partitions of closed evaluation periods (migration 036).
+
+Detaching moves every partition of a completed or cancelled period from the
+period-partitioned tables into the evaluation_archive schema. The rows stay in the
+database but leave the live tables, so active-period scans, indexes and vacuum no
+longer see them. Restoring attaches them again.
+
+Usage (inside the backend container):
+    python app/database/scripts/archive_period_partitions.py                             # status
+    python app/database/scripts/archive_period_partitions.py --archive <period uuid> [...]
+    python app/database/scripts/archive_period_partitions.py --archive-closed             # all completed/cancelled
+    python app/database/scripts/archive_period_partitions.py --restore <period uuid> [...]
+"""
+import argparse
+import asyncio
+import os
+import sys
+from uuid import UUID
+
+import asyncpg
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Archive or restore evaluation period partitions")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--archive", type=UUID, nargs="+", metavar="PERIOD_ID", help="detach these periods")
+    action.add_argument("--archive-closed", action="store_true", help="detach every completed/cancelled period")
+    action.add_argument("--restore", type=UUID, nargs="+", metavar="PERIOD_ID", help="re-attach these periods")
+    parser.add_argument("--schema", default="evaluation_archive", help="archive schema (default: evaluation_archive)")
+    return parser.parse_args()
+
+
+async def print_status(conn):
+    """Partitioned tables, live partition sizes per period, rows parked in DEFAULT and archived periods"""
+    tables = [row["table_name"] for row in await conn.fetch(
+        "SELECT table_name FROM period_partitioned_tables ORDER BY table_name"
+    )]
+    if not tables:
+        print("⚠️ No period-partitioned tables registered (is migration 036 applied?)")
+        return
+
+    print(f"📋 Partitioned tables: {', '.join(tables)}")
+
+    rows = await conn.fetch("""
+        SELECT p.id, p.name, p.status,
+               count(c.oid) AS partitions,
+               coalesce(sum(pg_total_relation_size(c.oid)), 0) AS bytes
+        FROM evaluation_periods p
+        JOIN period_partitioned_tables t ON TRUE
+        LEFT JOIN pg_class c
+               ON c.relname = period_partition_name(t.table_name, p.id)
+              AND c.relnamespace = 'public'::regnamespace
+        GROUP BY p.id, p.name, p.status, p.start_date
+        ORDER BY p.start_date
+    """)
+    print("📦 Live partitions:")
+    for row in rows:
+        print(f"   {row['id']}  {row['status']:<10} {row['partitions']:>2} tables "
+              f"{row['bytes'] / 1024 / 1024:>9.1f} MiB  {row['name']}")
+
+    for table in tables:
+        default_partition = await conn.fetchval(
+            "SELECT format('public.%I', period_default_partition_name($1))", table
+        )
+        default_rows = await conn.fetchval(f"SELECT count(*) FROM {default_partition}")
+        if default_rows:
+            print(f"⚠️ {table}: {default_rows} rows in the DEFAULT partition (period without a partition)")
+
+    archived = await conn.fetch("""
+        SELECT a.period_id, p.name, a.archive_schema, count(*) AS tables, min(a.archived_at) AS archived_at
+        FROM period_partition_archive a
+        LEFT JOIN evaluation_periods p ON p.id = a.period_id
+        GROUP BY a.period_id, p.name, a.archive_schema
+        ORDER BY min(a.archived_at)
+    """)
+    print(f"🗄️ Archived periods: {len(archived)}")
+    for row in archived:
+        print(f"   {row['period_id']}  {row['tables']:>2} tables in {row['archive_schema']} "
+              f"since {row['archived_at']:%Y-%m-%d}  {row['name'] or ''}")
+
+
+async def run(args) -> bool:
+    database_url = os.getenv('DATABASE_URL') or os.getenv('SUPABASE_DATABASE_URL')
+    if not database_url:
+        print("❌ DATABASE_URL or SUPABASE_DATABASE_URL not found in environment")
+        return False
+
+    conn = await asyncpg.connect(database_url)
+    try:
+        if args.archive_closed:
+            period_ids = [row["id"] for row in await conn.fetch("""
+                SELECT DISTINCT p.id, p.start_date
+                FROM evaluation_periods p
+                JOIN period_partitioned_tables t ON TRUE
+                JOIN pg_class c
+                  ON c.relname = period_partition_name(t.table_name, p.id)
+                 AND c.relnamespace = 'public'::regnamespace
+                WHERE p.status IN ('completed', 'cancelled')
+                ORDER BY p.start_date
+            """)]
+            if not period_ids:
+                print("✅ No closed periods with live partitions")
+        else:
+            period_ids = args.archive or args.restore or []
+
+        ok = True
+        for period_id in period_ids:
+            try:
+                # Each period in its own transaction: a failure leaves the others done
+                async with conn.transaction():
+                    if args.restore:
+                        count = await conn.fetchval("SELECT attach_period_partitions($1)", period_id)
+                        print(f"✅ Restored {count} partitions of period {period_id}")
+                    else:
+                        count = await conn.fetchval(
+                            "SELECT detach_period_partitions($1, $2)", period_id, args.schema
+                        )
+                        print(f"✅ Archived {count} partitions of period {period_id} into {args.schema}")
+            except asyncpg.PostgresError as e:
+                print(f"❌ Period {period_id}: {e}")
+                ok = False
+
+        await print_status(conn)
+        return ok
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(run(parse_args())) else 1)
@@ -0,0 +1,108 @@
+"""
+Recompute `supervisor_feedback.supervisor_rating` after an org's `evaluation_score_mapping` changes.
+
+Why: the stored numeric rating is derived from the mapping at write time. Changing the
+mapping (or the derivation, as in migrations 020 / 029) leaves historical rows stale.
+This script streams feedback rows per organization in id order, recomputes the rating in
+memory against the org's current mapping and writes changed rows back in bulk
+(see app/services/supervisor_rating_recompute.py).
+
+Each chunk is committed separately and its cursor is saved to the checkpoint file, so an
+interrupted --apply run continues where it stopped when started again with --resume.
+Idempotent: rows whose rating already matches are not touched.
+
+Usage (inside the backend container):
+    python app/database/scripts/recompute_supervisor_ratings.py                          # DRY-RUN, all orgs
+    python app/database/scripts/recompute_supervisor_ratings.py --org org_123 --org org_456
+    python app/database/scripts/recompute_supervisor_ratings.py --apply --chunk-size 2000
+    python app/database/scripts/recompute_supervisor_ratings.py --apply --resume         # continue after interruption
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from pathlib import Path
+from uuid import UUID
+
+from app.database.session import AsyncSessionLocal, engine
+from app.services.supervisor_rating_recompute import (
+    DEFAULT_CHUNK_SIZE,
+    SupervisorRatingRecomputeEngine,
+)
+
+DEFAULT_CHECKPOINT = Path(os.getenv("RECOMPUTE_CHECKPOINT_FILE", "/tmp/recompute_supervisor_ratings.json"))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Recompute supervisor_feedback.supervisor_rating")
+    parser.add_argument("--apply", action="store_true", help="write changes (default is a dry run)")
+    parser.add_argument("--org", action="append", dest="orgs", help="organization id (repeatable; default all)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--checkpoint", type=Path, default=DEFAULT_CHECKPOINT)
+    parser.add_argument("--resume", action="store_true", help="continue from the checkpoint file")
+    parser.add_argument("--show", type=int, default=20, help="number of changed rows to print")
+    return parser.parse_args()
+
+
+def load_checkpoint(path: Path):
+    if not path.exists():
+        return None
+    data = json.loads(path.read_text())
+    if not data.get("org_id"):
+        return None
+    return data["org_id"], UUID(data["after_id"]) if data.get("after_id") else None
+
+
+async def main() -> None:
+    args = parse_args()
+    dry_run = not args.apply
+
+    start_after = load_checkpoint(args.checkpoint) if args.resume else None
+    if start_after and start_after[1] is None:
+        start_after = None
+
+    async def save_checkpoint(org_id: str, after_id) -> None:
+        if dry_run:
+            return
+        args.checkpoint.write_text(json.dumps({"org_id": org_id, "after_id": str(after_id) if after_id else None}))
+
+    async with AsyncSessionLocal() as s:
+        recompute = SupervisorRatingRecomputeEngine(
+            s, chunk_size=args.chunk_size, dry_run=dry_run, max_recorded_changes=args.show
+        )
+        org_ids = args.orgs or await recompute.list_organization_ids()
+        if args.resume and start_after is None and args.checkpoint.exists():
+            # The last recorded org finished; skip everything up to and including it.
+            finished = json.loads(args.checkpoint.read_text()).get("org_id")
+            if finished in org_ids:
+                org_ids = org_ids[org_ids.index(finished) + 1:]
+
+        print(f"Organizations: {len(org_ids)}  chunk_size={args.chunk_size}  (DRY_RUN={dry_run})")
+        if start_after:
+            print(f"Resuming {start_after[0]} after feedback {start_after[1]}")
+
+        stats = await recompute.run(org_ids, start_after=start_after, on_checkpoint=save_checkpoint)
+
+        for change in stats.changes:
+            print(f"  {change.feedback_id}: {change.old_rating} -> {change.new_rating}")
+        if stats.changed > len(stats.changes):
+            print(f"  ... and {stats.changed - len(stats.changes)} more")
+
+        print(
+            f"Scanned {stats.scanned} rows in {stats.chunks} chunks across {stats.organizations} orgs; "
+            f"{stats.changed} changed, {stats.updated} updated, {stats.skipped} without derivable rating."
+        )
+        print(f"Elapsed {stats.elapsed_seconds:.2f}s ({stats.rows_per_second:.0f} rows/s)")
+
+        if dry_run:
+            await s.rollback()
+            print("DRY-RUN: nothing written. Re-run with --apply to persist.")
+        elif args.checkpoint.exists():
+            args.checkpoint.unlink()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
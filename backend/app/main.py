@@ -1,18 +1,47 @@
+# Import timing starts before anything else so the startup log shows which modules
+# dominate cold starts (see app.core.startup).
+from .core.startup import (
+    DeferredRouterMiddleware,
+    DeferredRouterRegistry,
+    ImportTimer,
+    run_startup_warmup,
+)
+
+_import_timer = ImportTimer().install()
+
 from datetime import datetime
-from fastapi import FastAPI, HTTPException, APIRouter
+from fastapi import FastAPI, HTTPException, APIRouter, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
+import asyncio
 import logging
 
-from .api.v1 import org_api_router
+from .api.v1 import DEFERRED_ORG_ROUTERS, org_api_router
 from .api.v2 import org_api_router_v2
 from .api.v1.auth import router as auth_router
-from .database.index_bootstrap import ensure_perf_indexes
-from .core.middleware import LoggingMiddleware, OrgSlugValidationMiddleware, http_exception_handler, general_exception_handler
+from .core.middleware import (
+    LoggingMiddleware,
+    MetricsMiddleware,
+    OrgSlugValidationMiddleware,
+    QueryProfilingMiddleware,
+    http_exception_handler,
+    general_exception_handler,
+)
+from .core.metrics import (
+    instrument_engine_pool,
+    is_scrape_allowed,
+    refresh_webhook_inbox_metrics,
+    render_latest,
+)
+from .core.query_profiler import install_query_profiler
 from .core.config import settings
 from .schemas.common import HealthCheckResponse
-from .database.session import AsyncSessionLocal
+from .database.session import AsyncSessionLocal, engine
 from .services.auth_service import close_jwks_client
+from .services.clerk_sync_queue import clerk_sync_queue
+from .api.webhooks.inbox_worker import inbox_worker
+
+_import_timer.uninstall()
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +67,16 @@ app.add_middleware(
 # Add custom middleware
 app.add_middleware(LoggingMiddleware)
 
+# Per-request SQL statement attribution (Server-Timing + N+1 detection)
+if settings.QUERY_PROFILER_ENABLED:
+    install_query_profiler()
+    app.add_middleware(QueryProfilingMiddleware)
+
+# Prometheus request latency + DB pool instrumentation
+if settings.METRICS_ENABLED:
+    instrument_engine_pool(engine)
+    app.add_middleware(MetricsMiddleware)
+
 # Add organization slug validation middleware
 # Note: This should be added after CORS but before other middleware for proper request processing
 async def get_session():
@@ -59,9 +98,16 @@ auth_api_router = APIRouter(prefix="/api/v1")
 auth_api_router.include_router(auth_router)
 app.include_router(auth_api_router)
 
-# Include webhooks at root level (without /api/v1 prefix)
-from .api.webhooks.router import webhooks_router
-app.include_router(webhooks_router)
+# Rarely used routers (webhooks at root level, org admin) are imported on the first
+# request that needs them or by the startup warmup, keeping them off the cold path.
+deferred_routers = DeferredRouterRegistry()
+deferred_routers.defer("app.api.webhooks.router", "webhooks_router", r"^/webhooks(/|$)")
+for module, attribute, path_pattern in DEFERRED_ORG_ROUTERS:
+    deferred_routers.defer(module, attribute, path_pattern, prefix="/api/org/{org_slug}")
+if settings.STARTUP_DEFER_ROUTERS:
+    app.add_middleware(DeferredRouterMiddleware, fastapi_app=app, registry=deferred_routers)
+else:
+    deferred_routers.load_all(app)
 
 def custom_openapi():
     """
@@ -71,6 +117,7 @@ def custom_openapi():
         return app.openapi_schema
     
     logger.debug("Generating custom OpenAPI schema...")
+    deferred_routers.load_all(app)
     
     # Rebuild schemas to resolve forward references before generating OpenAPI
     try:
@@ -131,19 +178,43 @@ app.openapi = custom_openapi
 logger.debug("Custom OpenAPI function assigned successfully")
 
 
+_warmup_task: asyncio.Task | None = None
+
+
 @app.on_event("startup")
-async def _bootstrap_indexes():
-    """Create performance indexes (idempotent)."""
-    try:
-        await ensure_perf_indexes()
-        logger.debug("Performance indexes ensured")
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning("Failed to ensure performance indexes: %s", exc)
+async def _start_warmup():
+    """Log the import profile and warm caches in the background (never blocks serving)."""
+    global _warmup_task
+    logger.info(
+        "startup.import_profile",
+        extra={"event": "startup.import_profile", **_import_timer.to_log_dict()},
+    )
+    if settings.STARTUP_WARMUP_ENABLED:
+        _warmup_task = asyncio.create_task(
+            run_startup_warmup(
+                AsyncSessionLocal,
+                app=app,
+                registry=deferred_routers,
+                timeout_seconds=settings.STARTUP_WARMUP_TIMEOUT_SECONDS,
+                max_orgs=settings.STARTUP_WARMUP_MAX_ORGS,
+            )
+        )
+
+
+@app.on_event("startup")
+async def _start_webhook_inbox_worker():
+    """Start draining persisted webhook events in the background."""
+    if settings.WEBHOOK_INBOX_WORKER_ENABLED:
+        inbox_worker.start()
 
 
 @app.on_event("shutdown")
 async def _shutdown_clients():
-    """Close shared HTTP clients."""
+    """Close shared HTTP clients and background workers."""
+    if _warmup_task is not None and not _warmup_task.done():
+        _warmup_task.cancel()
+    await inbox_worker.stop()
+    await clerk_sync_queue.stop()
     await close_jwks_client()
 
 @app.get("/", response_model=HealthCheckResponse)
@@ -155,6 +226,23 @@ async def root():
         version="1.0.0"
     )
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus scrape endpoint (aggregated across workers in multi-process mode)."""
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not is_scrape_allowed(
+        request.headers.get("authorization"),
+        request.client.host if request.client else None,
+        token=settings.METRICS_AUTH_TOKEN,
+        allow_unauthenticated=settings.is_development,
+    ):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+
+    await refresh_webhook_inbox_metrics()
+    payload, content_type = render_latest()
+    return Response(content=payload, media_type=content_type)
+
 @app.get("/health", response_model=HealthCheckResponse)
 async def health_check():
     """Health check endpoint."""
@@ -12,6 +12,7 @@ ComprehensiveDecision = Literal["昇格", "降格", "対象外"]
 HistoryOperation = Literal["UPSERT", "CLEAR"]
 ConditionField = Literal["overallRank", "performanceFinalRank", "competencyFinalRank", "coreValueFinalRank"]
 EvaluationPeriodLifecycleStatus = Literal["draft", "active", "completed", "cancelled"]
+TrendGroupBy = Literal["period", "department", "stage"]
 ComprehensiveEvaluationExportColumn = Literal[
     "employeeCode",
     "name",
@@ -227,6 +228,7 @@ class ComprehensiveEvaluationExportRequest(BaseModel):
 
 class ComprehensiveEvaluationFinalizeRequest(BaseModel):
     period_id: UUID = Field(..., alias="periodId")
+    process_remaining: bool = Field(False, alias="processRemaining")
 
     model_config = {"populate_by_name": True}
 
@@ -240,6 +242,134 @@ class ComprehensiveEvaluationFinalizeResponse(BaseModel):
 
     model_config = {"populate_by_name": True}
 
+
+class ComprehensivePeriodActivity(BaseModel):
+    """Per-user activity counts of a period, as shown in the dashboard history."""
+
+    goals_count: int = Field(0, alias="goalsCount")
+    completed_assessments_count: int = Field(0, alias="completedAssessmentsCount")
+    received_feedbacks_count: int = Field(0, alias="receivedFeedbacksCount")
+
+    model_config = {"populate_by_name": True}
+
+
+class ComprehensivePeriodSnapshot(BaseModel):
+    """Frozen result of one user in a finalized period (comprehensive_period_snapshots.document)."""
+
+    row: ComprehensiveEvaluationRow
+    activity: ComprehensivePeriodActivity
+
+    model_config = {"populate_by_name": True}
+
+
+class ComprehensiveSnapshotRefreshRequest(BaseModel):
+    period_id: UUID = Field(..., alias="periodId")
+
+    model_config = {"populate_by_name": True}
+
+
+class ComprehensiveSnapshotRefreshResponse(BaseModel):
+    period_id: UUID = Field(..., alias="periodId")
+    snapshot_count: int = Field(..., alias="snapshotCount")
+
+    model_config = {"populate_by_name": True}
+
+
+class ComprehensiveSnapshotExportRequest(BaseModel):
+    period_ids: List[UUID] = Field(..., alias="periodIds", min_length=1, max_length=20)
+    columns: List[ComprehensiveEvaluationExportColumn] = Field(..., min_length=1)
+
+    @model_validator(mode="after")
+    def _validate_unique(self):
+        if len(set(self.period_ids)) != len(self.period_ids):
+            raise ValueError("periodIds must not contain duplicates")
+        if len(set(self.columns)) != len(self.columns):
+            raise ValueError("columns must not contain duplicates")
+        return self
+
+    model_config = {"populate_by_name": True}
+
+
+class ComprehensiveComparisonPeriod(BaseModel):
+    period_id: UUID = Field(..., alias="periodId")
+    period_name: str = Field(..., alias="periodName")
+    snapshot_count: int = Field(..., alias="snapshotCount")
+
+    model_config = {"populate_by_name": True}
+
+
+class ComprehensiveComparisonResult(BaseModel):
+    overall_rank: Optional[EvaluationRank] = Field(None, alias="overallRank")
+    total_score: Optional[float] = Field(None, alias="totalScore")
+    performance_final_rank: Optional[EvaluationRank] = Field(None, alias="performanceFinalRank")
+    competency_final_rank: Optional[EvaluationRank] = Field(None, alias="competencyFinalRank")
+    core_value_final_rank: Optional[EvaluationRank] = Field(None, alias="coreValueFinalRank")
+    decision: ComprehensiveDecision
+    new_stage: Optional[str] = Field(None, alias="newStage")
+    new_level: Optional[int] = Field(None, alias="newLevel")
+
+    model_config = {"populate_by_name": True}
+
+
+class ComprehensiveComparisonUser(BaseModel):
+    user_id: UUID = Field(..., alias="userId")
+    employee_code: str = Field(..., alias="employeeCode")
+    name: str
+    department_name: Optional[str] = Field(None, alias="departmentName")
+    # Index-aligned with ComprehensivePeriodComparisonResponse.periods; None = no snapshot
+    results: List[Optional[ComprehensiveComparisonResult]]
+
+    model_config = {"populate_by_name": True}
+
+
+class ComprehensivePeriodComparisonResponse(BaseModel):
+    periods: List[ComprehensiveComparisonPeriod]
+    users: List[ComprehensiveComparisonUser]
+
+    model_config = {"populate_by_name": True}
+
+
+class ComprehensiveScoreStats(BaseModel):
+    count: int
+    average: float
+    p25: float
+    p50: float
+    p75: float
+    p90: float
+
+
+class ComprehensiveTrendPoint(BaseModel):
+    user_count: int = Field(..., alias="userCount")
+    processed_count: int = Field(..., alias="processedCount")
+    rank_distribution: Dict[EvaluationRank, int] = Field(..., alias="rankDistribution")
+    unranked_users: int = Field(..., alias="unrankedUsers")
+    promotion_count: int = Field(..., alias="promotionCount")
+    demotion_count: int = Field(..., alias="demotionCount")
+    promotion_rate: Optional[float] = Field(None, alias="promotionRate")
+    demotion_rate: Optional[float] = Field(None, alias="demotionRate")
+    performance_score: Optional[ComprehensiveScoreStats] = Field(None, alias="performanceScore")
+    total_score: Optional[ComprehensiveScoreStats] = Field(None, alias="totalScore")
+    assessment_completion_rate: Optional[float] = Field(None, alias="assessmentCompletionRate")
+    received_feedbacks_count: int = Field(..., alias="receivedFeedbacksCount")
+
+    model_config = {"populate_by_name": True}
+
+
+class ComprehensiveTrendGroup(BaseModel):
+    # Department or stage name; None for the whole period (groupBy=period) or users without one
+    key: Optional[str] = None
+    # Index-aligned with ComprehensiveTrendResponse.periods; None = no facts for this group in the period
+    points: List[Optional[ComprehensiveTrendPoint]]
+
+
+class ComprehensiveTrendResponse(BaseModel):
+    group_by: TrendGroupBy = Field(..., alias="groupBy")
+    periods: List[ComprehensiveComparisonPeriod]
+    groups: List[ComprehensiveTrendGroup]
+
+    model_config = {"populate_by_name": True}
+
+
 class ComprehensiveEvaluationProcessUserRequest(BaseModel):
     period_id: UUID = Field(..., alias="periodId")
     user_id: UUID = Field(..., alias="userId")
@@ -278,6 +408,55 @@ class ComprehensiveStageAssignmentUpdateRequest(ComprehensiveScopedAssignmentUpd
     pass
 
 
+class ComprehensiveSettingsSimulationRequest(BaseModel):
+    period_id: UUID = Field(..., alias="periodId")
+    settings: ComprehensiveEvaluationSettings
+    department_id: Optional[UUID] = Field(None, alias="departmentId")
+    stage_id: Optional[UUID] = Field(None, alias="stageId")
+    refresh_snapshot: bool = Field(False, alias="refreshSnapshot")
+    changed_users_limit: int = Field(200, ge=0, le=5000, alias="changedUsersLimit")
+
+    model_config = {"populate_by_name": True}
+
+
+class ComprehensiveSimulationSummary(BaseModel):
+    rank_distribution: Dict[EvaluationRank, int] = Field(..., alias="rankDistribution")
+    unranked_users: int = Field(..., alias="unrankedUsers")
+    promotion_candidates: int = Field(..., alias="promotionCandidates")
+    demotion_candidates: int = Field(..., alias="demotionCandidates")
+
+    model_config = {"populate_by_name": True}
+
+
+class ComprehensiveSimulationChangedUser(BaseModel):
+    user_id: UUID = Field(..., alias="userId")
+    employee_code: str = Field(..., alias="employeeCode")
+    name: str
+    department_name: Optional[str] = Field(None, alias="departmentName")
+    current_overall_rank: Optional[EvaluationRank] = Field(None, alias="currentOverallRank")
+    simulated_overall_rank: Optional[EvaluationRank] = Field(None, alias="simulatedOverallRank")
+    current_new_level: Optional[int] = Field(None, alias="currentNewLevel")
+    simulated_new_level: Optional[int] = Field(None, alias="simulatedNewLevel")
+    current_promotion_flag: bool = Field(..., alias="currentPromotionFlag")
+    simulated_promotion_flag: bool = Field(..., alias="simulatedPromotionFlag")
+    current_demotion_flag: bool = Field(..., alias="currentDemotionFlag")
+    simulated_demotion_flag: bool = Field(..., alias="simulatedDemotionFlag")
+
+    model_config = {"populate_by_name": True}
+
+
+class ComprehensiveSettingsSimulationResponse(BaseModel):
+    period_id: UUID = Field(..., alias="periodId")
+    snapshot_built_at: datetime = Field(..., alias="snapshotBuiltAt")
+    total_users: int = Field(..., alias="totalUsers")
+    current: ComprehensiveSimulationSummary
+    simulated: ComprehensiveSimulationSummary
+    changed_user_count: int = Field(..., alias="changedUserCount")
+    changed_users: List[ComprehensiveSimulationChangedUser] = Field(default_factory=list, alias="changedUsers")
+
+    model_config = {"populate_by_name": True}
+
+
 class ComprehensiveRulesetUpsertRequest(BaseModel):
     name: str = Field(..., min_length=1)
     settings: ComprehensiveEvaluationSettings
@@ -311,6 +490,38 @@ class ComprehensiveEvaluationProcessUserResponse(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+class ComprehensiveEvaluationProcessPeriodRequest(BaseModel):
+    period_id: UUID = Field(..., alias="periodId")
+    user_ids: Optional[List[UUID]] = Field(None, alias="userIds")
+    department_id: Optional[UUID] = Field(None, alias="departmentId")
+    stage_id: Optional[UUID] = Field(None, alias="stageId")
+    employment_type: Optional[EmploymentType] = Field(None, alias="employmentType")
+    search: Optional[str] = None
+    include_processed: bool = Field(False, alias="includeProcessed")
+    chunk_size: int = Field(500, ge=1, le=5000, alias="chunkSize")
+
+    model_config = {"populate_by_name": True}
+
+
+class ComprehensiveEvaluationProcessFailure(BaseModel):
+    user_id: UUID = Field(..., alias="userId")
+    reason: str
+
+    model_config = {"populate_by_name": True}
+
+
+class ComprehensiveEvaluationProcessPeriodResponse(BaseModel):
+    period_id: UUID = Field(..., alias="periodId")
+    total_users: int = Field(..., alias="totalUsers")
+    processed_users: int = Field(..., alias="processedUsers")
+    updated_user_levels: int = Field(..., alias="updatedUserLevels")
+    updated_user_stages: int = Field(..., alias="updatedUserStages")
+    committed_chunks: int = Field(..., alias="committedChunks")
+    failed_users: List[ComprehensiveEvaluationProcessFailure] = Field(default_factory=list, alias="failedUsers")
+
+    model_config = {"populate_by_name": True}
+
+
 class ComprehensiveManualDecisionUpsertRequest(BaseModel):
     period_id: UUID = Field(..., alias="periodId")
     decision: ComprehensiveDecision
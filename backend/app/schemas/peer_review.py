@@ -170,6 +170,15 @@ class CoreValueSummaryResponse(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+class CoreValueSummaryItem(CoreValueSummaryResponse):
+    """Core value summary for one user in the period-wide list (admin)."""
+    user_id: UUID = Field(..., alias="userId")
+    employee_code: Optional[str] = Field(None, alias="employeeCode")
+    name: str
+
+    model_config = {"populate_by_name": True}
+
+
 # ============================================================
 # Evaluation Progress (admin - 評価進捗)
 # ============================================================
@@ -44,6 +44,44 @@ class BulkUserStatusUpdateResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class UserImportRow(BaseModel):
+    """One CSV row of a bulk user import; department, stage, roles and supervisor are given by name/code.
+
+    Blank optional cells leave an existing user's value unchanged (new users default to active).
+    """
+    employee_code: str = Field(..., min_length=1, max_length=20)
+    name: str = Field(..., min_length=1, max_length=100)
+    email: EmailStr
+    clerk_user_id: str = Field(..., min_length=1, max_length=100)
+    job_title: Optional[str] = Field(None, max_length=100)
+    department: Optional[str] = Field(None, max_length=100)
+    stage: Optional[str] = None
+    roles: List[str] = []
+    supervisor_employee_code: Optional[str] = None
+    status: Optional[UserStatus] = None
+
+
+class UserImportRowError(BaseModel):
+    row: int = Field(..., description="CSV line number (the header is line 1)")
+    employee_code: Optional[str] = Field(None, alias="employeeCode")
+    errors: List[str]
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class UserImportResponse(BaseModel):
+    dry_run: bool = Field(..., alias="dryRun")
+    total_rows: int = Field(..., alias="totalRows")
+    created_count: int = Field(..., alias="createdCount")
+    updated_count: int = Field(..., alias="updatedCount")
+    failed_count: int = Field(..., alias="failedCount")
+    created_departments: List[str] = Field(default_factory=list, alias="createdDepartments")
+    clerk_sync_queued: int = Field(0, alias="clerkSyncQueued")
+    errors: List[UserImportRowError] = []
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
 # ========================================
 # DEPARTMENT SCHEMAS
 # ========================================
@@ -14,6 +14,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from time import perf_counter
 
+from ..core.metrics import record_cache_lookup
 from ..database.session import get_db_session
 from ..database.repositories.role_repo import RoleRepository
 from ..database.repositories.user_repo import UserRepository
@@ -447,10 +448,12 @@ async def _get_cached_auth_context(cache_key: str) -> AuthContext | None:
             ctx, cached_at = entry
             if now - cached_at <= _AUTH_CTX_TTL:
                 _auth_ctx_metrics["hits"] += 1
+                record_cache_lookup("auth_context", hit=True)
                 return ctx
             # Stale entry; drop it so future calls reload
             _auth_ctx_cache.pop(cache_key, None)
         _auth_ctx_metrics["misses"] += 1
+        record_cache_lookup("auth_context", hit=False)
     return None
 
 
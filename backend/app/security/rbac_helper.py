@@ -9,21 +9,22 @@ with standardized, reusable patterns.
 import logging
 from typing import Optional, List, Dict, Any, Set
 from uuid import UUID
-from cachetools import TTLCache
 
 from .context import AuthContext
 from .permissions import Permission
+from .rbac_scope import AccessScope
 from .rbac_types import ResourceType, ResourcePermissionMap
 from .viewer_visibility import ViewerSubjectType
 from ..core.exceptions import PermissionDeniedError
+from ..core.metrics import InstrumentedTTLCache
 
 logger = logging.getLogger(__name__)
 
 # Cache for subordinate relationships (100 users, 5-minute TTL)
-subordinate_cache = TTLCache(maxsize=100, ttl=300)
+subordinate_cache = InstrumentedTTLCache("rbac_subordinates", maxsize=100, ttl=300)
 
 # Cache for resource access results (500 items, 2-minute TTL for frequently accessed resources)
-resource_access_cache = TTLCache(maxsize=500, ttl=120)
+resource_access_cache = InstrumentedTTLCache("rbac_resource_access", maxsize=500, ttl=120)
 
 
 class RBACHelper:
@@ -71,6 +72,22 @@ class RBACHelper:
             - USER_READ_ALL: Returns None (access to all users)
             - USER_READ_SUBORDINATES: Returns list of subordinate user IDs
             - USER_READ_SELF: Returns list containing only current user ID
+
+        Prefer get_accessible_user_scope() for query filtering and membership checks.
+        """
+        scope = await RBACHelper.get_accessible_user_scope(auth_context, target_user_id)
+        return scope.to_id_list()
+
+    @staticmethod
+    async def get_accessible_user_scope(
+        auth_context: AuthContext,
+        target_user_id: Optional[UUID] = None
+    ) -> AccessScope:
+        """
+        Compact form of get_accessible_user_ids().
+
+        The scope filters queries with a subordinate semi-join instead of an ID list,
+        checks membership in O(1) and provides a short, stable cache key.
         """
         org_id = getattr(auth_context, "organization_id", None)
         role_key = ",".join(sorted([role.lower() for role in (auth_context.role_names or [])]))
@@ -78,43 +95,36 @@ class RBACHelper:
         
         # Check cache first
         if cached_result := resource_access_cache.get(cache_key):
-            logger.debug(f"Cache hit for accessible user IDs: {auth_context.user_id}")
+            logger.debug(f"Cache hit for accessible user scope: {auth_context.user_id}")
             return cached_result
         
-        base_result: Optional[List[UUID]] = None
-        
         if auth_context.has_permission(Permission.USER_READ_ALL):
             # Can access all users
-            base_result = None
+            base_scope = AccessScope.all(org_id)
         elif auth_context.has_permission(Permission.USER_READ_SUBORDINATES):
-            # Manager/Supervisor: Can access subordinates
-            subordinate_ids = await RBACHelper._get_subordinate_user_ids(
-                auth_context.user_id, RBACHelper.get_user_repository(), auth_context.organization_id
-            )
-            # Include self in accessible users for managers/supervisors
-            base_result = subordinate_ids + ([auth_context.user_id] if auth_context.user_id else [])
+            # Manager/Supervisor: Can access subordinates and self
+            base_scope = await RBACHelper._get_subordinate_scope(auth_context)
         elif auth_context.has_permission(Permission.USER_READ_SELF):
             # Employee: Can only access themselves
-            base_result = [auth_context.user_id] if auth_context.user_id else []
+            base_scope = AccessScope.self_only(auth_context.user_id, org_id)
         else:
             # No permission to read users
             raise PermissionDeniedError("No permission to read user data")
 
-        final_result = await RBACHelper._apply_viewer_visibility_overrides(
+        final_scope = await RBACHelper._apply_viewer_visibility_overrides(
             auth_context,
             ResourceType.USER,
-            base_result,
+            base_scope,
         )
 
         # Cache the result
-        resource_access_cache[cache_key] = final_result
+        resource_access_cache[cache_key] = final_scope
         
         logger.debug(
-            f"Computed accessible user IDs for user {auth_context.user_id}: "
-            f"{'all' if final_result is None else len(final_result)} users"
+            f"Computed accessible user scope for user {auth_context.user_id}: {final_scope.cache_key}"
         )
         
-        return final_result
+        return final_scope
     
     @staticmethod
     async def get_accessible_resource_ids(
@@ -134,11 +144,21 @@ class RBACHelper:
             None: User can access all resources of this type
             List[UUID]: Specific resource IDs the user can access
         """
+        scope = await RBACHelper.get_accessible_resource_scope(auth_context, resource_type, target_user_id)
+        return scope.to_id_list()
+
+    @staticmethod
+    async def get_accessible_resource_scope(
+        auth_context: AuthContext,
+        resource_type: ResourceType,
+        target_user_id: Optional[UUID] = None
+    ) -> AccessScope:
+        """Compact form of get_accessible_resource_ids() (owner user scope)."""
         cache_key = f"accessible_{resource_type.value}_{auth_context.user_id}_{target_user_id}"
         
         # Check cache first
         if cached_result := resource_access_cache.get(cache_key):
-            logger.debug(f"Cache hit for accessible {resource_type.value} IDs: {auth_context.user_id}")
+            logger.debug(f"Cache hit for accessible {resource_type.value} scope: {auth_context.user_id}")
             return cached_result
         
         result = await RBACHelper._compute_resource_access(
@@ -149,8 +169,8 @@ class RBACHelper:
         resource_access_cache[cache_key] = result
         
         logger.debug(
-            f"Computed accessible {resource_type.value} IDs for user {auth_context.user_id}: "
-            f"{'all' if result is None else len(result)} resources"
+            f"Computed accessible {resource_type.value} scope for user {auth_context.user_id}: "
+            f"{result.cache_key}"
         )
         
         return result
@@ -244,13 +264,21 @@ class RBACHelper:
         subordinate_cache[cache_key] = subordinates
         
         return subordinates
+
+    @staticmethod
+    async def _get_subordinate_scope(auth_context: AuthContext) -> AccessScope:
+        """The caller and their subordinates as a SUBORDINATES scope."""
+        subordinate_ids = await RBACHelper._get_subordinate_user_ids(
+            auth_context.user_id, RBACHelper.get_user_repository(), auth_context.organization_id
+        )
+        return AccessScope.subordinates_of(auth_context.user_id, subordinate_ids, auth_context.organization_id)
     
     @staticmethod
     async def _compute_resource_access(
         auth_context: AuthContext,
         resource_type: ResourceType,
         target_user_id: Optional[UUID] = None
-    ) -> Optional[List[UUID]]:
+    ) -> AccessScope:
         """
         Compute resource access based on resource type and user permissions.
         
@@ -262,37 +290,34 @@ class RBACHelper:
         # Check for "read_all" permission
         if "read_all" in resource_permissions:
             if auth_context.has_permission(resource_permissions["read_all"]):
-                return None  # Access to all resources
+                return AccessScope.all(auth_context.organization_id)  # Access to all resources
         
         # Check for "read_subordinates" permission
         if "read_subordinates" in resource_permissions:
             if auth_context.has_permission(resource_permissions["read_subordinates"]):
-                subordinate_ids = await RBACHelper._get_subordinate_user_ids(
-                    auth_context.user_id, RBACHelper.get_user_repository(), auth_context.organization_id
-                )
                 # For resource access, we typically need the user IDs who own the resources
-                base_ids = subordinate_ids + ([auth_context.user_id] if auth_context.user_id else [])
+                base_scope = await RBACHelper._get_subordinate_scope(auth_context)
                 return await RBACHelper._apply_viewer_visibility_overrides(
                     auth_context,
                     resource_type,
-                    base_ids,
+                    base_scope,
                 )
         
         # Check for "read_self" permission
         if "read_self" in resource_permissions:
             if auth_context.has_permission(resource_permissions["read_self"]):
-                base_ids = [auth_context.user_id] if auth_context.user_id else []
+                base_scope = AccessScope.self_only(auth_context.user_id, auth_context.organization_id)
                 return await RBACHelper._apply_viewer_visibility_overrides(
                     auth_context,
                     resource_type,
-                    base_ids,
+                    base_scope,
                 )
         
         # Check for general "read" permission (like evaluations)
         if "read" in resource_permissions:
             if auth_context.has_permission(resource_permissions["read"]):
                 # For general read permissions, apply same logic as user access
-                return await RBACHelper.get_accessible_user_ids(auth_context, target_user_id)
+                return await RBACHelper.get_accessible_user_scope(auth_context, target_user_id)
 
         # No permissions found
         raise PermissionDeniedError(f"No permission to access {resource_type.value} resources")
@@ -301,16 +326,12 @@ class RBACHelper:
     async def _apply_viewer_visibility_overrides(
         auth_context: AuthContext,
         resource_type: ResourceType,
-        base_result: Optional[List[UUID]],
-    ) -> Optional[List[UUID]]:
+        base_scope: AccessScope,
+    ) -> AccessScope:
         override_targets = await RBACHelper._get_viewer_visibility_targets(auth_context, resource_type)
         if override_targets is None:
-            return base_result
-        if base_result is None:
-            return None
-        combined = set(base_result)
-        combined.update(override_targets)
-        return list(combined)
+            return base_scope
+        return base_scope.with_extra(override_targets)
 
     @staticmethod
     async def _get_viewer_visibility_targets(
@@ -0,0 +1,188 @@
+"""
+Compact RBAC user scope.
+
+``RBACHelper.get_accessible_user_ids`` materializes the users a caller may see as a
+list. For supervisors with large teams and viewers with department overrides that list
+is shipped to the database as one bind parameter per user on every query, hashed
+element by element into cache keys, and searched linearly for membership checks.
+
+``AccessScope`` describes the same set by how it was derived:
+
+    ALL            no user filtering (read_all permission)
+    SELF           only the caller
+    SUBORDINATES   the caller plus their current subordinates (plus optional extras)
+    EXPLICIT       a fixed set of user IDs
+
+and offers the three operations callers need:
+
+- ``predicate(column)``: a SQL filter. ``SUBORDINATES`` compiles to a semi-join on
+  ``users_supervisors`` and large explicit sets bind as a single ``uuid[]`` array.
+- ``user_id in scope``: O(1) membership against a frozenset.
+- ``cache_key``: a short, stable string that does not grow with the team size.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from enum import Enum
+from typing import FrozenSet, Iterable, List, Optional, Sequence, Union
+from uuid import UUID
+
+from sqlalchemy import any_, false, literal, or_
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.sql.elements import ColumnElement
+
+# Explicit sets larger than this bind as one uuid[] parameter instead of one per ID.
+ARRAY_BIND_THRESHOLD = 50
+
+
+class ScopeKind(str, Enum):
+    ALL = "all"
+    SELF = "self"
+    SUBORDINATES = "subordinates"
+    EXPLICIT = "explicit"
+
+
+def _digest(ids: Iterable[UUID]) -> str:
+    joined = ",".join(sorted(str(user_id) for user_id in ids))
+    return hashlib.sha1(joined.encode("utf-8")).hexdigest()[:16]
+
+
+def _id_filter(column, ids: FrozenSet[UUID]) -> ColumnElement:
+    if len(ids) > ARRAY_BIND_THRESHOLD:
+        return column == any_(literal(sorted(ids, key=str), ARRAY(PG_UUID(as_uuid=True))))
+    return column.in_(sorted(ids, key=str))
+
+
+@dataclass(frozen=True)
+class AccessScope:
+    """
+    The set of users a caller may access.
+
+    ``member_ids`` is the resolved membership used for ``in`` checks (empty for ALL).
+    For SUBORDINATES, ``subject_id`` is the supervisor and ``extra_ids`` holds users
+    granted on top of the team (viewer visibility overrides).
+    """
+
+    kind: ScopeKind
+    org_id: Optional[str] = None
+    subject_id: Optional[UUID] = None
+    member_ids: FrozenSet[UUID] = frozenset()
+    extra_ids: FrozenSet[UUID] = frozenset()
+
+    # ------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def all(cls, org_id: Optional[str] = None) -> "AccessScope":
+        return cls(ScopeKind.ALL, org_id=org_id)
+
+    @classmethod
+    def self_only(cls, user_id: Optional[UUID], org_id: Optional[str] = None) -> "AccessScope":
+        if not user_id:
+            return cls.explicit([], org_id)
+        return cls(ScopeKind.SELF, org_id=org_id, subject_id=user_id, member_ids=frozenset([user_id]))
+
+    @classmethod
+    def subordinates_of(
+        cls,
+        supervisor_id: Optional[UUID],
+        subordinate_ids: Iterable[UUID],
+        org_id: str,
+    ) -> "AccessScope":
+        """The supervisor and their current subordinates (``subordinate_ids`` as already resolved)."""
+        if not supervisor_id or not org_id:
+            # Without an org the team cannot be expressed as a semi-join; keep the IDs.
+            return cls.explicit([*subordinate_ids, supervisor_id], org_id)
+        members = frozenset(user_id for user_id in subordinate_ids if user_id) | {supervisor_id}
+        return cls(ScopeKind.SUBORDINATES, org_id=org_id, subject_id=supervisor_id, member_ids=members)
+
+    @classmethod
+    def explicit(cls, user_ids: Iterable[UUID], org_id: Optional[str] = None) -> "AccessScope":
+        return cls(ScopeKind.EXPLICIT, org_id=org_id, member_ids=frozenset(u for u in user_ids if u))
+
+    @classmethod
+    def coerce(cls, user_ids: Union["AccessScope", Sequence[UUID], None]) -> "AccessScope":
+        """Accept the legacy ``Optional[List[UUID]]`` form (None = all) as well as a scope."""
+        if isinstance(user_ids, AccessScope):
+            return user_ids
+        if user_ids is None:
+            return cls.all()
+        return cls.explicit(user_ids)
+
+    # ------------------------------------------------------------------
+    # Set operations
+    # ------------------------------------------------------------------
+
+    @property
+    def is_all(self) -> bool:
+        return self.kind == ScopeKind.ALL
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.is_all and not self.member_ids
+
+    def __contains__(self, user_id: object) -> bool:
+        return self.is_all or user_id in self.member_ids
+
+    def with_extra(self, user_ids: Iterable[UUID]) -> "AccessScope":
+        """Grant additional users on top of this scope."""
+        extra = frozenset(u for u in user_ids if u) - self.member_ids
+        if self.is_all or not extra:
+            return self
+        if self.kind == ScopeKind.SUBORDINATES:
+            return AccessScope(
+                ScopeKind.SUBORDINATES,
+                org_id=self.org_id,
+                subject_id=self.subject_id,
+                member_ids=self.member_ids | extra,
+                extra_ids=self.extra_ids | extra,
+            )
+        return AccessScope.explicit(self.member_ids | extra, self.org_id)
+
+    def restrict_to(self, user_ids: Iterable[UUID]) -> "AccessScope":
+        """Intersection with an explicit set of users."""
+        if self.is_all:
+            return AccessScope.explicit(user_ids, self.org_id)
+        return AccessScope.explicit((u for u in user_ids if u in self.member_ids), self.org_id)
+
+    def to_id_list(self) -> Optional[List[UUID]]:
+        """Legacy representation: None for ALL, otherwise the member IDs in a stable order."""
+        if self.is_all:
+            return None
+        return sorted(self.member_ids, key=str)
+
+    # ------------------------------------------------------------------
+    # SQL and caching
+    # ------------------------------------------------------------------
+
+    def predicate(self, user_id_column) -> Optional[ColumnElement]:
+        """SQL filter on ``user_id_column``; None when no filtering is needed."""
+        if self.is_all:
+            return None
+        if self.is_empty:
+            return false()
+        if self.kind == ScopeKind.SELF:
+            return user_id_column == self.subject_id
+        if self.kind == ScopeKind.SUBORDINATES:
+            from ..database.repositories.user_repo import current_subordinate_ids_query
+
+            # The query member_ids was resolved from (via the repositories' get_subordinates).
+            team = current_subordinate_ids_query(self.subject_id, self.org_id)
+            clauses = [user_id_column == self.subject_id, user_id_column.in_(team)]
+            if self.extra_ids:
+                clauses.append(_id_filter(user_id_column, self.extra_ids))
+            return or_(*clauses)
+        return _id_filter(user_id_column, self.member_ids)
+
+    @property
+    def cache_key(self) -> str:
+        """Stable key whose length does not depend on the number of users in scope."""
+        if self.is_all:
+            return "all"
+        if self.kind == ScopeKind.SELF:
+            return f"self:{self.subject_id}"
+        if self.kind == ScopeKind.SUBORDINATES:
+            key = f"subordinates:{self.org_id}:{self.subject_id}"
+            return f"{key}+{_digest(self.extra_ids)}" if self.extra_ids else key
+        return f"explicit:{len(self.member_ids)}:{_digest(self.member_ids)}"
@@ -6,6 +6,7 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.metrics import record_cache_lookup
 from ..database.repositories.permission_repo import (
     PermissionRepository,
     RolePermissionRepository,
@@ -42,6 +43,7 @@ async def get_cached_role_permissions(
             permissions, cached_at = cached
             if now - cached_at <= _TTL:
                 _metrics["hits"] += 1
+                record_cache_lookup("role_permission_cache", hit=True)
                 ttl_remaining_ms = max(0, int((_TTL - (now - cached_at)).total_seconds() * 1000))
                 logger.info(
                     "role_permissions.cache.hit",
@@ -59,6 +61,7 @@ async def get_cached_role_permissions(
     repo = PermissionRepository(session)
     permission_models = await repo.list_for_role(str(role_id), organization_id)
     _metrics["misses"] += 1
+    record_cache_lookup("role_permission_cache", hit=False)
     if not permission_models:
         async with _lock:
             _cache[cache_key] = (set(), now)
@@ -138,10 +141,12 @@ async def get_cached_permissions_for_roles(
             cached = _cache.get(cache_key)
             if cached and now - cached[1] <= _TTL:
                 _metrics["hits"] += 1
+                record_cache_lookup("role_permission_cache", hit=True)
                 permissions_by_role[role.name.lower()] = cached[0]
             else:
                 roles_to_load[cache_key] = (role.id, role.name)
                 _metrics["misses"] += 1
+                record_cache_lookup("role_permission_cache", hit=False)
 
     if not roles_to_load:
         return permissions_by_role
@@ -5,8 +5,6 @@ import time
 from typing import Dict, Any, Optional
 
 import httpx
-from cachetools import TTLCache
-from clerk_backend_api import Clerk
 from jose import JWTError, jwk, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -20,11 +18,12 @@ from ..schemas.stage_competency import Stage
 from ..core.clerk_config import get_clerk_config
 from ..core.config import settings
 from ..core.exceptions import UnauthorizedError
+from ..core.metrics import JWKS_REFRESHES, InstrumentedTTLCache
 
 logger = logging.getLogger(__name__)
 
 # Global JWKS cache - 60 minutes TTL for security keys
-_jwks_cache: TTLCache = TTLCache(maxsize=10, ttl=3600)
+_jwks_cache: InstrumentedTTLCache = InstrumentedTTLCache("jwks", maxsize=10, ttl=3600)
 
 # Shared HTTP client for JWKS fetches to reuse keep-alive connections.
 _jwks_client: httpx.AsyncClient | None = None
@@ -33,7 +32,7 @@ _jwks_client_lock = asyncio.Lock()
 # Short-lived cache for decoded AuthUser by token hash to avoid repeated JWT
 # verification work across rapid successive requests. Entries are also
 # validated against the token's exp claim on read.
-_token_cache: TTLCache = TTLCache(maxsize=512, ttl=300)
+_token_cache: InstrumentedTTLCache = InstrumentedTTLCache("auth_token", maxsize=512, ttl=300)
 
 
 async def _get_jwks_client() -> httpx.AsyncClient:
@@ -66,20 +65,29 @@ class AuthService:
         self.stage_repo = StageRepository(session) if session else None
         self.role_repo = RoleRepository(session) if session else None
         
-        # Initialize Clerk client
-        clerk_config = get_clerk_config()
-        self.clerk = Clerk(
-            bearer_auth=clerk_config.secret_key
-        )
+        # Validate Clerk configuration eagerly; the SDK client itself is built on
+        # first use because importing clerk_backend_api dominates cold-start time.
+        self._clerk_secret_key = get_clerk_config().secret_key
+        self._clerk = None
+
+    @property
+    def clerk(self):
+        """Clerk SDK client (created lazily)."""
+        if self._clerk is None:
+            from clerk_backend_api import Clerk
+
+            self._clerk = Clerk(bearer_auth=self._clerk_secret_key)
+        return self._clerk
 
     async def _fetch_jwks(self, issuer: str) -> Dict[str, Any]:
         """Fetch JWKS from Clerk with caching."""
         cache_key = f"jwks_{issuer}"
         
         # Check cache first
-        if cache_key in _jwks_cache:
+        cached_jwks = _jwks_cache.get(cache_key)
+        if cached_jwks is not None:
             logger.debug(f"Using cached JWKS for issuer: {issuer}")
-            return _jwks_cache[cache_key]
+            return cached_jwks
         
         # Fetch from Clerk
         jwks_url = f"{issuer}/.well-known/jwks.json"
@@ -93,10 +101,12 @@ class AuthService:
 
             # Cache the result
             _jwks_cache[cache_key] = jwks_data
+            JWKS_REFRESHES.labels(result="success").inc()
             logger.info(f"Successfully cached JWKS for issuer: {issuer}")
             return jwks_data
 
         except Exception as e:
+            JWKS_REFRESHES.labels(result="error").inc()
             logger.error(f"Failed to fetch JWKS from {jwks_url}: {e}")
             raise Exception(f"JWKS fetch failed: {str(e)}")
 
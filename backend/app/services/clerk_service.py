@@ -1,4 +1,3 @@
-from clerk_backend_api import Clerk
 from typing import Dict, Any, Optional, List
 import os
 import logging
@@ -7,9 +6,18 @@ logger = logging.getLogger(__name__)
 
 class ClerkService:
     def __init__(self):
-        self.clerk = Clerk(
-            bearer_auth=os.getenv("CLERK_SECRET_KEY")
-        )
+        self._clerk = None
+
+    @property
+    def clerk(self):
+        """Clerk SDK client, created on first use (the SDK is slow to import)."""
+        if self._clerk is None:
+            from clerk_backend_api import Clerk
+
+            self._clerk = Clerk(
+                bearer_auth=os.getenv("CLERK_SECRET_KEY")
+            )
+        return self._clerk
         
     
     def update_user_metadata(self, clerk_user_id: str, metadata: Dict[str, Any]) -> bool:
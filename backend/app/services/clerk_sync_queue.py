@@ -0,0 +1,115 @@
+"""
+Rate-limited queue for Clerk metadata updates.
+
+ClerkService calls are synchronous HTTP requests. Issuing one per user inside a
+request (as create_user does) is fine for a single user, but a bulk import of
+thousands of users would pin the request on Clerk and run into its rate limit.
+Callers enqueue updates instead; a few workers drain the queue off-thread with
+request starts spaced at ``requests_per_second``.
+
+Updates live in memory only: a restart drops pending items, which is acceptable
+because the database stays the source of truth and metadata is re-synced on the
+next profile update.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.config import settings
+from .clerk_service import ClerkService
+
+logger = logging.getLogger(__name__)
+
+
+class ClerkSyncQueue:
+    """Drains queued Clerk metadata updates at a bounded request rate."""
+
+    def __init__(
+        self,
+        clerk_service: Optional[ClerkService] = None,
+        *,
+        requests_per_second: float = settings.CLERK_SYNC_REQUESTS_PER_SECOND,
+        concurrency: int = settings.CLERK_SYNC_CONCURRENCY,
+    ):
+        self.clerk_service = clerk_service or ClerkService()
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self.concurrency = max(1, concurrency)
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._next_slot = 0.0
+        self._metrics: Dict[str, int] = {"enqueued": 0, "succeeded": 0, "failed": 0}
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+    def enqueue_metadata_update(self, clerk_user_id: str, metadata: Dict[str, Any]) -> None:
+        """Queue a publicMetadata update; workers are started on first use."""
+        self._ensure_started()
+        self._queue.put_nowait((clerk_user_id, metadata))
+        self._metrics["enqueued"] += 1
+
+    async def join(self) -> None:
+        """Wait until every queued update has been attempted."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def _ensure_started(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        for index in range(len(self._workers), self.concurrency):
+            self._workers.append(asyncio.create_task(self._run(), name=f"clerk-sync-queue-{index}"))
+
+    async def stop(self) -> None:
+        """Cancel the workers; pending updates are dropped and counted as failed."""
+        for worker in self._workers:
+            worker.cancel()
+        for worker in self._workers:
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        self._workers = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self._metrics["failed"] += 1
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+    async def _wait_for_slot(self) -> None:
+        """Reserve the next request start time (safe without a lock: no await in between)."""
+        now = asyncio.get_running_loop().time()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def _run(self) -> None:
+        while True:
+            item: Tuple[str, Dict[str, Any]] = await self._queue.get()
+            clerk_user_id, metadata = item
+            try:
+                await self._wait_for_slot()
+                ok = await asyncio.to_thread(self.clerk_service.update_user_metadata, clerk_user_id, metadata)
+                self._metrics["succeeded" if ok else "failed"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pragma: no cover - defensive, keep worker alive
+                self._metrics["failed"] += 1
+                logger.error(f"Clerk metadata sync failed for {clerk_user_id}: {exc}")
+            finally:
+                self._queue.task_done()
+
+    def get_metrics(self) -> Dict[str, int]:
+        return {**self._metrics, "pending": self._queue.qsize() if self._queue is not None else 0}
+
+
+# Process-wide queue stopped from the application shutdown hook
+clerk_sync_queue = ClerkSyncQueue()
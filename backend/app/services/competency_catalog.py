@@ -0,0 +1,169 @@
+"""
+Org-level cache of stage competency catalogs.
+
+Goal lists, competency snapshots at approval and self-assessment validation all need
+"the competencies of this user's stage". They now share one accessor:
+
+    catalog = CompetencyCatalog(session)
+    by_user = await catalog.get_user_catalogs(org_id, user_ids)    # 3 queries at most
+    by_stage = await catalog.get_stage_catalogs(org_id, stage_ids)  # 1-2 queries
+
+Entries are keyed by (org_id, stage_id, catalog version). The version is the
+organization's competency fingerprint (row count, latest updated_at), read from the
+database on every lookup, so a write on any worker makes that org's cached stages
+unreachable everywhere at once; the old entries just age out of the TTL cache. The
+fingerprint is read before the competencies, so an entry never holds data older
+than its version. Goal approval snapshots and self-assessment validation persist
+what they read, which is why a per-process version is not enough here.
+
+Cached values are shared between requests and therefore immutable: frozen
+dataclasses, tuples and read-only mappings. Use thaw() (or StageCatalog.context())
+for anything handed to a JSON column or a response model.
+
+bump_catalog_version(org_id) is a separate, per-process generation that only keys
+the competency search cache (read-only listings), like the other service TTL caches.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.metrics import InstrumentedTTLCache
+from ..database.repositories.competency_repo import CompetencyRepository
+from ..database.repositories.user_repo import UserRepository
+
+logger = logging.getLogger(__name__)
+
+# (org_id, stage_id, fingerprint) -> StageCatalog (512 stages, 10-minute TTL)
+_stage_catalog_cache = InstrumentedTTLCache("competency_catalog", maxsize=512, ttl=600)
+
+# org_id -> search cache generation (this process only)
+_catalog_versions: Dict[str, int] = {}
+
+CatalogVersion = Tuple[int, Optional[datetime]]
+
+
+def catalog_version(org_id: str) -> int:
+    """Current competency search cache generation for the organization in this process."""
+    return _catalog_versions.get(org_id, 0)
+
+
+def bump_catalog_version(org_id: str) -> int:
+    """Invalidate this process's cached competency searches for the organization. Call after competency or stage writes."""
+    version = catalog_version(org_id) + 1
+    _catalog_versions[org_id] = version
+    return version
+
+
+def freeze(value: Any) -> Any:
+    """Deep read-only copy of a JSON-like value (dict -> mappingproxy, list -> tuple)."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain, caller-owned copy of a frozen value (mappingproxy -> dict, tuple -> list)."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True, eq=False)
+class CatalogCompetency:
+    """Read-only view of a Competency row."""
+    id: UUID
+    stage_id: UUID
+    name: str
+    description: Any
+    display_order: Optional[int]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+    @classmethod
+    def from_model(cls, model: Any) -> "CatalogCompetency":
+        return cls(
+            id=model.id,
+            stage_id=model.stage_id,
+            name=model.name,
+            description=freeze(model.description),
+            display_order=model.display_order,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class StageCatalog:
+    """Competencies of one stage, in display order, at one catalog version."""
+    stage_id: UUID
+    version: CatalogVersion
+    competencies: Tuple[CatalogCompetency, ...]
+
+    def context(self) -> Dict[str, Any]:
+        """Plain dict in the stage_competency_data / competency_snapshot layout."""
+        return {
+            "competency_ids": [c.id for c in self.competencies],
+            "competency_names": {str(c.id): c.name for c in self.competencies},
+            "ideal_action_texts": {str(c.id): thaw(c.description) or {} for c in self.competencies},
+        }
+
+
+class CompetencyCatalog:
+    """Batch accessor for stage competency catalogs backed by the shared cache."""
+
+    def __init__(self, session: AsyncSession):
+        self.competency_repo = CompetencyRepository(session)
+        self.user_repo = UserRepository(session)
+
+    async def get_stage_catalogs(self, org_id: str, stage_ids: Iterable[Optional[UUID]]) -> Dict[UUID, StageCatalog]:
+        """stage_id -> StageCatalog for every requested stage: one version query plus one query for all misses."""
+        requested = list(dict.fromkeys(sid for sid in stage_ids if sid))
+        if not requested:
+            return {}
+        version = await self.competency_repo.get_catalog_fingerprint(org_id)
+        catalogs: Dict[UUID, StageCatalog] = {}
+        missing = []
+        for stage_id in requested:
+            cached = _stage_catalog_cache.get((org_id, stage_id, version))
+            if cached is not None:
+                catalogs[stage_id] = cached
+            else:
+                missing.append(stage_id)
+
+        if missing:
+            grouped: Dict[UUID, list] = {stage_id: [] for stage_id in missing}
+            for model in await self.competency_repo.get_by_stage_ids(missing, org_id):
+                grouped[model.stage_id].append(CatalogCompetency.from_model(model))
+            for stage_id, competencies in grouped.items():
+                catalog = StageCatalog(stage_id=stage_id, version=version, competencies=tuple(competencies))
+                _stage_catalog_cache[(org_id, stage_id, version)] = catalog
+                catalogs[stage_id] = catalog
+            logger.debug(f"Loaded competency catalogs for {len(missing)} stages in org {org_id} ({version})")
+
+        return catalogs
+
+    async def get_stage_catalog(self, org_id: str, stage_id: UUID) -> StageCatalog:
+        """Single-stage convenience wrapper around get_stage_catalogs."""
+        return (await self.get_stage_catalogs(org_id, [stage_id]))[stage_id]
+
+    async def get_user_catalogs(self, org_id: str, user_ids: Iterable[UUID]) -> Dict[UUID, StageCatalog]:
+        """user_id -> catalog of the user's current stage. Users without a stage are absent."""
+        stage_by_user = await self.user_repo.get_user_stage_ids(user_ids, org_id)
+        catalogs = await self.get_stage_catalogs(org_id, stage_by_user.values())
+        return {
+            user_id: catalogs[stage_id]
+            for user_id, stage_id in stage_by_user.items()
+            if stage_id
+        }
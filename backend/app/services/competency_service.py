@@ -2,7 +2,6 @@ from __future__ import annotations
 import logging
 from typing import Optional, List
 from uuid import UUID
-from cachetools import TTLCache
 
 from ..database.repositories.competency_repo import CompetencyRepository
 from ..database.repositories.stage_repo import StageRepository
@@ -18,15 +17,17 @@ from ..security.decorators import require_permission, require_any_permission
 from ..core.exceptions import (
     NotFoundError, ConflictError, PermissionDeniedError, BadRequestError
 )
+from ..core.metrics import InstrumentedTTLCache
+from .competency_catalog import CompetencyCatalog, bump_catalog_version, catalog_version, thaw
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
 # Cache for competency search results (100 items, 5-minute TTL)
-competency_search_cache = TTLCache(maxsize=100, ttl=300)
+competency_search_cache = InstrumentedTTLCache("competency_search", maxsize=100, ttl=300)
 
 # Cache for user stage lookups within competency service (100 items, 5-minute TTL)
-user_stage_cache = TTLCache(maxsize=100, ttl=300)
+user_stage_cache = InstrumentedTTLCache("user_stage", maxsize=100, ttl=300)
 
 
 class CompetencyService:
@@ -37,6 +38,7 @@ class CompetencyService:
         self.competency_repo = CompetencyRepository(session)
         self.stage_repo = StageRepository(session)
         self.user_repo = UserRepository(session)
+        self.competency_catalog = CompetencyCatalog(session)
     
     @require_any_permission([Permission.COMPETENCY_READ, Permission.COMPETENCY_READ_SELF])
     async def get_competencies(
@@ -98,18 +100,19 @@ class CompetencyService:
                         raise PermissionDeniedError("Access denied to requested stages")
                     filtered_stage_ids = [user_stage_id]  # Only allow user's own stage
             
-            # Create cache key (include user role and org for cache segregation)
+            # Create cache key (include user role, org and catalog version for cache segregation)
             user_role = current_user_context.role_names[0] if current_user_context.role_names else "unknown"
             cache_key = (
                 f"competencies:{current_user_context.organization_id}:"
+                f"v{catalog_version(current_user_context.organization_id)}:"
                 f"{user_role}:{search_term}:{filtered_stage_ids}:"
                 f"{pagination.page if pagination else 1}:"
                 f"{pagination.limit if pagination else 'all'}"
             )
             
             # Check cache first
-            if cache_key in competency_search_cache:
-                cached_data = competency_search_cache[cache_key]
+            cached_data = competency_search_cache.get(cache_key)
+            if cached_data is not None:
                 return PaginatedResponse.model_validate_json(cached_data)
             
             # Get competencies from repository
@@ -232,8 +235,8 @@ class CompetencyService:
             await self.session.commit()
             await self.session.refresh(competency)
             
-            # Clear cache
-            competency_search_cache.clear()
+            # Invalidate cached catalogs and search results for this organization
+            bump_catalog_version(current_user_context.organization_id)
             
             # Return enriched competency
             enriched_competency = await self._enrich_competency_data(competency)
@@ -299,8 +302,8 @@ class CompetencyService:
             await self.session.commit()
             await self.session.refresh(updated_competency)
             
-            # Clear cache
-            competency_search_cache.clear()
+            # Invalidate cached catalogs and search results for this organization
+            bump_catalog_version(current_user_context.organization_id)
             
             # Return enriched competency
             enriched_competency = await self._enrich_competency_data(updated_competency)
@@ -348,8 +351,8 @@ class CompetencyService:
                 # Commit transaction
                 await self.session.commit()
                 
-                # Clear cache
-                competency_search_cache.clear()
+                # Invalidate cached catalogs and search results for this organization
+                bump_catalog_version(current_user_context.organization_id)
                 
                 logger.info(f"Successfully deleted competency {competency_id}")
                 return True
@@ -389,7 +392,8 @@ class CompetencyService:
                 user_stage_id = await self._get_user_stage_id(current_user_context.user_id, current_user_context.organization_id)
                 if user_stage_id is None:
                     raise PermissionDeniedError("User has no stage assigned")
-                competencies = await self.competency_repo.get_by_stage_id(user_stage_id, current_user_context.organization_id)
+                catalog = await self.competency_catalog.get_stage_catalog(current_user_context.organization_id, user_stage_id)
+                competencies = catalog.competencies
             
             # Convert to schema objects
             competency_schemas = []
@@ -432,7 +436,8 @@ class CompetencyService:
                 raise NotFoundError(f"Stage with ID {stage_id} not found")
             
             # Get competencies for stage
-            competencies = await self.competency_repo.get_by_stage_id(stage_id, current_user_context.organization_id)
+            catalog = await self.competency_catalog.get_stage_catalog(current_user_context.organization_id, stage_id)
+            competencies = catalog.competencies
             
             # Convert to schema objects
             competency_schemas = []
@@ -511,13 +516,13 @@ class CompetencyService:
             return user_stage_id
     
     async def _enrich_competency_data(self, competency_model: CompetencyModel) -> Competency:
-        """Convert competency model to schema with basic enrichment"""
+        """Convert competency model (or cached CatalogCompetency) to schema with basic enrichment"""
         try:
             # Convert to schema
             competency_dict = {
                 "id": competency_model.id,
                 "name": competency_model.name,
-                "description": competency_model.description,
+                "description": thaw(competency_model.description),
                 "stage_id": competency_model.stage_id,
                 "created_at": competency_model.created_at,
                 "updated_at": competency_model.updated_at
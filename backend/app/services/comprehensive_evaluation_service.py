@@ -4,12 +4,15 @@ import csv
 import io
 import logging
 from math import ceil
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.exceptions import BadRequestError, NotFoundError, PermissionDeniedError
+from ..core.metrics import InstrumentedTTLCache
+from ..core.rating_engine import MBO_THRESHOLDS, threshold_table
 from ..core.rating_utils import RATING_CODE_TO_NUMERIC
 from ..database.models.evaluation import EvaluationPeriodStatus
 from ..database.repositories.comprehensive_evaluation_repo import ComprehensiveEvaluationRepository
@@ -27,24 +30,41 @@ from ..schemas.comprehensive_evaluation import (
     ComprehensiveEvaluationFinalizeResponse,
     ComprehensiveEvaluationListMeta,
     ComprehensiveEvaluationListResponse,
+    ComprehensiveEvaluationProcessFailure,
+    ComprehensiveEvaluationProcessPeriodResponse,
     ComprehensiveEvaluationProcessUserResponse,
     ComprehensiveEvaluationRow,
     ComprehensiveEvaluationSettings,
     ComprehensiveEvaluationSettingsWorkspace,
+    ComprehensiveComparisonPeriod,
+    ComprehensiveComparisonResult,
+    ComprehensiveComparisonUser,
     ComprehensiveManualDecisionHistoryEntry,
     ComprehensiveManualDecisionHistoryResponse,
     ComprehensiveManualDecisionResponse,
     ComprehensiveManualDecisionUpsertRequest,
     MyComprehensiveEvaluationResponse,
+    ComprehensivePeriodActivity,
+    ComprehensivePeriodComparisonResponse,
+    ComprehensivePeriodSnapshot,
     ComprehensiveRulesetAssignment,
     ComprehensiveStageAssignmentUpdateRequest,
     ComprehensiveRulesetTemplate,
     ComprehensiveRulesetUpsertRequest,
+    ComprehensiveSettingsSimulationResponse,
+    ComprehensiveSimulationChangedUser,
+    ComprehensiveSimulationSummary,
+    ComprehensiveSnapshotExportRequest,
+    ComprehensiveSnapshotRefreshResponse,
+    ComprehensiveTrendResponse,
     DemotionRuleGroup,
     EvaluationRank,
     PromotionRuleGroup,
+    TrendGroupBy,
 )
 from ..security.context import AuthContext
+from .comprehensive_simulation import SimulationOutcome, get_score_snapshot, invalidate_score_snapshot, simulate
+from .comprehensive_trends import build_trend_groups
 
 
 logger = logging.getLogger(__name__)
@@ -72,17 +92,6 @@ DEFAULT_LEVEL_DELTAS: Dict[EvaluationRank, int] = {
     "C": -5,
     "D": -8,
 }
-# MBO final rating thresholds on 0-100 scale (spec section 4-3)
-MBO_THRESHOLDS: Dict[EvaluationRank, float] = {
-    "SS": 86.0,
-    "S": 70.0,
-    "A+": 64.0,
-    "A": 56.0,
-    "A-": 50.0,
-    "B": 34.0,
-    "C": 20.0,
-    "D": 0.0,
-}
 USER_LEVEL_MIN = 1
 USER_LEVEL_MAX = 30
 COMPREHENSIVE_EVALUATION_EXPORT_HEADERS: Dict[ComprehensiveEvaluationExportColumn, str] = {
@@ -103,6 +112,30 @@ COMPREHENSIVE_EVALUATION_EXPORT_HEADERS: Dict[ComprehensiveEvaluationExportColum
     "promotionDemotionFlag": "昇格/降格フラグ",
     "processingStatus": "処理状態",
 }
+SNAPSHOT_EXPORT_PERIOD_HEADER = "評価期間"
+# Bump when the comprehensive_period_snapshots document shape changes incompatibly.
+SNAPSHOT_DOCUMENT_VERSION = 1
+# Completed periods shown by the trend view when no periodIds are given (most recent last).
+DEFAULT_TREND_PERIODS = 8
+MAX_TREND_PERIODS = 20
+
+
+# (org_id, period_id, settings fingerprint) -> (default, by department, by stage) settings.
+# The fingerprint is read from the database on every lookup, so a ruleset or assignment write
+# on any worker changes the key. Processing, finalize and snapshots still read the assignments
+# fresh, since they persist results derived from the settings.
+_period_settings_cache = InstrumentedTTLCache("comprehensive_period_settings", maxsize=256, ttl=120)
+
+
+class _FrozenEvaluationSettings(ComprehensiveEvaluationSettings):
+    """Cached settings instance; attribute assignment raises instead of leaking into other requests."""
+
+    model_config = {**ComprehensiveEvaluationSettings.model_config, "frozen": True}
+
+
+def _freeze_settings(settings: ComprehensiveEvaluationSettings) -> ComprehensiveEvaluationSettings:
+    # Fields are already validated; model_construct only re-wraps them.
+    return _FrozenEvaluationSettings.model_construct(**dict(settings))
 
 
 class ComprehensiveEvaluationService:
@@ -187,6 +220,9 @@ class ComprehensiveEvaluationService:
         Results are only available once the period is finalized (completed); for any
         other status the rank is withheld (returns None) so the employee cannot see a
         pre-finalization grade that a manual decision could still change.
+
+        Served from the period snapshot when one exists; periods finalized before
+        snapshots were introduced are recomputed as before.
         """
         org_id = self._require_org(context)
         user_id = self._require_user_id(context)
@@ -195,6 +231,11 @@ class ComprehensiveEvaluationService:
         if self._get_period_status(period) != "completed":
             return MyComprehensiveEvaluationResponse(overall_rank=None)
 
+        document = await self.repo.get_period_snapshot(org_id=org_id, period_id=period_id, user_id=user_id)
+        if document is not None:
+            snapshot = self._parse_snapshot_document(document)
+            return MyComprehensiveEvaluationResponse(overall_rank=snapshot.row.applied.overall_rank)
+
         default_settings, settings_by_department, settings_by_stage = await self._get_period_settings_map(
             org_id=org_id,
             period_id=period_id,
@@ -371,17 +412,13 @@ class ComprehensiveEvaluationService:
                 settings_json=payload.settings.model_dump(mode="json", by_alias=True),
                 source_ruleset_id=source_ruleset["id"] if source_ruleset else None,
                 source_ruleset_name_snapshot=source_ruleset["name"] if source_ruleset else None,
+                audit={
+                    "actor_user_id": actor_user_id,
+                    "action": "default_assignment_update",
+                    "before_json": before_assignment.settings.model_dump(mode="json", by_alias=True),
+                },
             )
             persisted_response = self._build_assignment_response(persisted)
-            await self.repo.insert_settings_audit(
-                org_id=org_id,
-                actor_user_id=actor_user_id,
-                action="default_assignment_update",
-                period_id=payload.period_id,
-                ruleset_id=source_ruleset["id"] if source_ruleset else None,
-                before_json=before_assignment.settings.model_dump(mode="json", by_alias=True),
-                after_json=persisted_response.settings.model_dump(mode="json", by_alias=True),
-            )
             await self.session.commit()
         except Exception:
             await self.session.rollback()
@@ -431,8 +468,15 @@ class ComprehensiveEvaluationService:
                     department_id=department_id,
                     department_name=department.name,
                 )
-                action = "department_assignment_clear"
-                audit_ruleset_id = None
+                await self.repo.insert_settings_audit(
+                    org_id=org_id,
+                    actor_user_id=actor_user_id,
+                    action="department_assignment_clear",
+                    period_id=payload.period_id,
+                    department_id=department_id,
+                    before_json=before_assignment.settings.model_dump(mode="json", by_alias=True),
+                    after_json=after_assignment.settings.model_dump(mode="json", by_alias=True),
+                )
             else:
                 assert payload.settings is not None
                 self._validate_settings(payload.settings)
@@ -443,23 +487,15 @@ class ComprehensiveEvaluationService:
                     settings_json=payload.settings.model_dump(mode="json", by_alias=True),
                     source_ruleset_id=source_ruleset["id"] if source_ruleset else None,
                     source_ruleset_name_snapshot=source_ruleset["name"] if source_ruleset else None,
+                    audit={
+                        "actor_user_id": actor_user_id,
+                        "action": "department_assignment_update",
+                        "before_json": before_assignment.settings.model_dump(mode="json", by_alias=True),
+                    },
                 )
                 after_assignment = self._build_assignment_response(
                     {**persisted, "department_name": department.name}
                 )
-                action = "department_assignment_update"
-                audit_ruleset_id = source_ruleset["id"] if source_ruleset else None
-
-            await self.repo.insert_settings_audit(
-                org_id=org_id,
-                actor_user_id=actor_user_id,
-                action=action,
-                period_id=payload.period_id,
-                department_id=department_id,
-                ruleset_id=audit_ruleset_id,
-                before_json=before_assignment.settings.model_dump(mode="json", by_alias=True),
-                after_json=after_assignment.settings.model_dump(mode="json", by_alias=True),
-            )
             await self.session.commit()
         except Exception:
             await self.session.rollback()
@@ -509,8 +545,15 @@ class ComprehensiveEvaluationService:
                     stage_id=stage_id,
                     stage_name=stage.name,
                 )
-                action = "stage_assignment_clear"
-                audit_ruleset_id = None
+                await self.repo.insert_settings_audit(
+                    org_id=org_id,
+                    actor_user_id=actor_user_id,
+                    action="stage_assignment_clear",
+                    period_id=payload.period_id,
+                    stage_id=stage_id,
+                    before_json=before_assignment.settings.model_dump(mode="json", by_alias=True),
+                    after_json=after_assignment.settings.model_dump(mode="json", by_alias=True),
+                )
             else:
                 assert payload.settings is not None
                 self._validate_settings(payload.settings)
@@ -521,23 +564,15 @@ class ComprehensiveEvaluationService:
                     settings_json=payload.settings.model_dump(mode="json", by_alias=True),
                     source_ruleset_id=source_ruleset["id"] if source_ruleset else None,
                     source_ruleset_name_snapshot=source_ruleset["name"] if source_ruleset else None,
+                    audit={
+                        "actor_user_id": actor_user_id,
+                        "action": "stage_assignment_update",
+                        "before_json": before_assignment.settings.model_dump(mode="json", by_alias=True),
+                    },
                 )
                 after_assignment = self._build_assignment_response(
                     {**persisted, "stage_name": stage.name}
                 )
-                action = "stage_assignment_update"
-                audit_ruleset_id = source_ruleset["id"] if source_ruleset else None
-
-            await self.repo.insert_settings_audit(
-                org_id=org_id,
-                actor_user_id=actor_user_id,
-                action=action,
-                period_id=payload.period_id,
-                stage_id=stage_id,
-                ruleset_id=audit_ruleset_id,
-                before_json=before_assignment.settings.model_dump(mode="json", by_alias=True),
-                after_json=after_assignment.settings.model_dump(mode="json", by_alias=True),
-            )
             await self.session.commit()
         except Exception:
             await self.session.rollback()
@@ -676,11 +711,114 @@ class ComprehensiveEvaluationService:
             await self.session.rollback()
             raise
 
+    async def simulate_settings(
+        self,
+        *,
+        context: AuthContext,
+        period_id: UUID,
+        settings: ComprehensiveEvaluationSettings,
+        department_id: Optional[UUID] = None,
+        stage_id: Optional[UUID] = None,
+        refresh_snapshot: bool = False,
+        changed_users_limit: int = 200,
+    ) -> ComprehensiveSettingsSimulationResponse:
+        """
+        Compare the period's automatic outcomes under a draft settings object with the saved ones.
+
+        The draft replaces the default assignment, or the department/stage assignment when
+        department_id/stage_id is given, and the usual assignment precedence applies. Nothing
+        is saved; scores come from the cached period snapshot (see comprehensive_simulation).
+        """
+        org_id = self._require_org(context)
+        self._require_read_role(context)
+        if department_id is not None and stage_id is not None:
+            raise BadRequestError("Specify at most one of departmentId and stageId")
+        self._validate_settings(settings)
+        await self._ensure_period_exists(period_id, org_id)
+
+        default_settings, settings_by_department, settings_by_stage = await self._get_period_settings_map(
+            org_id=org_id,
+            period_id=period_id,
+        )
+        draft_default, draft_by_department, draft_by_stage = default_settings, settings_by_department, settings_by_stage
+        if department_id is not None:
+            draft_by_department = {**settings_by_department, department_id: settings}
+        elif stage_id is not None:
+            draft_by_stage = {**settings_by_stage, stage_id: settings}
+        else:
+            draft_default = settings
+
+        snapshot = await get_score_snapshot(self.repo, org_id=org_id, period_id=period_id, refresh=refresh_snapshot)
+        current = simulate(
+            snapshot,
+            [
+                self._resolve_settings_for_assignment_target(
+                    department_id=row_department_id,
+                    stage_id=row_stage_id,
+                    default_settings=default_settings,
+                    settings_by_department=settings_by_department,
+                    settings_by_stage=settings_by_stage,
+                )
+                for row_department_id, row_stage_id in zip(snapshot.department_ids, snapshot.stage_ids)
+            ],
+        )
+        simulated = simulate(
+            snapshot,
+            [
+                self._resolve_settings_for_assignment_target(
+                    department_id=row_department_id,
+                    stage_id=row_stage_id,
+                    default_settings=draft_default,
+                    settings_by_department=draft_by_department,
+                    settings_by_stage=draft_by_stage,
+                )
+                for row_department_id, row_stage_id in zip(snapshot.department_ids, snapshot.stage_ids)
+            ],
+        )
+
+        changed = [
+            index
+            for index in range(len(snapshot))
+            if (
+                current.overall_ranks[index] != simulated.overall_ranks[index]
+                or current.new_levels[index] != simulated.new_levels[index]
+                or current.promotion_flags[index] != simulated.promotion_flags[index]
+                or current.demotion_flags[index] != simulated.demotion_flags[index]
+            )
+        ]
+
+        return ComprehensiveSettingsSimulationResponse(
+            periodId=period_id,
+            snapshotBuiltAt=snapshot.built_at,
+            totalUsers=len(snapshot),
+            current=self._build_simulation_summary(current),
+            simulated=self._build_simulation_summary(simulated),
+            changedUserCount=len(changed),
+            changedUsers=[
+                ComprehensiveSimulationChangedUser(
+                    userId=snapshot.user_ids[index],
+                    employeeCode=snapshot.employee_codes[index],
+                    name=snapshot.names[index],
+                    departmentName=snapshot.department_names[index],
+                    currentOverallRank=current.overall_ranks[index],
+                    simulatedOverallRank=simulated.overall_ranks[index],
+                    currentNewLevel=current.new_levels[index],
+                    simulatedNewLevel=simulated.new_levels[index],
+                    currentPromotionFlag=current.promotion_flags[index],
+                    simulatedPromotionFlag=simulated.promotion_flags[index],
+                    currentDemotionFlag=current.demotion_flags[index],
+                    simulatedDemotionFlag=simulated.demotion_flags[index],
+                )
+                for index in changed[:changed_users_limit]
+            ],
+        )
+
     async def finalize_evaluation_period(
         self,
         *,
         context: AuthContext,
         period_id: UUID,
+        process_remaining: bool = False,
     ) -> ComprehensiveEvaluationFinalizeResponse:
         org_id = self._require_org(context)
         self._require_user_id(context)
@@ -696,9 +834,23 @@ class ComprehensiveEvaluationService:
                 "Only draft, active, or completed evaluation periods can be finalized"
             )
 
+        total_users = 0
+        updated_user_levels = 0
+        if process_remaining and previous_status != "completed":
+            # Apply every still-unprocessed user before the period locks; chunks commit on their own.
+            processed = await self.process_period_evaluations(context=context, period_id=period_id)
+            if processed.failed_users:
+                raise BadRequestError(
+                    f"{len(processed.failed_users)} users could not be processed; "
+                    "resolve them before finalizing"
+                )
+            total_users = processed.total_users
+            updated_user_levels = processed.updated_user_levels
+
         try:
             if previous_status != "completed":
                 await self.period_repo.update_status(period_id, EvaluationPeriodStatus.COMPLETED, org_id)
+            await self._write_period_snapshots(org_id=org_id, period_id=period_id)
             await self.session.commit()
         except Exception:
             await self.session.rollback()
@@ -708,8 +860,171 @@ class ComprehensiveEvaluationService:
             periodId=period_id,
             previousStatus=previous_status,
             currentStatus="completed",
-            totalUsers=0,
-            updatedUserLevels=0,
+            totalUsers=total_users,
+            updatedUserLevels=updated_user_levels,
+        )
+
+    async def refresh_period_snapshots(
+        self,
+        *,
+        context: AuthContext,
+        period_id: UUID,
+    ) -> ComprehensiveSnapshotRefreshResponse:
+        """Rebuild the snapshots of a completed period (e.g. one finalized before snapshots existed)."""
+        org_id = self._require_org(context)
+        self._require_write_role(context)
+
+        period = await self._ensure_period_exists(period_id, org_id)
+        if self._get_period_status(period) != "completed":
+            raise BadRequestError("Snapshots are only kept for completed evaluation periods")
+
+        try:
+            snapshot_count = await self._write_period_snapshots(org_id=org_id, period_id=period_id)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return ComprehensiveSnapshotRefreshResponse(periodId=period_id, snapshotCount=snapshot_count)
+
+    async def export_period_snapshots_csv(
+        self,
+        *,
+        context: AuthContext,
+        payload: ComprehensiveSnapshotExportRequest,
+    ) -> str:
+        """One CSV over several completed periods, read from their snapshots only."""
+        org_id = self._require_org(context)
+        self._require_read_role(context)
+
+        period_names: Dict[UUID, str] = {}
+        for period_id in payload.period_ids:
+            period = await self._ensure_period_exists(period_id, org_id)
+            if self._get_period_status(period) != "completed":
+                raise BadRequestError("Only completed evaluation periods can be exported from snapshots")
+            period_names[period_id] = period.name
+
+        records = await self.repo.list_period_snapshots(org_id=org_id, period_ids=payload.period_ids)
+
+        stream = io.StringIO(newline="")
+        writer = csv.writer(stream, lineterminator="\r\n")
+        writer.writerow(
+            [SNAPSHOT_EXPORT_PERIOD_HEADER]
+            + [COMPREHENSIVE_EVALUATION_EXPORT_HEADERS[column] for column in payload.columns]
+        )
+        for record in records:
+            row = self._parse_snapshot_document(record["document"]).row
+            writer.writerow(
+                [period_names[record["period_id"]]]
+                + [self._get_export_cell_value(row=row, column=column) for column in payload.columns]
+            )
+
+        return stream.getvalue()
+
+    async def compare_periods(
+        self,
+        *,
+        context: AuthContext,
+        period_ids: Sequence[UUID],
+        user_ids: Optional[Sequence[UUID]] = None,
+    ) -> ComprehensivePeriodComparisonResponse:
+        """Applied results per user across completed periods, read from their snapshots."""
+        org_id = self._require_org(context)
+        self._require_read_role(context)
+
+        period_ids = list(dict.fromkeys(period_ids))
+        if not period_ids or len(period_ids) > 20:
+            raise BadRequestError("Between 1 and 20 periodIds are required")
+
+        periods = [await self._ensure_period_exists(period_id, org_id) for period_id in period_ids]
+        position = {period_id: index for index, period_id in enumerate(period_ids)}
+        snapshot_counts = [0] * len(period_ids)
+        users: Dict[UUID, ComprehensiveComparisonUser] = {}
+
+        records = await self.repo.list_period_snapshots(org_id=org_id, period_ids=period_ids, user_ids=user_ids)
+        for record in records:
+            row = self._parse_snapshot_document(record["document"]).row
+            entry = users.get(row.user_id)
+            if entry is None:
+                entry = users[row.user_id] = ComprehensiveComparisonUser(
+                    userId=row.user_id,
+                    employeeCode=row.employee_code,
+                    name=row.name,
+                    departmentName=row.department_name,
+                    results=[None] * len(period_ids),
+                )
+            index = position[record["period_id"]]
+            snapshot_counts[index] += 1
+            entry.results[index] = ComprehensiveComparisonResult(
+                overallRank=row.applied.overall_rank,
+                totalScore=row.applied.total_score,
+                performanceFinalRank=row.performance_final_rank,
+                competencyFinalRank=row.competency_final_rank,
+                coreValueFinalRank=row.core_value_final_rank,
+                decision=row.applied.decision,
+                newStage=row.applied.new_stage,
+                newLevel=row.applied.new_level,
+            )
+
+        return ComprehensivePeriodComparisonResponse(
+            periods=[
+                ComprehensiveComparisonPeriod(
+                    periodId=period_id,
+                    periodName=period.name,
+                    snapshotCount=snapshot_counts[index],
+                )
+                for index, (period_id, period) in enumerate(zip(period_ids, periods))
+            ],
+            users=sorted(users.values(), key=lambda user: user.employee_code),
+        )
+
+    async def get_trends(
+        self,
+        *,
+        context: AuthContext,
+        period_ids: Optional[Sequence[UUID]],
+        group_by: TrendGroupBy,
+        department_name: Optional[str] = None,
+        stage_name: Optional[str] = None,
+    ) -> ComprehensiveTrendResponse:
+        """Per-period aggregates from comprehensive_period_facts, grouped by period, department or stage.
+
+        Without period_ids the most recent completed periods are used, oldest first.
+        """
+        org_id = self._require_org(context)
+        self._require_read_role(context)
+
+        if period_ids:
+            period_ids = list(dict.fromkeys(period_ids))
+            if len(period_ids) > MAX_TREND_PERIODS:
+                raise BadRequestError(f"At most {MAX_TREND_PERIODS} periodIds are allowed")
+            periods = [await self._ensure_period_exists(period_id, org_id) for period_id in period_ids]
+        else:
+            completed = await self.period_repo.get_by_status(EvaluationPeriodStatus.COMPLETED, org_id)
+            periods = sorted(completed, key=lambda period: period.start_date)[-DEFAULT_TREND_PERIODS:]
+            period_ids = [period.id for period in periods]
+
+        facts = await self.repo.list_period_facts(org_id=org_id, period_ids=period_ids) if period_ids else []
+        for column, value in (("department_name", department_name), ("stage_name", stage_name)):
+            wanted = self._normalize_optional_filter_value(value)
+            if wanted is not None:
+                facts = [fact for fact in facts if self._normalize_optional_filter_value(fact[column]) == wanted]
+
+        user_counts: Dict[UUID, int] = {}
+        for fact in facts:
+            user_counts[fact["period_id"]] = user_counts.get(fact["period_id"], 0) + fact["user_count"]
+
+        return ComprehensiveTrendResponse(
+            groupBy=group_by,
+            periods=[
+                ComprehensiveComparisonPeriod(
+                    periodId=period.id,
+                    periodName=period.name,
+                    snapshotCount=user_counts.get(period.id, 0),
+                )
+                for period in periods
+            ],
+            groups=build_trend_groups(facts, period_ids, group_by=group_by),
         )
 
     async def process_user_evaluation(
@@ -729,6 +1044,7 @@ class ComprehensiveEvaluationService:
         default_settings, settings_by_department, settings_by_stage = await self._get_period_settings_map(
             org_id=org_id,
             period_id=period_id,
+            cached=False,
         )
         row_items, _ = await self.repo.list_rows(
             org_id=org_id,
@@ -756,37 +1072,24 @@ class ComprehensiveEvaluationService:
                 settings_by_stage=settings_by_stage,
             ),
         )
-        applied_state = row.applied
-
         updated_level = False
         updated_stage = False
 
-        requested_stage_name = self._normalize_stage_name(applied_state.new_stage)
-        current_stage_name = self._normalize_stage_name(row.current_stage)
-        if requested_stage_name and (
-            current_stage_name is None or requested_stage_name.casefold() != current_stage_name.casefold()
-        ):
+        requested_stage_name = self._get_requested_stage_change(row)
+        if requested_stage_name:
             stage_name_to_id, stage_name_folded_to_id = await self._get_stage_name_maps(org_id)
-            stage_id = self._resolve_stage_id(
+            stage_id = self._resolve_requested_stage_id(
                 stage_name=requested_stage_name,
                 stage_name_to_id=stage_name_to_id,
                 stage_name_folded_to_id=stage_name_folded_to_id,
             )
-            if stage_id is None:
-                raise BadRequestError("applied stage is not registered in this organization")
             updated = await self.user_repo.update_user_stage(user_id, stage_id, org_id)
             updated_stage = updated is not None
 
-        if row.employment_type == "employee" and applied_state.new_level is not None:
-            try:
-                proposed_level = int(applied_state.new_level)
-            except (TypeError, ValueError):
-                raise BadRequestError("applied level is invalid") from None
-
-            next_level = max(USER_LEVEL_MIN, min(USER_LEVEL_MAX, proposed_level))
-            if row.current_level is None or row.current_level != next_level:
-                updated_users = await self.user_repo.batch_update_user_levels(org_id, {user_id: next_level})
-                updated_level = user_id in updated_users
+        next_level = self._get_requested_level_change(row)
+        if next_level is not None:
+            updated_users = await self.user_repo.batch_update_user_levels(org_id, {user_id: next_level})
+            updated_level = user_id in updated_users
 
         try:
             await self.repo.upsert_processing_status(
@@ -794,11 +1097,13 @@ class ComprehensiveEvaluationService:
                 period_id=period_id,
                 user_id=user_id,
                 processed_by_user_id=actor_user_id,
+                pre_decision=(row_items[0].get("stage_id"), row.current_level),
             )
             await self.session.commit()
         except Exception:
             await self.session.rollback()
             raise
+        invalidate_score_snapshot(org_id, period_id)
 
         return ComprehensiveEvaluationProcessUserResponse(
             periodId=period_id,
@@ -808,6 +1113,139 @@ class ComprehensiveEvaluationService:
             updatedStage=updated_stage,
         )
 
+    async def process_period_evaluations(
+        self,
+        *,
+        context: AuthContext,
+        period_id: UUID,
+        user_ids: Optional[Sequence[UUID]] = None,
+        department_id: Optional[UUID] = None,
+        stage_id: Optional[UUID] = None,
+        employment_type: Optional[str] = None,
+        search: Optional[str] = None,
+        include_processed: bool = False,
+        chunk_size: int = 500,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> ComprehensiveEvaluationProcessPeriodResponse:
+        """
+        Apply the computed level/stage changes for every matching user of the period.
+
+        Settings, stage names and evaluation rows are loaded once; writes go out as one
+        batched stage update, one batched level update and one multi-row status upsert per
+        chunk, each chunk in its own transaction. Only unprocessed users are selected unless
+        include_processed is set, so re-running after an interruption resumes where the last
+        committed chunk stopped. Users whose applied state cannot be written are reported in
+        failedUsers and stay unprocessed. Each status keeps the stage/level the user had before
+        the first processing, which list_rows reports for processed users.
+        """
+        org_id = self._require_org(context)
+        actor_user_id = self._require_user_id(context)
+        self._require_write_role(context)
+        if chunk_size < 1:
+            raise BadRequestError("chunk_size must be positive")
+
+        period = await self._ensure_period_exists(period_id, org_id)
+        self._ensure_period_allows_user_processing(period)
+
+        default_settings, settings_by_department, settings_by_stage = await self._get_period_settings_map(
+            org_id=org_id,
+            period_id=period_id,
+            cached=False,
+        )
+        stage_name_to_id, stage_name_folded_to_id = await self._get_stage_name_maps(org_id)
+        row_items, total_users = await self.repo.list_rows(
+            org_id=org_id,
+            period_id=period_id,
+            user_id=None,
+            user_ids=user_ids,
+            department_id=department_id,
+            stage_id=stage_id,
+            employment_type=employment_type,
+            search=search,
+            processing_status=None if include_processed else "unprocessed",
+            page=1,
+            limit=None,
+        )
+
+        failed_users: List[ComprehensiveEvaluationProcessFailure] = []
+        planned: List[Tuple[UUID, Optional[UUID], Optional[int]]] = []
+        pre_decision: Dict[UUID, Tuple[Optional[UUID], Optional[int]]] = {}
+        for item in row_items:
+            row = self._build_row_from_repo_item(
+                item=item,
+                period_id=period_id,
+                settings=self._resolve_settings_for_assignment_target(
+                    department_id=item.get("department_id"),
+                    stage_id=item.get("stage_id"),
+                    default_settings=default_settings,
+                    settings_by_department=settings_by_department,
+                    settings_by_stage=settings_by_stage,
+                ),
+            )
+            try:
+                requested_stage_name = self._get_requested_stage_change(row)
+                next_stage_id = (
+                    self._resolve_requested_stage_id(
+                        stage_name=requested_stage_name,
+                        stage_name_to_id=stage_name_to_id,
+                        stage_name_folded_to_id=stage_name_folded_to_id,
+                    )
+                    if requested_stage_name
+                    else None
+                )
+                next_level = self._get_requested_level_change(row)
+            except BadRequestError as e:
+                failed_users.append(ComprehensiveEvaluationProcessFailure(userId=row.user_id, reason=e.detail))
+                continue
+            planned.append((row.user_id, next_stage_id, next_level))
+            pre_decision[row.user_id] = (item.get("stage_id"), row.current_level)
+
+        processed_users = 0
+        updated_user_levels = 0
+        updated_user_stages = 0
+        committed_chunks = 0
+        for start in range(0, len(planned), chunk_size):
+            chunk = planned[start:start + chunk_size]
+            stage_updates = {uid: sid for uid, sid, _ in chunk if sid is not None}
+            level_updates = {uid: level for uid, _, level in chunk if level is not None}
+            try:
+                updated_stages = await self.user_repo.batch_update_user_stages(org_id, stage_updates)
+                updated_levels = await self.user_repo.batch_update_user_levels(org_id, level_updates)
+                await self.repo.upsert_processing_statuses(
+                    org_id=org_id,
+                    period_id=period_id,
+                    user_ids=[uid for uid, _, _ in chunk],
+                    processed_by_user_id=actor_user_id,
+                    pre_decision={uid: pre_decision[uid] for uid, _, _ in chunk},
+                )
+                await self.session.commit()
+            except Exception:
+                await self.session.rollback()
+                logger.error(
+                    f"Comprehensive processing for period {period_id} stopped after "
+                    f"{processed_users}/{len(planned)} users; re-run to resume"
+                )
+                raise
+
+            invalidate_score_snapshot(org_id, period_id)
+            processed_users += len(chunk)
+            updated_user_stages += len(updated_stages)
+            updated_user_levels += len(updated_levels)
+            committed_chunks += 1
+            logger.info(f"Comprehensive processing for period {period_id}: {processed_users}/{len(planned)} users")
+            if on_progress is not None:
+                on_progress(processed_users, len(planned))
+
+        return ComprehensiveEvaluationProcessPeriodResponse(
+            periodId=period_id,
+            totalUsers=total_users,
+            processedUsers=processed_users,
+            updatedUserLevels=updated_user_levels,
+            updatedUserStages=updated_user_stages,
+            committedChunks=committed_chunks,
+            failedUsers=failed_users,
+        )
+
     async def upsert_manual_decision(
         self,
         *,
@@ -905,10 +1343,12 @@ class ComprehensiveEvaluationService:
                 applied_by_user_id=persisted.get("applied_by_user_id"),
                 applied_at=persisted.get("applied_at"),
             )
+            await self._write_period_snapshots(org_id=org_id, period_id=payload.period_id, user_id=user_id)
             await self.session.commit()
         except Exception:
             await self.session.rollback()
             raise
+        invalidate_score_snapshot(org_id, payload.period_id)
 
         return ComprehensiveManualDecisionResponse(
             periodId=persisted["period_id"],
@@ -971,6 +1411,7 @@ class ComprehensiveEvaluationService:
                 applied_by_user_id=existing.get("applied_by_user_id") if existing else actor_user_id,
                 applied_at=existing.get("applied_at") if existing else None,
             )
+            await self._write_period_snapshots(org_id=org_id, period_id=period_id, user_id=user_id)
             await self.session.commit()
         except Exception:
             await self.session.rollback()
@@ -1054,6 +1495,49 @@ class ComprehensiveEvaluationService:
         *,
         org_id: str,
         period_id: UUID,
+        cached: bool = True,
+    ) -> Tuple[
+        ComprehensiveEvaluationSettings,
+        Mapping[UUID, ComprehensiveEvaluationSettings],
+        Mapping[UUID, ComprehensiveEvaluationSettings],
+    ]:
+        """
+        Validated settings of the period: default, per department and per stage.
+
+        Served from _period_settings_cache under the settings fingerprint read from the
+        database, so repeated grid paging costs one small aggregate query instead of
+        re-reading the assignments and parsing and validating their JSON. The returned
+        objects are shared between requests and read-only.
+
+        Pass ``cached=False`` on paths that write results derived from the settings
+        (processing, finalize, snapshots) to read them within the caller's transaction.
+        """
+        if not cached:
+            return await self._load_period_settings_map(org_id=org_id, period_id=period_id)
+
+        fingerprint = await self.repo.get_period_settings_fingerprint(org_id=org_id, period_id=period_id)
+        key = (org_id, period_id, fingerprint)
+        cached = _period_settings_cache.get(key)
+        if cached is not None:
+            return cached
+
+        default_settings, settings_by_department, settings_by_stage = await self._load_period_settings_map(
+            org_id=org_id,
+            period_id=period_id,
+        )
+        cached = (
+            _freeze_settings(default_settings),
+            MappingProxyType({key_id: _freeze_settings(item) for key_id, item in settings_by_department.items()}),
+            MappingProxyType({key_id: _freeze_settings(item) for key_id, item in settings_by_stage.items()}),
+        )
+        _period_settings_cache[key] = cached
+        return cached
+
+    async def _load_period_settings_map(
+        self,
+        *,
+        org_id: str,
+        period_id: UUID,
     ) -> Tuple[
         ComprehensiveEvaluationSettings,
         Dict[UUID, ComprehensiveEvaluationSettings],
@@ -1370,6 +1854,76 @@ class ComprehensiveEvaluationService:
 
         return stream.getvalue()
 
+    async def _write_period_snapshots(
+        self,
+        *,
+        org_id: str,
+        period_id: UUID,
+        user_id: Optional[UUID] = None,
+    ) -> int:
+        """Freeze the applied rows of the period (only user_id's when given); caller commits."""
+        default_settings, settings_by_department, settings_by_stage = await self._get_period_settings_map(
+            org_id=org_id,
+            period_id=period_id,
+            cached=False,
+        )
+        rows_data, _ = await self.repo.list_rows(
+            org_id=org_id,
+            period_id=period_id,
+            user_id=user_id,
+            department_id=None,
+            stage_id=None,
+            employment_type=None,
+            search=None,
+            processing_status=None,
+            page=1,
+            limit=None,
+        )
+        activity = await self.repo.list_period_activity_counts(
+            org_id=org_id,
+            period_id=period_id,
+            user_ids=[user_id] if user_id else None,
+        )
+
+        documents: Dict[UUID, Dict[str, Any]] = {}
+        for item in rows_data:
+            row = self._build_row_from_repo_item(
+                item=item,
+                period_id=period_id,
+                settings=self._resolve_settings_for_assignment_target(
+                    department_id=item.get("department_id"),
+                    stage_id=item.get("stage_id"),
+                    default_settings=default_settings,
+                    settings_by_department=settings_by_department,
+                    settings_by_stage=settings_by_stage,
+                ),
+            )
+            documents[row.user_id] = self._build_snapshot_document(row=row, activity=activity.get(row.user_id))
+
+        snapshot_count = await self.repo.upsert_period_snapshots(
+            org_id=org_id,
+            period_id=period_id,
+            documents=documents,
+            prune=user_id is None,
+        )
+        await self.repo.refresh_period_facts(org_id=org_id, period_id=period_id)
+        return snapshot_count
+
+    def _build_snapshot_document(
+        self,
+        *,
+        row: ComprehensiveEvaluationRow,
+        activity: Optional[Mapping[str, int]],
+    ) -> Dict[str, Any]:
+        snapshot = ComprehensivePeriodSnapshot(
+            row=row,
+            activity=ComprehensivePeriodActivity.model_validate(activity or {}),
+        )
+        return {"version": SNAPSHOT_DOCUMENT_VERSION, **snapshot.model_dump(mode="json", by_alias=True)}
+
+    def _parse_snapshot_document(self, document: Mapping[str, Any]) -> ComprehensivePeriodSnapshot:
+        return ComprehensivePeriodSnapshot.model_validate(document)
+
     def _get_export_cell_value(
         self,
         *,
@@ -1556,6 +2110,16 @@ class ComprehensiveEvaluationService:
             applied=applied_state,
             manualDecision=manual_decision,
         )
+
+    def _build_simulation_summary(self, outcome: SimulationOutcome) -> ComprehensiveSimulationSummary:
+        distribution = outcome.rank_distribution()
+        return ComprehensiveSimulationSummary(
+            rankDistribution=distribution,
+            unrankedUsers=len(outcome.overall_ranks) - sum(distribution.values()),
+            promotionCandidates=sum(outcome.promotion_flags),
+            demotionCandidates=sum(outcome.demotion_flags),
+        )
+
     def _build_settings_from_rules(self, rule_data: Dict[str, List[Dict]]) -> ComprehensiveEvaluationSettings:
         overall_rules = sorted(
             rule_data.get("overall_rules", []),
@@ -1889,13 +2453,7 @@ class ComprehensiveEvaluationService:
         score: Optional[float],
         thresholds: Dict[EvaluationRank, float],
     ) -> Optional[EvaluationRank]:
-        if score is None:
-            return None
-
-        for rank in RANK_ORDER:
-            if score >= float(thresholds[rank]):
-                return rank
-        return RANK_ORDER[-1]
+        return threshold_table(thresholds).classify(score)
 
     def _is_rank_at_least(self, actual: EvaluationRank, minimum: EvaluationRank) -> bool:
         return RANK_INDEX[actual] <= RANK_INDEX[minimum]
@@ -1988,6 +2546,46 @@ class ComprehensiveEvaluationService:
             return direct_match
         return stage_name_folded_to_id.get(stage_name.casefold())
 
+    def _get_requested_stage_change(self, row: ComprehensiveEvaluationRow) -> Optional[str]:
+        """Applied stage name when it differs from the user's current stage, else None."""
+        requested_stage_name = self._normalize_stage_name(row.applied.new_stage)
+        current_stage_name = self._normalize_stage_name(row.current_stage)
+        if requested_stage_name and (
+            current_stage_name is None or requested_stage_name.casefold() != current_stage_name.casefold()
+        ):
+            return requested_stage_name
+        return None
+
+    def _resolve_requested_stage_id(
+        self,
+        *,
+        stage_name: str,
+        stage_name_to_id: Dict[str, UUID],
+        stage_name_folded_to_id: Dict[str, UUID],
+    ) -> UUID:
+        stage_id = self._resolve_stage_id(
+            stage_name=stage_name,
+            stage_name_to_id=stage_name_to_id,
+            stage_name_folded_to_id=stage_name_folded_to_id,
+        )
+        if stage_id is None:
+            raise BadRequestError("applied stage is not registered in this organization")
+        return stage_id
+
+    def _get_requested_level_change(self, row: ComprehensiveEvaluationRow) -> Optional[int]:
+        """Clamped applied level for employees when it differs from the current level, else None."""
+        if row.employment_type != "employee" or row.applied.new_level is None:
+            return None
+        try:
+            proposed_level = int(row.applied.new_level)
+        except (TypeError, ValueError):
+            raise BadRequestError("applied level is invalid") from None
+
+        next_level = max(USER_LEVEL_MIN, min(USER_LEVEL_MAX, proposed_level))
+        if row.current_level is not None and row.current_level == next_level:
+            return None
+        return next_level
+
     def _normalize_stage_name(self, stage_name: Optional[str]) -> Optional[str]:
         if stage_name is None:
             return None
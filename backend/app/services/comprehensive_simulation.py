@@ -0,0 +1,248 @@
+"""
+What-if simulation of comprehensive evaluation settings.
+
+Tuning thresholds or promotion/demotion groups used to mean saving the settings and
+reloading the whole list_rows grid. The settings only change how already-computed
+scores are classified, so the simulator keeps the settings-independent inputs of a
+period in a columnar snapshot and re-classifies them in memory:
+
+    snapshot = await get_score_snapshot(repo, org_id, period_id)   # list_rows once per TTL
+    outcome = simulate(snapshot, settings_per_row)                  # no queries
+
+Snapshot columns are index-aligned tuples. simulate() groups rows by their effective
+settings and classifies each group with threshold_table(...).classify_many, so a draft
+for one department only touches that department's rows.
+
+The MBO rank does not depend on the settings and is resolved when the snapshot is
+built, with the same rules as ComprehensiveEvaluationService._build_row_from_repo_item.
+Manual decisions are not part of the simulation: it compares automatic outcomes.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from uuid import UUID
+
+from ..core.metrics import InstrumentedTTLCache
+from ..core.rating_engine import CODE_INDEX, MBO_THRESHOLD_TABLE, RATING_CODES, threshold_table
+from ..core.rating_utils import RATING_CODE_TO_NUMERIC
+from ..database.repositories.comprehensive_evaluation_repo import ComprehensiveEvaluationRepository
+from ..schemas.comprehensive_evaluation import ComprehensiveEvaluationSettings
+
+logger = logging.getLogger(__name__)
+
+# (org_id, period_id) -> ScoreSnapshot (5-minute TTL; processing drops the entry early)
+_score_snapshot_cache = InstrumentedTTLCache("comprehensive_score_snapshot", maxsize=32, ttl=300)
+
+_RANK_FIELDS = ("overallRank", "performanceFinalRank", "competencyFinalRank", "coreValueFinalRank")
+
+
+def _to_optional_float(value: Any) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def _performance_rank(mbo_total_100: Optional[float]) -> Optional[str]:
+    if mbo_total_100 is not None and mbo_total_100 < 20.0:
+        return "D"  # Boundary rule B (spec section 8, rule 8B)
+    return MBO_THRESHOLD_TABLE.classify(mbo_total_100)
+
+
+@dataclass(frozen=True, eq=False)
+class ScoreSnapshot:
+    """Settings-independent inputs of every user in a period, one tuple per column."""
+    period_id: UUID
+    built_at: datetime
+    user_ids: Tuple[UUID, ...]
+    employee_codes: Tuple[str, ...]
+    names: Tuple[str, ...]
+    department_names: Tuple[Optional[str], ...]
+    department_ids: Tuple[Optional[UUID], ...]
+    stage_ids: Tuple[Optional[UUID], ...]
+    is_employee: Tuple[bool, ...]
+    current_levels: Tuple[Optional[int], ...]
+    performance_ranks: Tuple[Optional[str], ...]
+    competency_scores: Tuple[Optional[float], ...]
+    core_value_scores: Tuple[Optional[float], ...]
+
+    def __len__(self) -> int:
+        return len(self.user_ids)
+
+    @classmethod
+    def from_rows(cls, period_id: UUID, rows: Sequence[Mapping[str, Any]]) -> "ScoreSnapshot":
+        competency_scores = []
+        core_value_scores = []
+        for row in rows:
+            competency = _to_optional_float(row.get("competency_raw_score"))
+            competency_scores.append(
+                competency if competency is not None else _to_optional_float(row.get("competency_score"))
+            )
+            core_value = _to_optional_float(row.get("core_value_raw_score"))
+            core_value_scores.append(
+                core_value if core_value is not None else _to_optional_float(row.get("core_value_score"))
+            )
+
+        return cls(
+            period_id=period_id,
+            built_at=datetime.now(timezone.utc),
+            user_ids=tuple(row["user_id"] for row in rows),
+            employee_codes=tuple(row["employee_code"] for row in rows),
+            names=tuple(row["name"] for row in rows),
+            department_names=tuple(row.get("department_name") for row in rows),
+            department_ids=tuple(row.get("department_id") for row in rows),
+            stage_ids=tuple(row.get("stage_id") for row in rows),
+            is_employee=tuple(row["employment_type"] == "employee" for row in rows),
+            current_levels=tuple(row.get("current_level") for row in rows),
+            performance_ranks=tuple(
+                _performance_rank(_to_optional_float(row.get("mbo_total_100"))) for row in rows
+            ),
+            competency_scores=tuple(competency_scores),
+            core_value_scores=tuple(core_value_scores),
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class SimulationOutcome:
+    """Automatic outcome per snapshot row, index-aligned with the snapshot."""
+    overall_ranks: Tuple[Optional[str], ...]
+    promotion_flags: Tuple[bool, ...]
+    demotion_flags: Tuple[bool, ...]
+    new_levels: Tuple[Optional[int], ...]
+
+    def rank_distribution(self) -> Dict[str, int]:
+        counts = {rank: 0 for rank in RATING_CODES}
+        for rank in self.overall_ranks:
+            if rank is not None:
+                counts[rank] += 1
+        return counts
+
+
+async def get_score_snapshot(
+    repo: ComprehensiveEvaluationRepository,
+    *,
+    org_id: str,
+    period_id: UUID,
+    refresh: bool = False,
+) -> ScoreSnapshot:
+    """Cached snapshot of the period, built from one unpaged list_rows call on a miss."""
+    key = (org_id, period_id)
+    if not refresh:
+        cached = _score_snapshot_cache.get(key)
+        if cached is not None:
+            return cached
+
+    rows, _ = await repo.list_rows(
+        org_id=org_id,
+        period_id=period_id,
+        user_id=None,
+        department_id=None,
+        stage_id=None,
+        employment_type=None,
+        search=None,
+        processing_status=None,
+        page=1,
+        limit=None,
+    )
+    snapshot = ScoreSnapshot.from_rows(period_id, rows)
+    _score_snapshot_cache[key] = snapshot
+    logger.debug(f"Built comprehensive score snapshot for period {period_id} ({len(snapshot)} users)")
+    return snapshot
+
+
+def invalidate_score_snapshot(org_id: str, period_id: UUID) -> None:
+    """Drop the cached snapshot, e.g. after processing changed current levels."""
+    _score_snapshot_cache.pop((org_id, period_id), None)
+
+
+def _compile_groups(groups: Iterable[Any], *, attribute: str) -> List[Tuple[Tuple[int, int], ...]]:
+    """Rule groups as ((field position, rank index), ...) tuples."""
+    return [
+        tuple(
+            (_RANK_FIELDS.index(condition.field), CODE_INDEX[getattr(condition, attribute)])
+            for condition in group.conditions
+        )
+        for group in groups
+    ]
+
+
+def _any_group_passes(groups: List[Tuple[Tuple[int, int], ...]], ranks: Tuple[Optional[int], ...], *, at_least: bool) -> bool:
+    for group in groups:
+        for position, limit in group:
+            actual = ranks[position]
+            if actual is None or (actual > limit if at_least else actual < limit):
+                break
+        else:
+            return True
+    return False
+
+
+def _simulate_rows(
+    snapshot: ScoreSnapshot,
+    indexes: Sequence[int],
+    settings: ComprehensiveEvaluationSettings,
+    results: List[Tuple[Optional[str], bool, bool, Optional[int]]],
+) -> None:
+    table = threshold_table(settings.overall_score_thresholds)
+    competency_ranks = table.classify_many(snapshot.competency_scores[i] for i in indexes)
+    core_value_ranks = table.classify_many(snapshot.core_value_scores[i] for i in indexes)
+
+    totals: List[Optional[float]] = []
+    for i, competency_rank in zip(indexes, competency_ranks):
+        performance_rank = snapshot.performance_ranks[i]
+        if performance_rank is None or competency_rank is None:
+            totals.append(None)
+            continue
+        totals.append(
+            RATING_CODE_TO_NUMERIC[performance_rank] * (10.0 / 11.0)
+            + RATING_CODE_TO_NUMERIC[competency_rank] * (1.0 / 11.0)
+        )
+    overall_ranks = table.classify_many(round(q, 2) if q is not None else None for q in totals)
+
+    promotion_groups = _compile_groups(settings.promotion.rule_groups, attribute="minimum_rank")
+    demotion_groups = _compile_groups(settings.demotion.rule_groups, attribute="threshold_rank")
+    level_deltas = settings.level_delta_by_overall_rank
+
+    for offset, i in enumerate(indexes):
+        q = totals[offset]
+        overall_rank = "D" if q is not None and q < 0.1 else overall_ranks[offset]  # Boundary rule A
+        ranks = (
+            CODE_INDEX.get(overall_rank) if overall_rank else None,
+            CODE_INDEX.get(snapshot.performance_ranks[i]) if snapshot.performance_ranks[i] else None,
+            CODE_INDEX.get(competency_ranks[offset]) if competency_ranks[offset] else None,
+            CODE_INDEX.get(core_value_ranks[offset]) if core_value_ranks[offset] else None,
+        )
+        is_employee = snapshot.is_employee[i]
+        current_level = snapshot.current_levels[i]
+        new_level = None
+        if is_employee and overall_rank is not None and current_level is not None:
+            new_level = current_level + int(level_deltas[overall_rank])
+        results[i] = (
+            overall_rank,
+            is_employee and _any_group_passes(promotion_groups, ranks, at_least=True),
+            _any_group_passes(demotion_groups, ranks, at_least=False),
+            new_level,
+        )
+
+
+def simulate(
+    snapshot: ScoreSnapshot,
+    settings_per_row: Sequence[ComprehensiveEvaluationSettings],
+) -> SimulationOutcome:
+    """Automatic outcome of every snapshot row under its settings (index-aligned)."""
+    groups: Dict[int, Tuple[ComprehensiveEvaluationSettings, List[int]]] = {}
+    for index, settings in enumerate(settings_per_row):
+        groups.setdefault(id(settings), (settings, []))[1].append(index)
+
+    results: List[Tuple[Optional[str], bool, bool, Optional[int]]] = [(None, False, False, None)] * len(snapshot)
+    for settings, indexes in groups.values():
+        _simulate_rows(snapshot, indexes, settings, results)
+
+    overall_ranks, promotion_flags, demotion_flags, new_levels = zip(*results) if results else ((), (), (), ())
+    return SimulationOutcome(
+        overall_ranks=tuple(overall_ranks),
+        promotion_flags=tuple(promotion_flags),
+        demotion_flags=tuple(demotion_flags),
+        new_levels=tuple(new_levels),
+    )
@@ -0,0 +1,119 @@
+"""
+Cross-period trends of the comprehensive evaluation, served from comprehensive_period_facts.
+
+A finalized period has one fact row per (department, stage), aggregated in SQL from
+its snapshots whenever they are written (ComprehensiveEvaluationRepository.
+refresh_period_facts). A trend point merges the fact rows of one period and group:
+
+    facts = await repo.list_period_facts(org_id=org_id, period_ids=period_ids)   # one indexed query
+    groups = build_trend_groups(facts, period_ids, group_by="department")       # no further queries
+
+Counts add up across fact rows. Score columns are sorted per fact row, so they are
+merged with heapq.merge and the percentiles of a merged group stay exact.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from uuid import UUID
+
+from ..core.rating_engine import RATING_CODES
+from ..schemas.comprehensive_evaluation import (
+    ComprehensiveScoreStats,
+    ComprehensiveTrendGroup,
+    ComprehensiveTrendPoint,
+    TrendGroupBy,
+)
+
+_GROUP_COLUMNS: Dict[str, Optional[str]] = {
+    "period": None,
+    "department": "department_name",
+    "stage": "stage_name",
+}
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> Optional[float]:
+    """Linear interpolation between the closest ranks (numpy's default method)."""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def _score_stats(columns: Sequence[Sequence[float]]) -> Optional[ComprehensiveScoreStats]:
+    values = list(heapq.merge(*columns))
+    if not values:
+        return None
+    return ComprehensiveScoreStats(
+        count=len(values),
+        average=round(sum(values) / len(values), 2),
+        p25=round(percentile(values, 0.25), 2),
+        p50=round(percentile(values, 0.5), 2),
+        p75=round(percentile(values, 0.75), 2),
+        p90=round(percentile(values, 0.9), 2),
+    )
+
+
+def _ratio(numerator: int, denominator: int) -> Optional[float]:
+    return round(numerator / denominator, 4) if denominator else None
+
+
+def build_trend_point(facts: Sequence[Mapping[str, Any]]) -> ComprehensiveTrendPoint:
+    """Merge fact rows (same period) into one point."""
+    rank_distribution = {rank: 0 for rank in RATING_CODES}
+    for fact in facts:
+        for rank, count in fact["rank_counts"].items():
+            rank_distribution[rank] += int(count)
+
+    user_count = sum(fact["user_count"] for fact in facts)
+    promotion_count = sum(fact["promotion_count"] for fact in facts)
+    demotion_count = sum(fact["demotion_count"] for fact in facts)
+    goals_count = sum(fact["goals_count"] for fact in facts)
+    completed_assessments_count = sum(fact["completed_assessments_count"] for fact in facts)
+
+    return ComprehensiveTrendPoint(
+        userCount=user_count,
+        processedCount=sum(fact["processed_count"] for fact in facts),
+        rankDistribution=rank_distribution,
+        unrankedUsers=sum(fact["unranked_count"] for fact in facts),
+        promotionCount=promotion_count,
+        demotionCount=demotion_count,
+        promotionRate=_ratio(promotion_count, user_count),
+        demotionRate=_ratio(demotion_count, user_count),
+        performanceScore=_score_stats([fact["performance_scores"] for fact in facts]),
+        totalScore=_score_stats([fact["total_scores"] for fact in facts]),
+        assessmentCompletionRate=_ratio(completed_assessments_count, goals_count),
+        receivedFeedbacksCount=sum(fact["received_feedbacks_count"] for fact in facts),
+    )
+
+
+def build_trend_groups(
+    facts: Sequence[Mapping[str, Any]],
+    period_ids: Sequence[UUID],
+    *,
+    group_by: TrendGroupBy,
+) -> List[ComprehensiveTrendGroup]:
+    """One group per department/stage name (a single group for "period"), points aligned with period_ids."""
+    column = _GROUP_COLUMNS[group_by]
+    position = {period_id: index for index, period_id in enumerate(period_ids)}
+    buckets: Dict[Optional[str], List[List[Mapping[str, Any]]]] = {}
+    for fact in facts:
+        index = position.get(fact["period_id"])
+        if index is None:
+            continue
+        key = fact[column] if column else None
+        buckets.setdefault(key, [[] for _ in period_ids])[index].append(fact)
+
+    def sort_key(key: Optional[str]) -> Tuple[bool, str]:
+        return key is None, key or ""
+
+    return [
+        ComprehensiveTrendGroup(
+            key=key,
+            points=[build_trend_point(period_facts) if period_facts else None for period_facts in buckets[key]],
+        )
+        for key in sorted(buckets, key=sort_key)
+    ]
@@ -295,8 +295,8 @@ class CoreValueService:
             raise PermissionDeniedError("Organization context required")
 
         # Verify supervisor has access to this subordinate
-        accessible_user_ids = await RBACHelper.get_accessible_user_ids(current_user_context)
-        if accessible_user_ids is not None and subordinate_id not in accessible_user_ids:
+        accessible_scope = await RBACHelper.get_accessible_user_scope(current_user_context)
+        if subordinate_id not in accessible_scope:
             raise PermissionDeniedError(f"You do not have permission to access data for user {subordinate_id}")
 
         evaluation = await self.evaluation_repo.get_evaluation(period_id, subordinate_id, org_id)
@@ -16,6 +16,7 @@ from ..database.repositories.goal_repo import GoalRepository
 from ..database.repositories.self_assessment_repo import SelfAssessmentRepository
 from ..database.repositories.supervisor_feedback_repo import SupervisorFeedbackRepository
 from ..database.repositories.evaluation_period_repo import EvaluationPeriodRepository
+from ..database.repositories.comprehensive_evaluation_repo import ComprehensiveEvaluationRepository
 from ..database.models.user import User
 from ..database.models.goal import Goal
 from ..database.models.self_assessment import SelfAssessment
@@ -28,6 +29,7 @@ from ..schemas.dashboard import (
     DeadlineAlertsData, DeadlineAlert, HistoryAccessData, HistoricalPeriodSummary,
     AlertSeverity, TaskPriority, TaskType, DeadlineUrgency, EvaluationStage, SubordinateStatus
 )
+from ..schemas.comprehensive_evaluation import ComprehensivePeriodActivity
 from ..schemas.user import UserStatus
 from ..core.exceptions import NotFoundError, PermissionDeniedError
 
@@ -45,6 +47,7 @@ class DashboardService:
         self.self_assessment_repo = SelfAssessmentRepository(session)
         self.supervisor_feedback_repo = SupervisorFeedbackRepository(session)
         self.evaluation_period_repo = EvaluationPeriodRepository(session)
+        self.comprehensive_repo = ComprehensiveEvaluationRepository(session)
 
     # ========================================
     # ADMIN DASHBOARD
@@ -936,7 +939,31 @@ class DashboardService:
 
         period_summaries: List[HistoricalPeriodSummary] = []
 
+        # Finalized periods carry frozen counts in their snapshots; only older periods are counted live
+        snapshots = await self.comprehensive_repo.list_period_snapshots(
+            org_id=org_id,
+            period_ids=[period.id for period in recent_periods],
+            user_ids=[employee_id],
+        )
+        snapshot_activity = {
+            record["period_id"]: ComprehensivePeriodActivity.model_validate(record["document"]["activity"])
+            for record in snapshots
+        }
+
         for period in recent_periods:
+            activity = snapshot_activity.get(period.id)
+            if activity is not None:
+                period_summaries.append(HistoricalPeriodSummary(
+                    period_id=period.id,
+                    period_name=period.name,
+                    period_type=period.period_type,
+                    end_date=period.end_date,
+                    goals_count=activity.goals_count,
+                    completed_assessments_count=activity.completed_assessments_count,
+                    received_feedbacks_count=activity.received_feedbacks_count
+                ))
+                continue
+
             # Count goals for this period
             goals_query = select(func.count(Goal.id)).where(
                 and_(Goal.user_id == employee_id, Goal.period_id == period.id)
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 from datetime import date
 
@@ -15,7 +15,7 @@ from ..schemas.evaluation import (
     EvaluationPeriodDetail, EvaluationPeriodList
 )
 from ..schemas.goal import GoalStatistics, UserActivity
-from ..schemas.common import PaginationParams
+from ..schemas.common import PaginationParams, PaginatedResponse
 from ..security.context import AuthContext
 from ..security.permissions import Permission
 from ..security.decorators import require_role
@@ -336,11 +336,14 @@ class EvaluationPeriodService:
     async def get_evaluation_period_goal_statistics(
         self,
         current_user_context: AuthContext,
-        period_id: UUID
+        period_id: UUID,
+        include_user_activities: bool = True
     ) -> GoalStatistics:
         """Get goal statistics for an evaluation period.
 
-        Only administrators can access goal statistics.
+        Only administrators can access goal statistics. Totals are aggregated in the
+        database; pass include_user_activities=False to get only the period totals and
+        page the user list through get_evaluation_period_user_activities instead.
         """
 
         org_id = current_user_context.organization_id
@@ -353,21 +356,48 @@ class EvaluationPeriodService:
             raise NotFoundError(f"Evaluation period with ID {period_id} not found")
 
         try:
-            # Get goals for the period
-            goals = await self.goal_repo.get_goals_by_period(period_id, org_id)
-
-            # Get all users in the organization
-            users = await self.user_repo.get_all_users(org_id)
+            status_counts = await self.goal_repo.get_period_status_counts(period_id, org_id)
 
-            # Process goal statistics
-            stats = await self._process_goal_statistics(period_id, goals, users, org_id)
+            user_activities: List[UserActivity] = []
+            if include_user_activities:
+                user_activities, _ = await self._load_user_activities(period_id, org_id, None)
 
-            return stats
+            return GoalStatistics(
+                period_id=period_id,
+                total=sum(status_counts.values()),
+                by_status=status_counts,
+                user_activities=user_activities
+            )
 
         except Exception as e:
             logger.error(f"Error getting goal statistics for period {period_id}: {e}")
             raise
 
+    @require_role("admin")
+    async def get_evaluation_period_user_activities(
+        self,
+        current_user_context: AuthContext,
+        period_id: UUID,
+        pagination: PaginationParams
+    ) -> PaginatedResponse[UserActivity]:
+        """Get one page of per-user goal activity for an evaluation period (admin only)."""
+
+        org_id = current_user_context.organization_id
+        if not org_id:
+            raise PermissionDeniedError("Organization context required")
+
+        period = await self.evaluation_period_repo.get_by_id(period_id, org_id)
+        if not period:
+            raise NotFoundError(f"Evaluation period with ID {period_id} not found")
+
+        try:
+            activities, total = await self._load_user_activities(period_id, org_id, pagination)
+            return PaginatedResponse.create(activities, total, pagination)
+
+        except Exception as e:
+            logger.error(f"Error getting user activities for period {period_id}: {e}")
+            raise
+
     # ========================================
     # PRIVATE VALIDATION METHODS
     # ========================================
@@ -486,77 +516,32 @@ class EvaluationPeriodService:
         
         return (period.end_date - today).days
 
-    async def _process_goal_statistics(self, period_id: UUID, goals: List, users: List, org_id: str) -> GoalStatistics:
-        """Process goal data to create statistics."""
-        # Count goals by status
-        status_counts = {}
-        user_goal_data = {}
-
-        for goal in goals:
-            # Count by status
-            status = str(goal.status) if hasattr(goal, 'status') else 'unknown'
-            status_counts[status] = status_counts.get(status, 0) + 1
-
-            # Group by user
-            user_id = goal.user_id if hasattr(goal, 'user_id') else None
-            if user_id:
-                if user_id not in user_goal_data:
-                    user_goal_data[user_id] = {
-                        'goal_count': 0,
-                        'goal_statuses': {},
-                        'last_goal_submission': None
-                    }
-
-                user_goal_data[user_id]['goal_count'] += 1
-                user_goal_data[user_id]['goal_statuses'][status] = user_goal_data[user_id]['goal_statuses'].get(status, 0) + 1
-
-                # Track last submission (if available)
-                if hasattr(goal, 'updated_at') and goal.updated_at:
-                    if not user_goal_data[user_id]['last_goal_submission'] or goal.updated_at > user_goal_data[user_id]['last_goal_submission']:
-                        user_goal_data[user_id]['last_goal_submission'] = goal.updated_at
-
-        # Create user activity records
-        user_activities = []
-        for user in users:
-            user_id = user.id if hasattr(user, 'id') else None
-            if not user_id:
-                continue
-
-            goal_data = user_goal_data.get(user_id, {
-                'goal_count': 0,
-                'goal_statuses': {},
-                'last_goal_submission': None
-            })
-
-            # Get supervisor and subordinate info (if available)
-            supervisor_name = None
-            subordinate_name = None
-
-            if hasattr(user, 'supervisor') and user.supervisor:
-                supervisor_name = getattr(user.supervisor, 'name', None)
-
-            if hasattr(user, 'subordinates') and user.subordinates:
-                # Get first subordinate name as example
-                subordinate_name = getattr(user.subordinates[0], 'name', None) if user.subordinates else None
-
-            user_activity = UserActivity(
-                user_id=user_id,
-                user_name=getattr(user, 'name', 'Unknown'),
-                employee_code=getattr(user, 'employee_code', ''),
-                user_role=user.roles[0].name if user.roles else 'Unknown',
-                department_name=user.department.name if user.department else 'Unknown',
-                subordinate_name=subordinate_name,
-                supervisor_name=supervisor_name,
-                last_goal_submission=goal_data['last_goal_submission'],
-                last_review_submission=None,  # TODO: Add when review data is available
-                goal_count=goal_data['goal_count'],
-                goal_statuses=goal_data['goal_statuses']
-            )
-            user_activities.append(user_activity)
-
-        return GoalStatistics(
-            period_id=period_id,
-            total=len(goals),
-            by_status=status_counts,
-            user_activities=user_activities
+    async def _load_user_activities(
+        self,
+        period_id: UUID,
+        org_id: str,
+        pagination: Optional[PaginationParams]
+    ) -> Tuple[List[UserActivity], int]:
+        """Build UserActivity rows for one page of users (all users when pagination is None)."""
+        rows, total = await self.user_repo.get_user_activity_page(org_id, pagination)
+        goal_data = await self.goal_repo.get_period_user_goal_counts(
+            period_id, [row["id"] for row in rows], org_id
         )
+
+        activities = []
+        for row in rows:
+            goals = goal_data.get(row["id"], {})
+            activities.append(UserActivity(
+                user_id=row["id"],
+                user_name=row["name"] or 'Unknown',
+                employee_code=row["employee_code"] or '',
+                user_role=row["role_name"] or 'Unknown',
+                department_name=row["department_name"] or 'Unknown',
+                subordinate_name=row["subordinate_name"],
+                supervisor_name=row["supervisor_name"],
+                last_goal_submission=goals.get('last_goal_submission'),
+                last_review_submission=None,
+                goal_count=goals.get('goal_count', 0),
+                goal_statuses=goals.get('goal_statuses', {})
+            ))
+        return activities, total
@@ -1,10 +1,9 @@
 from __future__ import annotations
 import logging
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Union
 from uuid import UUID
 from datetime import datetime, timezone
 from decimal import Decimal
-from cachetools import TTLCache
 
 from ..database.repositories.goal_repo import GoalRepository
 from ..database.repositories.user_repo import UserRepository
@@ -12,6 +11,7 @@ from ..database.repositories.evaluation_period_repo import EvaluationPeriodRepos
 from ..database.repositories.competency_repo import CompetencyRepository
 from ..database.repositories.supervisor_review_repository import SupervisorReviewRepository
 from ..database.repositories.self_assessment_repo import SelfAssessmentRepository
+from ..services.competency_catalog import CompetencyCatalog
 from ..database.models.goal import Goal as GoalModel
 from ..schemas.goal import (
     GoalCreate, GoalUpdate, Goal, GoalDetail, GoalStatus,
@@ -29,6 +29,7 @@ from ..schemas.user import UserStatus
 from ..security.context import AuthContext
 from ..security.permissions import Permission
 from ..security.rbac_helper import RBACHelper
+from ..security.rbac_scope import AccessScope
 from ..security.rbac_types import ResourceType
 from ..security.decorators import require_permission, require_any_permission
 from ..core.exceptions import (
@@ -38,12 +39,13 @@ from ..core.exceptions import (
     ValidationError,
     ConflictError,
 )
+from ..core.metrics import InstrumentedTTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
 # Cache for goal search results (50 items, 5-minute TTL aligned with other services)
-goal_search_cache = TTLCache(maxsize=50, ttl=300)
+goal_search_cache = InstrumentedTTLCache("goal_search", maxsize=50, ttl=300)
 
 
 class GoalService:
@@ -55,6 +57,7 @@ class GoalService:
         self.user_repo = UserRepository(session)
         self.evaluation_period_repo = EvaluationPeriodRepository(session)
         self.competency_repo = CompetencyRepository(session)
+        self.competency_catalog = CompetencyCatalog(session)
         self.supervisor_review_repo = SupervisorReviewRepository(session)
         self.self_assessment_repo = SelfAssessmentRepository(session)
         
@@ -92,7 +95,7 @@ class GoalService:
         try:
             # Determine which users' goals the current user can access
             accessible_user_ids = await self._get_accessible_goal_user_ids(
-                current_user_context, user_id, self_only=self_only
+                current_user_context, user_id, self_only=self_only, as_scope=True
             )
             org_id = current_user_context.organization_id
             if not org_id:
@@ -100,7 +103,7 @@ class GoalService:
 
             # If the caller has no accessible users, return an empty page rather than
             # risk widening scope due to downstream truthiness checks.
-            if accessible_user_ids is not None and len(accessible_user_ids) == 0:
+            if AccessScope.coerce(accessible_user_ids).is_empty:
                 page_number = pagination.page if pagination else 1
                 page_limit = pagination.limit if pagination else 0
                 return PaginatedResponse(
@@ -111,8 +114,8 @@ class GoalService:
                     pages=1,
                 )
             
-            # Search goals with filters
-            goals = await self.goal_repo.search_goals(
+            # Search goals with filters; the total comes back with the page
+            goals, total_count = await self.goal_repo.search_goals_page(
                 org_id=org_id,
                 user_ids=accessible_user_ids,
                 period_id=period_id,
@@ -121,16 +124,6 @@ class GoalService:
                 has_previous_goal_id=has_previous_goal_id,
                 pagination=pagination
             )
-            
-            # Get total count for pagination
-            total_count = await self.goal_repo.count_goals(
-                org_id=org_id,
-                user_ids=accessible_user_ids,
-                period_id=period_id,
-                goal_category=goal_category,
-                status=status,
-                has_previous_goal_id=has_previous_goal_id,
-            )
 
             # Batch fetch supervisor reviews if requested (performance optimization)
             reviews_map = {}
@@ -188,21 +181,11 @@ class GoalService:
                         comp_user_ids.add(goal_model.user_id)
 
                 if comp_user_ids:
-                    # Get stage_id for each user, then all competencies per stage
-                    stage_cache: dict[UUID, list] = {}  # stage_id -> competencies
-                    for uid in comp_user_ids:
-                        stage_id = await self.user_repo.get_user_stage_id(uid, org_id)
-                        if not stage_id:
-                            continue
-                        if stage_id not in stage_cache:
-                            stage_cache[stage_id] = await self.competency_repo.get_by_stage_id(stage_id, org_id)
-
-                        comps = stage_cache[stage_id]
-                        stage_competency_data[str(uid)] = {
-                            "competency_ids": [c.id for c in comps],
-                            "competency_names": {str(c.id): c.name for c in comps},
-                            "ideal_action_texts": {str(c.id): (c.description or {}) for c in comps},
-                        }
+                    # Stage of each user, then the cached competency catalog per stage
+                    user_catalogs = await self.competency_catalog.get_user_catalogs(org_id, comp_user_ids)
+                    stage_competency_data = {
+                        str(uid): catalog.context() for uid, catalog in user_catalogs.items()
+                    }
             except Exception as e:
                 logger.warning(f"Failed to batch load stage competencies: {e}")
 
@@ -355,20 +338,10 @@ class GoalService:
                     comp_user_ids.add(goal_model.user_id)
 
             if comp_user_ids:
-                stage_cache: dict[UUID, list] = {}
-                for uid in comp_user_ids:
-                    stage_id = await self.user_repo.get_user_stage_id(uid, org_id)
-                    if not stage_id:
-                        continue
-                    if stage_id not in stage_cache:
-                        stage_cache[stage_id] = await self.competency_repo.get_by_stage_id(stage_id, org_id)
-
-                    comps = stage_cache[stage_id]
-                    stage_competency_data[str(uid)] = {
-                        "competency_ids": [c.id for c in comps],
-                        "competency_names": {str(c.id): c.name for c in comps},
-                        "ideal_action_texts": {str(c.id): (c.description or {}) for c in comps},
-                    }
+                user_catalogs = await self.competency_catalog.get_user_catalogs(org_id, comp_user_ids)
+                stage_competency_data = {
+                    str(uid): catalog.context() for uid, catalog in user_catalogs.items()
+                }
         except Exception as e:
             logger.warning(f"Failed to batch load stage competencies: {e}")
 
@@ -412,10 +385,11 @@ class GoalService:
             accessible_user_ids = await self._get_accessible_goal_user_ids(
                 current_user_context=current_user_context,
                 requested_user_id=user_id,
+                as_scope=True,
             )
 
             # If the caller has no accessible users, short-circuit with an empty page
-            if accessible_user_ids is not None and len(accessible_user_ids) == 0:
+            if AccessScope.coerce(accessible_user_ids).is_empty:
                 empty_meta = GoalListPageMeta(total=0, page=pagination.page, limit=pagination.limit, pages=1)
                 empty_filters = GoalListPageFilters(
                     period_id=period_id,
@@ -1117,7 +1091,7 @@ class GoalService:
         """
         try:
             # Search goals with user_ids=None (ALL users in organization)
-            goals = await self.goal_repo.search_goals(
+            goals, total_count = await self.goal_repo.search_goals_page(
                 org_id=org_id,
                 user_ids=[user_id] if user_id else None,  # None = all users, [user_id] = specific user
                 period_id=period_id,
@@ -1127,16 +1101,6 @@ class GoalService:
                 pagination=pagination
             )
 
-            # Get total count for pagination
-            total_count = await self.goal_repo.count_goals(
-                org_id=org_id,
-                user_ids=[user_id] if user_id else None,
-                period_id=period_id,
-                department_id=department_id,
-                goal_category=goal_category,
-                status=status
-            )
-
             # Batch fetch supervisor reviews if requested (performance optimization)
             reviews_map = {}
             if include_reviews and goals:
@@ -1224,36 +1188,46 @@ class GoalService:
         self,
         current_user_context: AuthContext,
         requested_user_id: Optional[UUID] = None,
-        self_only: bool = False
-    ) -> Optional[List[UUID]]:
+        self_only: bool = False,
+        as_scope: bool = False,
+    ) -> Union[List[UUID], AccessScope]:
         """Determine which users' goals the current user can access.
 
         Args:
             current_user_context: The authentication context
             requested_user_id: Specific user ID to filter by (optional)
             self_only: If True, return only the current user's ID (ignore subordinates)
+            as_scope: Return an AccessScope (subordinate semi-join) instead of an ID list
         """
+        scope = await self._get_accessible_goal_scope(current_user_context, requested_user_id, self_only)
+        return scope if as_scope else scope.to_id_list()
+
+    async def _get_accessible_goal_scope(
+        self,
+        current_user_context: AuthContext,
+        requested_user_id: Optional[UUID] = None,
+        self_only: bool = False
+    ) -> AccessScope:
+        user_id = current_user_context.user_id
+        org_id = current_user_context.organization_id
+
         # If self_only is True, return only the current user's ID
         if self_only:
-            return [current_user_context.user_id] if current_user_context.user_id else []
+            return AccessScope.self_only(user_id, org_id)
 
         if current_user_context.has_permission(Permission.GOAL_READ_ALL) or current_user_context.has_permission(Permission.GOAL_MANAGE):
             # Admin: can read any user's goals when explicitly requested
             if requested_user_id:
-                return [requested_user_id]
+                return AccessScope.explicit([requested_user_id], org_id)
             # Safe default: admin sees only their own goals unless explicitly requesting others
             # For org-wide view, use get_all_goals_for_admin() endpoint instead
-            return [current_user_context.user_id] if current_user_context.user_id else []
-
-        accessible_ids = []
+            return AccessScope.self_only(user_id, org_id)
 
         # Add self when the user can either read or manage their own goals.
         can_access_self = (
             current_user_context.has_permission(Permission.GOAL_READ_SELF)
             or current_user_context.has_permission(Permission.GOAL_MANAGE_SELF)
         )
-        if can_access_self and current_user_context.user_id:
-            accessible_ids.append(current_user_context.user_id)
 
         # Supervisors: can see subordinates' goals.
         # Approvers must also be able to view the goals they act on.
@@ -1261,29 +1235,28 @@ class GoalService:
             current_user_context.has_permission(Permission.GOAL_READ_SUBORDINATES)
             or current_user_context.has_permission(Permission.GOAL_APPROVE)
         )
+
         if can_access_subordinates:
             # Supervisor: can see subordinates' goals
             subordinate_ids = await RBACHelper._get_subordinate_user_ids(
-                current_user_context.user_id, self.user_repo, current_user_context.organization_id
+                user_id, self.user_repo, org_id
             )
-            accessible_ids.extend(subordinate_ids)
-
-        # Deduplicate while preserving order
-        seen = set()
-        deduped: list[UUID] = []
-        for uid in accessible_ids:
-            if uid and uid not in seen:
-                seen.add(uid)
-                deduped.append(uid)
-        accessible_ids = deduped
+            if can_access_self:
+                scope = AccessScope.subordinates_of(user_id, subordinate_ids, org_id)
+            else:
+                scope = AccessScope.explicit(subordinate_ids, org_id)
+        elif can_access_self:
+            scope = AccessScope.self_only(user_id, org_id)
+        else:
+            scope = AccessScope.explicit([], org_id)
 
         # If specific user requested, check if accessible
         if requested_user_id:
-            if requested_user_id not in accessible_ids:
+            if requested_user_id not in scope:
                 raise PermissionDeniedError(f"You do not have permission to access goals for user {requested_user_id}")
-            return [requested_user_id]
+            return AccessScope.explicit([requested_user_id], org_id)
 
-        return accessible_ids
+        return scope
 
     async def _validate_goal_creation(self, goal_data: GoalCreate, user_id: UUID, org_id: UUID):
         """Validate goal creation business rules."""
@@ -1448,15 +1421,8 @@ class GoalService:
         Fetch complete rejection history by following previousGoalId chain.
 
         DEPRECATED: This method is kept for backward compatibility only.
-        New code should use _get_rejection_histories_batch() for better performance.
-        This method performs N+1 queries (2 queries per rejection level).
-
-        Performance comparison:
-        - This method: N goals × M depth × 2 queries = O(N*M) queries
-        - Batch method: 2-3 queries total regardless of N or M
-
-        This uses a Python loop which is simpler than SQL recursive CTE
-        and sufficient for typical rejection depths (1-3 levels).
+        New code should use _get_rejection_histories_batch() to fetch many chains at once.
+        Both resolve the chain with a single recursive query.
 
         Args:
             goal_id: Starting goal ID (the previousGoalId to start from)
@@ -1466,34 +1432,10 @@ class GoalService:
         Returns:
             List of SupervisorReview in chronological order (oldest first)
         """
-        history = []
-        current_id = goal_id
-        visited = set()
-
-        while current_id and len(visited) < max_depth:
-            # Prevent infinite loops
-            if current_id in visited:
-                logger.warning(f"Circular reference detected in rejection history at goal {current_id}")
-                break
-            visited.add(current_id)
-
-            # Fetch the rejection review for the current goal (the rejected goal)
-            review = await self.supervisor_review_repo.get_rejection_review_by_goal(
-                current_id,
-                org_id
-            )
-
-            if review:
-                # Add review to history (prepend for chronological order)
-                history.insert(0, review)
-
-            # Fetch the goal to get its previousGoalId to continue the chain
-            goal = await self.goal_repo.get_goal_by_id(current_id, org_id)
-            if not goal or not goal.previous_goal_id:
-                break
-
-            # Move to the previous goal in the chain
-            current_id = goal.previous_goal_id
+        histories = await self.supervisor_review_repo.get_rejection_histories_for_chains(
+            [goal_id], org_id, max_depth=max_depth
+        )
+        history = histories.get(goal_id, [])
 
         logger.info(f"Fetched {len(history)} rejection reviews for goal chain starting at {goal_id}")
         return history
@@ -1506,7 +1448,10 @@ class GoalService:
     ) -> dict[UUID, List]:
         """
         Batch fetch rejection histories for multiple goals efficiently.
-        This eliminates N+1 queries by processing all goals at once.
+
+        All previousGoalId chains and their rejection reviews are fetched in one
+        recursive CTE query, however many goals are passed or how deep the
+        resubmissions go.
 
         Args:
             goals: List of GoalModel objects to fetch rejection histories for
@@ -1522,68 +1467,10 @@ class GoalService:
         if not previous_goal_ids:
             return {}
 
-        # First, collect ALL goal IDs in all chains by following previous_goal_id links
-        all_goal_ids = set(previous_goal_ids)
-        current_level = set(previous_goal_ids)
-        all_goals_map = {}
-
-        for depth in range(max_depth):
-            if not current_level:
-                break
-
-            # Batch fetch goals for this level
-            goals_batch = await self.goal_repo.get_goals_by_ids_batch(
-                list(current_level), org_id
-            )
-            all_goals_map.update(goals_batch)
-
-            # Find next level (all previous_goal_ids from current level)
-            next_level = set()
-            for goal_id in current_level:
-                goal = goals_batch.get(goal_id)
-                if goal and goal.previous_goal_id and goal.previous_goal_id not in all_goal_ids:
-                    next_level.add(goal.previous_goal_id)
-                    all_goal_ids.add(goal.previous_goal_id)
-
-            current_level = next_level
-
-        # Now batch fetch ALL rejection reviews at once
-        reviews_batch = await self.supervisor_review_repo.get_rejection_reviews_batch(
-            list(all_goal_ids), org_id
+        histories_map = await self.supervisor_review_repo.get_rejection_histories_for_chains(
+            list(previous_goal_ids), org_id, max_depth=max_depth
         )
 
-        # Build the history for each original previous_goal_id by following the chain
-        histories_map: dict[UUID, List] = {}
-
-        for start_goal_id in previous_goal_ids:
-            history = []
-            current_id = start_goal_id
-            visited = set()
-
-            # Follow the chain and collect reviews
-            while current_id and len(visited) < max_depth:
-                if current_id in visited:
-                    logger.warning(f"Circular reference detected in rejection history at goal {current_id}")
-                    break
-                visited.add(current_id)
-
-                # Get the rejection review for this goal (already fetched in batch)
-                review = reviews_batch.get(current_id)
-                if review:
-                    # Prepend to maintain chronological order (oldest first)
-                    history.insert(0, review)
-
-                # Get the goal to continue the chain (already fetched in batch)
-                goal = all_goals_map.get(current_id)
-                if not goal or not goal.previous_goal_id:
-                    break
-
-                # Move to the previous goal in the chain
-                current_id = goal.previous_goal_id
-
-            if history:
-                histories_map[start_goal_id] = history
-
         logger.info(f"Batch fetched rejection histories for {len(previous_goal_ids)} goal chains")
         return histories_map
 
@@ -1874,17 +1761,15 @@ class GoalService:
             if target.get("competency_snapshot"):
                 return  # already snapshotted
 
-            stage_id = await self.user_repo.get_user_stage_id(goal.user_id, org_id)
-            if not stage_id:
-                return
-            comps = await self.competency_repo.get_by_stage_id(stage_id, org_id)
-            if not comps:
+            catalog = (await self.competency_catalog.get_user_catalogs(org_id, [goal.user_id])).get(goal.user_id)
+            if not catalog or not catalog.competencies:
                 return
+            stage_id = catalog.stage_id
 
+            context = catalog.context()
             snapshot = {
-                "competency_ids": [str(c.id) for c in comps],
-                "competency_names": {str(c.id): c.name for c in comps},
-                "ideal_action_texts": {str(c.id): (c.description or {}) for c in comps},
+                **context,
+                "competency_ids": [str(cid) for cid in context["competency_ids"]],
                 "stage_id": str(stage_id),
             }
             # Reassign (triggers @validates; competency_snapshot is in the allowlist)
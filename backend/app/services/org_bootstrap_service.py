@@ -1,5 +1,6 @@
 import logging
 from typing import Dict, Iterable, List
+from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,7 +9,6 @@ from ..database.repositories.permission_repo import (
     RolePermissionRepository,
 )
 from ..database.repositories.role_repo import RoleRepository
-from ..schemas.user import RoleCreate
 from ..security.permissions import Permission as PermissionEnum
 
 
@@ -39,13 +39,17 @@ class OrgBootstrapService:
         self.role_permission_repo = RolePermissionRepository(session)
 
     async def bootstrap(self, organization_id: str) -> None:
+        """
+        Set-based, idempotent bootstrap: a constant handful of statements regardless
+        of how many roles or permissions are seeded.
+        """
         # 1) Ensure permission catalog exists (codes, descriptions, groups)
         await self._ensure_catalog_seeded()
 
         # 2) Ensure canonical roles exist (idempotent)
         roles = await self._ensure_roles(organization_id)
 
-        # 3) Apply default role-permission assignments (idempotent replace)
+        # 3) Apply default role-permission assignments (idempotent insert)
         await self._ensure_role_permissions(organization_id, roles)
 
         await self.session.flush()
@@ -55,34 +59,18 @@ class OrgBootstrapService:
         )
 
     async def _ensure_catalog_seeded(self) -> None:
-        # Build catalog triples (code, description, group)
-        from ..services.permission_service import PERMISSION_CATALOG_METADATA
+        from ..services.permission_service import ensure_permission_catalog_seeded
 
-        # Validate coverage of enum
-        missing = [
-            p.value for p in PermissionEnum if p.value not in PERMISSION_CATALOG_METADATA
-        ]
-        if missing:
-            raise ValueError(
-                f"Missing metadata for permissions: {missing}. Update PERMISSION_CATALOG_METADATA."
-            )
+        await ensure_permission_catalog_seeded(self.session)
 
-        catalog = [
-            (code, desc, group) for code, (group, desc) in PERMISSION_CATALOG_METADATA.items()
+    async def _ensure_roles(self, org_id: str) -> Dict[str, UUID]:
+        role_rows = [
+            (name, description, order)
+            for order, (name, description) in enumerate(self.CANONICAL_ROLES, start=1)
         ]
-        await self.permission_repo.ensure_permission_codes(catalog)
-
-    async def _ensure_roles(self, org_id: str) -> Dict[str, object]:
-        roles: Dict[str, object] = {}
-        order = 1
-        for name, description in self.CANONICAL_ROLES:
-            existing = await self.role_repo.get_by_name(name, org_id)
-            if existing is None:
-                created = await self.role_repo.create_role(
-                    RoleCreate(name=name, description=description, hierarchy_order=order),
-                    org_id,
-                )
-                roles[name] = created
+        ensured = await self.role_repo.bulk_ensure_roles(org_id, role_rows)
+        for name, (_, created) in ensured.items():
+            if created:
                 logger.info(
                     "org.bootstrap.role.created",
                     extra={
@@ -91,12 +79,9 @@ class OrgBootstrapService:
                         "role_name": name,
                     },
                 )
-            else:
-                roles[name] = existing
-            order += 1
-        return roles
+        return {name: role_id for name, (role_id, _) in ensured.items()}
 
-    async def _ensure_role_permissions(self, org_id: str, roles_by_name: Dict[str, object]) -> None:
+    async def _ensure_role_permissions(self, org_id: str, roles_by_name: Dict[str, UUID]) -> None:
         # Build safe default sets
         all_codes = [p.value for p in PermissionEnum]
 
@@ -158,20 +143,20 @@ class OrgBootstrapService:
             "viewer": viewer_codes,
         }
 
-        # Persist using repository replace (idempotent)
-        for role_name, code_list in default_map.items():
-            role = roles_by_name.get(role_name)
-            if not role:
-                continue
-            permissions = await self.permission_repo.get_by_codes(code_list) if code_list else []
-            await self.role_permission_repo.replace_role_permissions(role, org_id, permissions)
-            logger.info(
-                "org.bootstrap.role_permissions.applied",
-                extra={
-                    "event": "org.bootstrap.role_permissions.applied",
-                    "organization_id": org_id,
-                    "role_name": role_name,
-                    "permission_count": len(code_list),
-                },
-            )
-
+        # Persist all assignments in one multi-row insert (idempotent)
+        assignments = [
+            (roles_by_name[role_name], code)
+            for role_name, code_list in default_map.items()
+            if role_name in roles_by_name
+            for code in code_list
+        ]
+        inserted = await self.role_permission_repo.bulk_assign_default_permissions(org_id, assignments)
+        logger.info(
+            "org.bootstrap.role_permissions.applied",
+            extra={
+                "event": "org.bootstrap.role_permissions.applied",
+                "organization_id": org_id,
+                "assignment_count": len(assignments),
+                "inserted_count": inserted,
+            },
+        )
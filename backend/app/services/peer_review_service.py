@@ -1,6 +1,8 @@
 from __future__ import annotations
+import csv
+import io
 import logging
-from typing import Optional, List
+from typing import AsyncIterator, Callable, Optional, List
 from uuid import UUID
 
 from ..database.repositories.peer_review_assignment_repo import PeerReviewAssignmentRepository
@@ -10,6 +12,8 @@ from ..database.repositories.core_value_evaluation_repo import CoreValueEvaluati
 from ..database.repositories.core_value_feedback_repo import CoreValueFeedbackRepository
 from ..database.repositories.user_repo import UserRepository
 from ..database.repositories.evaluation_period_repo import EvaluationPeriodRepository
+from ..database.repositories.evaluation_progress_repo import PROGRESS_SORT_COLUMNS, EvaluationProgressRepository
+from ..database.session import AsyncSessionLocal
 from ..schemas.peer_review import (
     PeerReviewAssignReviewersRequest,
     PeerReviewAssignmentResponse,
@@ -19,6 +23,7 @@ from ..schemas.peer_review import (
     PeerReviewAveragedScores,
     PeerReviewCoreValueAverage,
     CoreValueSummaryResponse,
+    CoreValueSummaryItem,
     CoreValueSummarySource,
     EvaluationProgressEntry,
     EvaluationProgressSource,
@@ -29,11 +34,14 @@ from ..schemas.peer_review import (
     BulkAssignReviewersResult,
     BulkAssignReviewersResponse,
 )
+from ..schemas.common import PaginatedResponse, PaginationParams
 from ..schemas.core_value import CoreValueRatingCode
+from ..schemas.user import UserStatus
 from ..core.rating_utils import (
     RATING_CODE_TO_NUMERIC,
     score_to_final_rating,
     calculate_source_average,
+    calculate_source_averages,
     to_circled_number,
 )
 from ..security.context import AuthContext
@@ -47,6 +55,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+EVALUATION_PROGRESS_EXPORT_HEADERS = [
+    "社員番号",
+    "氏名",
+    "部署",
+    "自己評価",
+    "同僚評価①",
+    "同僚評価① 状態",
+    "同僚評価②",
+    "同僚評価② 状態",
+    "上長",
+    "上長評価 状態",
+]
+
 
 class PeerReviewService:
     """Service layer for peer review business logic."""
@@ -60,6 +81,7 @@ class PeerReviewService:
         self.cv_feedback_repo = CoreValueFeedbackRepository(session)
         self.user_repo = UserRepository(session)
         self.period_repo = EvaluationPeriodRepository(session)
+        self.progress_repo = EvaluationProgressRepository(session)
         RBACHelper.initialize_with_repository(self.user_repo)
 
     # ========================================
@@ -424,8 +446,8 @@ class PeerReviewService:
         # Non-admin can only see their own
         if target_user_id != current_user_context.user_id:
             # Check admin permission
-            accessible = await RBACHelper.get_accessible_user_ids(current_user_context)
-            if accessible is not None and target_user_id not in accessible:
+            accessible = await RBACHelper.get_accessible_user_scope(current_user_context)
+            if target_user_id not in accessible:
                 raise PermissionDeniedError("You can only view your own peer review results")
 
         submitted = await self.evaluation_repo.get_submitted_evaluations_for_reviewee(
@@ -489,12 +511,72 @@ class PeerReviewService:
         if not org_id:
             raise PermissionDeniedError("Organization context required")
 
+        cv_eval = await self.cv_evaluation_repo.get_evaluation(period_id, user_id, org_id)
+        submitted_evals = await self.evaluation_repo.get_submitted_evaluations_for_reviewee(
+            period_id, user_id, org_id
+        )
+        feedback = None
+        if cv_eval:
+            feedback = await self.cv_feedback_repo.get_feedback_by_evaluation(cv_eval.id, org_id)
+
+        return CoreValueSummaryResponse(**self._build_core_value_summary(cv_eval, submitted_evals, feedback))
+
+    @require_any_permission([Permission.GOAL_READ_ALL])
+    async def get_core_value_summaries(
+        self,
+        current_user_context: AuthContext,
+        period_id: UUID,
+        user_ids: Optional[List[UUID]] = None,
+        department_ids: Optional[List[UUID]] = None,
+        search_term: str = "",
+        pagination: Optional[PaginationParams] = None,
+    ) -> PaginatedResponse[CoreValueSummaryItem]:
+        """
+        総合評価 for every active user in the period (or a filtered subset), one page at a time.
+
+        Three queries regardless of page size: the user page with its total, core value
+        evaluations with their supervisor feedback, and submitted peer evaluations.
+        """
+        org_id = current_user_context.organization_id
+        if not org_id:
+            raise PermissionDeniedError("Organization context required")
+
+        pagination = pagination or PaginationParams()
+        users, total = await self.user_repo.search_users_page(
+            org_id,
+            search_term=search_term,
+            statuses=[UserStatus.ACTIVE],
+            department_ids=department_ids,
+            user_ids=user_ids,
+            pagination=pagination,
+        )
+        page_user_ids = [user.id for user in users]
+        evaluations = await self.cv_evaluation_repo.get_evaluations_for_users(period_id, page_user_ids, org_id)
+        peer_evaluations = await self.evaluation_repo.get_submitted_evaluations_for_reviewees(
+            period_id, page_user_ids, org_id
+        )
+
+        items = []
+        for user in users:
+            cv_eval = evaluations.get(user.id)
+            summary = self._build_core_value_summary(
+                cv_eval,
+                peer_evaluations.get(user.id, []),
+                cv_eval.feedback if cv_eval else None,
+            )
+            items.append(
+                CoreValueSummaryItem(user_id=user.id, employee_code=user.employee_code, name=user.name, **summary)
+            )
+        return PaginatedResponse.create(items, total, pagination)
+
+    @staticmethod
+    def _build_core_value_summary(cv_eval, submitted_evals, feedback) -> dict:
+        """Combine self, peer and supervisor sources with equal weight (総合評価)."""
         sources_scores: list[float] = []
 
         # 1. 自己評価 - from core_value_evaluations
         self_score = None
         self_rating = None
-        cv_eval = await self.cv_evaluation_repo.get_evaluation(period_id, user_id, org_id)
         if cv_eval and cv_eval.status in ("submitted", "approved") and cv_eval.scores:
             self_score = calculate_source_average(cv_eval.scores)
             if self_score is not None:
@@ -503,11 +585,8 @@ class PeerReviewService:
 
         # 2. 同僚評価 - from peer_review_evaluations (each reviewer is a separate source)
         peer_sources: List[CoreValueSummarySource] = []
-        submitted_evals = await self.evaluation_repo.get_submitted_evaluations_for_reviewee(
-            period_id, user_id, org_id
-        )
-        for i, ev in enumerate(submitted_evals, 1):
-            peer_score = calculate_source_average(ev.scores)
+        peer_scores = calculate_source_averages(ev.scores for ev in submitted_evals)
+        for i, peer_score in enumerate(peer_scores, 1):
             peer_rating = score_to_final_rating(peer_score) if peer_score is not None else None
             peer_sources.append(
                 CoreValueSummarySource(
@@ -522,13 +601,11 @@ class PeerReviewService:
         # 3. 上長評価 - from core_value_feedback
         supervisor_score = None
         supervisor_rating = None
-        if cv_eval:
-            feedback = await self.cv_feedback_repo.get_feedback_by_evaluation(cv_eval.id, org_id)
-            if feedback and feedback.status == "submitted" and feedback.scores:
-                supervisor_score = calculate_source_average(feedback.scores)
-                if supervisor_score is not None:
-                    supervisor_rating = score_to_final_rating(supervisor_score)
-                    sources_scores.append(supervisor_score)
+        if cv_eval and feedback and feedback.status == "submitted" and feedback.scores:
+            supervisor_score = calculate_source_average(feedback.scores)
+            if supervisor_score is not None:
+                supervisor_rating = score_to_final_rating(supervisor_score)
+                sources_scores.append(supervisor_score)
 
         # 4. 総合平均 - equal weight average of available sources
         overall_score = None
@@ -537,15 +614,15 @@ class PeerReviewService:
             overall_score = round(sum(sources_scores) / len(sources_scores), 2)
             overall_rating = score_to_final_rating(overall_score)
 
-        return CoreValueSummaryResponse(
-            self_rating=self_rating,
-            self_score=round(self_score, 2) if self_score is not None else None,
-            peer_sources=peer_sources,
-            supervisor_rating=supervisor_rating,
-            supervisor_score=round(supervisor_score, 2) if supervisor_score is not None else None,
-            overall_rating=overall_rating,
-            overall_score=overall_score,
-        )
+        return {
+            "self_rating": self_rating,
+            "self_score": round(self_score, 2) if self_score is not None else None,
+            "peer_sources": peer_sources,
+            "supervisor_rating": supervisor_rating,
+            "supervisor_score": round(supervisor_score, 2) if supervisor_score is not None else None,
+            "overall_rating": overall_rating,
+            "overall_score": overall_score,
+        }
 
     # ========================================
     # ADMIN - 評価進捗 (EVALUATION PROGRESS)
@@ -556,104 +633,147 @@ class PeerReviewService:
         self,
         current_user_context: AuthContext,
         period_id: UUID,
+        department_ids: Optional[List[UUID]] = None,
+        sort_by: str = "name",
+        descending: bool = False,
     ) -> List[EvaluationProgressEntry]:
         """Get evaluation progress for all active users in a period (admin)."""
         org_id = current_user_context.organization_id
         if not org_id:
             raise PermissionDeniedError("Organization context required")
 
-        # 1. All active users
-        all_users = await self.user_repo.get_active_users(org_id)
-        user_ids = [u.id for u in all_users]
-
-        if not user_ids:
-            return []
-
-        # 2. Self-assessment statuses (batch)
-        cv_statuses = await self.cv_evaluation_repo.get_evaluation_status_by_users(
-            user_ids, period_id, org_id
-        )
-
-        # 3. Peer review assignments (already groups by reviewee with evaluation status)
-        assignments = await self.assignment_repo.get_assignments_for_period(period_id, org_id)
-        assignments_by_reviewee: dict[str, list] = {}
-        for a in assignments:
-            rid = str(a.reviewee_id)
-            if rid not in assignments_by_reviewee:
-                assignments_by_reviewee[rid] = []
-            assignments_by_reviewee[rid].append(a)
-
-        # 4. Supervisor feedback statuses (batch)
-        feedback_rows = await self.cv_feedback_repo.get_feedbacks_status_for_period(period_id, org_id)
-        feedback_by_subordinate: dict[str, dict] = {}
-        for row in feedback_rows:
-            feedback_by_subordinate[row["subordinate_id"]] = row
-
-        # 5. Build entries
         entries: List[EvaluationProgressEntry] = []
-        for user in all_users:
-            uid = str(user.id)
-
-            # Self assessment
-            cv_status = cv_statuses.get(uid)
-            self_status = None
-            if cv_status:
-                s = cv_status["status"]
-                self_status = "submitted" if s in ("submitted", "approved") else s
-            self_assessment = EvaluationProgressSource(
-                evaluator_name=user.name,
-                status=self_status,
-            )
-
-            # Peer reviewers
-            user_assignments = assignments_by_reviewee.get(uid, [])
-            # Sort by creation order
-            user_assignments.sort(key=lambda a: a.created_at)
+        async for rows in self.progress_repo.stream_rows(
+            org_id=org_id,
+            period_id=period_id,
+            department_ids=department_ids,
+            sort_by=sort_by,
+            descending=descending,
+        ):
+            entries.extend(self._progress_entry(row) for row in rows)
+        return entries
 
-            peer1 = EvaluationProgressSource(evaluator_name=None, status=None)
-            peer2 = EvaluationProgressSource(evaluator_name=None, status=None)
+    @require_any_permission([Permission.GOAL_READ_ALL])
+    async def get_evaluation_progress_page(
+        self,
+        current_user_context: AuthContext,
+        period_id: UUID,
+        department_ids: Optional[List[UUID]] = None,
+        search: Optional[str] = None,
+        sort_by: str = "name",
+        descending: bool = False,
+        pagination: Optional[PaginationParams] = None,
+    ) -> PaginatedResponse[EvaluationProgressEntry]:
+        """One page of evaluation progress with the total, from a single SQL read model (admin)."""
+        org_id = current_user_context.organization_id
+        if not org_id:
+            raise PermissionDeniedError("Organization context required")
 
-            for i, a in enumerate(user_assignments[:2]):
-                reviewer_name = a.reviewer.name if a.reviewer else None
-                eval_status = a.evaluation_status  # property on model
-                source = EvaluationProgressSource(
-                    evaluator_name=reviewer_name,
-                    status=eval_status,
-                )
-                if i == 0:
-                    peer1 = source
-                else:
-                    peer2 = source
-
-            # Supervisor feedback
-            fb = feedback_by_subordinate.get(uid)
-            if fb:
-                sup_name = fb["supervisor_name"]
-                sup_status = fb["status"]
-            else:
-                # Fallback: get supervisor from user relationships
-                sup_name = None
-                if user.supervisor_relations:
-                    sup_rel = user.supervisor_relations[0]
-                    if sup_rel.supervisor:
-                        sup_name = sup_rel.supervisor.name
-                sup_status = None
-            supervisor_source = EvaluationProgressSource(
-                evaluator_name=sup_name,
-                status=sup_status,
-            )
+        pagination = pagination or PaginationParams()
+        rows, total = await self.progress_repo.list_page(
+            org_id=org_id,
+            period_id=period_id,
+            department_ids=department_ids,
+            search=search,
+            sort_by=sort_by,
+            descending=descending,
+            page=pagination.page,
+            limit=pagination.limit,
+        )
+        return PaginatedResponse.create([self._progress_entry(row) for row in rows], total, pagination)
 
-            entries.append(EvaluationProgressEntry(
-                user_id=user.id,
-                user_name=user.name,
-                department_name=user.department.name if user.department else None,
-                self_assessment=self_assessment,
-                peer_reviewer1=peer1,
-                peer_reviewer2=peer2,
-                supervisor=supervisor_source,
-            ))
+    @require_any_permission([Permission.GOAL_READ_ALL])
+    async def export_evaluation_progress_csv(
+        self,
+        current_user_context: AuthContext,
+        period_id: UUID,
+        department_ids: Optional[List[UUID]] = None,
+        search: Optional[str] = None,
+        sort_by: str = "name",
+        descending: bool = False,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        CSV lines for the progress export, produced chunk by chunk from a server-side
+        cursor so memory stays flat for large organizations.
+
+        The cursor runs on its own session (``session_factory``, default
+        ``AsyncSessionLocal``) opened and closed by the stream: the body of a
+        StreamingResponse is sent after the request-scoped session may already be
+        closed (OrgSlugValidationMiddleware closes the one it opened once
+        ``call_next`` returns).
+        """
+        org_id = current_user_context.organization_id
+        if not org_id:
+            raise PermissionDeniedError("Organization context required")
+        if sort_by not in PROGRESS_SORT_COLUMNS:
+            # Validate up front: the stream only starts once the response is being sent.
+            raise ValueError(f"Unsupported sort key: {sort_by}")
 
-        return entries
+        rows = self._stream_progress_rows(
+            session_factory or AsyncSessionLocal,
+            org_id=org_id,
+            period_id=period_id,
+            department_ids=department_ids,
+            search=search,
+            sort_by=sort_by,
+            descending=descending,
+        )
+        return self._progress_csv_lines(rows)
+
+    @staticmethod
+    async def _stream_progress_rows(session_factory: Callable[[], AsyncSession], **filters):
+        async with session_factory() as session:
+            async for chunk in EvaluationProgressRepository(session).stream_rows(**filters):
+                yield chunk
+
+    @staticmethod
+    async def _progress_csv_lines(chunks) -> AsyncIterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EVALUATION_PROGRESS_EXPORT_HEADERS)
+        yield "\ufeff" + buffer.getvalue()
+        async for rows in chunks:
+            buffer.seek(0)
+            buffer.truncate()
+            for row in rows:
+                writer.writerow([
+                    row.get("employee_code") or "",
+                    row["user_name"],
+                    row.get("department_name") or "",
+                    row.get("self_status") or "",
+                    row.get("peer1_name") or "",
+                    row.get("peer1_status") or "",
+                    row.get("peer2_name") or "",
+                    row.get("peer2_status") or "",
+                    row.get("supervisor_name") or "",
+                    row.get("supervisor_status") or "",
+                ])
+            yield buffer.getvalue()
+
+    @staticmethod
+    def _progress_entry(row: dict) -> EvaluationProgressEntry:
+        return EvaluationProgressEntry(
+            user_id=row["user_id"],
+            user_name=row["user_name"],
+            department_name=row.get("department_name"),
+            self_assessment=EvaluationProgressSource(
+                evaluator_name=row["user_name"],
+                status=row.get("self_status"),
+            ),
+            peer_reviewer1=EvaluationProgressSource(
+                evaluator_name=row.get("peer1_name"),
+                status=row.get("peer1_status"),
+            ),
+            peer_reviewer2=EvaluationProgressSource(
+                evaluator_name=row.get("peer2_name"),
+                status=row.get("peer2_status"),
+            ),
+            supervisor=EvaluationProgressSource(
+                evaluator_name=row.get("supervisor_name"),
+                status=row.get("supervisor_status"),
+            ),
+        )
 
     # ========================================
     # ADMIN - 評価詳細 (EVALUATION DETAIL)
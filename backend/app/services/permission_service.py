@@ -1,6 +1,6 @@
+import hashlib
 import logging
 from typing import Dict, List, Optional, Set
-from cachetools import TTLCache
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,6 +23,7 @@ from ..security.decorators import require_permission
 from ..security.permissions import Permission as PermissionEnum
 from ..security.role_permission_cache import invalidate_role_permission_cache
 from ..core.exceptions import ConflictError, NotFoundError, PermissionDeniedError
+from ..core.metrics import InstrumentedTTLCache
 
 
 logger = logging.getLogger(__name__)
@@ -74,10 +75,70 @@ PERMISSION_CATALOG_METADATA: Dict[str, tuple[str, str]] = {
     PermissionEnum.STAGE_MANAGE.value: ("ステージ", "ステージを管理"),
 }
 
+
+def _compute_catalog_version(metadata: Dict[str, tuple[str, str]]) -> str:
+    """Content hash of the catalog; changes whenever a code, group or description changes."""
+    digest = hashlib.sha256()
+    for code in sorted(metadata):
+        group, description = metadata[code]
+        digest.update(f"{code}\x1f{group}\x1f{description}\x1e".encode("utf-8"))
+    return digest.hexdigest()
+
+
+PERMISSION_CATALOG_VERSION = _compute_catalog_version(PERMISSION_CATALOG_METADATA)
+
+# Catalog version known to be stored in the DB for this process (skip seeding entirely)
+_seeded_catalog_version: Optional[str] = None
+
+
+async def ensure_permission_catalog_seeded(session: AsyncSession, *, commit: bool = False) -> bool:
+    """
+    Make sure the DB permission catalog matches PERMISSION_CATALOG_METADATA.
+
+    - Warm process: no queries.
+    - Cold process, catalog already seeded: one indexed lookup.
+    - Catalog changed: one multi-row upsert that also records the new version.
+
+    Returns True when rows were written. With ``commit=False`` the caller owns the
+    transaction, so the in-process marker is only set once the version is observed
+    as committed.
+    """
+    global _seeded_catalog_version
+    if _seeded_catalog_version == PERMISSION_CATALOG_VERSION:
+        return False
+
+    missing_codes = [
+        permission.value
+        for permission in PermissionEnum
+        if permission.value not in PERMISSION_CATALOG_METADATA
+    ]
+    if missing_codes:
+        raise ValueError(f"Missing permission metadata definitions for: {missing_codes}")
+
+    permission_repo = PermissionRepository(session)
+    if await permission_repo.is_catalog_version_seeded(PERMISSION_CATALOG_VERSION):
+        _seeded_catalog_version = PERMISSION_CATALOG_VERSION
+        return False
+
+    permission_catalog = [
+        (code, description, group)
+        for code, (group, description) in PERMISSION_CATALOG_METADATA.items()
+    ]
+    await permission_repo.bulk_seed_catalog(permission_catalog, PERMISSION_CATALOG_VERSION)
+    if commit:
+        await session.commit()
+        _seeded_catalog_version = PERMISSION_CATALOG_VERSION
+    logger.info(
+        "permissions.catalog.seeded",
+        extra={"event": "permissions.catalog.seeded", "catalog_version": PERMISSION_CATALOG_VERSION},
+    )
+    return True
+
+
 # Read-heavy response caches (short TTL to avoid staleness after role/permission edits)
-_role_permissions_cache = TTLCache(maxsize=32, ttl=120)
-_permission_catalog_cache = TTLCache(maxsize=4, ttl=120)
-_permission_catalog_grouped_cache = TTLCache(maxsize=4, ttl=120)
+_role_permissions_cache = InstrumentedTTLCache("role_permissions", maxsize=32, ttl=120)
+_permission_catalog_cache = InstrumentedTTLCache("permission_catalog", maxsize=4, ttl=120)
+_permission_catalog_grouped_cache = InstrumentedTTLCache("permission_catalog_grouped", maxsize=4, ttl=120)
 
 
 def _invalidate_permission_caches(cache_key: str) -> None:
@@ -95,25 +156,7 @@ class PermissionService:
         self.role_repo = RoleRepository(session)
 
     async def _ensure_catalog_seeded(self) -> None:
-        missing_codes = [
-            permission.value
-            for permission in PermissionEnum
-            if permission.value not in PERMISSION_CATALOG_METADATA
-        ]
-        if missing_codes:
-            raise ValueError(f"Missing permission metadata definitions for: {missing_codes}")
-
-        permission_catalog = [
-            (
-                code,
-                description,
-                group,
-            )
-            for code, (group, description) in PERMISSION_CATALOG_METADATA.items()
-        ]
-        _, created = await self.permission_repo.ensure_permission_codes(permission_catalog)
-        if created:
-            await self.session.commit()
+        await ensure_permission_catalog_seeded(self.session, commit=True)
 
     @require_permission(PermissionEnum.ROLE_READ_ALL)
     async def list_catalog(self, context: AuthContext) -> List[PermissionCatalogItem]:
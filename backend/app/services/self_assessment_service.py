@@ -2,7 +2,6 @@ from __future__ import annotations
 import logging
 from typing import Optional, List, Any
 from uuid import UUID
-from cachetools import TTLCache
 
 from ..database.repositories.self_assessment_repo import SelfAssessmentRepository
 from ..database.repositories.goal_repo import GoalRepository
@@ -26,12 +25,14 @@ from ..core.exceptions import (
     NotFoundError, PermissionDeniedError, BadRequestError, ValidationError
 )
 from .rating_rules import validate_rating_code_for_goal
+from .competency_catalog import CompetencyCatalog, thaw
+from ..core.metrics import InstrumentedTTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
 # Cache for self-assessment search results (50 items, 5-minute TTL aligned with other services)
-self_assessment_search_cache = TTLCache(maxsize=50, ttl=300)
+self_assessment_search_cache = InstrumentedTTLCache("self_assessment_search", maxsize=50, ttl=300)
 
 
 class SelfAssessmentService:
@@ -43,6 +44,7 @@ class SelfAssessmentService:
         self.goal_repo = GoalRepository(session)
         self.user_repo = UserRepository(session)
         self.competency_repo = CompetencyRepository(session)
+        self.competency_catalog = CompetencyCatalog(session)
         self.evaluation_period_repo = EvaluationPeriodRepository(session)
         self.supervisor_feedback_repo = SupervisorFeedbackRepository(session)
         self.competency_repo = CompetencyRepository(session)
@@ -83,8 +85,8 @@ class SelfAssessmentService:
             if accessible_user_ids is not None and len(accessible_user_ids) == 0:
                 return PaginatedResponse(items=[], total=0, page=pagination.page if pagination else 1, limit=pagination.limit if pagination else 0, pages=0)
 
-            # Search assessments with filters
-            assessments = await self.self_assessment_repo.search_assessments(
+            # Search assessments with filters; the total comes back with the page
+            assessments, total_count = await self.self_assessment_repo.search_assessments_page(
                 org_id=org_id,
                 user_ids=accessible_user_ids,
                 period_id=period_id,
@@ -92,19 +94,8 @@ class SelfAssessmentService:
                 pagination=pagination
             )
             
-            # Get total count for pagination
-            total_count = await self.self_assessment_repo.count_assessments(
-                org_id=org_id,
-                user_ids=accessible_user_ids,
-                period_id=period_id,
-                status=status
-            )
-            
-            # Convert to response format
-            enriched_assessments = []
-            for assessment_model in assessments:
-                enriched_assessment = await self._enrich_assessment_data(assessment_model)
-                enriched_assessments.append(enriched_assessment)
+            # Projection rows map straight into the list response model
+            enriched_assessments = [SelfAssessment.model_validate(row) for row in assessments]
             
             # Create paginated response
             if pagination:
@@ -749,11 +740,10 @@ class SelfAssessmentService:
         required_from_stage: dict[str, list[str]] = {}
 
         try:
-            stage_id = await self.user_repo.get_user_stage_id(goal.user_id, org_id)
-            if stage_id:
-                stage_competencies = await self.competency_repo.get_by_stage_id(stage_id, org_id)
-                for competency in stage_competencies:
-                    description = competency.description
+            catalog = (await self.competency_catalog.get_user_catalogs(org_id, [goal.user_id])).get(goal.user_id)
+            if catalog:
+                for competency in catalog.competencies:
+                    description = thaw(competency.description)
                     if isinstance(description, dict):
                         action_indexes = self._normalize_action_indexes(list(description.keys()))
                     elif isinstance(description, list):
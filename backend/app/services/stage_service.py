@@ -2,7 +2,6 @@ import logging
 from typing import List, Dict, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from cachetools import TTLCache
 
 from ..database.repositories.stage_repo import StageRepository
 from ..database.repositories.competency_repo import CompetencyRepository
@@ -20,6 +19,8 @@ from ..security.context import AuthContext
 from ..security.permissions import Permission
 from ..security.decorators import require_permission
 from ..core.exceptions import NotFoundError, ConflictError, BadRequestError
+from ..core.metrics import InstrumentedTTLCache
+from .competency_catalog import CompetencyCatalog, bump_catalog_version, thaw
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +28,13 @@ logger = logging.getLogger(__name__)
 class StageService:
     """Service layer for stage-related business logic and operations"""
 
-    _global_cache = TTLCache(maxsize=64, ttl=30)
+    _global_cache = InstrumentedTTLCache("stages", maxsize=64, ttl=30)
     
     def __init__(self, session: AsyncSession):
         self.session = session
         self.stage_repo = StageRepository(session)
         self.competency_repo = CompetencyRepository(session)
+        self.competency_catalog = CompetencyCatalog(session)
         # Short-lived cache for read-most admin/list endpoints
         self._cache = StageService._global_cache
     
@@ -61,12 +63,13 @@ class StageService:
             # Create new stage
             stage_model = await self.stage_repo.create(stage_data, current_user_context.organization_id)
             await self.session.commit()
+            bump_catalog_version(current_user_context.organization_id)
             await self.session.refresh(stage_model)
             
             logger.info(f"Successfully created stage: {stage_model.name}")
             
             # Get competencies for the stage (will be empty for new stage)
-            competencies = await self._get_competencies_for_stage(stage_model.id)
+            competencies = await self._get_competencies_for_stage(stage_model.id, current_user_context.organization_id)
             
             return self._map_stage_to_detail(stage_model, user_count=0, competencies=competencies)
             
@@ -102,7 +105,7 @@ class StageService:
         user_count = await self.stage_repo.count_users_by_stage(stage_id, current_user_context.organization_id)
         
         # Get competencies for the stage
-        competencies = await self._get_competencies_for_stage(stage_id)
+        competencies = await self._get_competencies_for_stage(stage_id, current_user_context.organization_id)
         
         return self._map_stage_to_detail(stage_model, user_count=user_count, competencies=competencies)
     
@@ -192,6 +195,7 @@ class StageService:
                 raise NotFoundError(f"Stage with ID {stage_id} not found")
                 
             await self.session.commit()
+            bump_catalog_version(current_user_context.organization_id)
             await self.session.refresh(updated_stage)
             
             logger.info(f"Successfully updated stage: {updated_stage.name}")
@@ -200,7 +204,7 @@ class StageService:
             user_count = await self.stage_repo.count_users_by_stage(stage_id, current_user_context.organization_id)
             
             # Get competencies for the stage
-            competencies = await self._get_competencies_for_stage(stage_id)
+            competencies = await self._get_competencies_for_stage(stage_id, current_user_context.organization_id)
             
             return self._map_stage_to_detail(updated_stage, user_count=user_count, competencies=competencies)
             
@@ -246,6 +250,7 @@ class StageService:
                 raise NotFoundError(f"Stage with ID {stage_id} not found")
             
             await self.session.commit()
+            bump_catalog_version(current_user_context.organization_id)
             logger.info(f"Successfully deleted stage with ID: {stage_id}")
             
             return {"message": "Stage deleted successfully"}
@@ -289,10 +294,11 @@ class StageService:
             )
 
             await self.session.commit()
+            bump_catalog_version(current_user_context.organization_id)
             await self.session.refresh(updated_stage)
 
             user_count = await self.stage_repo.count_users_by_stage(stage_id, current_user_context.organization_id)
-            competencies = await self._get_competencies_for_stage(stage_id)
+            competencies = await self._get_competencies_for_stage(stage_id, current_user_context.organization_id)
 
             logger.info(f"Stage weights updated for stage {stage_id} by user {current_user_context.user_id}")
             return self._map_stage_to_detail(updated_stage, user_count=user_count, competencies=competencies)
@@ -332,26 +338,27 @@ class StageService:
             for entry, actor_name, actor_employee_code in entries
         ]
     
-    async def _get_competencies_for_stage(self, stage_id: UUID) -> List[Competency]:
+    async def _get_competencies_for_stage(self, stage_id: UUID, org_id: str) -> List[Competency]:
         """
         Get all competencies for a specific stage.
         
         Args:
             stage_id: Stage UUID
+            org_id: Organization ID for scoping
             
         Returns:
             List[Competency]: List of competencies for the stage
         """
         try:
-            competency_models = await self.competency_repo.get_by_stage_id(stage_id)
+            catalog = await self.competency_catalog.get_stage_catalog(org_id, stage_id)
             
             # Convert to schema objects
             competencies = []
-            for competency_model in competency_models:
+            for competency_model in catalog.competencies:
                 competency = Competency(
                     id=competency_model.id,
                     name=competency_model.name,
-                    description=competency_model.description,
+                    description=thaw(competency_model.description),
                     stage_id=competency_model.stage_id,
                     created_at=competency_model.created_at,
                     updated_at=competency_model.updated_at
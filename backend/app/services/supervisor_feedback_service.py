@@ -2,7 +2,6 @@ from __future__ import annotations
 import logging
 from typing import Optional
 from uuid import UUID
-from cachetools import TTLCache
 
 from ..database.repositories.supervisor_feedback_repo import SupervisorFeedbackRepository
 from ..database.repositories.self_assessment_repo import SelfAssessmentRepository
@@ -28,12 +27,13 @@ from ..core.exceptions import (
     NotFoundError, PermissionDeniedError, BadRequestError, ValidationError, ConflictError
 )
 from .rating_rules import validate_rating_code_for_goal
+from ..core.metrics import InstrumentedTTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
 # Cache for supervisor feedback search results (50 items, 5-minute TTL aligned with other services)
-supervisor_feedback_search_cache = TTLCache(maxsize=50, ttl=300)
+supervisor_feedback_search_cache = InstrumentedTTLCache("supervisor_feedback_search", maxsize=50, ttl=300)
 
 
 class SupervisorFeedbackService:
@@ -142,8 +142,8 @@ class SupervisorFeedbackService:
                     if accessible_user_ids is not None:
                         final_user_ids = accessible_user_ids
 
-            # Search feedbacks with filters (org-scoped)
-            feedbacks = await self.supervisor_feedback_repo.search_feedbacks(
+            # Search feedbacks with filters (org-scoped); the total comes back with the page
+            feedbacks, total_count = await self.supervisor_feedback_repo.search_feedbacks_page(
                 org_id=org_id,
                 supervisor_ids=final_supervisor_ids,
                 user_ids=final_user_ids,
@@ -153,23 +153,9 @@ class SupervisorFeedbackService:
                 has_return_comment=has_return_comment,
                 pagination=pagination
             )
-
-            # Get total count for pagination (org-scoped)
-            total_count = await self.supervisor_feedback_repo.count_feedbacks(
-                org_id=org_id,
-                supervisor_ids=final_supervisor_ids,
-                user_ids=final_user_ids,
-                period_id=period_id,
-                status=status,
-                action=action,
-                has_return_comment=has_return_comment
-            )
             
-            # Convert to response format
-            enriched_feedbacks = []
-            for feedback_model in feedbacks:
-                enriched_feedback = await self._enrich_feedback_data(feedback_model)
-                enriched_feedbacks.append(enriched_feedback)
+            # Projection rows map straight into the list response model
+            enriched_feedbacks = [SupervisorFeedback.model_validate(row) for row in feedbacks]
             
             # Create paginated response
             if pagination:
@@ -0,0 +1,319 @@
+"""
+Batch recomputation of ``supervisor_feedback.supervisor_rating``.
+
+``supervisor_rating`` is derived from the organization's ``evaluation_score_mapping``
+(see ``SupervisorFeedbackRepository``): a single ``supervisor_rating_code`` maps directly,
+competency ``rating_data`` uses the 2-step average (per-competency mean, then the mean of
+those). When an org's mapping changes, every stored rating has to be recomputed; so far
+that was done with one-off SQL migrations (018, 020, 029) or per-row repository calls that
+issue one mapping query per action code.
+
+``SupervisorRatingRecomputeEngine`` does it per organization:
+
+    1. load the org's active mapping once (legacy ``RATING_CODE_VALUES`` as fallback)
+    2. stream feedback rows in ``id`` keyset order, ``chunk_size`` at a time
+    3. compute ratings in memory and keep only rows whose value changes
+    4. write the chunk back with one ``UPDATE ... FROM (VALUES ...)`` and commit
+
+Each chunk commits on its own and reports its last ``id`` through ``on_checkpoint`` so an
+interrupted run can resume from the cursor. Writes are guarded by ``IS DISTINCT FROM``,
+so rerunning from scratch is also safe, only slower.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..schemas.common import RATING_CODE_VALUES, RatingCode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+# Two bind parameters per row; stay well below asyncpg's 32767 limit.
+MAX_CHUNK_SIZE = 10000
+
+_TWO_PLACES = Decimal("0.01")
+
+
+def _normalize_code(raw_code: Any) -> Optional[RatingCode]:
+    if isinstance(raw_code, RatingCode):
+        return raw_code
+    if not isinstance(raw_code, str):
+        return None
+    normalized = raw_code.strip().upper()
+    if not normalized:
+        return None
+    try:
+        return RatingCode(normalized)
+    except ValueError:
+        return None
+
+
+def rating_for_code(rating_code: Any, scores: Mapping[RatingCode, Decimal]) -> Optional[Decimal]:
+    """Mapped score for a single rating code, or None when the code is unknown."""
+    code = _normalize_code(rating_code)
+    if code is None:
+        return None
+    return scores.get(code)
+
+
+def rating_from_rating_data(
+    rating_data: Any,
+    scores: Mapping[RatingCode, Decimal],
+) -> Optional[Decimal]:
+    """
+    In-memory equivalent of ``SupervisorFeedbackRepository._calculate_supervisor_rating_from_rating_data``:
+    average action scores within each competency, then average the competencies.
+    """
+    if not isinstance(rating_data, dict) or not rating_data:
+        return None
+
+    competency_scores: List[Decimal] = []
+    for ratings_by_action in rating_data.values():
+        if not isinstance(ratings_by_action, dict) or not ratings_by_action:
+            continue
+        action_scores = [
+            scores[code]
+            for code in (_normalize_code(raw) for raw in ratings_by_action.values())
+            if code is not None and code in scores
+        ]
+        if action_scores:
+            competency_scores.append(sum(action_scores, Decimal("0")) / Decimal(len(action_scores)))
+
+    if not competency_scores:
+        return None
+
+    average = sum(competency_scores, Decimal("0")) / Decimal(len(competency_scores))
+    return average.quantize(_TWO_PLACES)
+
+
+def compute_supervisor_rating(
+    rating_code: Optional[str],
+    rating_data: Any,
+    scores: Mapping[RatingCode, Decimal],
+) -> Optional[Decimal]:
+    """Rating the repository would store for this feedback: code first, then rating_data."""
+    if rating_code:
+        return rating_for_code(rating_code, scores)
+    return rating_from_rating_data(rating_data, scores)
+
+
+@dataclass(frozen=True)
+class RatingChange:
+    feedback_id: UUID
+    old_rating: Optional[Decimal]
+    new_rating: Decimal
+
+
+@dataclass
+class RecomputeStats:
+    """Counters for one run; ``rows_per_second`` covers scanning, computing and writing."""
+
+    dry_run: bool
+    organizations: int = 0
+    scanned: int = 0
+    changed: int = 0
+    updated: int = 0
+    skipped: int = 0
+    chunks: int = 0
+    elapsed_seconds: float = 0.0
+    changes: List[RatingChange] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.scanned / self.elapsed_seconds
+
+
+CheckpointCallback = Callable[[str, Optional[UUID]], Awaitable[None]]
+
+
+class SupervisorRatingRecomputeEngine:
+    """Recomputes supervisor ratings for one or more organizations in keyset-ordered chunks."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        dry_run: bool = True,
+        max_recorded_changes: int = 100,
+    ):
+        if chunk_size < 1 or chunk_size > MAX_CHUNK_SIZE:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_CHUNK_SIZE}")
+        self.session = session
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+        self.max_recorded_changes = max_recorded_changes
+
+    async def list_organization_ids(self) -> List[str]:
+        result = await self.session.execute(text("SELECT id FROM organizations ORDER BY id"))
+        return [row[0] for row in result.all()]
+
+    async def load_score_mapping(self, org_id: str) -> Dict[RatingCode, Decimal]:
+        """Active org mapping merged over the legacy fallback values, validated to 0-100."""
+        scores = {code: Decimal(str(value)) for code, value in RATING_CODE_VALUES.items()}
+        result = await self.session.execute(
+            text(
+                """
+                SELECT rating_code, score_value
+                FROM evaluation_score_mapping
+                WHERE organization_id = :org_id AND is_active IS TRUE
+                """
+            ),
+            {"org_id": org_id},
+        )
+        for rating_code, score_value in result.all():
+            code = _normalize_code(rating_code)
+            if code is None or score_value is None:
+                continue
+            value = Decimal(str(score_value))
+            if value < Decimal("0") or value > Decimal("100"):
+                raise ValueError(
+                    f"Mapped score {value} for rating code {code.value} in org {org_id} is outside 0-100"
+                )
+            scores[code] = value
+        return scores
+
+    async def run(
+        self,
+        org_ids: Sequence[str],
+        *,
+        start_after: Optional[Tuple[str, UUID]] = None,
+        on_checkpoint: Optional[CheckpointCallback] = None,
+    ) -> RecomputeStats:
+        """
+        Recompute every org in ``org_ids`` (in order).
+
+        ``start_after=(org_id, feedback_id)`` resumes inside that org; orgs listed before it
+        are treated as done. ``on_checkpoint(org_id, last_id)`` is awaited after each chunk
+        and with ``last_id=None`` when an org completes.
+        """
+        stats = RecomputeStats(dry_run=self.dry_run)
+        started = time.perf_counter()
+
+        org_ids = list(org_ids)
+        if start_after is not None:
+            resume_org, _ = start_after
+            if resume_org in org_ids:
+                org_ids = org_ids[org_ids.index(resume_org):]
+
+        for org_id in org_ids:
+            after_id = start_after[1] if start_after and start_after[0] == org_id else None
+            await self._run_org(org_id, after_id, stats, on_checkpoint)
+            stats.organizations += 1
+            if on_checkpoint is not None:
+                await on_checkpoint(org_id, None)
+
+        stats.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            "supervisor_rating_recompute.completed",
+            extra={
+                "event": "supervisor_rating_recompute.completed",
+                "dry_run": self.dry_run,
+                "organizations": stats.organizations,
+                "scanned": stats.scanned,
+                "changed": stats.changed,
+                "updated": stats.updated,
+                "rows_per_second": round(stats.rows_per_second, 1),
+            },
+        )
+        return stats
+
+    async def _run_org(
+        self,
+        org_id: str,
+        after_id: Optional[UUID],
+        stats: RecomputeStats,
+        on_checkpoint: Optional[CheckpointCallback],
+    ) -> None:
+        scores = await self.load_score_mapping(org_id)
+
+        while True:
+            rows = await self._fetch_chunk(org_id, after_id)
+            if not rows:
+                break
+
+            changes: List[RatingChange] = []
+            for row in rows:
+                new_rating = compute_supervisor_rating(row["supervisor_rating_code"], row["rating_data"], scores)
+                if new_rating is None:
+                    # Nothing derivable (no code, empty rating_data): leave the stored value alone.
+                    stats.skipped += 1
+                    continue
+                old_rating = row["supervisor_rating"]
+                old_value = Decimal(str(old_rating)).quantize(_TWO_PLACES) if old_rating is not None else None
+                if old_value != new_rating:
+                    changes.append(RatingChange(row["id"], old_value, new_rating))
+
+            stats.scanned += len(rows)
+            stats.changed += len(changes)
+            stats.chunks += 1
+            room = self.max_recorded_changes - len(stats.changes)
+            if room > 0:
+                stats.changes.extend(changes[:room])
+
+            if changes and not self.dry_run:
+                stats.updated += await self._write_chunk(changes)
+                await self.session.commit()
+
+            after_id = rows[-1]["id"]
+            if on_checkpoint is not None:
+                await on_checkpoint(org_id, after_id)
+            if len(rows) < self.chunk_size:
+                break
+
+    async def _fetch_chunk(self, org_id: str, after_id: Optional[UUID]) -> List[Mapping[str, Any]]:
+        keyset = "AND sf.id > :after_id" if after_id is not None else ""
+        result = await self.session.execute(
+            text(
+                f"""
+                SELECT sf.id, sf.supervisor_rating_code, sf.rating_data, sf.supervisor_rating
+                FROM supervisor_feedback sf
+                JOIN users u ON u.id = sf.supervisor_id
+                WHERE u.clerk_organization_id = :org_id
+                  AND (sf.supervisor_rating_code IS NOT NULL OR sf.rating_data IS NOT NULL)
+                  {keyset}
+                ORDER BY sf.id
+                LIMIT :limit
+                """
+            ),
+            {"org_id": org_id, "after_id": after_id, "limit": self.chunk_size},
+        )
+        return list(result.mappings().all())
+
+    async def _write_chunk(self, changes: Sequence[RatingChange]) -> int:
+        statement, params = build_bulk_update(changes)
+        result = await self.session.execute(statement, params)
+        return result.rowcount if result.rowcount is not None and result.rowcount >= 0 else len(changes)
+
+
+def build_bulk_update(changes: Sequence[RatingChange]):
+    """One ``UPDATE ... FROM (VALUES ...)`` statement for a chunk of changes."""
+    values = []
+    params: Dict[str, Any] = {}
+    for index, change in enumerate(changes):
+        values.append(f"(CAST(:id_{index} AS uuid), CAST(:rating_{index} AS numeric))")
+        params[f"id_{index}"] = change.feedback_id
+        params[f"rating_{index}"] = change.new_rating
+
+    statement = text(
+        f"""
+        UPDATE supervisor_feedback AS sf
+        SET supervisor_rating = v.rating,
+            updated_at = NOW()
+        FROM (VALUES {", ".join(values)}) AS v(id, rating)
+        WHERE sf.id = v.id
+          AND sf.supervisor_rating IS DISTINCT FROM v.rating
+        """
+    )
+    return statement, params
@@ -152,7 +152,7 @@ class SupervisorReviewService:
             # Branch by RBACHelper result
             if accessible_user_ids is None:
                 # Admin: access to all users
-                items = await self.repo.search(
+                items, total = await self.repo.search_page(
                     org_id,
                     period_id=period_id,
                     goal_id=goal_id,
@@ -160,16 +160,9 @@ class SupervisorReviewService:
                     status=status,
                     pagination=pagination,
                 )
-                total = await self.repo.count_all(
-                    org_id,
-                    period_id=period_id,
-                    goal_id=goal_id,
-                    subordinate_id=subordinate_id,
-                    status=status,
-                )
             elif len(accessible_user_ids) == 1 and accessible_user_ids[0] == current_user_context.user_id:
                 # Employee: only their own goals -> use goal-owner path
-                items = await self.repo.get_for_goal_owner(
+                items, total = await self.repo.get_for_goal_owner_page(
                     owner_user_id=current_user_context.user_id,
                     org_id=org_id,
                     period_id=period_id,
@@ -177,16 +170,9 @@ class SupervisorReviewService:
                     status=status,
                     pagination=pagination,
                 )
-                total = await self.repo.count_for_goal_owner(
-                    owner_user_id=current_user_context.user_id,
-                    org_id=org_id,
-                    period_id=period_id,
-                    goal_id=goal_id,
-                    status=status,
-                )
             else:
                 # Supervisor/manager: has subordinates (list includes subordinates + self)
-                items = await self.repo.get_by_supervisor(
+                items, total = await self.repo.get_by_supervisor_page(
                     current_user_context.user_id,
                     org_id,
                     period_id=period_id,
@@ -195,18 +181,8 @@ class SupervisorReviewService:
                     status=status,
                     pagination=pagination,
                 )
-                total = await self.repo.count_by_supervisor(
-                    current_user_context.user_id,
-                    org_id,
-                    period_id=period_id,
-                    goal_id=goal_id,
-                    subordinate_id=subordinate_id,
-                    status=status,
-                )
 
-            schemas = [
-                SupervisorReviewSchema.model_validate(r, from_attributes=True) for r in items
-            ]
+            schemas = [SupervisorReviewSchema.model_validate(row) for row in items]
             pages = (total + pagination.limit - 1) // pagination.limit
             return PaginatedResponse(
                 items=schemas, total=total, page=pagination.page, limit=pagination.limit, pages=pages
@@ -230,20 +206,14 @@ class SupervisorReviewService:
         if not org_id:
             raise PermissionDeniedError("Organization context required")
 
-        items = await self.repo.get_pending_reviews(
+        items, total = await self.repo.get_pending_reviews_page(
             current_user_context.user_id,
             org_id,
             period_id=period_id,
             subordinate_id=subordinate_id,
             pagination=pagination,
         )
-        total = await self.repo.count_pending_reviews(
-            current_user_context.user_id,
-            org_id,
-            period_id=period_id,
-            subordinate_id=subordinate_id,
-        )
-        schemas = [SupervisorReviewSchema.model_validate(r, from_attributes=True) for r in items]
+        schemas = [SupervisorReviewSchema.model_validate(row) for row in items]
         items_out: list[SupervisorReviewSchema | SupervisorReviewWithContext] = schemas
 
         include_set = {part.strip().lower() for part in include or set() if part.strip()}
@@ -0,0 +1,365 @@
+"""
+Bulk user import from CSV.
+
+Onboarding through ``UserService.create_user`` costs several validation queries, role
+and supervisor inserts and a synchronous Clerk call per employee. The import instead:
+
+1. streams the CSV and validates every row in memory against the organization's
+   departments, stages, roles and users, which are loaded up front in a few queries;
+2. writes users, ``user_roles`` and ``users_supervisors`` with multi-row upserts in
+   chunks of ``IMPORT_CHUNK_SIZE`` rows, all in one transaction;
+3. queues the Clerk metadata updates on the rate-limited ``clerk_sync_queue``.
+
+Rows are matched to existing users by ``employee_code``. Rows with errors are reported
+per CSV line and skipped; every other row is imported. Unknown departments are created,
+unknown stages and roles are row errors.
+"""
+
+import codecs
+import csv
+import io
+import logging
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.exceptions import BadRequestError, PermissionDeniedError
+from ..database.repositories.department_repo import DepartmentRepository
+from ..database.repositories.role_repo import RoleRepository
+from ..database.repositories.stage_repo import StageRepository
+from ..database.repositories.user_import_repo import UserImportRepository
+from ..schemas.user import UserImportResponse, UserImportRow, UserImportRowError, UserStatus
+from ..security.context import AuthContext
+from .clerk_sync_queue import ClerkSyncQueue, clerk_sync_queue
+from .user_service import user_detail_cache, user_search_cache
+
+logger = logging.getLogger(__name__)
+
+IMPORT_COLUMNS = (
+    "employee_code",
+    "name",
+    "email",
+    "clerk_user_id",
+    "job_title",
+    "department",
+    "stage",
+    "roles",
+    "supervisor_employee_code",
+    "status",
+)
+REQUIRED_IMPORT_COLUMNS = ("employee_code", "name", "email", "clerk_user_id")
+ROLE_SEPARATOR = ";"
+IMPORT_CHUNK_SIZE = 1000
+MAX_IMPORT_ROWS = 20000
+
+
+@dataclass
+class _ImportRow:
+    line: int
+    values: Dict[str, Any]
+    row: Optional[UserImportRow] = None
+    errors: List[str] = field(default_factory=list)
+    user_id: Optional[UUID] = None
+    existing_status: Optional[str] = None
+
+    @property
+    def employee_code(self) -> Optional[str]:
+        return self.row.employee_code if self.row else self.values.get("employee_code")
+
+    @property
+    def effective_status(self) -> str:
+        if self.row and self.row.status:
+            return self.row.status.value
+        return self.existing_status or UserStatus.ACTIVE.value
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class UserImportService:
+    """Validates a user CSV in memory and writes it with set-based statements."""
+
+    def __init__(self, session: AsyncSession, sync_queue: ClerkSyncQueue = clerk_sync_queue):
+        self.session = session
+        self.sync_queue = sync_queue
+        self.import_repo = UserImportRepository(session)
+        self.department_repo = DepartmentRepository(session)
+        self.stage_repo = StageRepository(session)
+        self.role_repo = RoleRepository(session)
+
+    async def import_users_csv(
+        self,
+        file: BinaryIO,
+        current_user_context: AuthContext,
+        *,
+        encoding: str = "utf-8-sig",
+        dry_run: bool = False,
+    ) -> UserImportResponse:
+        """Import users from a CSV file; ``dry_run`` validates and reports without writing."""
+        current_user_context.require_role("admin")
+        org_id = current_user_context.organization_id
+        if not org_id:
+            raise PermissionDeniedError("Organization context required")
+
+        rows: List[_ImportRow] = []
+        for row in self._read_rows(file, encoding):
+            if len(rows) == MAX_IMPORT_ROWS:
+                raise BadRequestError(f"Cannot import more than {MAX_IMPORT_ROWS} users at once")
+            rows.append(row)
+        if not rows:
+            raise BadRequestError("CSV contains no user rows")
+
+        valid_rows = [row for row in rows if row.row is not None]
+        self._check_duplicates(valid_rows)
+
+        departments = {department.name: department.id for department in await self.department_repo.get_all(org_id)}
+        stages = {stage.name: stage.id for stage in await self.stage_repo.get_all(org_id)}
+        roles = {role.name.lower(): role for role in await self.role_repo.get_all(org_id)}
+        owners = await self.import_repo.find_identity_owners(
+            employee_codes=sorted(
+                {row.row.employee_code for row in valid_rows}
+                | {row.row.supervisor_employee_code for row in valid_rows if row.row.supervisor_employee_code}
+            ),
+            emails=sorted({row.row.email for row in valid_rows}),
+            clerk_user_ids=sorted({row.row.clerk_user_id for row in valid_rows}),
+        )
+
+        self._check_identities(valid_rows, owners, org_id)
+        self._check_lookups(valid_rows, stages, roles)
+        supervisors = self._resolve_supervisors(valid_rows, owners, org_id)
+
+        importable = [row for row in valid_rows if not row.errors]
+        new_departments = sorted(
+            {row.row.department for row in importable if row.row.department and row.row.department not in departments}
+        )
+        created_count = sum(1 for row in importable if row.user_id is None)
+        clerk_sync_queued = 0
+
+        if importable and not dry_run:
+            try:
+                ensured = await self.import_repo.ensure_departments(org_id, new_departments)
+                departments.update({name: department_id for name, (department_id, _) in ensured.items()})
+                new_departments = sorted(name for name, (_, created) in ensured.items() if created)
+
+                for row in importable:
+                    if row.user_id is None:
+                        row.user_id = uuid4()
+
+                for chunk in _chunks(importable, IMPORT_CHUNK_SIZE):
+                    await self.import_repo.upsert_users(
+                        org_id, [self._user_values(row, departments, stages) for row in chunk]
+                    )
+
+                role_rows = [row for row in importable if row.row.roles]
+                for chunk in _chunks(role_rows, IMPORT_CHUNK_SIZE):
+                    await self.import_repo.replace_user_roles(
+                        {row.user_id: [roles[name.lower()].id for name in row.row.roles] for row in chunk}
+                    )
+
+                supervised_rows = [row for row in importable if row.line in supervisors]
+                for chunk in _chunks(supervised_rows, IMPORT_CHUNK_SIZE):
+                    await self.import_repo.replace_supervisors(
+                        {row.user_id: self._supervisor_id(supervisors[row.line]) for row in chunk}
+                    )
+
+                await self.session.commit()
+            except Exception:
+                await self.session.rollback()
+                raise
+
+            user_search_cache.clear()
+            user_detail_cache.clear()
+            for row in importable:
+                metadata: Dict[str, Any] = {"users_table_id": str(row.user_id), "profile_completed": True}
+                if row.row.roles:
+                    metadata["roles"] = [roles[name.lower()].name for name in row.row.roles]
+                self.sync_queue.enqueue_metadata_update(row.row.clerk_user_id, metadata)
+            clerk_sync_queued = len(importable)
+            logger.info(f"Imported {len(importable)} users into org {org_id} ({created_count} created)")
+
+        errors = [
+            UserImportRowError(row=row.line, employeeCode=row.employee_code, errors=row.errors)
+            for row in rows
+            if row.errors
+        ]
+        return UserImportResponse(
+            dryRun=dry_run,
+            totalRows=len(rows),
+            createdCount=created_count,
+            updatedCount=len(importable) - created_count,
+            failedCount=len(errors),
+            createdDepartments=new_departments,
+            clerkSyncQueued=clerk_sync_queued,
+            errors=errors,
+        )
+
+    # ------------------------------------------------------------------
+    # Parsing
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _read_rows(file: BinaryIO, encoding: str) -> Iterator[_ImportRow]:
+        try:
+            codecs.lookup(encoding)
+        except LookupError as exc:
+            raise BadRequestError(f"Unknown encoding: {encoding}") from exc
+
+        stream = io.TextIOWrapper(file, encoding=encoding, newline="")
+        try:
+            reader = csv.DictReader(stream)
+            header = [column.strip() for column in reader.fieldnames or []]
+            unknown = [column for column in header if column not in IMPORT_COLUMNS]
+            if unknown:
+                raise BadRequestError(f"Unknown columns: {', '.join(unknown)}")
+            missing = [column for column in REQUIRED_IMPORT_COLUMNS if column not in header]
+            if missing:
+                raise BadRequestError(f"Missing required columns: {', '.join(missing)}")
+            reader.fieldnames = header
+
+            for record in reader:
+                values: Dict[str, Any] = {}
+                for column, cell in record.items():
+                    cell = (cell or "").strip() if column is not None else ""
+                    if cell:
+                        values[column] = cell
+                if not values:
+                    continue
+                if "roles" in values:
+                    values["roles"] = [name.strip() for name in values["roles"].split(ROLE_SEPARATOR) if name.strip()]
+
+                item = _ImportRow(line=reader.line_num, values=values)
+                if None in record:
+                    item.errors.append("Row has more cells than the header")
+                else:
+                    try:
+                        item.row = UserImportRow.model_validate(values)
+                    except ValidationError as exc:
+                        item.errors.extend(
+                            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()
+                        )
+                yield item
+        except UnicodeDecodeError as exc:
+            raise BadRequestError(f"CSV is not valid {encoding}") from exc
+        finally:
+            stream.detach()
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _check_duplicates(rows: Sequence[_ImportRow]) -> None:
+        for column in ("employee_code", "email", "clerk_user_id"):
+            first_line: Dict[str, int] = {}
+            for row in rows:
+                value = getattr(row.row, column)
+                if value in first_line:
+                    row.errors.append(f"Duplicate {column} (same as line {first_line[value]})")
+                else:
+                    first_line[value] = row.line
+
+    @staticmethod
+    def _check_identities(rows: Sequence[_ImportRow], owners: Sequence[Dict[str, Any]], org_id: str) -> None:
+        by_code = {owner["employee_code"]: owner for owner in owners}
+        by_email = {owner["email"]: owner for owner in owners}
+        by_clerk_id = {owner["clerk_user_id"]: owner for owner in owners}
+
+        for row in rows:
+            existing = by_code.get(row.row.employee_code)
+            if existing is not None:
+                if existing["clerk_organization_id"] != org_id:
+                    row.errors.append("employee_code is used in another organization")
+                    continue
+                if existing["clerk_user_id"] != row.row.clerk_user_id:
+                    row.errors.append("clerk_user_id does not match the existing user")
+                row.user_id = existing["id"]
+                row.existing_status = existing["status"]
+
+            for column, lookup in (("email", by_email), ("clerk_user_id", by_clerk_id)):
+                owner = lookup.get(getattr(row.row, column))
+                if owner is not None and owner["id"] != row.user_id:
+                    row.errors.append(f"{column} is already used by another user")
+
+    @staticmethod
+    def _check_lookups(rows: Sequence[_ImportRow], stages: Dict[str, UUID], roles: Dict[str, Any]) -> None:
+        for row in rows:
+            if row.row.stage and row.row.stage not in stages:
+                row.errors.append(f"Unknown stage: {row.row.stage}")
+            for name in row.row.roles:
+                if name.lower() not in roles:
+                    row.errors.append(f"Unknown role: {name}")
+
+    @staticmethod
+    def _resolve_supervisors(
+        rows: Sequence[_ImportRow],
+        owners: Sequence[Dict[str, Any]],
+        org_id: str,
+    ) -> Dict[int, Any]:
+        """
+        Map line -> supervisor (an _ImportRow of this file or an existing user record).
+
+        A supervisor listed in the file must be importable itself, so rows are re-checked
+        until no further row fails; an existing user is used when its own row has errors.
+        """
+        by_code = {row.row.employee_code: row for row in rows}
+        org_users = {
+            owner["employee_code"]: owner for owner in owners if owner["clerk_organization_id"] == org_id
+        }
+        supervisors: Dict[int, Any] = {}
+
+        changed = True
+        while changed:
+            changed = False
+            for row in rows:
+                code = row.row.supervisor_employee_code
+                if row.errors or not code:
+                    continue
+
+                error: Optional[str] = None
+                candidate = by_code.get(code)
+                if code == row.row.employee_code:
+                    error = "A user cannot be their own supervisor"
+                elif candidate is not None and not candidate.errors:
+                    if candidate.effective_status != UserStatus.ACTIVE.value:
+                        error = f"Supervisor {code} is not active"
+                    supervisors[row.line] = candidate
+                elif code in org_users:
+                    if org_users[code]["status"] != UserStatus.ACTIVE.value:
+                        error = f"Supervisor {code} is not active"
+                    supervisors[row.line] = org_users[code]
+                elif candidate is not None:
+                    error = f"Supervisor {code} (line {candidate.line}) has errors"
+                else:
+                    error = f"Unknown supervisor employee_code: {code}"
+
+                if error:
+                    row.errors.append(error)
+                    supervisors.pop(row.line, None)
+                    changed = True
+        return supervisors
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _user_values(row: _ImportRow, departments: Dict[str, UUID], stages: Dict[str, UUID]) -> Dict[str, Any]:
+        is_new = row.existing_status is None
+        status = row.row.status or (UserStatus.ACTIVE if is_new else None)
+        return {
+            "id": row.user_id,
+            "clerk_user_id": row.row.clerk_user_id,
+            "employee_code": row.row.employee_code,
+            "name": row.row.name,
+            "email": row.row.email,
+            "status": status.value if status else None,
+            "department_id": departments.get(row.row.department) if row.row.department else None,
+            "stage_id": stages.get(row.row.stage) if row.row.stage else None,
+            "job_title": row.row.job_title,
+        }
+
+    @staticmethod
+    def _supervisor_id(supervisor: Any) -> UUID:
+        return supervisor.user_id if isinstance(supervisor, _ImportRow) else supervisor["id"]
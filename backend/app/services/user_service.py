@@ -3,10 +3,10 @@ import logging
 from typing import Optional, Dict, Any, Set
 from uuid import UUID
 from datetime import date
-from cachetools import TTLCache
 import asyncio
 
 from .clerk_service import ClerkService
+from .user_enrichment import UserEnrichmentEngine
 from ..database.repositories.user_repo import UserRepository
 from ..database.repositories.department_repo import DepartmentRepository
 from ..database.repositories.stage_repo import StageRepository
@@ -16,10 +16,10 @@ from ..security.decorators import require_permission
 from ..security.rbac_types import ResourceType
 from ..database.models.user import User as UserModel, UserSupervisor
 from ..schemas.user import (
-    UserCreate, UserUpdate, UserStageUpdate, User, UserDetailResponse, UserInDB, SimpleUser,
-    Department, Stage, Role, UserStatus, UserExistsResponse, UserClerkIdUpdate,
+    UserCreate, UserUpdate, UserStageUpdate, UserDetailResponse, SimpleUser,
+    UserStatus, UserExistsResponse, UserClerkIdUpdate,
     BulkUserStatusUpdateItem, BulkUserStatusUpdateResult, BulkUserStatusUpdateResponse,
-    UserGoalWeightUpdate, UserGoalWeightHistoryEntry, GoalWeightBudget
+    UserGoalWeightUpdate, UserGoalWeightHistoryEntry
 )
 from ..schemas.common import PaginationParams, PaginatedResponse
 from ..security.context import AuthContext
@@ -27,15 +27,16 @@ from ..security.permissions import Permission
 from ..core.exceptions import (
     NotFoundError, ConflictError, PermissionDeniedError, BadRequestError
 )
+from ..core.metrics import InstrumentedTTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import delete
 
 logger = logging.getLogger(__name__)
 
 # Cache for user search results (100 items, 30-second TTL for faster hierarchy updates)
-user_search_cache = TTLCache(maxsize=100, ttl=30)
+user_search_cache = InstrumentedTTLCache("user_search", maxsize=100, ttl=30)
 # Cache for user detail responses to reduce repeated detail lookups in dashboards
-user_detail_cache = TTLCache(maxsize=256, ttl=30)
+user_detail_cache = InstrumentedTTLCache("user_detail", maxsize=256, ttl=30)
 
 
 
@@ -49,6 +50,7 @@ class UserService:
         self.department_repo = DepartmentRepository(session)
         self.stage_repo = StageRepository(session)
         self.role_repo = RoleRepository(session)
+        self.enrichment = UserEnrichmentEngine(session)
         
         # Initialize RBACHelper with user repository for standardized permissions
         RBACHelper.initialize_with_repository(self.user_repo)
@@ -71,7 +73,7 @@ class UserService:
         try:
             
             # Use RBACHelper for standardized permission-based access control
-            user_ids_to_filter = await RBACHelper.get_accessible_user_ids(
+            accessible_scope = await RBACHelper.get_accessible_user_scope(
                 current_user_context
             )
             
@@ -83,7 +85,7 @@ class UserService:
                 "stage_ids": sorted([str(s) for s in stage_ids]) if stage_ids else None,
                 "role_ids": sorted([str(r) for r in role_ids]) if role_ids else None,
                 "supervisor_id": str(supervisor_id) if supervisor_id else None, 
-                "user_ids": sorted([str(u) for u in user_ids_to_filter]) if user_ids_to_filter else None,
+                "user_scope": accessible_scope.cache_key,
                 "pagination": f"{pagination.page}_{pagination.limit}" if pagination else None,
                 "requesting_user_roles": sorted(current_user_context.role_names)
             }
@@ -98,20 +100,16 @@ class UserService:
             org_id = current_user_context.organization_id
             
             # Handle supervisor_id filtering specifically
-            final_user_ids_to_filter = user_ids_to_filter
+            final_user_ids_to_filter = accessible_scope
             if supervisor_id:
                 # Get subordinates of the specified supervisor (org-scoped)
                 subordinate_users = await self.user_repo.get_subordinates(supervisor_id, org_id)
-                subordinate_ids = [user.id for user in subordinate_users]
                 
-                # If we already have user_ids_to_filter, intersect them
-                if final_user_ids_to_filter:
-                    final_user_ids_to_filter = list(set(final_user_ids_to_filter) & set(subordinate_ids))
-                else:
-                    final_user_ids_to_filter = subordinate_ids
+                # Intersect with the caller's scope
+                final_user_ids_to_filter = accessible_scope.restrict_to(user.id for user in subordinate_users)
             
             # Get data from repository with organization filtering
-            users = await self.user_repo.search_users(
+            users, total_count = await self.user_repo.search_users_page(
                 search_term=search_term,
                 statuses=statuses,
                 department_ids=department_ids,
@@ -122,25 +120,13 @@ class UserService:
                 org_id=org_id  # Automatic organization filtering
             )
             
-            total_count = await self.user_repo.count_users(
-                search_term=search_term,
-                statuses=statuses,
-                department_ids=department_ids,
-                stage_ids=stage_ids,
-                role_ids=role_ids,
-                user_ids=final_user_ids_to_filter,
-                org_id=org_id  # Automatic organization filtering
-            )
-            
-            # Enrich users with detailed data including supervisor/subordinates
+            # Enrich the whole page with supervisor/subordinates in a fixed number of queries
             can_view_level = current_user_context.has_role("eval_admin")
-            enriched_users = []
-            for user_model in users:
-                enriched_user = await self._enrich_detailed_user_data(
-                    user_model,
-                    include_level=can_view_level,
-                )
-                enriched_users.append(enriched_user)
+            enriched_users = await self.enrichment.enrich_detailed(
+                users,
+                org_id,
+                include_level=can_view_level,
+            )
             
             # Create paginated response
             total_pages = (total_count + pagination.limit - 1) // pagination.limit if pagination else 1
@@ -197,7 +183,6 @@ class UserService:
                 subordinate_users = await self.user_repo.get_subordinates(supervisor_id, org_id)
                 user_ids_to_filter = [user.id for user in subordinate_users]
             
-            # Use efficient repository method with joins
             users = await self.user_repo.get_users_for_org_chart(
                 org_id,
                 department_ids=department_ids,
@@ -205,7 +190,8 @@ class UserService:
                 user_ids=user_ids_to_filter
             )
             
-            return users
+            # Departments and roles for all users in two batched queries
+            return await self.enrichment.enrich_simple(users, org_id)
             
         except Exception as e:
             logger.error(f"Error in get_users_for_organization_chart: {e}")
@@ -1084,39 +1070,6 @@ class UserService:
     
     # Private helper methods
 
-    def _build_goal_weight_budget(
-        self,
-        user: UserModel,
-        stage: Optional[Stage]
-    ) -> Optional[GoalWeightBudget]:
-        override_values = (
-            user.quantitative_weight_override,
-            user.qualitative_weight_override,
-            user.competency_weight_override,
-        )
-        has_override = all(value is not None for value in override_values)
-
-        if has_override:
-            return GoalWeightBudget(
-                quantitative=float(user.quantitative_weight_override),
-                qualitative=float(user.qualitative_weight_override),
-                competency=float(user.competency_weight_override),
-                source="user",
-            )
-
-        if stage:
-            quantitative = getattr(stage, "quantitative_weight", None)
-            qualitative = getattr(stage, "qualitative_weight", None)
-            competency = getattr(stage, "competency_weight", None)
-            return GoalWeightBudget(
-                quantitative=float(quantitative or 0),
-                qualitative=float(qualitative or 0),
-                competency=float(competency or 0),
-                source="stage",
-            )
-
-        return None
-
     def _invalidate_user_caches(self, org_id: str, user_id: UUID) -> None:
         """Invalidate local user caches that might contain stale data."""
         keys_to_delete = [
@@ -1253,78 +1206,15 @@ class UserService:
                 raise BadRequestError(f"Department with ID {user_data.department_id} does not exist")
         
     
-    async def _enrich_user_data(self, user: UserModel) -> User:
-        """Enrich user data with relationships using repository pattern"""
-        # Get department using repository
-        department_model = await self.department_repo.get_by_id(user.department_id, user.clerk_organization_id)
-        if not department_model:
-            # Create a fallback department if not found
-            department = Department(
-                id=user.department_id,
-                name="Unknown Department",
-                description="Department not found"
-            )
-        else:
-            department = Department.model_validate(department_model, from_attributes=True)
-        
-        # Get stage using repository
-        stage_model = await self.stage_repo.get_by_id(user.stage_id, user.clerk_organization_id)
-        if not stage_model:
-            # Create a fallback stage if not found
-            stage = Stage(
-                id=user.stage_id,
-                name="Unknown Stage",
-                description="Stage not found"
-            )
-        else:
-            stage = Stage.model_validate(stage_model, from_attributes=True)
-        
-        # Get roles using repository
-        role_models = await self.role_repo.get_user_roles(user.id, user.clerk_organization_id)
-        roles = [Role.model_validate(role, from_attributes=True) for role in role_models]
-
-        # Use UserInDB to validate basic user data first
-        user_in_db = UserInDB.model_validate(user, from_attributes=True)
-        
-        return User(
-            **user_in_db.model_dump(),
-            department=department,
-            stage=stage,
-            roles=roles,
-        )
-
     async def _enrich_detailed_user_data(
         self,
         user: UserModel,
         include_level: bool = False,
     ) -> UserDetailResponse:
-        """Enrich user data for UserDetailResponse with supervisor/subordinates using repository pattern"""
-        # Get basic enriched user data first
-        base_user = await self._enrich_user_data(user)
-        goal_weight_budget = self._build_goal_weight_budget(user, base_user.stage)
-        
-        # Get supervisor relationship
-        supervisor_models = await self.user_repo.get_user_supervisors(user.id, user.clerk_organization_id)
-        supervisor = None
-        if supervisor_models:
-            supervisor_model = supervisor_models[0]  # Take first supervisor if multiple
-            supervisor = await self._enrich_user_data(supervisor_model)
-
-        # Get subordinates relationship
-        subordinate_models = await self.user_repo.get_subordinates(user.id, user.clerk_organization_id)
-        subordinates = []
-        for subordinate_model in subordinate_models:
-            subordinate = await self._enrich_user_data(subordinate_model)
-            subordinates.append(subordinate)
-
-        # Create detailed response with supervisor/subordinates
-        user_detail_data = base_user.model_dump()
-        user_detail_data.update({
-            'supervisor': supervisor,
-            'subordinates': subordinates if subordinates else None,
-            'goal_weight_budget': goal_weight_budget,
-            'level': user.level if include_level else None,
-        })
-
-        return UserDetailResponse(**user_detail_data)
-    
+        """Enrich a single user for UserDetailResponse with supervisor/subordinates."""
+        enriched = await self.enrichment.enrich_detailed(
+            [user],
+            user.clerk_organization_id,
+            include_level=include_level,
+        )
+        return enriched[0]
@@ -32,6 +32,8 @@ from ..schemas.user_page import (
 from ..security.context import AuthContext
 from ..security.permissions import Permission
 from ..security.rbac_helper import RBACHelper
+from ..security.rbac_scope import AccessScope
+from ..core.metrics import InstrumentedTTLCache
 
 
 @dataclass(frozen=True)
@@ -48,8 +50,8 @@ class UserServiceV2:
     """
 
     # Shared across all instances to enable cross-request caching
-    _global_page_cache: TTLCache = TTLCache(maxsize=128, ttl=30)
-    _filters_cache: TTLCache = TTLCache(maxsize=64, ttl=60)
+    _global_page_cache: InstrumentedTTLCache = InstrumentedTTLCache("user_v2_page", maxsize=128, ttl=30)
+    _filters_cache: InstrumentedTTLCache = InstrumentedTTLCache("user_v2_filters", maxsize=64, ttl=60)
 
     DEFAULT_INCLUDES: Set[str] = frozenset({"department", "stage", "roles", "supervisor", "subordinates"})
     MAX_LIMIT = 100
@@ -108,8 +110,8 @@ class UserServiceV2:
         pagination = PaginationParams(page=page, limit=min(limit, self.MAX_LIMIT))
         self._reset_metrics()
 
-        accessible_user_ids = await RBACHelper.get_accessible_user_ids(ctx)
-        if accessible_user_ids == []:
+        accessible_scope = await RBACHelper.get_accessible_user_scope(ctx)
+        if accessible_scope.is_empty:
             empty_payload = PaginatedResponse.create([], 0, pagination)
             return ListUsersResult(
                 payload=empty_payload,
@@ -119,7 +121,7 @@ class UserServiceV2:
             )
 
         filtered_user_ids = await self._apply_supervisor_filter(
-            accessible_user_ids,
+            accessible_scope,
             supervisor_id,
             ctx.organization_id,
         )
@@ -297,11 +299,10 @@ class UserServiceV2:
         include_set = self._normalise_include(include or {"department", "stage", "roles"})
         self._reset_metrics()
 
-        accessible_user_ids: Optional[Sequence[UUID]]
         try:
-            accessible_user_ids = await RBACHelper.get_accessible_user_ids(ctx)
+            accessible_scope = await RBACHelper.get_accessible_user_scope(ctx)
         except PermissionDeniedError:
-            accessible_user_ids = []
+            accessible_scope = AccessScope.explicit([])
 
         review_access_ids: set[UUID] = set()
         if ctx.user_id and ctx.has_permission(Permission.GOAL_APPROVE):
@@ -313,14 +314,15 @@ class UserServiceV2:
                 status="draft",
             )
 
-        if accessible_user_ids == [] and not review_access_ids:
+        if accessible_scope.is_empty and not review_access_ids:
             return []
 
-        if accessible_user_ids is not None:
-            accessible_set = set(accessible_user_ids)
-            if review_access_ids:
-                accessible_set.update(review_access_ids)
-            requested_ids = [user_id for user_id in requested_ids if user_id in accessible_set]
+        if not accessible_scope.is_all:
+            requested_ids = [
+                user_id
+                for user_id in requested_ids
+                if user_id in accessible_scope or user_id in review_access_ids
+            ]
             if not requested_ids:
                 return []
 
@@ -340,12 +342,12 @@ class UserServiceV2:
 
     async def _apply_supervisor_filter(
         self,
-        accessible_user_ids: Optional[Sequence[UUID]],
+        accessible_scope: AccessScope,
         supervisor_id: Optional[UUID],
         org_id: str,
-    ) -> Optional[Sequence[UUID]]:
+    ) -> AccessScope:
         if not supervisor_id:
-            return accessible_user_ids
+            return accessible_scope
 
         subordinate_ids = await self._timed(
             self.user_repo.fetch_subordinate_ids,
@@ -353,12 +355,7 @@ class UserServiceV2:
             org_id,
         )
 
-        if accessible_user_ids is None:
-            return subordinate_ids
-
-        subordinate_set = set(subordinate_ids)
-        filtered = [user_id for user_id in accessible_user_ids if user_id in subordinate_set]
-        return filtered
+        return accessible_scope.restrict_to(subordinate_ids)
 
     async def _build_response_items(
         self,
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+List read models: full ORM graphs vs. column projections.
+
+For the supervisor feedback, self-assessment and supervisor review list pages this
+runs, against a real database, the previous query (entity select with the
+joined-eager-loaded relationships) and the projection the *_page methods now use,
+with the same filters, ordering and limit. For each pair it reports:
+  - columns per row and approximate payload bytes (UTF-8 size of the text form of
+    every non-null value; the binary wire format differs but scales the same way)
+  - latency of query + mapping into the list response models (best and median)
+
+Needs DATABASE_URL pointing at a database with data for --org.
+
+Usage (from backend/):
+    python benchmarks/list_projections.py --org org_xxx [--period <uuid>] --limit 200 --repeat 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from uuid import UUID
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import select  # noqa: E402
+
+from app.database.models.supervisor_feedback import SupervisorFeedback as SupervisorFeedbackModel  # noqa: E402
+from app.database.models.self_assessment import SelfAssessment as SelfAssessmentModel  # noqa: E402
+from app.database.models.supervisor_review import SupervisorReview as SupervisorReviewModel  # noqa: E402
+from app.database.repositories.self_assessment_repo import ASSESSMENT_LIST_COLUMNS, SelfAssessmentRepository  # noqa: E402
+from app.database.repositories.supervisor_feedback_repo import FEEDBACK_LIST_COLUMNS, SupervisorFeedbackRepository  # noqa: E402
+from app.database.repositories.supervisor_review_repository import REVIEW_LIST_COLUMNS, SupervisorReviewRepository  # noqa: E402
+from app.database.session import AsyncSessionLocal  # noqa: E402
+from app.schemas.self_assessment import SelfAssessment  # noqa: E402
+from app.schemas.supervisor_feedback import SupervisorFeedback  # noqa: E402
+from app.schemas.supervisor_review import SupervisorReview  # noqa: E402
+from app.services.self_assessment_service import SelfAssessmentService  # noqa: E402
+from app.services.supervisor_feedback_service import SupervisorFeedbackService  # noqa: E402
+
+
+def build_cases(session, org_id, period_id, limit):
+    feedback_repo = SupervisorFeedbackRepository(session)
+    assessment_repo = SelfAssessmentRepository(session)
+    review_repo = SupervisorReviewRepository(session)
+    feedback_service = SupervisorFeedbackService(session)
+    assessment_service = SelfAssessmentService(session)
+
+    def feedback_query(base):
+        query = feedback_repo._build_feedback_search_query(
+            base, org_id, None, None, period_id, None, None, None, None,
+        )
+        return query.order_by(SupervisorFeedbackModel.created_at.desc()).limit(limit)
+
+    def assessment_query(base):
+        query = assessment_repo._build_assessment_search_query(base, org_id, None, period_id, None)
+        return query.order_by(SelfAssessmentModel.created_at.desc()).limit(limit)
+
+    def review_query(base):
+        query = review_repo._org_query(base, org_id, period_id=period_id)
+        return query.order_by(SupervisorReviewModel.updated_at.desc()).limit(limit)
+
+    async def map_reviews(model):
+        return SupervisorReview.model_validate(model, from_attributes=True)
+
+    return [
+        (
+            "supervisor feedback",
+            feedback_query(feedback_repo._feedback_select()),
+            feedback_service._enrich_feedback_data,
+            feedback_query(select(*FEEDBACK_LIST_COLUMNS)),
+            SupervisorFeedback,
+        ),
+        (
+            "self-assessments",
+            assessment_query(assessment_repo._assessment_select()),
+            assessment_service._enrich_assessment_data,
+            assessment_query(select(*ASSESSMENT_LIST_COLUMNS)),
+            SelfAssessment,
+        ),
+        (
+            "supervisor reviews",
+            review_query(select(SupervisorReviewModel)),
+            map_reviews,
+            review_query(select(*REVIEW_LIST_COLUMNS)),
+            SupervisorReview,
+        ),
+    ]
+
+
+async def payload(session, statement):
+    """(rows, columns per row, approximate bytes) of the raw result rows."""
+    connection = await session.connection()
+    result = await connection.execute(statement)
+    rows = result.all()
+    size = sum(len(str(value).encode()) for row in rows for value in row if value is not None)
+    return len(rows), len(result.keys()), size
+
+
+async def run_legacy(session, statement, enrich):
+    result = await session.execute(statement)
+    models = result.scalars().unique().all()
+    items = [await enrich(model) for model in models]
+    session.expunge_all()
+    return items
+
+
+async def run_projection(session, statement, response_model):
+    result = await session.execute(statement)
+    return [response_model.model_validate(dict(row._mapping)) for row in result]
+
+
+async def timed(repeat, fn, *args):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn(*args)
+        samples.append((time.perf_counter() - started) * 1000)
+    return min(samples), statistics.median(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--org", required=True)
+    parser.add_argument("--period", type=UUID, default=None)
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    async with AsyncSessionLocal() as session:
+        print(f"org={args.org} period={args.period} limit={args.limit} repeat={args.repeat}")
+        print(f"{'list':<20}{'model':>11}{'rows':>6}{'cols':>6}{'KiB':>9}{'best ms':>10}{'median ms':>11}")
+        for name, legacy_stmt, enrich, projection_stmt, response_model in build_cases(
+            session, args.org, args.period, args.limit
+        ):
+            legacy_items = await run_legacy(session, legacy_stmt, enrich)
+            projection_items = await run_projection(session, projection_stmt, response_model)
+            assert [item.id for item in legacy_items] == [item.id for item in projection_items], name
+
+            for label, fn, statement, extra in (
+                ("orm graph", run_legacy, legacy_stmt, enrich),
+                ("projection", run_projection, projection_stmt, response_model),
+            ):
+                rows, columns, size = await payload(session, statement)
+                best, median = await timed(args.repeat, fn, session, statement, extra)
+                print(f"{name:<20}{label:>11}{rows:>6}{columns:>6}{size / 1024:>9.1f}{best:>10.1f}{median:>11.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: rating engine tables vs. the previous per-value helpers.
+
+Compares, on the same random input:
+  - score → rank with settings thresholds: the old linear scan over RANK_ORDER vs.
+    the cached ``ThresholdTable``
+  - scores dict → average: per-dict ``calculate_source_average`` with a list build vs.
+    ``CORE_VALUE_SCALE.average_many`` over all dicts at once
+
+Each pair is also checked for identical results before timing.
+
+Usage (from backend/):
+    python benchmarks/rating_engine.py --size 100000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.rating_engine import (  # noqa: E402
+    CORE_VALUE_SCALE,
+    RATING_CODES,
+    threshold_table,
+)
+
+LEGACY_NUMERIC = dict(CORE_VALUE_SCALE.by_code)
+SETTINGS_THRESHOLDS = {"SS": 6.5, "S": 5.5, "A+": 4.5, "A": 3.7, "A-": 2.7, "B": 1.7, "C": 1.0, "D": 0.1}
+
+
+def legacy_rank_from_score(score, thresholds):
+    if score is None:
+        return None
+    for rank in RATING_CODES:
+        if score >= float(thresholds[rank]):
+            return rank
+    return RATING_CODES[-1]
+
+
+def legacy_source_average(scores):
+    if not scores:
+        return None
+    values = []
+    for rating_code in scores.values():
+        numeric = LEGACY_NUMERIC.get(rating_code)
+        if numeric is not None:
+            values.append(numeric)
+    if not values:
+        return None
+    return sum(values) / len(values)
+
+
+def best_of(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    scores = [rng.uniform(0, 7) for _ in range(args.size)]
+    codes = RATING_CODES[:-1]
+    score_dicts = [
+        {f"cv-{i}": rng.choice(codes) for i in range(9)} for _ in range(args.size // 10)
+    ]
+
+    table = threshold_table(SETTINGS_THRESHOLDS)
+    assert [legacy_rank_from_score(s, SETTINGS_THRESHOLDS) for s in scores] == table.classify_many(scores)
+    assert [legacy_source_average(d) for d in score_dicts] == CORE_VALUE_SCALE.average_many(score_dicts)
+
+    cases = [
+        (
+            "rank from thresholds",
+            lambda: [legacy_rank_from_score(s, SETTINGS_THRESHOLDS) for s in scores],
+            lambda: threshold_table(SETTINGS_THRESHOLDS).classify_many(scores),
+        ),
+        (
+            "source averages",
+            lambda: [legacy_source_average(d) for d in score_dicts],
+            lambda: CORE_VALUE_SCALE.average_many(score_dicts),
+        ),
+    ]
+
+    print(f"size={args.size} dicts={len(score_dicts)} repeat={args.repeat} (best of)")
+    print(f"{'case':<22}{'legacy ms':>12}{'engine ms':>12}{'speedup':>10}")
+    for name, legacy, engine in cases:
+        legacy_s = best_of(legacy, args.repeat)
+        engine_s = best_of(engine, args.repeat)
+        print(f"{name:<22}{legacy_s * 1000:>12.1f}{engine_s * 1000:>12.1f}{legacy_s / engine_s:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""
+Gunicorn server hooks (loaded automatically from the working directory).
+
+Prometheus multi-process mode: workers write metric samples to mmap files under
+PROMETHEUS_MULTIPROC_DIR. The directory is reset when the master starts so stale
+files from a previous container run are not aggregated, and files of exited workers
+are marked dead so their live gauges stop being summed.
+"""
+
+import os
+import shutil
+
+
+def on_starting(server):
+    multiproc_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if not multiproc_dir:
+        return
+    shutil.rmtree(multiproc_dir, ignore_errors=True)
+    os.makedirs(multiproc_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if not os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        return
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
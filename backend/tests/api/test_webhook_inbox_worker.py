@@ -0,0 +1,121 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.api.webhooks import inbox_worker as inbox_module
+from app.api.webhooks.inbox_worker import WebhookInboxWorker, compute_retry_at
+from app.database.repositories.webhook_event_repo import ClaimedWebhookEvent
+
+
+class _SessionContext:
+    def __init__(self, session):
+        self.session = session
+
+    async def __aenter__(self):
+        return self.session
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _make_worker(session, **kwargs):
+    return WebhookInboxWorker(lambda: _SessionContext(session), batch_size=10, **kwargs)
+
+
+def _claimed(event_type="user.updated", attempts=1):
+    return ClaimedWebhookEvent(
+        id=uuid4(),
+        event_id=f"msg_{uuid4().hex}",
+        event_type=event_type,
+        subject_id="user_1",
+        payload={"type": event_type, "data": {"id": "user_1"}},
+        attempts=attempts,
+        received_at=datetime.utcnow(),
+    )
+
+
+@pytest.fixture
+def repo(monkeypatch):
+    repo = MagicMock()
+    repo.coalesce_pending = AsyncMock(return_value=2)
+    repo.claim_batch = AsyncMock(return_value=[])
+    repo.mark_processed = AsyncMock()
+    repo.mark_failed = AsyncMock()
+    monkeypatch.setattr(inbox_module, "WebhookEventRepository", lambda session: repo)
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_drain_once_marks_successful_events_processed_in_one_call(repo, monkeypatch):
+    events = [_claimed(), _claimed("organization.created")]
+    repo.claim_batch.return_value = events
+    dispatch = AsyncMock()
+    monkeypatch.setattr("app.api.webhooks.clerk.dispatch_webhook_event", dispatch)
+    session = AsyncMock()
+
+    worker = _make_worker(session)
+    handled = await worker.drain_once()
+
+    assert handled == 2
+    assert dispatch.await_count == 2
+    repo.coalesce_pending.assert_awaited_once_with(inbox_module.COALESCIBLE_EVENT_TYPES)
+    repo.mark_processed.assert_awaited_once_with([events[0].id, events[1].id])
+    repo.mark_failed.assert_not_awaited()
+    metrics = worker.get_metrics()
+    assert metrics["processed"] == 2
+    assert metrics["superseded"] == 2
+
+
+@pytest.mark.asyncio
+async def test_drain_once_schedules_retry_for_failed_event(repo, monkeypatch):
+    event = _claimed(attempts=1)
+    repo.claim_batch.return_value = [event]
+    monkeypatch.setattr(
+        "app.api.webhooks.clerk.dispatch_webhook_event",
+        AsyncMock(side_effect=RuntimeError("db down")),
+    )
+    session = AsyncMock()
+
+    worker = _make_worker(session, max_attempts=3)
+    await worker.drain_once()
+
+    session.rollback.assert_awaited()
+    repo.mark_processed.assert_awaited_once_with([])
+    args, kwargs = repo.mark_failed.await_args
+    assert args[0] == event.id
+    assert "db down" in args[1]
+    assert kwargs["retry_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_drain_once_moves_event_to_dead_after_max_attempts(repo, monkeypatch):
+    event = _claimed(attempts=3)
+    repo.claim_batch.return_value = [event]
+    monkeypatch.setattr(
+        "app.api.webhooks.clerk.dispatch_webhook_event",
+        AsyncMock(side_effect=RuntimeError("bad payload")),
+    )
+
+    worker = _make_worker(AsyncMock(), max_attempts=3)
+    await worker.drain_once()
+
+    assert repo.mark_failed.await_args.kwargs["retry_at"] is None
+    assert worker.get_metrics()["dead"] == 1
+
+
+@pytest.mark.asyncio
+async def test_drain_once_without_due_events_skips_outcome_writes(repo):
+    worker = _make_worker(AsyncMock())
+
+    assert await worker.drain_once() == 0
+    repo.mark_processed.assert_not_awaited()
+
+
+def test_compute_retry_at_backs_off_exponentially_with_cap():
+    now = datetime(2026, 1, 1)
+
+    assert (compute_retry_at(1, now) - now).total_seconds() == 2
+    assert (compute_retry_at(3, now) - now).total_seconds() == 8
+    assert (compute_retry_at(30, now) - now).total_seconds() == 15 * 60
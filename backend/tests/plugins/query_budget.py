@@ -0,0 +1,61 @@
+"""
+Pytest plugin: fail a test when it exceeds a declared SQL query budget.
+
+    @pytest.mark.query_budget(max_queries=3, max_repeats=1)
+    async def test_goal_list_page_is_constant_in_queries(...):
+        ...
+
+Every statement executed through any SQLAlchemy engine while the test runs is
+attributed to the test (see ``app.core.query_profiler``). ``max_repeats`` limits how
+many times a single statement shape may run, which catches N+1 regressions even
+when the total stays under ``max_queries``. Tests can also request the
+``query_profile`` fixture to make their own assertions.
+"""
+
+import pytest
+
+from app.core.query_profiler import QueryProfile, install_query_profiler, profile_queries
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(max_queries=None, max_repeats=None): fail when the test issues more SQL "
+        "statements than allowed, or repeats one statement shape more than max_repeats times",
+    )
+    install_query_profiler()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """Profile the test body (not fixture setup) when a query_budget marker is present."""
+    if item.get_closest_marker("query_budget") is None:
+        return (yield)
+    with profile_queries(label=item.nodeid) as profile:
+        result = yield
+    _enforce_budget(item, profile)
+    return result
+
+
+@pytest.fixture
+def query_profile(request):
+    """QueryProfile collecting every statement executed during the test (setup included)."""
+    with profile_queries(label=request.node.nodeid) as profile:
+        yield profile
+
+
+def _enforce_budget(node, profile: QueryProfile) -> None:
+    marker = node.get_closest_marker("query_budget")
+    if marker is None:
+        return
+    max_queries = marker.kwargs.get("max_queries", marker.args[0] if marker.args else None)
+    max_repeats = marker.kwargs.get("max_repeats")
+
+    problems = []
+    if max_queries is not None and profile.query_count > max_queries:
+        problems.append(f"{profile.query_count} queries executed, budget is {max_queries}")
+    if max_repeats is not None:
+        for shape, count in profile.repeated_shapes(threshold=max_repeats + 1):
+            problems.append(f"statement repeated {count}x (max {max_repeats}): {shape[:200]}")
+    if problems:
+        pytest.fail("Query budget exceeded:\n  " + "\n  ".join(problems), pytrace=False)
@@ -0,0 +1,89 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import Column, Integer, String, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import declarative_base
+
+from app.database.repositories.base import BaseRepository
+from app.schemas.common import PaginationParams
+
+
+pytest.importorskip("aiosqlite")
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "pagination_items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    kind = Column(String, nullable=False)
+
+
+class ItemRepository(BaseRepository[Item]):
+    pass
+
+
+@pytest_asyncio.fixture
+async def repo():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        session.add_all(
+            Item(id=i, name=f"item-{i:02d}", kind="even" if i % 2 == 0 else "odd") for i in range(1, 24)
+        )
+        await session.flush()
+        statements = []
+        original_execute = session.execute
+
+        async def counting_execute(statement, *args, **kwargs):
+            statements.append(statement)
+            return await original_execute(statement, *args, **kwargs)
+
+        session.execute = counting_execute
+        repository = ItemRepository(session, Item)
+        repository.statements = statements
+        yield repository
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_paginate_returns_entities_and_total_in_one_statement(repo):
+    query = select(Item).where(Item.kind == "odd").order_by(Item.id)
+
+    items, total = await repo.paginate(query, PaginationParams(page=2, limit=5))
+
+    assert [item.id for item in items] == [11, 13, 15, 17, 19]
+    assert total == 12
+    assert len(repo.statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_paginate_column_select_returns_mappings_without_count(repo):
+    query = select(Item.id, Item.name).order_by(Item.id.desc())
+
+    rows, total = await repo.paginate(query, PaginationParams(page=1, limit=2))
+
+    assert rows == [{"id": 23, "name": "item-23"}, {"id": 22, "name": "item-22"}]
+    assert total == 23
+
+
+@pytest.mark.asyncio
+async def test_paginate_past_last_page_still_reports_total(repo):
+    items, total = await repo.paginate(select(Item).order_by(Item.id), PaginationParams(page=10, limit=5))
+
+    assert items == []
+    assert total == 23
+
+
+@pytest.mark.asyncio
+async def test_estimated_mode_is_exact_on_last_page(repo):
+    items, total = await repo.paginate(
+        select(Item).order_by(Item.id), PaginationParams(page=5, limit=5), estimate=True
+    )
+
+    assert [item.id for item in items] == [21, 22, 23]
+    assert total == 23
+    assert len(repo.statements) == 1
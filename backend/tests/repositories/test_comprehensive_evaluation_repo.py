@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 from uuid import uuid4
@@ -61,6 +62,46 @@ async def test_upsert_processing_status_records_actor():
 
     _, params = session.execute.await_args.args
     assert params["processed_by_user_id"] == actor_id
+    assert params["pre_decision_recorded"] is False
+
+
+@pytest.mark.asyncio
+async def test_upsert_processing_statuses_records_pre_decision_state_per_user():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute = AsyncMock(return_value=SimpleNamespace(rowcount=2))
+    repo = ComprehensiveEvaluationRepository(session)
+    recorded_id, unrecorded_id, stage_id = uuid4(), uuid4(), uuid4()
+
+    await repo.upsert_processing_statuses(
+        org_id="org_test",
+        period_id=uuid4(),
+        user_ids=[recorded_id, unrecorded_id, recorded_id],
+        processed_by_user_id=uuid4(),
+        pre_decision={recorded_id: (stage_id, 12)},
+    )
+
+    statement, params = session.execute.await_args.args
+    assert params["user_ids"] == [recorded_id, unrecorded_id]
+    assert params["stage_ids"] == [stage_id, None]
+    assert params["levels"] == [12, None]
+    assert params["recorded"] == [True, False]
+    assert "comprehensive_processing_statuses.pre_decision_recorded" in str(statement)
+
+
+@pytest.mark.asyncio
+async def test_period_settings_fingerprint_covers_assignments_and_rulesets():
+    session = AsyncMock(spec=AsyncSession)
+    updated_at = datetime(2026, 4, 1, tzinfo=timezone.utc)
+    session.execute = AsyncMock(return_value=SimpleNamespace(one=lambda: (3, updated_at, None, None)))
+    repo = ComprehensiveEvaluationRepository(session)
+    period_id = uuid4()
+
+    fingerprint = await repo.get_period_settings_fingerprint(org_id="org_test", period_id=period_id)
+
+    statement, params = session.execute.await_args.args
+    assert fingerprint == (3, updated_at, 0, None)
+    assert params == {"organization_id": "org_test", "period_id": period_id}
+    assert "comprehensive_ruleset_assignments" in str(statement) and "comprehensive_rulesets" in str(statement)
 
 
 @pytest.mark.asyncio
@@ -76,3 +117,90 @@ async def test_clear_processing_status_returns_true_when_row_deleted():
     )
 
     assert deleted is True
+
+
+@pytest.mark.asyncio
+async def test_replace_settings_sends_one_statement_with_flattened_rules_and_audit():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute = AsyncMock(return_value=SimpleNamespace(scalar_one=lambda: 3))
+    repo = ComprehensiveEvaluationRepository(session)
+    actor_id = uuid4()
+
+    changed = await repo.replace_settings(
+        org_id="org_test",
+        overall_rules=[
+            {"overall_rank": "S", "min_score": 5.5, "max_score": None, "level_delta": 8, "display_order": 0},
+            {"overall_rank": "A", "min_score": 3.7, "max_score": 5.5, "level_delta": 5, "display_order": 1},
+        ],
+        promotion_groups=[
+            {
+                "group_name": "fast track",
+                "display_order": 0,
+                "conditions": [
+                    {"condition_order": 0, "field_name": "overallRank", "operator": "rank_at_least", "threshold_rank": "S"},
+                    {"condition_order": 1, "field_name": "coreValueFinalRank", "operator": "rank_at_least", "threshold_rank": "A"},
+                ],
+            }
+        ],
+        demotion_groups=[
+            {
+                "group_name": None,
+                "display_order": 0,
+                "conditions": [
+                    {"condition_order": 0, "field_name": "overallRank", "operator": "rank_at_or_worse", "threshold_rank": "D"},
+                ],
+            }
+        ],
+        audit={"actor_user_id": actor_id, "action": "settings_update", "before_json": {}, "after_json": {"a": 1}},
+    )
+
+    assert changed == 3
+    session.execute.assert_awaited_once()
+    statement, params = session.execute.await_args.args
+    assert "comprehensive_settings_audit_log" in str(statement)
+    assert params["overall_ranks"] == ["S", "A"]
+    assert params["group_types"] == ["promotion", "demotion"]
+    assert params["condition_types"] == ["promotion", "promotion", "demotion"]
+    assert params["condition_group_orders"] == [0, 0, 0]
+    assert params["threshold_ranks"] == ["S", "A", "D"]
+    assert params["audit_actor_user_id"] == actor_id
+    assert params["audit_after_json"] == '{"a": 1}'
+
+
+@pytest.mark.asyncio
+async def test_upsert_department_assignment_writes_row_and_audit_in_one_statement():
+    period_id = uuid4()
+    department_id = uuid4()
+    session = AsyncMock(spec=AsyncSession)
+    session.execute = AsyncMock(
+        return_value=SimpleNamespace(
+            fetchone=lambda: SimpleNamespace(
+                _mapping={
+                    "id": uuid4(),
+                    "period_id": period_id,
+                    "department_id": department_id,
+                    "stage_id": None,
+                    "settings_json": '{"x": 1}',
+                }
+            )
+        )
+    )
+    repo = ComprehensiveEvaluationRepository(session)
+
+    persisted = await repo.upsert_department_assignment(
+        org_id="org_test",
+        period_id=period_id,
+        department_id=department_id,
+        settings_json={"x": 1},
+        source_ruleset_id=None,
+        source_ruleset_name_snapshot=None,
+        audit={"actor_user_id": uuid4(), "action": "department_assignment_update", "before_json": {"x": 0}},
+    )
+
+    session.execute.assert_awaited_once()
+    statement, params = session.execute.await_args.args
+    assert "ON CONFLICT (organization_id, period_id, department_id)" in str(statement)
+    assert "comprehensive_settings_audit_log" in str(statement)
+    assert params["department_id"] == department_id and params["stage_id"] is None
+    assert params["audit_before_json"] == '{"x": 0}'
+    assert persisted["department_id"] == department_id
@@ -1,5 +1,6 @@
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -48,3 +49,16 @@ async def test_goal_list_page_empty_user_ids_returns_empty_without_query():
     assert total == 0
     assert session.execute.await_count == 0
 
+
+
+@pytest.mark.asyncio
+async def test_search_goals_filters_on_denormalized_org_without_joining_users():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute = AsyncMock(return_value=MagicMock())
+    repo = GoalRepository(session)
+
+    await repo.search_goals(org_id="org_test", period_id=uuid4(), status=["submitted"])
+
+    sql = str(session.execute.await_args.args[0].compile())
+    assert "goals.organization_id = :organization_id" in sql
+    assert "JOIN users ON" not in sql
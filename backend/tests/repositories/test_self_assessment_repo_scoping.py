@@ -1,5 +1,6 @@
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -28,3 +29,17 @@ async def test_count_assessments_empty_user_ids_returns_zero_without_query():
 
     assert result == 0
     assert session.execute.await_count == 0
+
+
+@pytest.mark.asyncio
+async def test_search_assessments_page_selects_list_columns_without_relationship_joins():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+    repo = SelfAssessmentRepository(session)
+
+    await repo.search_assessments_page(org_id="org_test", period_id=uuid4())
+
+    sql = str(session.execute.await_args.args[0].compile())
+    assert "self_assessments.self_comment" in sql.split(" FROM ", 1)[0]
+    assert " JOIN " not in sql
+    assert "self_assessments.organization_id = :organization_id" in sql
@@ -1,5 +1,6 @@
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -28,3 +29,46 @@ async def test_count_feedbacks_empty_user_ids_returns_zero_without_query():
 
     assert result == 0
     assert session.execute.await_count == 0
+
+
+@pytest.mark.asyncio
+async def test_get_by_status_filters_on_denormalized_org_without_joining_users():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute = AsyncMock(return_value=MagicMock())
+    repo = SupervisorFeedbackRepository(session)
+
+    await repo.get_by_status("submitted", org_id="org_test")
+
+    sql = str(session.execute.await_args.args[0].compile())
+    where = sql.split("WHERE", 1)[1]
+    assert "supervisor_feedback.organization_id = :organization_id" in where
+    assert "JOIN users ON" not in sql
+    assert "clerk_organization_id" not in where
+
+
+@pytest.mark.asyncio
+async def test_search_feedbacks_page_selects_list_columns_without_relationship_joins():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+    repo = SupervisorFeedbackRepository(session)
+
+    rows, total = await repo.search_feedbacks_page(org_id="org_test", supervisor_ids=[uuid4()])
+
+    assert (rows, total) == ([], 0)
+    sql = str(session.execute.await_args.args[0].compile())
+    select_list = sql.split(" FROM ", 1)[0]
+    assert "supervisor_feedback.rating_data" in select_list
+    assert "users." not in select_list and "self_assessments." not in select_list
+    assert " JOIN " not in sql
+
+
+@pytest.mark.asyncio
+async def test_search_feedbacks_page_joins_goals_only_for_owner_scope():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+    repo = SupervisorFeedbackRepository(session)
+
+    await repo.search_feedbacks_page(org_id="org_test", user_ids=[uuid4()])
+
+    sql = str(session.execute.await_args.args[0].compile())
+    assert "JOIN goals ON" in sql and "JOIN users" not in sql
@@ -0,0 +1,151 @@
+from datetime import date
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.database.models.goal import Goal
+from app.database.models.user import User, UserSupervisor
+from app.database.repositories.user_repository_v2 import UserRepositoryV2
+from app.security.context import AuthContext, RoleInfo
+from app.security.permissions import Permission
+from app.security.rbac_helper import RBACHelper, resource_access_cache, subordinate_cache
+from app.security.rbac_scope import ARRAY_BIND_THRESHOLD, AccessScope, ScopeKind
+
+
+ORG_ID = "org_scope"
+
+
+def _compile(scope):
+    stmt = select(Goal.id).where(scope.predicate(Goal.user_id))
+    return stmt.compile(dialect=postgresql.dialect())
+
+
+def test_subordinate_scope_compiles_to_semi_join_and_checks_membership_by_set():
+    supervisor_id = uuid4()
+    team = [uuid4() for _ in range(500)]
+    scope = AccessScope.subordinates_of(supervisor_id, team, ORG_ID)
+
+    compiled = _compile(scope)
+
+    assert "users_supervisors" in str(compiled)
+    assert len(compiled.params) < 10
+    assert supervisor_id in scope and team[-1] in scope
+    assert uuid4() not in scope
+    assert scope.cache_key == f"subordinates:{ORG_ID}:{supervisor_id}"
+
+
+def test_large_explicit_scope_binds_single_array_parameter():
+    ids = [uuid4() for _ in range(ARRAY_BIND_THRESHOLD + 1)]
+    compiled = _compile(AccessScope.explicit(ids))
+
+    assert "ANY" in str(compiled)
+    assert len(compiled.params) == 1
+
+
+def test_cache_key_is_stable_and_short():
+    ids = [uuid4() for _ in range(1000)]
+
+    first = AccessScope.explicit(ids).cache_key
+    second = AccessScope.explicit(reversed(ids)).cache_key
+
+    assert first == second
+    assert len(first) < 40
+    assert AccessScope.all().cache_key == "all"
+
+
+def test_coerce_keeps_legacy_list_semantics():
+    assert AccessScope.coerce(None).is_all
+    assert AccessScope.coerce([]).is_empty
+    assert AccessScope.coerce([]).predicate(Goal.user_id) is not None
+    assert AccessScope.coerce(None).predicate(Goal.user_id) is None
+
+
+def test_viewer_extras_and_supervisor_filter():
+    supervisor_id, report, outsider = uuid4(), uuid4(), uuid4()
+    scope = AccessScope.subordinates_of(supervisor_id, [report], ORG_ID).with_extra([outsider])
+
+    assert scope.kind == ScopeKind.SUBORDINATES
+    assert outsider in scope
+    assert scope.cache_key.startswith(f"subordinates:{ORG_ID}:{supervisor_id}+")
+
+    restricted = scope.restrict_to([report, uuid4()])
+    assert restricted.to_id_list() == [report]
+    assert AccessScope.all().restrict_to([report]).to_id_list() == [report]
+
+
+@pytest.mark.asyncio
+async def test_helper_returns_subordinate_scope_and_legacy_list():
+    subordinate_cache.clear()
+    resource_access_cache.clear()
+    context = AuthContext(
+        user_id=uuid4(),
+        roles=[RoleInfo(id=3, name="supervisor", description="Supervisor")],
+        organization_id=ORG_ID,
+        role_permission_overrides={"supervisor": {Permission.USER_READ_SUBORDINATES}},
+    )
+    team = [uuid4(), uuid4()]
+
+    with patch.object(RBACHelper, "_get_subordinate_user_ids", AsyncMock(return_value=team)):
+        scope = await RBACHelper.get_accessible_user_scope(context)
+        ids = await RBACHelper.get_accessible_user_ids(context)
+
+    assert scope.kind == ScopeKind.SUBORDINATES
+    assert set(ids) == {context.user_id, *team}
+
+
+@pytest.mark.asyncio
+async def test_membership_and_predicate_agree_on_ended_supervisor_relations():
+    pytest.importorskip("aiosqlite")
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: User.metadata.create_all(sync_conn, tables=[User.__table__, UserSupervisor.__table__])
+        )
+
+    supervisor_id, current_id, former_id, inactive_id = uuid4(), uuid4(), uuid4(), uuid4()
+    async with AsyncSession(engine) as session:
+        for user_id, status in [
+            (supervisor_id, "active"),
+            (current_id, "active"),
+            (former_id, "active"),
+            (inactive_id, "inactive"),
+        ]:
+            session.add(User(
+                id=user_id,
+                clerk_user_id=f"clerk_{user_id}",
+                clerk_organization_id=ORG_ID,
+                name=str(user_id),
+                email=f"{user_id}@example.com",
+                employee_code=str(user_id)[:20],
+                status=status,
+            ))
+        session.add_all([
+            UserSupervisor(user_id=current_id, supervisor_id=supervisor_id, valid_from=date(2024, 1, 1)),
+            UserSupervisor(
+                user_id=former_id, supervisor_id=supervisor_id,
+                valid_from=date(2023, 1, 1), valid_to=date(2023, 12, 31),
+            ),
+            UserSupervisor(user_id=inactive_id, supervisor_id=supervisor_id, valid_from=date(2024, 1, 1)),
+        ])
+        await session.commit()
+
+        subordinate_cache.clear()
+        context = AuthContext(
+            user_id=supervisor_id,
+            roles=[RoleInfo(id=3, name="supervisor", description="Supervisor")],
+            organization_id=ORG_ID,
+        )
+        with patch.object(RBACHelper, "_user_repository", UserRepositoryV2(session)):
+            scope = await RBACHelper._get_subordinate_scope(context)
+
+        result = await session.execute(select(User.id).where(scope.predicate(User.id)))
+        filtered = set(result.scalars().all())
+
+    await engine.dispose()
+    subordinate_cache.clear()
+    assert filtered == {supervisor_id, current_id}
+    assert {user_id for user_id in (supervisor_id, current_id, former_id, inactive_id) if user_id in scope} == filtered
@@ -0,0 +1,79 @@
+"""
+Tests for the shared stage competency catalog cache.
+
+Pattern: async with mocked repos — same as test_competency_snapshot.py.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.competency_catalog import CompetencyCatalog, thaw
+
+
+def _row(stage_id, name, description):
+    return SimpleNamespace(
+        id=uuid4(), stage_id=stage_id, name=name, description=description,
+        display_order=None, created_at=None, updated_at=None,
+    )
+
+
+def _catalog(rows, stage_by_user=None, fingerprint=(3, None)) -> CompetencyCatalog:
+    catalog = CompetencyCatalog(AsyncMock(spec=AsyncSession))
+    catalog.competency_repo.get_catalog_fingerprint = AsyncMock(return_value=fingerprint)
+    catalog.competency_repo.get_by_stage_ids = AsyncMock(return_value=rows)
+    catalog.user_repo.get_user_stage_ids = AsyncMock(return_value=stage_by_user or {})
+    return catalog
+
+
+@pytest.mark.asyncio
+async def test_users_resolve_through_one_batch_and_share_cached_stages():
+    org_id = f"org-{uuid4()}"
+    stage_a, stage_b = uuid4(), uuid4()
+    alice, bob, carol, dave = uuid4(), uuid4(), uuid4(), uuid4()
+    rows = [_row(stage_a, "A-one", {"1": "x"}), _row(stage_a, "A-two", None), _row(stage_b, "B-one", ["t"])]
+    catalog = _catalog(rows, {alice: stage_a, bob: stage_a, carol: stage_b, dave: None})
+
+    by_user = await catalog.get_user_catalogs(org_id, [alice, bob, carol, dave])
+
+    assert set(by_user) == {alice, bob, carol}
+    assert by_user[alice] is by_user[bob]
+    assert [c.name for c in by_user[alice].competencies] == ["A-one", "A-two"]
+    assert by_user[carol].context()["ideal_action_texts"] == {str(rows[2].id): ["t"]}
+    assert set(catalog.competency_repo.get_by_stage_ids.await_args.args[0]) == {stage_a, stage_b}
+
+    # Another request (new session) is served from the shared cache
+    other = _catalog([])
+    assert (await other.get_stage_catalogs(org_id, [stage_a, stage_b]))[stage_a] is by_user[alice]
+    other.competency_repo.get_by_stage_ids.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_database_fingerprint_change_invalidates_org_and_entries_are_immutable():
+    org_id = f"org-{uuid4()}"
+    stage_id = uuid4()
+    first = _catalog([_row(stage_id, "old", {"1": "x"})], fingerprint=(1, datetime(2026, 1, 1)))
+    before = await first.get_stage_catalog(org_id, stage_id)
+
+    with pytest.raises(TypeError):
+        before.competencies[0].description["1"] = "mutated"
+    context = before.context()
+    context["ideal_action_texts"][str(before.competencies[0].id)]["1"] = "caller copy"
+    assert thaw(before.competencies[0].description) == {"1": "x"}
+
+    # Same fingerprint (no write anywhere): served from cache.
+    unchanged = _catalog([], fingerprint=(1, datetime(2026, 1, 1)))
+    assert await unchanged.get_stage_catalog(org_id, stage_id) is before
+    unchanged.competency_repo.get_by_stage_ids.assert_not_awaited()
+
+    # A write on another worker moves the fingerprint this worker reads from the database.
+    second = _catalog([_row(stage_id, "new", {})], fingerprint=(1, datetime(2026, 1, 2)))
+    after = await second.get_stage_catalog(org_id, stage_id)
+
+    assert after.version == (1, datetime(2026, 1, 2))
+    assert [c.name for c in after.competencies] == ["new"]
+    second.competency_repo.get_by_stage_ids.assert_awaited_once()
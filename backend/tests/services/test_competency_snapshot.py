@@ -23,6 +23,14 @@ def _goal_service() -> GoalService:
     return GoalService(AsyncMock(spec=AsyncSession))
 
 
+def _competency_row(competency_id, stage_id, name, description) -> SimpleNamespace:
+    """Minimal stand-in for a Competency row as loaded by the competency catalog."""
+    return SimpleNamespace(
+        id=competency_id, stage_id=stage_id, name=name, description=description,
+        display_order=None, created_at=None, updated_at=None,
+    )
+
+
 def _competency_goal_model(*, target_data: dict, user_id=None) -> SimpleNamespace:
     """Minimal stand-in for the GoalModel attributes read by _enrich_goal_data."""
     return SimpleNamespace(
@@ -105,11 +113,13 @@ async def test_snapshot_written_for_competency_goal_on_approval():
         id=uuid4(), user_id=uuid4(), goal_category="コンピテンシー",
         target_data={"action_plan": "x"},
     )
+    stage_id = uuid4()
     svc = _goal_service()
-    svc.user_repo.get_user_stage_id = AsyncMock(return_value=uuid4())
-    svc.competency_repo.get_by_stage_id = AsyncMock(return_value=[
-        SimpleNamespace(id=c1, name="C-one", description={"1": "t", "2": "t"}),
-        SimpleNamespace(id=c2, name="C-two", description={"1": "t"}),
+    svc.competency_catalog.user_repo.get_user_stage_ids = AsyncMock(return_value={goal.user_id: stage_id})
+    svc.competency_catalog.competency_repo.get_catalog_fingerprint = AsyncMock(return_value=(2, None))
+    svc.competency_catalog.competency_repo.get_by_stage_ids = AsyncMock(return_value=[
+        _competency_row(c1, stage_id, "C-one", {"1": "t", "2": "t"}),
+        _competency_row(c2, stage_id, "C-two", {"1": "t"}),
     ])
     svc.session.commit = AsyncMock()
 
@@ -126,8 +136,9 @@ async def test_snapshot_written_for_competency_goal_on_approval():
 @pytest.mark.asyncio
 async def test_snapshot_is_idempotent_and_skips_non_competency():
     svc = _goal_service()
-    svc.user_repo.get_user_stage_id = AsyncMock()
-    svc.competency_repo.get_by_stage_id = AsyncMock()
+    svc.competency_catalog.user_repo.get_user_stage_ids = AsyncMock()
+    svc.competency_catalog.competency_repo.get_catalog_fingerprint = AsyncMock(return_value=(2, None))
+    svc.competency_catalog.competency_repo.get_by_stage_ids = AsyncMock()
 
     # already has a snapshot -> no repo calls, untouched
     existing = {"action_plan": "x", "competency_snapshot": {"competency_ids": ["keep"]}}
@@ -140,8 +151,8 @@ async def test_snapshot_is_idempotent_and_skips_non_competency():
     await svc._snapshot_competency_context(g2, "org")
     assert "competency_snapshot" not in g2.target_data
 
-    svc.user_repo.get_user_stage_id.assert_not_awaited()
-    svc.competency_repo.get_by_stage_id.assert_not_awaited()
+    svc.competency_catalog.user_repo.get_user_stage_ids.assert_not_awaited()
+    svc.competency_catalog.competency_repo.get_by_stage_ids.assert_not_awaited()
 
 
 # ============================================================
@@ -156,13 +167,12 @@ async def test_required_actions_resolved_from_snapshot():
         target_data={"competency_snapshot": {"ideal_action_texts": {cid: {"1": "t", "2": "t", "3": "t"}}}},
     )
     svc = SelfAssessmentService(AsyncMock(spec=AsyncSession))
-    svc.user_repo.get_user_stage_id = AsyncMock()       # must NOT be used when snapshot present
-    svc.competency_repo.get_by_stage_id = AsyncMock()
+    svc.competency_catalog.get_user_catalogs = AsyncMock()  # must NOT be used when snapshot present
 
     required = await svc._get_required_competency_actions_for_goal(goal, "org")
 
     assert required == {cid: ["1", "2", "3"]}
-    svc.user_repo.get_user_stage_id.assert_not_awaited()  # snapshot short-circuits the live stage
+    svc.competency_catalog.get_user_catalogs.assert_not_awaited()  # snapshot short-circuits the live stage
 
 
 # ============================================================
@@ -1,8 +1,10 @@
+from datetime import datetime
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 from uuid import UUID, uuid4
 
 import pytest
+from pydantic import ValidationError
 
 from app.core.exceptions import BadRequestError, PermissionDeniedError
 from app.database.models.evaluation import EvaluationPeriodStatus
@@ -1017,6 +1019,7 @@ async def test_upsert_manual_decision_applies_stage_and_level_when_completed():
     service.repo.upsert_processing_status = AsyncMock()
     service.user_repo.update_user_stage = AsyncMock(return_value=SimpleNamespace(id=user_id))
     service.user_repo.batch_update_user_levels = AsyncMock(return_value={user_id})
+    service._write_period_snapshots = AsyncMock(return_value=1)
 
     payload = ComprehensiveManualDecisionUpsertRequest(
         periodId=period_id,
@@ -1035,6 +1038,7 @@ async def test_upsert_manual_decision_applies_stage_and_level_when_completed():
     service.user_repo.update_user_stage.assert_awaited_once_with(user_id, stage_id, "org_test")
     service.user_repo.batch_update_user_levels.assert_awaited_once_with("org_test", {user_id: 12})
     service.repo.upsert_processing_status.assert_awaited_once()
+    service._write_period_snapshots.assert_awaited_once_with(org_id="org_test", period_id=period_id, user_id=user_id)
     session.commit.assert_awaited_once()
 
 
@@ -1049,6 +1053,7 @@ async def test_finalize_period_marks_completed_without_bulk_level_updates():
     service.user_repo.batch_update_user_levels = AsyncMock()
     service.user_repo.batch_update_user_stages = AsyncMock()
     service.period_repo.update_status = AsyncMock(return_value=SimpleNamespace(status="completed"))
+    service._write_period_snapshots = AsyncMock(return_value=0)
 
     result = await service.finalize_evaluation_period(
         context=make_context(role_name="eval_admin"),
@@ -1063,6 +1068,7 @@ async def test_finalize_period_marks_completed_without_bulk_level_updates():
         EvaluationPeriodStatus.COMPLETED,
         "org_test",
     )
+    service._write_period_snapshots.assert_awaited_once_with(org_id="org_test", period_id=period_id)
     session.commit.assert_awaited_once()
     assert result.previous_status == "active"
     assert result.current_status == "completed"
@@ -1079,6 +1085,7 @@ async def test_finalize_period_allows_draft_status():
     service.period_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(status="draft"))
     service.get_comprehensive_evaluation = AsyncMock()
     service.period_repo.update_status = AsyncMock(return_value=SimpleNamespace(status="completed"))
+    service._write_period_snapshots = AsyncMock(return_value=0)
 
     result = await service.finalize_evaluation_period(
         context=make_context(role_name="eval_admin"),
@@ -1104,6 +1111,7 @@ async def test_finalize_period_is_idempotent_when_already_completed():
     service.period_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(status="completed"))
     service.get_comprehensive_evaluation = AsyncMock()
     service.period_repo.update_status = AsyncMock()
+    service._write_period_snapshots = AsyncMock(return_value=0)
 
     result = await service.finalize_evaluation_period(
         context=make_context(role_name="eval_admin"),
@@ -1175,10 +1183,12 @@ async def test_process_user_evaluation_applies_computed_level_and_marks_processe
         period_id=period_id,
         user_id=user_id,
         processed_by_user_id=UUID("00000000-0000-0000-0000-000000000001"),
+        pre_decision=(None, 20),
     )
     assert result.processing_status == "processed"
     assert result.updated_level is True
     assert result.updated_stage is False
+    assert service._get_period_settings_map.await_args.kwargs["cached"] is False
 
 
 @pytest.mark.asyncio
@@ -1256,3 +1266,230 @@ async def test_process_user_evaluation_rejects_closed_period(period_status: str)
             period_id=period_id,
             user_id=uuid4(),
         )
+
+
+def _process_row(period_id, user_id, **overrides):
+    row = {
+        "id": f"{period_id}:{user_id}",
+        "user_id": user_id,
+        "employee_code": "E100",
+        "name": "Bulk User",
+        "department_name": "Engineering",
+        "employment_type": "employee",
+        "processing_status": "unprocessed",
+        "performance_weight_percent": 100,
+        "competency_weight_percent": 10,
+        "performance_score": 4.40,
+        "performance_raw_score": 4.40,
+        "mbo_total_100": 70.0,
+        "competency_score": 0.52,
+        "competency_raw_score": 5.20,
+        "core_value_score": None,
+        "core_value_raw_score": None,
+        "current_stage": "STAGE4",
+        "current_level": 20,
+        "manual_decision": None,
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.mark.asyncio
+async def test_process_period_evaluations_batches_writes_per_chunk():
+    session = AsyncMock()
+    service = ComprehensiveEvaluationService(session)
+    period_id = uuid4()
+    next_stage_id = uuid4()
+    user_ids = [uuid4() for _ in range(5)]
+    rows = [_process_row(period_id, user_id) for user_id in user_ids[:3]]
+    rows.append(
+        _process_row(
+            period_id,
+            user_ids[3],
+            manual_decision="昇格",
+            manual_stage_after="STAGE5",
+            manual_level_after=40,
+            manual_reason="manual",
+            manual_double_checked_by=None,
+            manual_applied_by_user_id=UUID("00000000-0000-0000-0000-000000000001"),
+            manual_applied_at="2026-03-03T00:00:00+00:00",
+        )
+    )
+    rows.append(
+        _process_row(
+            period_id,
+            user_ids[4],
+            manual_decision="昇格",
+            manual_stage_after="STAGE9",
+            manual_level_after=None,
+            manual_reason="manual",
+            manual_double_checked_by=None,
+            manual_applied_by_user_id=UUID("00000000-0000-0000-0000-000000000001"),
+            manual_applied_at="2026-03-03T00:00:00+00:00",
+        )
+    )
+
+    service.period_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(status="active"))
+    service._get_period_settings_map = AsyncMock(return_value=(build_settings(), {}, {}))
+    service.stage_repo.get_all = AsyncMock(return_value=[SimpleNamespace(id=next_stage_id, name="STAGE5")])
+    service.repo.list_rows = AsyncMock(return_value=(rows, len(rows)))
+    service.user_repo.batch_update_user_stages = AsyncMock(side_effect=lambda org_id, updates: set(updates))
+    service.user_repo.batch_update_user_levels = AsyncMock(side_effect=lambda org_id, updates: set(updates))
+    service.repo.upsert_processing_statuses = AsyncMock()
+    progress = []
+
+    result = await service.process_period_evaluations(
+        context=make_context(role_name="eval_admin"),
+        period_id=period_id,
+        chunk_size=3,
+        on_progress=lambda done, total: progress.append((done, total)),
+    )
+
+    list_kwargs = service.repo.list_rows.await_args.kwargs
+    assert list_kwargs["processing_status"] == "unprocessed" and list_kwargs["limit"] is None
+    service._get_period_settings_map.assert_awaited_once()
+    assert service._get_period_settings_map.await_args.kwargs["cached"] is False
+    service.stage_repo.get_all.assert_awaited_once()
+
+    assert service.user_repo.batch_update_user_levels.await_args_list[0].args == (
+        "org_test",
+        {user_id: 28 for user_id in user_ids[:3]},
+    )
+    assert service.user_repo.batch_update_user_stages.await_args_list[1].args == (
+        "org_test",
+        {user_ids[3]: next_stage_id},
+    )
+    assert service.user_repo.batch_update_user_levels.await_args_list[1].args == ("org_test", {user_ids[3]: 30})
+    marked = [call.kwargs["user_ids"] for call in service.repo.upsert_processing_statuses.await_args_list]
+    assert marked == [user_ids[:3], [user_ids[3]]]
+    recorded = [call.kwargs["pre_decision"] for call in service.repo.upsert_processing_statuses.await_args_list]
+    assert recorded == [{user_id: (None, 20) for user_id in user_ids[:3]}, {user_ids[3]: (None, 20)}]
+    assert session.commit.await_count == 2
+    assert progress == [(3, 4), (4, 4)]
+
+    assert result.total_users == 5 and result.processed_users == 4
+    assert result.updated_user_levels == 4 and result.updated_user_stages == 1
+    assert result.committed_chunks == 2
+    assert [failure.user_id for failure in result.failed_users] == [user_ids[4]]
+    assert "not registered" in result.failed_users[0].reason
+
+
+@pytest.mark.asyncio
+async def test_process_period_evaluations_rolls_back_failed_chunk_and_keeps_earlier_ones():
+    session = AsyncMock()
+    service = ComprehensiveEvaluationService(session)
+    period_id = uuid4()
+    rows = [_process_row(period_id, uuid4()) for _ in range(4)]
+
+    service.period_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(status="active"))
+    service._get_period_settings_map = AsyncMock(return_value=(build_settings(), {}, {}))
+    service.stage_repo.get_all = AsyncMock(return_value=[])
+    service.repo.list_rows = AsyncMock(return_value=(rows, len(rows)))
+    service.user_repo.batch_update_user_stages = AsyncMock(return_value=set())
+    service.user_repo.batch_update_user_levels = AsyncMock(side_effect=[{rows[0]["user_id"]}, RuntimeError("db down")])
+    service.repo.upsert_processing_statuses = AsyncMock()
+
+    with pytest.raises(RuntimeError):
+        await service.process_period_evaluations(
+            context=make_context(role_name="eval_admin"),
+            period_id=period_id,
+            chunk_size=2,
+        )
+
+    assert session.commit.await_count == 1
+    session.rollback.assert_awaited_once()
+    service.repo.upsert_processing_statuses.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_finalize_period_can_process_remaining_users_first():
+    session = AsyncMock()
+    service = ComprehensiveEvaluationService(session)
+    period_id = uuid4()
+    user_id = uuid4()
+
+    service.period_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(status="active"))
+    service.period_repo.update_status = AsyncMock()
+    service._get_period_settings_map = AsyncMock(return_value=(build_settings(), {}, {}))
+    service.stage_repo.get_all = AsyncMock(return_value=[])
+    service.repo.list_rows = AsyncMock(return_value=([_process_row(period_id, user_id)], 1))
+    service.user_repo.batch_update_user_stages = AsyncMock(return_value=set())
+    service.user_repo.batch_update_user_levels = AsyncMock(return_value={user_id})
+    service.repo.upsert_processing_statuses = AsyncMock()
+    service._write_period_snapshots = AsyncMock(return_value=1)
+
+    result = await service.finalize_evaluation_period(
+        context=make_context(role_name="eval_admin"),
+        period_id=period_id,
+        process_remaining=True,
+    )
+
+    service.period_repo.update_status.assert_awaited_once()
+    assert result.current_status == "completed"
+    assert result.total_users == 1 and result.updated_user_levels == 1
+
+
+@pytest.mark.asyncio
+async def test_period_settings_map_is_cached_until_the_database_fingerprint_moves():
+    service = ComprehensiveEvaluationService(AsyncMock())
+    period_id = uuid4()
+    department_id = uuid4()
+    default_json = build_settings().model_dump(mode="json", by_alias=True)
+    department_settings = build_settings()
+    department_settings.overall_score_thresholds["A"] = 4.0
+    assignment_rows = [
+        {"department_id": None, "stage_id": None, "settings_json": default_json},
+        {
+            "department_id": department_id,
+            "stage_id": None,
+            "settings_json": department_settings.model_dump(mode="json", by_alias=True),
+        },
+    ]
+    service.repo.get_period_settings_fingerprint = AsyncMock(return_value=(2, datetime(2026, 4, 1), 1, None))
+    service.repo.list_period_assignments = AsyncMock(return_value=assignment_rows)
+
+    first = await service._get_period_settings_map(org_id="org_test", period_id=period_id)
+    service._build_settings_from_json = Mock(side_effect=AssertionError("settings JSON parsed again"))
+    second = await service._get_period_settings_map(org_id="org_test", period_id=period_id)
+
+    assert second is first
+    service.repo.list_period_assignments.assert_awaited_once()
+    default_settings, settings_by_department, _ = first
+    assert settings_by_department[department_id].overall_score_thresholds["A"] == 4.0
+    with pytest.raises(ValidationError):
+        default_settings.overall_score_thresholds = {}
+    with pytest.raises(TypeError):
+        settings_by_department[uuid4()] = default_settings
+
+    # Another worker saves the default assignment: this process sees it through the fingerprint.
+    del service._build_settings_from_json
+    changed = build_settings()
+    changed.overall_score_thresholds["A"] = 3.9
+    assignment_rows[0] = {
+        "department_id": None,
+        "stage_id": None,
+        "settings_json": changed.model_dump(mode="json", by_alias=True),
+    }
+    service.repo.get_period_settings_fingerprint.return_value = (2, datetime(2026, 4, 2), 1, None)
+
+    third = await service._get_period_settings_map(org_id="org_test", period_id=period_id)
+    assert third is not first
+    assert third[0].overall_score_thresholds["A"] == 3.9
+    assert service.repo.list_period_assignments.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_uncached_period_settings_skip_the_cache_and_fingerprint():
+    service = ComprehensiveEvaluationService(AsyncMock())
+    period_id = uuid4()
+    service.repo.get_period_settings_fingerprint = AsyncMock()
+    service.repo.list_period_assignments = AsyncMock(return_value=[
+        {"department_id": None, "stage_id": None, "settings_json": build_settings().model_dump(mode="json", by_alias=True)},
+    ])
+
+    first, _, _ = await service._get_period_settings_map(org_id="org_test", period_id=period_id, cached=False)
+    second, _, _ = await service._get_period_settings_map(org_id="org_test", period_id=period_id, cached=False)
+
+    assert first is not second
+    service.repo.get_period_settings_fingerprint.assert_not_awaited()
+    assert service.repo.list_period_assignments.await_count == 2
@@ -0,0 +1,224 @@
+"""
+Tests for the finalized-period snapshots of the comprehensive evaluation.
+
+Pattern: async with mocked repos — same as test_comprehensive_evaluation_service.py.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.core.exceptions import BadRequestError
+from app.schemas.comprehensive_evaluation import (
+    ComprehensiveEvaluationSettings,
+    ComprehensiveSnapshotExportRequest,
+)
+from app.security.context import AuthContext, RoleInfo
+from app.services.comprehensive_evaluation_service import ComprehensiveEvaluationService
+
+
+def _settings() -> ComprehensiveEvaluationSettings:
+    return ComprehensiveEvaluationSettings.model_validate(
+        {
+            "promotion": {"ruleGroups": []},
+            "demotion": {"ruleGroups": []},
+            "overallScoreThresholds": {"SS": 6.5, "S": 5.5, "A+": 4.5, "A": 3.7, "A-": 2.7, "B": 1.7, "C": 1.0, "D": 0.1},
+            "levelDeltaByOverallRank": {"SS": 10, "S": 8, "A+": 6, "A": 5, "A-": 2, "B": 1, "C": -5, "D": -8},
+        }
+    )
+
+
+def _context(role_name: str = "eval_admin") -> AuthContext:
+    return AuthContext(
+        user_id=UUID("00000000-0000-0000-0000-000000000001"),
+        roles=[RoleInfo(id=1, name=role_name, description="")],
+        organization_id="org_test",
+        organization_slug="test-org",
+    )
+
+
+def _row(period_id, user_id, *, employee_code="E-001", mbo=56.0, competency=4.6):
+    return {
+        "id": f"{period_id}:{user_id}",
+        "user_id": user_id,
+        "employee_code": employee_code,
+        "name": "User",
+        "department_name": "Sales",
+        "department_id": None,
+        "stage_id": None,
+        "employment_type": "employee",
+        "processing_status": "processed",
+        "performance_weight_percent": 100,
+        "competency_weight_percent": 10,
+        "mbo_total_100": mbo,
+        "competency_raw_score": competency,
+        "competency_score": None,
+        "core_value_raw_score": 5.0,
+        "core_value_score": None,
+        "current_stage": "STAGE3",
+        "current_level": 10,
+        "manual_decision": None,
+    }
+
+
+async def _documents_for(service, period_id, rows, activity=None):
+    """Run _write_period_snapshots against mocked repos and return the written documents."""
+    service._get_period_settings_map = AsyncMock(return_value=(_settings(), {}, {}))
+    service.repo.list_rows = AsyncMock(return_value=(rows, len(rows)))
+    service.repo.list_period_activity_counts = AsyncMock(return_value=activity or {})
+    service.repo.upsert_period_snapshots = AsyncMock(return_value=len(rows))
+    service.repo.refresh_period_facts = AsyncMock(return_value=1)
+    await service._write_period_snapshots(org_id="org_test", period_id=period_id)
+    return service.repo.upsert_period_snapshots.await_args.kwargs["documents"]
+
+
+@pytest.mark.asyncio
+async def test_write_period_snapshots_freezes_applied_rows_and_activity():
+    service = ComprehensiveEvaluationService(AsyncMock())
+    period_id = uuid4()
+    user_id = uuid4()
+    activity = {user_id: {"goals_count": 4, "completed_assessments_count": 3, "received_feedbacks_count": 2}}
+
+    documents = await _documents_for(service, period_id, [_row(period_id, user_id)], activity)
+
+    assert service.repo.list_rows.await_args.kwargs["limit"] is None
+    assert service.repo.upsert_period_snapshots.await_args.kwargs["prune"] is True
+    service.repo.refresh_period_facts.assert_awaited_once_with(org_id="org_test", period_id=period_id)
+    document = documents[user_id]
+    assert document["version"] == 1
+    assert document["activity"] == {"goalsCount": 4, "completedAssessmentsCount": 3, "receivedFeedbacksCount": 2}
+
+    snapshot = service._parse_snapshot_document(document)
+    live = service._build_row_from_repo_item(item=_row(period_id, user_id), period_id=period_id, settings=_settings())
+    assert snapshot.row == live
+    assert snapshot.row.applied.overall_rank == "A"
+
+
+@pytest.mark.asyncio
+async def test_my_comprehensive_evaluation_reads_snapshot_without_recomputing():
+    service = ComprehensiveEvaluationService(AsyncMock())
+    period_id = uuid4()
+    user_id = _context().user_id
+    document = (await _documents_for(service, period_id, [_row(period_id, user_id)]))[user_id]
+
+    service.period_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(status="completed"))
+    service.repo.get_period_snapshot = AsyncMock(return_value=document)
+    service.repo.list_rows = AsyncMock()
+
+    result = await service.get_my_comprehensive_evaluation(context=_context("employee"), period_id=period_id)
+
+    assert result.overall_rank == "A"
+    service.repo.list_rows.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_compare_periods_aligns_results_with_requested_periods():
+    service = ComprehensiveEvaluationService(AsyncMock())
+    first, second = uuid4(), uuid4()
+    both, only_second = uuid4(), uuid4()
+    first_documents = await _documents_for(service, first, [_row(first, both, employee_code="E-002", mbo=90.0)])
+    second_documents = await _documents_for(
+        service,
+        second,
+        [_row(second, both, employee_code="E-002"), _row(second, only_second, employee_code="E-001")],
+    )
+
+    service.period_repo.get_by_id = AsyncMock(
+        side_effect=lambda period_id, org_id: SimpleNamespace(
+            status="completed", name="2025" if period_id == first else "2026"
+        )
+    )
+    service.repo.list_period_snapshots = AsyncMock(
+        return_value=[
+            {"period_id": first, "user_id": both, "document": first_documents[both]},
+            {"period_id": second, "user_id": only_second, "document": second_documents[only_second]},
+            {"period_id": second, "user_id": both, "document": second_documents[both]},
+        ]
+    )
+
+    result = await service.compare_periods(context=_context(), period_ids=[first, second])
+
+    assert [(period.period_name, period.snapshot_count) for period in result.periods] == [("2025", 1), ("2026", 2)]
+    assert [user.employee_code for user in result.users] == ["E-001", "E-002"]
+    missing, present = result.users[0].results
+    assert missing is None and present.overall_rank == "A"
+    assert [entry.overall_rank for entry in result.users[1].results] == ["SS", "A"]
+
+
+@pytest.mark.asyncio
+async def test_export_period_snapshots_prefixes_period_name_and_requires_completed_periods():
+    service = ComprehensiveEvaluationService(AsyncMock())
+    period_id = uuid4()
+    user_id = uuid4()
+    document = (await _documents_for(service, period_id, [_row(period_id, user_id)]))[user_id]
+    service.repo.list_period_snapshots = AsyncMock(
+        return_value=[{"period_id": period_id, "user_id": user_id, "document": document}]
+    )
+    payload = ComprehensiveSnapshotExportRequest(periodIds=[period_id], columns=["employeeCode", "overallRank"])
+
+    service.period_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(status="completed", name="2026 上期"))
+    csv_content = await service.export_period_snapshots_csv(context=_context(), payload=payload)
+    assert csv_content.splitlines() == ["評価期間,社員番号,総合評価", "2026 上期,E-001,A"]
+
+    service.period_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(status="active", name="2026 下期"))
+    with pytest.raises(BadRequestError):
+        await service.export_period_snapshots_csv(context=_context(), payload=payload)
+
+
+class _ProcessingState:
+    """users / comprehensive_processing_statuses as list_rows reads them (pre-decision state when recorded)."""
+
+    def __init__(self, period_id, user_id, *, level):
+        self.period_id = period_id
+        self.user_id = user_id
+        self.level = level
+        self.status = None
+
+    async def list_rows(self, **_):
+        row = _row(self.period_id, self.user_id)
+        recorded = self.status is not None and self.status["pre_decision"] is not None
+        row["processing_status"] = "processed" if self.status is not None else "unprocessed"
+        row["current_level"] = self.status["pre_decision"][1] if recorded else self.level
+        return [row], 1
+
+    async def batch_update_user_levels(self, org_id, updates):
+        self.level = updates[self.user_id]
+        return [self.user_id]
+
+    async def upsert_processing_status(self, *, pre_decision=None, **_):
+        if self.status is None or self.status["pre_decision"] is None:
+            self.status = {"pre_decision": pre_decision}
+
+
+@pytest.mark.asyncio
+async def test_processed_then_finalized_snapshot_reports_the_applied_level_once():
+    service = ComprehensiveEvaluationService(AsyncMock())
+    period_id, user_id = uuid4(), uuid4()
+    state = _ProcessingState(period_id, user_id, level=10)
+    period = SimpleNamespace(status="active")
+    service.period_repo.get_by_id = AsyncMock(return_value=period)
+    service._get_period_settings_map = AsyncMock(return_value=(_settings(), {}, {}))
+    service.repo.list_rows = AsyncMock(side_effect=state.list_rows)
+    service.repo.upsert_processing_status = AsyncMock(side_effect=state.upsert_processing_status)
+    service.user_repo.batch_update_user_levels = AsyncMock(side_effect=state.batch_update_user_levels)
+
+    await service.process_user_evaluation(context=_context(), period_id=period_id, user_id=user_id)
+    # Re-processing starts from the recorded level instead of the already-applied one.
+    await service.process_user_evaluation(context=_context(), period_id=period_id, user_id=user_id)
+
+    assert state.level == 15
+    assert service.repo.upsert_processing_status.await_args_list[0].kwargs["pre_decision"] == (None, 10)
+
+    service.period_repo.update_status = AsyncMock()
+    service.repo.list_period_activity_counts = AsyncMock(return_value={})
+    service.repo.upsert_period_snapshots = AsyncMock(return_value=1)
+    service.repo.refresh_period_facts = AsyncMock(return_value=1)
+    await service.finalize_evaluation_period(context=_context(), period_id=period_id)
+
+    snapshot = service._parse_snapshot_document(
+        service.repo.upsert_period_snapshots.await_args.kwargs["documents"][user_id]
+    )
+    assert snapshot.row.current_level == 10
+    assert snapshot.row.auto.new_level == snapshot.row.applied.new_level == state.level
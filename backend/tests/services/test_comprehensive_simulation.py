@@ -0,0 +1,161 @@
+"""
+Tests for the comprehensive evaluation settings simulator.
+
+Pattern: async with mocked repos — same as test_comprehensive_evaluation_service.py.
+"""
+
+from itertools import product
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.core.exceptions import BadRequestError
+from app.schemas.comprehensive_evaluation import ComprehensiveEvaluationSettings
+from app.security.context import AuthContext, RoleInfo
+from app.services.comprehensive_evaluation_service import ComprehensiveEvaluationService
+from app.services.comprehensive_simulation import ScoreSnapshot, invalidate_score_snapshot, simulate
+
+
+def _settings(**threshold_overrides) -> ComprehensiveEvaluationSettings:
+    thresholds = {"SS": 6.5, "S": 5.5, "A+": 4.5, "A": 3.7, "A-": 2.7, "B": 1.7, "C": 1.0, "D": 0.1}
+    thresholds.update({rank.replace("_plus", "+"): value for rank, value in threshold_overrides.items()})
+    return ComprehensiveEvaluationSettings.model_validate(
+        {
+            "promotion": {
+                "ruleGroups": [
+                    {
+                        "id": "p1",
+                        "conditions": [
+                            {"type": "rank_at_least", "field": "overallRank", "minimumRank": "A+"},
+                            {"type": "rank_at_least", "field": "coreValueFinalRank", "minimumRank": "A"},
+                        ],
+                    },
+                    {
+                        "id": "p2",
+                        "conditions": [{"type": "rank_at_least", "field": "competencyFinalRank", "minimumRank": "SS"}],
+                    },
+                ]
+            },
+            "demotion": {
+                "ruleGroups": [
+                    {
+                        "id": "d1",
+                        "conditions": [{"type": "rank_at_or_worse", "field": "overallRank", "thresholdRank": "C"}],
+                    }
+                ]
+            },
+            "overallScoreThresholds": thresholds,
+            "levelDeltaByOverallRank": {"SS": 10, "S": 8, "A+": 6, "A": 5, "A-": 2, "B": 1, "C": -5, "D": -8},
+        }
+    )
+
+
+def _context() -> AuthContext:
+    return AuthContext(
+        user_id=UUID("00000000-0000-0000-0000-000000000001"),
+        roles=[RoleInfo(id=1, name="eval_admin", description="")],
+        organization_id="org_test",
+        organization_slug="test-org",
+    )
+
+
+def _row(period_id, *, mbo, competency, core_value, employment="employee", level=10, department_id=None):
+    user_id = uuid4()
+    return {
+        "id": f"{period_id}:{user_id}",
+        "user_id": user_id,
+        "employee_code": f"E-{user_id.hex[:6]}",
+        "name": "User",
+        "department_name": None,
+        "department_id": department_id,
+        "stage_id": None,
+        "employment_type": employment,
+        "processing_status": "unprocessed",
+        "performance_weight_percent": 100,
+        "competency_weight_percent": 10,
+        "mbo_total_100": mbo,
+        "competency_raw_score": competency,
+        "competency_score": None,
+        "core_value_raw_score": core_value,
+        "core_value_score": None,
+        "current_stage": "STAGE3",
+        "current_level": level,
+        "manual_decision": None,
+    }
+
+
+def test_simulation_matches_row_builder_auto_state():
+    service = ComprehensiveEvaluationService(AsyncMock())
+    period_id = uuid4()
+    settings = _settings(A=4.0)
+    rows = [
+        _row(period_id, mbo=mbo, competency=competency, core_value=core_value, employment=employment, level=level)
+        for mbo, competency, core_value, employment, level in product(
+            (None, 5.0, 19.9, 20.0, 55.9, 70.0, 90.0),
+            (None, 0.05, 1.0, 3.9, 4.5, 6.6),
+            (None, 2.0, 5.0),
+            ("employee", "parttime"),
+            (None, 12),
+        )
+    ]
+
+    outcome = simulate(ScoreSnapshot.from_rows(period_id, rows), [settings] * len(rows))
+
+    for index, item in enumerate(rows):
+        auto = service._build_row_from_repo_item(item=item, period_id=period_id, settings=settings).auto
+        assert outcome.overall_ranks[index] == auto.overall_rank
+        assert outcome.promotion_flags[index] == auto.promotion_flag
+        assert outcome.demotion_flags[index] == auto.demotion_flag
+        assert outcome.new_levels[index] == auto.new_level
+
+
+@pytest.mark.asyncio
+async def test_simulate_settings_reports_changes_from_cached_snapshot():
+    service = ComprehensiveEvaluationService(AsyncMock())
+    period_id = uuid4()
+    department_id = uuid4()
+    # mbo 56 → A (3.7 numeric), competency 4.6 → A+ : q = 3.7*10/11 + 5/11 ≈ 3.82 → A
+    in_department = _row(period_id, mbo=56.0, competency=4.6, core_value=5.0, department_id=department_id)
+    elsewhere = _row(period_id, mbo=56.0, competency=4.6, core_value=5.0)
+    rows = [in_department, elsewhere]
+
+    service.period_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(status="active"))
+    service._get_period_settings_map = AsyncMock(return_value=(_settings(), {}, {}))
+    service.repo.list_rows = AsyncMock(return_value=(rows, len(rows)))
+    invalidate_score_snapshot("org_test", period_id)
+
+    # Lowering the A+ boundary for one department promotes only that department's user.
+    result = await service.simulate_settings(
+        context=_context(),
+        period_id=period_id,
+        settings=_settings(A_plus=3.8),
+        department_id=department_id,
+    )
+
+    assert result.total_users == 2
+    assert result.current.rank_distribution["A"] == 2
+    assert result.simulated.rank_distribution["A"] == 1 and result.simulated.rank_distribution["A+"] == 1
+    assert result.current.promotion_candidates == 0 and result.simulated.promotion_candidates == 1
+    assert result.changed_user_count == 1
+    changed = result.changed_users[0]
+    assert changed.user_id == in_department["user_id"]
+    assert (changed.current_overall_rank, changed.simulated_overall_rank) == ("A", "A+")
+    assert (changed.current_new_level, changed.simulated_new_level) == (15, 16)
+
+    # Second simulation reuses the snapshot; only the saved settings are re-read.
+    result = await service.simulate_settings(context=_context(), period_id=period_id, settings=_settings())
+    assert result.changed_user_count == 0
+    service.repo.list_rows.assert_awaited_once()
+    assert service.repo.list_rows.await_args.kwargs["limit"] is None
+
+
+@pytest.mark.asyncio
+async def test_simulate_settings_validates_draft_before_loading_scores():
+    service = ComprehensiveEvaluationService(AsyncMock())
+    service.repo.list_rows = AsyncMock()
+
+    with pytest.raises(BadRequestError, match="strictly descending"):
+        await service.simulate_settings(context=_context(), period_id=uuid4(), settings=_settings(S=7.0))
+    service.repo.list_rows.assert_not_awaited()
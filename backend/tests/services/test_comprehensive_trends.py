@@ -0,0 +1,203 @@
+"""
+Tests for the cross-period trends of the comprehensive evaluation.
+
+Pattern: async with mocked repos — same as test_comprehensive_evaluation_service.py.
+"""
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.core.exceptions import PermissionDeniedError
+from app.schemas.comprehensive_evaluation import ComprehensiveManualDecisionUpsertRequest
+from app.security.context import AuthContext, RoleInfo
+from app.services.comprehensive_evaluation_service import ComprehensiveEvaluationService
+from app.services.comprehensive_trends import build_trend_groups, percentile
+
+
+def _context(role_name: str = "admin") -> AuthContext:
+    return AuthContext(
+        user_id=UUID("00000000-0000-0000-0000-000000000001"),
+        roles=[RoleInfo(id=1, name=role_name, description="")],
+        organization_id="org_test",
+        organization_slug="test-org",
+    )
+
+
+def _fact(period_id, *, department="Sales", stage="STAGE3", scores=(), ranks=None, promotions=0, goals=0, completed=0):
+    return {
+        "period_id": period_id,
+        "department_name": department,
+        "stage_name": stage,
+        "user_count": len(scores),
+        "processed_count": len(scores),
+        "unranked_count": 0,
+        "rank_counts": ranks or {},
+        "promotion_count": promotions,
+        "demotion_count": 0,
+        "performance_scores": sorted(scores),
+        "total_scores": sorted(scores),
+        "goals_count": goals,
+        "completed_assessments_count": completed,
+        "received_feedbacks_count": 0,
+    }
+
+
+def test_percentile_interpolates_between_ranks():
+    assert percentile([], 0.5) is None
+    assert percentile([10.0], 0.9) == 10.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 2.5
+    assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 0.25) == 2.0
+
+
+def test_build_trend_groups_merges_fact_rows_per_period():
+    first, second = uuid4(), uuid4()
+    facts = [
+        _fact(first, department="Sales", scores=[1.0, 3.0], ranks={"A": 2}, promotions=1, goals=4, completed=2),
+        _fact(first, department="Dev", scores=[2.0, 4.0], ranks={"A": 1, "B": 1}, goals=4, completed=4),
+        _fact(second, department=None, scores=[5.0], ranks={"S": 1}),
+    ]
+
+    [group] = build_trend_groups(facts, [first, second], group_by="period")
+    point = group.points[0]
+    assert group.key is None
+    assert point.user_count == 4
+    assert point.rank_distribution["A"] == 3 and point.rank_distribution["B"] == 1
+    assert point.promotion_rate == 0.25
+    assert point.assessment_completion_rate == 0.75
+    assert (point.performance_score.p50, point.performance_score.average) == (2.5, 2.5)
+
+    by_department = build_trend_groups(facts, [first, second], group_by="department")
+    assert [group.key for group in by_department] == ["Dev", "Sales", None]
+    assert by_department[0].points[1] is None
+    assert by_department[2].points[0] is None and by_department[2].points[1].user_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_trends_defaults_to_recent_completed_periods_and_filters_facts():
+    service = ComprehensiveEvaluationService(AsyncMock())
+    older, newer = uuid4(), uuid4()
+    service.period_repo.get_by_status = AsyncMock(
+        return_value=[
+            SimpleNamespace(id=newer, name="2026", start_date=date(2026, 4, 1)),
+            SimpleNamespace(id=older, name="2025", start_date=date(2025, 4, 1)),
+        ]
+    )
+    service.repo.list_period_facts = AsyncMock(
+        return_value=[
+            _fact(older, department="Sales", scores=[3.0]),
+            _fact(newer, department="Sales", scores=[4.0, 5.0]),
+            _fact(newer, department="Dev", scores=[1.0]),
+        ]
+    )
+
+    result = await service.get_trends(
+        context=_context(), period_ids=None, group_by="period", department_name=" Sales "
+    )
+
+    service.repo.list_period_facts.assert_awaited_once_with(org_id="org_test", period_ids=[older, newer])
+    assert [(period.period_name, period.snapshot_count) for period in result.periods] == [("2025", 1), ("2026", 2)]
+    assert [point.performance_score.average for point in result.groups[0].points] == [3.0, 4.5]
+
+
+@pytest.mark.asyncio
+async def test_get_trends_requires_read_role():
+    service = ComprehensiveEvaluationService(AsyncMock())
+    with pytest.raises(PermissionDeniedError):
+        await service.get_trends(context=_context("employee"), period_ids=None, group_by="period")
+
+
+def _fact_from_snapshot(period_id, document):
+    """One-snapshot comprehensive_period_facts row, read from the document paths refresh_period_facts uses."""
+    row = document["row"]
+    applied = row["applied"]
+    score = row["performanceScore"]
+    return _fact(
+        period_id,
+        department=row["departmentName"],
+        stage=row["currentStage"],
+        scores=[score] if score is not None else [],
+        ranks={applied["overallRank"]: 1} if applied["overallRank"] else {},
+        promotions=int(applied["decision"] == "昇格"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_promoted_user_trends_under_the_stage_they_were_evaluated_in():
+    service = ComprehensiveEvaluationService(AsyncMock())
+    period_id, user_id = uuid4(), uuid4()
+    stage3_id, stage4_id = uuid4(), uuid4()
+    live = {"stage": "STAGE3", "manual": {}}
+
+    async def list_rows(**_):
+        # Processed before the promotion: list_rows reports the recorded pre-decision stage/level.
+        return [
+            {
+                "id": f"{period_id}:{user_id}",
+                "user_id": user_id,
+                "employee_code": "E-001",
+                "name": "User",
+                "department_name": "Sales",
+                "department_id": None,
+                "stage_id": stage3_id,
+                "employment_type": "employee",
+                "processing_status": "processed",
+                "performance_weight_percent": 100,
+                "competency_weight_percent": 10,
+                "mbo_total_100": 70.0,
+                "competency_raw_score": 5.2,
+                "current_stage": "STAGE3",
+                "current_level": 10,
+                **live["manual"],
+            }
+        ], 1
+
+    async def upsert_manual_decision(**kwargs):
+        live["manual"] = {
+            "manual_decision": kwargs["decision"],
+            "manual_stage_after": kwargs["stage_after"],
+            "manual_level_after": kwargs["level_after"],
+            "manual_reason": kwargs["reason"],
+            "manual_applied_by_user_id": kwargs["applied_by_user_id"],
+            "manual_applied_at": "2026-04-01T00:00:00+00:00",
+        }
+        return {"period_id": period_id, "decision": kwargs["decision"], **kwargs, "applied_at": "2026-04-01T00:00:00+00:00"}
+
+    async def update_user_stage(user_id, stage_id, org_id):
+        live["stage"] = "STAGE4"
+
+    service.period_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(status="completed"))
+    service._get_period_settings_map = AsyncMock(return_value=(service._build_default_settings(), {}, {}))
+    service.stage_repo.get_by_name = AsyncMock(return_value=SimpleNamespace(id=stage4_id, name="STAGE4"))
+    service.repo.is_user_processed = AsyncMock(return_value=True)
+    service.repo.get_user_employment_profile = AsyncMock(return_value={"employment_type": "employee", "level": 15})
+    service.repo.upsert_manual_decision = AsyncMock(side_effect=upsert_manual_decision)
+    service.repo.upsert_processing_status = AsyncMock()
+    service.repo.insert_manual_decision_history = AsyncMock()
+    service.repo.list_rows = AsyncMock(side_effect=list_rows)
+    service.repo.list_period_activity_counts = AsyncMock(return_value={})
+    service.repo.upsert_period_snapshots = AsyncMock(return_value=1)
+    service.repo.refresh_period_facts = AsyncMock(return_value=1)
+    service.user_repo.update_user_stage = AsyncMock(side_effect=update_user_stage)
+    service.user_repo.batch_update_user_levels = AsyncMock(return_value=[user_id])
+
+    await service.upsert_manual_decision(
+        context=_context("eval_admin"),
+        user_id=user_id,
+        payload=ComprehensiveManualDecisionUpsertRequest(
+            periodId=period_id, decision="昇格", stageAfter="STAGE4", levelAfter=1, reason="promoted"
+        ),
+    )
+
+    document = service.repo.upsert_period_snapshots.await_args.kwargs["documents"][user_id]
+    assert live["stage"] == "STAGE4"
+    assert (document["row"]["currentStage"], document["row"]["applied"]["newStage"]) == ("STAGE3", "STAGE4")
+    service.repo.upsert_processing_status.assert_awaited_once()
+    assert "pre_decision" not in service.repo.upsert_processing_status.await_args.kwargs
+
+    [group] = build_trend_groups([_fact_from_snapshot(period_id, document)], [period_id], group_by="stage")
+    assert group.key == "STAGE3"
+    assert group.points[0].promotion_rate == 1.0
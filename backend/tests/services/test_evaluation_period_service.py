@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import BadRequestError
 from app.database.models.evaluation import EvaluationPeriodStatus
+from app.schemas.common import PaginationParams
 from app.schemas.evaluation import EvaluationPeriodCreate, EvaluationPeriodType
 from app.security.context import AuthContext, RoleInfo
 from app.security.permissions import Permission
@@ -145,3 +146,66 @@ async def test_delete_validation_rejects_active_and_cancelled(status: Evaluation
 
     with pytest.raises(BadRequestError, match=f"Cannot delete {status} evaluation period"):
         await service._validate_period_deletion(period)
+
+
+def _activity_row(name, **overrides):
+    row = {
+        "id": uuid4(),
+        "name": name,
+        "employee_code": f"E-{name}",
+        "department_name": "Sales",
+        "role_name": "employee",
+        "supervisor_name": "boss",
+        "subordinate_name": None,
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.mark.asyncio
+async def test_goal_statistics_are_aggregated_in_the_database():
+    service = EvaluationPeriodService(AsyncMock(spec=AsyncSession))
+    period_id = uuid4()
+    alice, bob = _activity_row("alice"), _activity_row("bob", department_name=None, role_name=None)
+    submitted_at = datetime(2026, 3, 1, 9, 0)
+
+    service.evaluation_period_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(id=period_id))
+    service.goal_repo.get_period_status_counts = AsyncMock(return_value={"draft": 2, "submitted": 3})
+    service.user_repo.get_user_activity_page = AsyncMock(return_value=([alice, bob], 2))
+    service.goal_repo.get_period_user_goal_counts = AsyncMock(return_value={
+        alice["id"]: {"goal_count": 3, "goal_statuses": {"draft": 1, "submitted": 2}, "last_goal_submission": submitted_at},
+    })
+
+    stats = await service.get_evaluation_period_goal_statistics(_admin_context(org_id="org-1"), period_id)
+
+    assert stats.total == 5 and stats.by_status == {"draft": 2, "submitted": 3}
+    first, second = stats.user_activities
+    assert (first.goal_count, first.last_goal_submission, first.supervisor_name) == (3, submitted_at, "boss")
+    assert (second.goal_count, second.goal_statuses) == (0, {})
+    assert (second.department_name, second.user_role) == ("Unknown", "Unknown")
+    assert service.user_repo.get_user_activity_page.await_args.args == ("org-1", None)
+
+    totals_only = await service.get_evaluation_period_goal_statistics(
+        _admin_context(org_id="org-1"), period_id, include_user_activities=False
+    )
+    assert totals_only.total == 5 and totals_only.user_activities == []
+    assert service.user_repo.get_user_activity_page.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_user_activities_page_aggregates_goals_only_for_page_users():
+    service = EvaluationPeriodService(AsyncMock(spec=AsyncSession))
+    period_id = uuid4()
+    rows = [_activity_row("carol")]
+
+    service.evaluation_period_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(id=period_id))
+    service.user_repo.get_user_activity_page = AsyncMock(return_value=(rows, 41))
+    service.goal_repo.get_period_user_goal_counts = AsyncMock(return_value={})
+
+    page = await service.get_evaluation_period_user_activities(
+        _admin_context(org_id="org-1"), period_id, PaginationParams(page=3, limit=20)
+    )
+
+    assert (page.total, page.page, page.pages) == (41, 3, 3)
+    assert [item.user_name for item in page.items] == ["carol"]
+    assert service.goal_repo.get_period_user_goal_counts.await_args.args == (period_id, [rows[0]["id"]], "org-1")
@@ -0,0 +1,71 @@
+"""
+Tests for GoalService rejection history retrieval (previousGoalId chains).
+
+Pattern: async with mocked repos — same as test_goal_service_withdraw.py.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.repositories.supervisor_review_repository import SupervisorReviewRepository
+from app.services.goal_service import GoalService
+
+
+ORG_ID = "org_test"
+
+
+def _review(goal_id, comment):
+    return SimpleNamespace(goal_id=goal_id, comment=comment)
+
+
+@pytest.mark.asyncio
+async def test_batch_histories_use_one_chain_query_for_all_goals():
+    service = GoalService(AsyncMock(spec=AsyncSession))
+    first_prev, second_prev = uuid4(), uuid4()
+    goals = [
+        SimpleNamespace(previous_goal_id=first_prev),
+        SimpleNamespace(previous_goal_id=second_prev),
+        SimpleNamespace(previous_goal_id=first_prev),
+        SimpleNamespace(previous_goal_id=None),
+    ]
+    histories = {first_prev: [_review(first_prev, "too vague")]}
+    service.supervisor_review_repo.get_rejection_histories_for_chains = AsyncMock(return_value=histories)
+    service.goal_repo.get_goals_by_ids_batch = AsyncMock()
+
+    result = await service._get_rejection_histories_batch(goals, ORG_ID)
+
+    assert result == histories
+    call = service.supervisor_review_repo.get_rejection_histories_for_chains.await_args
+    assert set(call.args[0]) == {first_prev, second_prev} and call.kwargs == {"max_depth": 10}
+    service.goal_repo.get_goals_by_ids_batch.assert_not_awaited()
+
+    assert await service._get_rejection_histories_batch([SimpleNamespace(previous_goal_id=None)], ORG_ID) == {}
+    assert service.supervisor_review_repo.get_rejection_histories_for_chains.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_chain_query_is_recursive_and_histories_are_oldest_first():
+    start, middle, oldest = uuid4(), uuid4(), uuid4()
+    rows = [
+        (start, 0, _review(start, "newest")),
+        (start, 1, _review(middle, "middle, latest")),
+        (start, 1, _review(middle, "middle, superseded")),
+        (start, 2, _review(oldest, "oldest")),
+        (start, 3, _review(start, "cycle repeat")),
+    ]
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=rows)))
+
+    histories = await SupervisorReviewRepository(session).get_rejection_histories_for_chains(
+        [start], ORG_ID, max_depth=5
+    )
+
+    assert [review.comment for review in histories[start]] == ["oldest", "middle, latest", "newest"]
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("WITH RECURSIVE goal_chain")
+    assert session.execute.await_count == 1
@@ -0,0 +1,89 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.security.permissions import Permission as PermissionEnum
+from app.services import permission_service
+from app.services.org_bootstrap_service import OrgBootstrapService
+
+
+ORG_ID = "org_bootstrap"
+
+
+@pytest.fixture(autouse=True)
+def reset_catalog_marker(monkeypatch):
+    monkeypatch.setattr(permission_service, "_seeded_catalog_version", None)
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_uses_one_statement_per_seeding_step(monkeypatch):
+    session = AsyncMock(spec=AsyncSession)
+    service = OrgBootstrapService(session)
+    role_ids = {name: uuid4() for name, _ in OrgBootstrapService.CANONICAL_ROLES}
+
+    monkeypatch.setattr(
+        permission_service.PermissionRepository,
+        "is_catalog_version_seeded",
+        AsyncMock(return_value=True),
+    )
+    service.role_repo.bulk_ensure_roles = AsyncMock(
+        return_value={name: (role_id, True) for name, role_id in role_ids.items()}
+    )
+    service.role_permission_repo.bulk_assign_default_permissions = AsyncMock(return_value=10)
+
+    await service.bootstrap(ORG_ID)
+
+    service.role_repo.bulk_ensure_roles.assert_awaited_once()
+    org_id, role_rows = service.role_repo.bulk_ensure_roles.await_args.args
+    assert org_id == ORG_ID
+    assert [row[0] for row in role_rows] == [name for name, _ in OrgBootstrapService.CANONICAL_ROLES]
+    assert [row[2] for row in role_rows] == [1, 2, 3, 4, 5]
+
+    service.role_permission_repo.bulk_assign_default_permissions.assert_awaited_once()
+    _, assignments = service.role_permission_repo.bulk_assign_default_permissions.await_args.args
+    admin_codes = {code for role_id, code in assignments if role_id == role_ids["admin"]}
+    assert admin_codes == {p.value for p in PermissionEnum}
+    assert not any(role_id == role_ids["viewer"] for role_id, _ in assignments)
+
+
+@pytest.mark.asyncio
+async def test_catalog_seeding_skips_all_queries_once_version_recorded(monkeypatch):
+    session = AsyncMock(spec=AsyncSession)
+    is_seeded = AsyncMock(return_value=False)
+    bulk_seed = AsyncMock(return_value=3)
+    monkeypatch.setattr(permission_service.PermissionRepository, "is_catalog_version_seeded", is_seeded)
+    monkeypatch.setattr(permission_service.PermissionRepository, "bulk_seed_catalog", bulk_seed)
+
+    assert await permission_service.ensure_permission_catalog_seeded(session, commit=True) is True
+    assert await permission_service.ensure_permission_catalog_seeded(session, commit=True) is False
+
+    assert is_seeded.await_count == 1
+    assert bulk_seed.await_count == 1
+    seeded_catalog, version = bulk_seed.await_args.args
+    assert version == permission_service.PERMISSION_CATALOG_VERSION
+    assert len(seeded_catalog) == len(permission_service.PERMISSION_CATALOG_METADATA)
+
+
+@pytest.mark.asyncio
+async def test_catalog_seeding_without_commit_rechecks_version(monkeypatch):
+    session = AsyncMock(spec=AsyncSession)
+    is_seeded = AsyncMock(side_effect=[False, True])
+    monkeypatch.setattr(permission_service.PermissionRepository, "is_catalog_version_seeded", is_seeded)
+    monkeypatch.setattr(permission_service.PermissionRepository, "bulk_seed_catalog", AsyncMock(return_value=1))
+
+    await permission_service.ensure_permission_catalog_seeded(session)
+    await permission_service.ensure_permission_catalog_seeded(session)
+    await permission_service.ensure_permission_catalog_seeded(session)
+
+    assert is_seeded.await_count == 2
+    session.commit.assert_not_awaited()
+
+
+def test_catalog_version_changes_with_metadata():
+    base = {"a": ("g", "desc")}
+    assert permission_service._compute_catalog_version(base) == permission_service._compute_catalog_version(dict(base))
+    assert permission_service._compute_catalog_version(base) != permission_service._compute_catalog_version(
+        {"a": ("g", "changed")}
+    )
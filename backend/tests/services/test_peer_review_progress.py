@@ -0,0 +1,205 @@
+"""
+Tests for the evaluation progress (評価進捗) read model wiring in PeerReviewService.
+
+Pattern: async with mocked repos — same as test_peer_review_my_detail.py.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.peer_reviews import router as peer_review_router
+from app.core import middleware as middleware_module
+from app.core.middleware import OrgSlugValidationMiddleware
+from app.database.repositories.evaluation_progress_repo import EvaluationProgressRepository
+from app.database.repositories.organization_repo import OrganizationRepository
+from app.schemas.common import PaginationParams
+from app.security.context import AuthContext, RoleInfo
+from app.security.dependencies import get_auth_context
+from app.security.permissions import Permission
+from app.services import peer_review_service as service_module
+from app.services.peer_review_service import PeerReviewService
+
+
+ORG_ID = "org_test"
+
+
+def _admin_context() -> AuthContext:
+    return AuthContext(
+        user_id=uuid4(),
+        roles=[RoleInfo(id=1, name="admin", description="Admin role")],
+        organization_id=ORG_ID,
+        role_permission_overrides={"admin": {Permission.GOAL_READ_ALL}},
+    )
+
+
+def _row(name, **statuses):
+    return {
+        "user_id": uuid4(),
+        "user_name": name,
+        "employee_code": f"E-{name}",
+        "department_name": "Sales",
+        "self_status": statuses.get("self_status"),
+        "peer1_name": "peer-a",
+        "peer1_status": statuses.get("peer1_status"),
+        "peer2_name": None,
+        "peer2_status": None,
+        "supervisor_name": "boss",
+        "supervisor_status": statuses.get("supervisor_status"),
+    }
+
+
+def _stream(*chunks):
+    async def stream_rows(**kwargs):
+        for chunk in chunks:
+            yield chunk
+
+    return stream_rows
+
+
+class _FakeSession:
+    """Stand-in session that records whether it was closed."""
+
+    def __init__(self):
+        self.closed = False
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+
+    async def close(self):
+        self.closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+@pytest.mark.asyncio
+async def test_page_maps_read_model_rows_to_entries():
+    service = PeerReviewService(AsyncMock(spec=AsyncSession))
+    service.progress_repo.list_page = AsyncMock(
+        return_value=([_row("alice", self_status="submitted", peer1_status="draft", supervisor_status="submitted")], 31)
+    )
+    department_id = uuid4()
+
+    page = await service.get_evaluation_progress_page(
+        _admin_context(),
+        uuid4(),
+        department_ids=[department_id],
+        sort_by="department",
+        descending=True,
+        pagination=PaginationParams(page=2, limit=10),
+    )
+
+    assert page.total == 31 and page.pages == 4 and page.page == 2
+    entry = page.items[0]
+    assert entry.self_assessment.evaluator_name == "alice"
+    assert entry.self_assessment.status == "submitted"
+    assert entry.peer_reviewer1.status == "draft" and entry.peer_reviewer2.evaluator_name is None
+    assert entry.supervisor.evaluator_name == "boss"
+    kwargs = service.progress_repo.list_page.await_args.kwargs
+    assert kwargs["department_ids"] == [department_id]
+    assert (kwargs["sort_by"], kwargs["descending"], kwargs["page"], kwargs["limit"]) == ("department", True, 2, 10)
+
+
+@pytest.mark.asyncio
+async def test_full_list_and_csv_export_consume_streamed_chunks(monkeypatch):
+    service = PeerReviewService(AsyncMock(spec=AsyncSession))
+    chunks = ([_row("alice"), _row("bob")], [_row("carol", self_status="draft")])
+    service.progress_repo.stream_rows = _stream(*chunks)
+
+    entries = await service.get_evaluation_progress(_admin_context(), uuid4())
+    assert [entry.user_name for entry in entries] == ["alice", "bob", "carol"]
+
+    export_session = _FakeSession()
+    monkeypatch.setattr(EvaluationProgressRepository, "stream_rows", lambda self, **kwargs: _stream(*chunks)())
+    lines = await service.export_evaluation_progress_csv(
+        _admin_context(), uuid4(), session_factory=lambda: export_session
+    )
+    assert not export_session.closed
+    parts = [part async for part in lines]
+    assert len(parts) == 1 + len(chunks)
+    assert parts[0].startswith("\ufeff社員番号,氏名")
+    assert parts[2] == "E-carol,carol,Sales,draft,peer-a,,,,boss,\r\n"
+    assert export_session.closed
+
+
+def test_export_streams_through_org_middleware_on_its_own_session(monkeypatch):
+    request_session, export_session = _FakeSession(), _FakeSession()
+    seen = []
+
+    async def get_session():
+        yield request_session
+
+    async def stream_rows(self, **kwargs):
+        for chunk in ([_row("alice")], [_row("bob")]):
+            seen.append((self.session is export_session, export_session.closed, request_session.closed))
+            yield chunk
+
+    middleware_module._org_slug_cache.clear()
+    auth_user = SimpleNamespace(organization_id=ORG_ID, organization_slug="acme", clerk_id="user_1")
+    monkeypatch.setattr(
+        middleware_module, "AuthService",
+        lambda session: SimpleNamespace(get_user_from_token=AsyncMock(return_value=auth_user)),
+    )
+    monkeypatch.setattr(OrganizationRepository, "get_by_slug", AsyncMock(return_value=SimpleNamespace(id=ORG_ID, slug="acme")))
+    monkeypatch.setattr(EvaluationProgressRepository, "stream_rows", stream_rows)
+    monkeypatch.setattr(service_module, "AsyncSessionLocal", lambda: export_session)
+
+    org_router = APIRouter(prefix="/api/org/{org_slug}")
+    org_router.include_router(peer_review_router)
+    app = FastAPI()
+    app.include_router(org_router)
+    app.add_middleware(OrgSlugValidationMiddleware, get_session=get_session)
+    app.dependency_overrides[get_auth_context] = _admin_context
+
+    response = TestClient(app).get(
+        "/api/org/acme/peer-reviews/progress/export",
+        params={"periodId": str(uuid4())},
+        headers={"Authorization": "Bearer token"},
+    )
+    middleware_module._org_slug_cache.clear()
+
+    assert response.status_code == 200
+    assert response.text.splitlines()[1:] == [
+        "E-alice,alice,Sales,,peer-a,,,,boss,",
+        "E-bob,bob,Sales,,peer-a,,,,boss,",
+    ]
+    # The middleware's session is gone before the body is streamed; the export's is not.
+    assert seen == [(True, False, True), (True, False, True)]
+    assert export_session.closed
+
+
+@pytest.mark.asyncio
+async def test_export_rejects_unknown_sort_before_streaming():
+    service = PeerReviewService(AsyncMock(spec=AsyncSession))
+
+    with pytest.raises(ValueError):
+        await service.export_evaluation_progress_csv(_admin_context(), uuid4(), sort_by="salary")
+
+
+def test_read_model_sql_orders_by_allowlisted_column_with_stable_tiebreak():
+    sql, params = EvaluationProgressRepository._build(
+        org_id=ORG_ID,
+        period_id=uuid4(),
+        department_ids=None,
+        search=" Ali ",
+        sort_by="supervisorStatus",
+        descending=True,
+        with_total=True,
+    )
+
+    assert "ORDER BY supervisor_status DESC NULLS LAST, u.id" in sql
+    assert "COUNT(*) OVER ()" in sql
+    assert params["search_like"] == "%ali%" and params["department_ids"] is None
+    with pytest.raises(ValueError):
+        EvaluationProgressRepository._build(
+            org_id=ORG_ID, period_id=uuid4(), department_ids=None, search=None,
+            sort_by="u.id; DROP TABLE users", descending=False, with_total=False,
+        )
@@ -0,0 +1,75 @@
+"""
+Tests for PeerReviewService.get_core_value_summaries (period-wide 総合評価 list).
+
+Pattern: async with mocked repos — same as test_peer_review_my_detail.py.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.common import PaginationParams
+from app.security.context import AuthContext, RoleInfo
+from app.security.permissions import Permission
+from app.services.peer_review_service import PeerReviewService
+
+
+ORG_ID = "org_test"
+
+
+def _admin_context() -> AuthContext:
+    return AuthContext(
+        user_id=uuid4(),
+        roles=[RoleInfo(id=1, name="admin", description="Admin role")],
+        organization_id=ORG_ID,
+        role_permission_overrides={"admin": {Permission.GOAL_READ_ALL}},
+    )
+
+
+def _user(name):
+    return SimpleNamespace(id=uuid4(), name=name, employee_code=f"E-{name}")
+
+
+@pytest.mark.asyncio
+async def test_summaries_for_a_page_use_constant_queries_and_match_single_user_summary():
+    context = _admin_context()
+    service = PeerReviewService(AsyncMock(spec=AsyncSession))
+    period_id = uuid4()
+    alice, bob = _user("alice"), _user("bob")
+
+    feedback = SimpleNamespace(status="submitted", scores={"cv1": "S", "cv2": "A"})
+    alice_eval = SimpleNamespace(id=uuid4(), status="submitted", scores={"cv1": "A", "cv2": "A"}, feedback=feedback)
+    alice_peers = [SimpleNamespace(scores={"cv1": "SS", "cv2": "S"}), SimpleNamespace(scores={"cv1": "B"})]
+
+    service.user_repo.search_users_page = AsyncMock(return_value=([alice, bob], 2))
+    service.cv_evaluation_repo.get_evaluations_for_users = AsyncMock(return_value={alice.id: alice_eval})
+    service.evaluation_repo.get_submitted_evaluations_for_reviewees = AsyncMock(
+        return_value={alice.id: alice_peers}
+    )
+
+    page = await service.get_core_value_summaries(context, period_id, pagination=PaginationParams(page=1, limit=50))
+
+    assert page.total == 2 and page.pages == 1
+    assert [item.name for item in page.items] == ["alice", "bob"]
+    for mock in (
+        service.user_repo.search_users_page,
+        service.cv_evaluation_repo.get_evaluations_for_users,
+        service.evaluation_repo.get_submitted_evaluations_for_reviewees,
+    ):
+        assert mock.await_count == 1
+
+    service.cv_evaluation_repo.get_evaluation = AsyncMock(return_value=alice_eval)
+    service.evaluation_repo.get_submitted_evaluations_for_reviewee = AsyncMock(return_value=alice_peers)
+    service.cv_feedback_repo.get_feedback_by_evaluation = AsyncMock(return_value=feedback)
+    single = await service.get_core_value_summary(context, period_id, alice.id)
+
+    alice_item = page.items[0]
+    assert alice_item.model_dump(exclude={"user_id", "employee_code", "name"}) == single.model_dump()
+    assert alice_item.overall_score == round((4.0 + 6.5 + 2.0 + 5.0) / 4, 2)
+    assert [source.label for source in alice_item.peer_sources] == ["同僚評価①", "同僚評価②"]
+
+    empty = page.items[1]
+    assert empty.overall_rating is None and empty.peer_sources == []
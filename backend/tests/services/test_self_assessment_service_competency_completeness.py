@@ -11,6 +11,18 @@ from app.schemas.common import SelfAssessmentStatus
 from app.services.self_assessment_service import SelfAssessmentService
 
 
+def _competency(competency_id, stage_id, description):
+    return SimpleNamespace(
+        id=competency_id,
+        stage_id=stage_id,
+        name="competency",
+        description=description,
+        display_order=None,
+        created_at=None,
+        updated_at=None,
+    )
+
+
 @pytest.mark.asyncio
 async def test_validate_competency_rating_data_requires_all_stage_actions():
     session = AsyncMock(spec=AsyncSession)
@@ -32,11 +44,12 @@ async def test_validate_competency_rating_data_requires_all_stage_actions():
         },
     )
 
-    comp_1 = SimpleNamespace(id=comp_1_id, description={"1": "a", "2": "b"})
-    comp_2 = SimpleNamespace(id=comp_2_id, description={"1": "c"})
+    comp_1 = _competency(comp_1_id, stage_id, {"1": "a", "2": "b"})
+    comp_2 = _competency(comp_2_id, stage_id, {"1": "c"})
 
-    service.user_repo.get_user_stage_id = AsyncMock(return_value=stage_id)
-    service.competency_repo.get_by_stage_id = AsyncMock(return_value=[comp_1, comp_2])
+    service.competency_catalog.user_repo.get_user_stage_ids = AsyncMock(return_value={user_id: stage_id})
+    service.competency_catalog.competency_repo.get_catalog_fingerprint = AsyncMock(return_value=(2, None))
+    service.competency_catalog.competency_repo.get_by_stage_ids = AsyncMock(return_value=[comp_1, comp_2])
 
     # Missing comp_2 action "1"
     rating_data = {
@@ -64,11 +77,12 @@ async def test_validate_competency_rating_data_accepts_complete_stage_actions():
         target_data={},
     )
 
-    comp_1 = SimpleNamespace(id=comp_1_id, description={"1": "a", "2": "b"})
-    comp_2 = SimpleNamespace(id=comp_2_id, description={"1": "c"})
+    comp_1 = _competency(comp_1_id, stage_id, {"1": "a", "2": "b"})
+    comp_2 = _competency(comp_2_id, stage_id, {"1": "c"})
 
-    service.user_repo.get_user_stage_id = AsyncMock(return_value=stage_id)
-    service.competency_repo.get_by_stage_id = AsyncMock(return_value=[comp_1, comp_2])
+    service.competency_catalog.user_repo.get_user_stage_ids = AsyncMock(return_value={user_id: stage_id})
+    service.competency_catalog.competency_repo.get_catalog_fingerprint = AsyncMock(return_value=(2, None))
+    service.competency_catalog.competency_repo.get_by_stage_ids = AsyncMock(return_value=[comp_1, comp_2])
 
     rating_data = {
         str(comp_1_id): {"1": "A", "2": "S"},
@@ -97,8 +111,9 @@ async def test_validate_competency_rating_data_falls_back_to_selected_actions_wh
         },
     )
 
-    service.user_repo.get_user_stage_id = AsyncMock(return_value=None)
-    service.competency_repo.get_by_stage_id = AsyncMock(return_value=[])
+    service.competency_catalog.user_repo.get_user_stage_ids = AsyncMock(return_value={user_id: None})
+    service.competency_catalog.competency_repo.get_catalog_fingerprint = AsyncMock(return_value=(2, None))
+    service.competency_catalog.competency_repo.get_by_stage_ids = AsyncMock(return_value=[])
 
     rating_data = {
         str(comp_id): {"1": "A"},
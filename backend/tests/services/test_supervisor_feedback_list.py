@@ -0,0 +1,70 @@
+"""
+Tests for the supervisor feedback list read model wiring in SupervisorFeedbackService.
+
+Pattern: async with mocked repos — same as test_peer_review_progress.py.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.common import PaginationParams, SubmissionStatus
+from app.schemas.supervisor_review import SupervisorAction
+from app.security.context import AuthContext, RoleInfo
+from app.security.permissions import Permission
+from app.security.rbac_helper import RBACHelper
+from app.services.supervisor_feedback_service import SupervisorFeedbackService
+
+
+def _admin_context() -> AuthContext:
+    return AuthContext(
+        user_id=uuid4(),
+        roles=[RoleInfo(id=1, name="admin", description="Admin role")],
+        organization_id="org_test",
+        role_permission_overrides={"admin": {Permission.GOAL_READ_ALL}},
+    )
+
+
+def _row(**overrides):
+    now = datetime.now(timezone.utc)
+    row = {
+        "id": uuid4(),
+        "self_assessment_id": uuid4(),
+        "period_id": uuid4(),
+        "supervisor_id": uuid4(),
+        "subordinate_id": uuid4(),
+        "supervisor_rating_code": "A",
+        "supervisor_rating": Decimal("0.00"),
+        "supervisor_comment": "ok",
+        "return_comment": None,
+        "rating_data": None,
+        "action": "APPROVED",
+        "status": "submitted",
+        "submitted_at": now,
+        "reviewed_at": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.mark.asyncio
+async def test_list_maps_projection_rows_into_response_models(monkeypatch):
+    service = SupervisorFeedbackService(AsyncMock(spec=AsyncSession))
+    monkeypatch.setattr(RBACHelper, "get_accessible_user_ids", AsyncMock(return_value=None))
+    rows = [_row(), _row(supervisor_rating=Decimal("72.50"), action="PENDING", status="draft")]
+    service.supervisor_feedback_repo.search_feedbacks_page = AsyncMock(return_value=(rows, 12))
+
+    page = await service.get_feedbacks(_admin_context(), pagination=PaginationParams(page=2, limit=10))
+
+    assert (page.total, page.page, page.pages) == (12, 2, 2)
+    first, second = page.items
+    assert first.id == rows[0]["id"] and first.self_assessment_id == rows[0]["self_assessment_id"]
+    assert first.supervisor_rating == 0.0
+    assert (first.action, first.status) == (SupervisorAction.APPROVED, SubmissionStatus.SUBMITTED)
+    assert second.supervisor_rating == 72.5 and second.status == SubmissionStatus.DRAFT
@@ -0,0 +1,137 @@
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.database.repositories.supervisor_feedback_repo import SupervisorFeedbackRepository
+from app.schemas.common import RatingCode
+from app.services.supervisor_rating_recompute import (
+    RatingChange,
+    SupervisorRatingRecomputeEngine,
+    build_bulk_update,
+    compute_supervisor_rating,
+)
+
+
+ORG_ID = "org_recompute"
+SCORES = {
+    RatingCode.SS: Decimal("100"),
+    RatingCode.S: Decimal("90"),
+    RatingCode.A: Decimal("70"),
+    RatingCode.B: Decimal("40"),
+    RatingCode.C: Decimal("10"),
+}
+
+
+def _uuid(n):
+    return UUID(int=n)
+
+
+class _Result:
+    def __init__(self, rows=None, rowcount=None):
+        self._rows = rows or []
+        self.rowcount = rowcount
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _FakeSession:
+    """Serves feedback rows by keyset and records UPDATE statements."""
+
+    def __init__(self, rows, mapping_rows):
+        self.rows = sorted(rows, key=lambda row: row["id"])
+        self.mapping_rows = mapping_rows
+        self.updates = []
+        self.commit = AsyncMock()
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        if "FROM evaluation_score_mapping" in sql:
+            return _Result(self.mapping_rows)
+        if sql.strip().startswith("UPDATE"):
+            self.updates.append(params)
+            return _Result(rowcount=len(params) // 2)
+        after = params.get("after_id")
+        remaining = [row for row in self.rows if after is None or row["id"] > after]
+        return _Result(remaining[: params["limit"]])
+
+
+def _feedback(n, rating=None, code=None, rating_data=None):
+    return {"id": _uuid(n), "supervisor_rating_code": code, "rating_data": rating_data, "supervisor_rating": rating}
+
+
+@pytest.mark.asyncio
+async def test_matches_repository_two_step_average():
+    repo = SupervisorFeedbackRepository(MagicMock())
+    repo.score_mapping_repo = MagicMock()
+    repo.score_mapping_repo.get_numeric_value_for_rating_code = AsyncMock(
+        side_effect=lambda organization_id, rating_code: SCORES[rating_code]
+    )
+    rating_data = {
+        "comp-1": {"0": "ss", "1": "B", "2": "C"},
+        "comp-2": {"0": "A", "1": None, "2": "bogus"},
+        "comp-3": {},
+    }
+
+    expected = await repo._calculate_supervisor_rating_from_rating_data(ORG_ID, rating_data)
+
+    assert compute_supervisor_rating(None, rating_data, SCORES) == expected == Decimal("60.00")
+    assert compute_supervisor_rating("S", rating_data, SCORES) == Decimal("90")
+    assert compute_supervisor_rating(None, {}, SCORES) is None
+
+
+@pytest.mark.asyncio
+async def test_run_streams_chunks_and_writes_only_changed_rows():
+    rows = [
+        _feedback(1, rating=Decimal("70.00"), code="A"),
+        _feedback(2, rating=Decimal("4.00"), code="A"),
+        _feedback(3, rating=None, rating_data={"c": {"0": "S", "1": "B"}}),
+        _feedback(4, rating=Decimal("1.00"), rating_data={"c": {}}),
+        _feedback(5, rating=Decimal("6.00"), code="S"),
+    ]
+    session = _FakeSession(rows, [("SS", 100), ("S", 90), ("A", 70), ("B", 40)])
+    checkpoints = []
+
+    async def on_checkpoint(org_id, after_id):
+        checkpoints.append((org_id, after_id))
+
+    engine = SupervisorRatingRecomputeEngine(session, chunk_size=2, dry_run=False)
+    stats = await engine.run([ORG_ID], on_checkpoint=on_checkpoint)
+
+    assert stats.scanned == 5 and stats.chunks == 3
+    assert stats.changed == 3 and stats.updated == 3 and stats.skipped == 1
+    assert [change.feedback_id for change in stats.changes] == [_uuid(2), _uuid(3), _uuid(5)]
+    assert stats.changes[1].new_rating == Decimal("65.00")
+    assert len(session.updates) == 3
+    assert checkpoints == [(ORG_ID, _uuid(2)), (ORG_ID, _uuid(4)), (ORG_ID, _uuid(5)), (ORG_ID, None)]
+
+
+@pytest.mark.asyncio
+async def test_dry_run_diffs_without_writing_and_resumes_from_cursor():
+    rows = [_feedback(n, rating=Decimal("0"), code="A") for n in range(1, 6)]
+    session = _FakeSession(rows, [])
+
+    engine = SupervisorRatingRecomputeEngine(session, chunk_size=10, dry_run=True)
+    stats = await engine.run([ORG_ID], start_after=(ORG_ID, _uuid(3)))
+
+    assert stats.scanned == 2 and stats.changed == 2 and stats.updated == 0
+    assert stats.changes[0].new_rating == Decimal("4")
+    assert session.updates == []
+    session.commit.assert_not_awaited()
+
+
+def test_bulk_update_uses_values_list():
+    statement, params = build_bulk_update(
+        [RatingChange(_uuid(1), None, Decimal("1.00")), RatingChange(_uuid(2), Decimal("2"), Decimal("3.00"))]
+    )
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "FROM (VALUES" in sql
+    assert "IS DISTINCT FROM" in sql
+    assert len(params) == 4
@@ -0,0 +1,134 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.services.user_enrichment import UserEnrichmentEngine
+
+
+ORG_ID = "org_enrich"
+NOW = datetime(2026, 1, 1)
+
+
+def _department(org_id=ORG_ID):
+    return SimpleNamespace(id=uuid4(), organization_id=org_id, name="Sales", description=None)
+
+
+def _stage(org_id=ORG_ID):
+    return SimpleNamespace(
+        id=uuid4(),
+        organization_id=org_id,
+        name="S1",
+        description=None,
+        quantitative_weight=70,
+        qualitative_weight=30,
+        competency_weight=10,
+    )
+
+
+def _role(name, order):
+    return SimpleNamespace(
+        id=uuid4(), name=name, description=name, hierarchy_order=order, created_at=NOW, updated_at=NOW
+    )
+
+
+def _user(department, stage, name="user"):
+    return SimpleNamespace(
+        id=uuid4(),
+        clerk_user_id=f"clerk_{uuid4().hex[:8]}",
+        employee_code="E1",
+        name=name,
+        email=f"{uuid4().hex[:8]}@example.com",
+        job_title=None,
+        status="active",
+        department_id=department.id,
+        stage_id=stage.id,
+        created_at=NOW,
+        updated_at=NOW,
+        level=3,
+        clerk_organization_id=ORG_ID,
+        quantitative_weight_override=None,
+        qualitative_weight_override=None,
+        competency_weight_override=None,
+    )
+
+
+@pytest.fixture
+def org():
+    department, stage = _department(), _stage()
+    return SimpleNamespace(department=department, stage=stage)
+
+
+def _engine(departments, stages, roles, supervisors=None, subordinates=None):
+    engine = UserEnrichmentEngine(AsyncMock())
+    engine.user_repo.get_supervisors_for_users = AsyncMock(return_value=supervisors or {})
+    engine.user_repo.get_subordinates_for_users = AsyncMock(return_value=subordinates or {})
+    engine.user_repo_v2.fetch_departments = AsyncMock(return_value={d.id: d for d in departments})
+    engine.user_repo_v2.fetch_stages = AsyncMock(return_value={s.id: s for s in stages})
+    engine.user_repo_v2.fetch_roles_for_users = AsyncMock(return_value=roles)
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_detailed_page_uses_one_call_per_relation_regardless_of_size(org):
+    users = [_user(org.department, org.stage, name=f"u{i}") for i in range(50)]
+    supervisor = _user(org.department, org.stage, name="boss")
+    reports = {user.id: [_user(org.department, org.stage) for _ in range(5)] for user in users}
+    employee, manager = _role("employee", 3), _role("manager", 2)
+    engine = _engine(
+        [org.department],
+        [org.stage],
+        {users[0].id: [employee, manager]},
+        supervisors={users[0].id: [supervisor, users[1]]},
+        subordinates=reports,
+    )
+
+    result = await engine.enrich_detailed(users, ORG_ID, include_level=True)
+
+    assert [item.id for item in result] == [user.id for user in users]
+    assert result[0].supervisor.id == supervisor.id
+    assert result[1].supervisor is None
+    assert len(result[0].subordinates) == 5
+    assert [role.name for role in result[0].roles] == ["manager", "employee"]
+    assert result[0].level == 3
+    assert result[0].goal_weight_budget.source == "stage"
+
+    for mock in (
+        engine.user_repo.get_supervisors_for_users,
+        engine.user_repo.get_subordinates_for_users,
+        engine.user_repo_v2.fetch_departments,
+        engine.user_repo_v2.fetch_stages,
+        engine.user_repo_v2.fetch_roles_for_users,
+    ):
+        assert mock.await_count == 1
+    looked_up = list(engine.user_repo_v2.fetch_roles_for_users.await_args.args[0])
+    assert len(looked_up) == 50 + 1 + 250
+
+
+@pytest.mark.asyncio
+async def test_missing_or_foreign_department_falls_back_to_unknown(org):
+    foreign_department = _department(org_id="other_org")
+    user = _user(foreign_department, org.stage)
+    engine = _engine([foreign_department], [org.stage], {})
+
+    [result] = await engine.enrich_detailed([user], ORG_ID)
+
+    assert result.department.name == "Unknown Department"
+    assert result.stage.id == org.stage.id
+    assert result.level is None
+    assert result.subordinates is None
+
+
+@pytest.mark.asyncio
+async def test_simple_users_skip_stage_lookup(org):
+    users = [_user(org.department, org.stage) for _ in range(3)]
+    engine = _engine([org.department], [org.stage], {users[2].id: [_role("admin", 1)]})
+
+    result = await engine.enrich_simple(users, ORG_ID)
+
+    assert [item.department.id for item in result] == [org.department.id] * 3
+    assert [len(item.roles) for item in result] == [0, 0, 1]
+    engine.user_repo_v2.fetch_stages.assert_not_awaited()
+    engine.user_repo.get_supervisors_for_users.assert_not_awaited()
@@ -0,0 +1,162 @@
+import asyncio
+import io
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.core.exceptions import BadRequestError, PermissionDeniedError
+from app.security.context import AuthContext, RoleInfo
+from app.services.clerk_sync_queue import ClerkSyncQueue
+from app.services import user_import_service as import_module
+from app.services.user_import_service import UserImportService
+
+
+HEADER = "employee_code,name,email,clerk_user_id,department,stage,roles,supervisor_employee_code,status"
+
+
+def make_context(role_name: str = "admin", org_id: str = "org-1") -> AuthContext:
+    return AuthContext(
+        user_id=UUID("00000000-0000-0000-0000-000000000001"),
+        roles=[RoleInfo(id=1, name=role_name, description="")],
+        organization_id=org_id,
+        organization_slug="org",
+    )
+
+
+def make_csv(*lines: str, header: str = HEADER) -> io.BytesIO:
+    return io.BytesIO(("﻿" + "\n".join((header, *lines)) + "\n").encode("utf-8"))
+
+
+def make_service(owners=None):
+    session = AsyncMock()
+    sync_queue = MagicMock()
+    service = UserImportService(session, sync_queue=sync_queue)
+    service.department_repo.get_all = AsyncMock(return_value=[SimpleNamespace(id=uuid4(), name="Sales")])
+    service.stage_repo.get_all = AsyncMock(return_value=[SimpleNamespace(id=uuid4(), name="STAGE1")])
+    service.role_repo.get_all = AsyncMock(
+        return_value=[
+            SimpleNamespace(id=uuid4(), name="employee"),
+            SimpleNamespace(id=uuid4(), name="supervisor"),
+        ]
+    )
+    service.import_repo.find_identity_owners = AsyncMock(return_value=owners or [])
+    service.import_repo.ensure_departments = AsyncMock(
+        side_effect=lambda org_id, names: {name: (uuid4(), True) for name in names}
+    )
+    service.import_repo.upsert_users = AsyncMock()
+    service.import_repo.replace_user_roles = AsyncMock()
+    service.import_repo.replace_supervisors = AsyncMock()
+    return service, session, sync_queue
+
+
+@pytest.mark.asyncio
+async def test_import_writes_valid_rows_in_chunks_and_queues_clerk_sync(monkeypatch):
+    monkeypatch.setattr(import_module, "IMPORT_CHUNK_SIZE", 2)
+    existing_id = uuid4()
+    owners = [
+        {
+            "id": existing_id,
+            "employee_code": "E001",
+            "email": "boss@example.com",
+            "clerk_user_id": "user_boss",
+            "clerk_organization_id": "org-1",
+            "status": "active",
+        }
+    ]
+    service, session, sync_queue = make_service(owners)
+    csv_file = make_csv(
+        "E001,Boss,boss@example.com,user_boss,Sales,,Supervisor,,",
+        "E002,Member A,a@example.com,user_a,Support,STAGE1,employee,E001,",
+        "E003,Member B,b@example.com,user_b,,,,E002,",
+    )
+
+    result = await service.import_users_csv(csv_file, make_context())
+
+    assert (result.created_count, result.updated_count, result.failed_count) == (2, 1, 0)
+    assert result.created_departments == ["Support"]
+    assert not csv_file.closed
+
+    assert service.import_repo.upsert_users.await_count == 2
+    written = [user for call in service.import_repo.upsert_users.await_args_list for user in call.args[1]]
+    by_code = {user["employee_code"]: user for user in written}
+    assert by_code["E001"]["id"] == existing_id and by_code["E001"]["status"] is None
+    assert by_code["E002"]["status"] == "active" and by_code["E002"]["department_id"] is not None
+
+    [supervisors] = [call.args[0] for call in service.import_repo.replace_supervisors.await_args_list]
+    assert supervisors == {by_code["E002"]["id"]: existing_id, by_code["E003"]["id"]: by_code["E002"]["id"]}
+    session.commit.assert_awaited_once()
+
+    assert sync_queue.enqueue_metadata_update.call_count == 3
+    clerk_user_id, metadata = sync_queue.enqueue_metadata_update.call_args_list[0].args
+    assert clerk_user_id == "user_boss"
+    assert metadata == {"users_table_id": str(existing_id), "profile_completed": True, "roles": ["supervisor"]}
+
+
+@pytest.mark.asyncio
+async def test_import_reports_row_errors_and_cascades_failed_supervisors():
+    owners = [
+        {
+            "id": uuid4(),
+            "employee_code": "X001",
+            "email": "taken@example.com",
+            "clerk_user_id": "user_other_org",
+            "clerk_organization_id": "org-2",
+            "status": "active",
+        }
+    ]
+    service, session, _ = make_service(owners)
+    csv_file = make_csv(
+        "E001,Lead,lead@example.com,user_lead,,STAGE9,,,",
+        "E002,Member,member@example.com,user_member,,,,E001,",
+        "E003,Dup,member@example.com,user_dup,,,,,",
+        "X001,Other,other@example.com,user_x,,,,,",
+        "E004,Taken,taken@example.com,user_e4,,,,,",
+        "E005,Bad,not-an-email,user_e5,,,,,",
+        "E006,Ok,ok@example.com,user_ok,,,Employee,,",
+    )
+
+    result = await service.import_users_csv(csv_file, make_context(), dry_run=True)
+
+    errors = {error.row: error.errors for error in result.errors}
+    assert errors[2] == ["Unknown stage: STAGE9"]
+    assert errors[3] == ["Supervisor E001 (line 2) has errors"]
+    assert errors[4] == ["Duplicate email (same as line 3)"]
+    assert errors[5] == ["employee_code is used in another organization"]
+    assert errors[6] == ["email is already used by another user"]
+    assert errors[7][0].startswith("email:")
+    assert (result.created_count, result.failed_count) == (1, 6)
+    service.import_repo.upsert_users.assert_not_awaited()
+    session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_bad_headers_and_non_admins():
+    service, _, _ = make_service()
+
+    with pytest.raises(BadRequestError, match="Unknown columns: mail"):
+        await service.import_users_csv(make_csv("E1,A,a@example.com,u", header="employee_code,name,mail,clerk_user_id"), make_context())
+    with pytest.raises(BadRequestError, match="Missing required columns: clerk_user_id"):
+        await service.import_users_csv(make_csv("E1,A,a@example.com", header="employee_code,name,email"), make_context())
+    with pytest.raises(PermissionDeniedError):
+        await service.import_users_csv(make_csv(), make_context(role_name="employee"))
+
+
+@pytest.mark.asyncio
+async def test_clerk_sync_queue_spaces_requests():
+    clerk_service = MagicMock()
+    clerk_service.update_user_metadata = MagicMock(return_value=True)
+    queue = ClerkSyncQueue(clerk_service, requests_per_second=50, concurrency=3)
+    loop = asyncio.get_running_loop()
+
+    started = loop.time()
+    for index in range(5):
+        queue.enqueue_metadata_update(f"user_{index}", {"roles": []})
+    await queue.join()
+    elapsed = loop.time() - started
+    await queue.stop()
+
+    assert clerk_service.update_user_metadata.call_count == 5
+    assert elapsed >= 4 / 50 - 0.005
+    assert queue.get_metrics() == {"enqueued": 5, "succeeded": 5, "failed": 0, "pending": 0}
@@ -0,0 +1,150 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.metrics import (
+    InstrumentedTTLCache,
+    instrument_engine_pool,
+    is_scrape_allowed,
+    refresh_webhook_inbox_metrics,
+    render_latest,
+    timed_query,
+)
+from app.core.middleware import MetricsMiddleware
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_instrumented_cache_counts_hits_misses_and_entries():
+    cache = InstrumentedTTLCache("test_cache_counts", maxsize=10, ttl=60)
+
+    assert cache.get("a") is None
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    assert cache["b"] == 2
+    with pytest.raises(KeyError):
+        cache["missing"]
+    del cache["b"]
+
+    assert _sample("cache_lookups_total", cache="test_cache_counts", result="hit") == 2
+    assert _sample("cache_lookups_total", cache="test_cache_counts", result="miss") == 2
+    assert _sample("cache_entries", cache="test_cache_counts") == 1
+
+
+def test_instrumented_cache_does_not_count_evictions_and_tracks_expiry():
+    clock = [0]
+    cache = InstrumentedTTLCache("test_cache_evictions", maxsize=2, ttl=10, timer=lambda: clock[0])
+
+    for index in range(10):
+        cache[index] = index
+    assert _sample("cache_lookups_total", cache="test_cache_evictions", result="hit") == 0
+    assert _sample("cache_entries", cache="test_cache_evictions") == 2
+
+    clock[0] = 11
+    cache.expire()
+    assert len(cache) == 0
+    assert _sample("cache_entries", cache="test_cache_evictions") == 0
+
+
+def test_instrumented_cache_get_counts_an_entry_expiring_mid_lookup_as_one_outcome():
+    # The entry is alive at the first timer read of the lookup and expired at the next one:
+    # a membership check followed by a separate read would raise KeyError.
+    reads = []
+    cache = InstrumentedTTLCache(
+        "test_cache_expiry_race", maxsize=2, ttl=10, timer=lambda: reads.pop(0) if reads else 0
+    )
+    cache["key"] = "value"
+
+    reads[:] = [5, 15]
+    assert cache.get("key") == "value"
+    reads[:] = [15, 15]
+    assert cache.get("key", "default") == "default"
+    assert _sample("cache_lookups_total", cache="test_cache_expiry_race", result="hit") == 1
+    assert _sample("cache_lookups_total", cache="test_cache_expiry_race", result="miss") == 1
+
+
+def test_scrape_access_requires_token_or_loopback_outside_development():
+    assert is_scrape_allowed("Bearer secret", "10.0.0.5", token="secret", allow_unauthenticated=False)
+    assert not is_scrape_allowed("Bearer nope", "127.0.0.1", token="secret", allow_unauthenticated=True)
+    assert not is_scrape_allowed(None, "10.0.0.5", token="secret", allow_unauthenticated=False)
+    assert is_scrape_allowed(None, "127.0.0.1", token=None, allow_unauthenticated=False)
+    assert not is_scrape_allowed(None, "10.0.0.5", token=None, allow_unauthenticated=False)
+    assert is_scrape_allowed(None, "10.0.0.5", token=None, allow_unauthenticated=True)
+
+
+def test_middleware_labels_latency_by_route_template():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    before = _sample("http_request_duration_seconds_count", **labels)
+
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/2")
+
+    assert _sample("http_request_duration_seconds_count", **labels) == before + 2
+
+
+@pytest.mark.asyncio
+async def test_pool_instrumentation_records_checkout_wait_and_in_use():
+    pytest.importorskip("aiosqlite")
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_engine_pool(engine)
+    instrument_engine_pool(engine)  # idempotent
+    before = _sample("db_pool_checkout_seconds_count")
+    in_use_before = _sample("db_pool_connections_in_use")
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        assert _sample("db_pool_connections_in_use") == in_use_before + 1
+
+    assert _sample("db_pool_checkout_seconds_count") == before + 1
+    assert _sample("db_pool_connections_in_use") == in_use_before
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_timed_query_observes_duration_per_operation():
+    @timed_query("test_operation")
+    async def run_query():
+        return 42
+
+    before = _sample("comprehensive_evaluation_query_seconds_count", operation="test_operation")
+    assert await run_query() == 42
+    assert _sample("comprehensive_evaluation_query_seconds_count", operation="test_operation") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_webhook_inbox_gauges_sampled_from_worker():
+    worker = AsyncMock()
+    worker.get_queue_metrics.return_value = {"pending": 7, "processing": 1, "dead": 2, "lag_seconds": 12.5}
+
+    await refresh_webhook_inbox_metrics(worker)
+
+    assert _sample("webhook_inbox_events", status="pending") == 7
+    assert _sample("webhook_inbox_events", status="dead") == 2
+    assert _sample("webhook_inbox_lag_seconds") == 12.5
+    payload, content_type = render_latest()
+    assert b"webhook_inbox_events" in payload
+    assert content_type.startswith("text/plain")
+
+
+@pytest.mark.asyncio
+async def test_webhook_inbox_sampling_failure_does_not_raise():
+    worker = AsyncMock()
+    worker.get_queue_metrics.side_effect = RuntimeError("db down")
+
+    await refresh_webhook_inbox_metrics(worker)
@@ -0,0 +1,26 @@
+def test_period_partitioned_models_carry_period_id_in_their_keys():
+    """
+    Migration 036 list-partitions these tables by period_id, which PostgreSQL requires in
+    every primary and unique key. The model metadata must declare the same keys.
+    """
+    from sqlalchemy import UniqueConstraint
+
+    from app.database.models.comprehensive_evaluation import ComprehensiveProcessingStatus
+    from app.database.models.core_value import CoreValueFeedback
+    from app.database.models.peer_review import PeerReviewEvaluation
+    from app.database.models.supervisor_feedback import SupervisorFeedback
+    from app.database.models.supervisor_review import SupervisorReview
+
+    for model in (
+        SupervisorReview,
+        SupervisorFeedback,
+        CoreValueFeedback,
+        PeerReviewEvaluation,
+        ComprehensiveProcessingStatus,
+    ):
+        table = model.__table__
+        assert [column.name for column in table.primary_key.columns] == ["id", "period_id"], table.name
+        unique_keys = [index.columns for index in table.indexes if index.unique] + [
+            constraint.columns for constraint in table.constraints if isinstance(constraint, UniqueConstraint)
+        ]
+        assert all("period_id" in columns for columns in unique_keys), table.name
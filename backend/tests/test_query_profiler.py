@@ -0,0 +1,85 @@
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.middleware import QueryProfilingMiddleware
+from app.core.query_profiler import install_query_profiler, normalize_statement, profile_queries
+
+
+@pytest_asyncio.fixture
+async def engine():
+    pytest.importorskip("aiosqlite")
+    install_query_profiler()
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        await conn.execute(text("INSERT INTO items (id, name) VALUES (1, 'a'), (2, 'b'), (3, 'c')"))
+    yield engine
+    await engine.dispose()
+
+
+def test_normalize_statement_collapses_binds_literals_and_in_lists():
+    first = normalize_statement("SELECT * FROM goals WHERE id = $1 AND status IN ($2, $3, $4)")
+    second = normalize_statement("SELECT *  FROM goals\n WHERE id = $7 AND status IN ($8, $9)")
+    literal = normalize_statement("SELECT * FROM goals WHERE id = 42 AND status IN ('a', 'b')")
+
+    assert first == second == literal
+    assert normalize_statement("SELECT x::text FROM t WHERE a = :a") == "SELECT x::text FROM t WHERE a = ?"
+
+
+@pytest.mark.asyncio
+async def test_profile_attributes_statements_and_flags_repeated_shapes(engine):
+    with profile_queries() as profile:
+        async with engine.connect() as conn:
+            ids = (await conn.execute(text("SELECT id FROM items ORDER BY id"))).scalars().all()
+            for item_id in ids:
+                await conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": item_id})
+
+    assert profile.query_count == 4
+    assert profile.repeated_shapes(threshold=3) == [("SELECT name FROM items WHERE id = ?", 3)]
+    assert profile.db_time_ms >= 0
+
+
+@pytest.mark.asyncio
+async def test_statements_outside_profile_are_not_recorded(engine):
+    with profile_queries() as profile:
+        pass
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    assert profile.query_count == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(max_queries=1, max_repeats=1)
+async def test_query_budget_marker_allows_batched_lookup(engine):
+    async with engine.connect() as conn:
+        rows = (await conn.execute(text("SELECT id, name FROM items WHERE id IN (1, 2, 3)"))).all()
+
+    assert len(rows) == 3
+
+
+def test_middleware_adds_server_timing_header(engine):
+    app = FastAPI()
+    app.add_middleware(QueryProfilingMiddleware)
+
+    @app.get("/items")
+    async def list_items():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+        return {"ok": True}
+
+    response = TestClient(app).get("/items")
+
+    assert response.status_code == 200
+    assert 'desc="2 queries"' in response.headers["Server-Timing"]
+    assert "app;dur=" in response.headers["Server-Timing"]
@@ -0,0 +1,64 @@
+import math
+from pathlib import Path
+
+import pytest
+
+from app.core.rating_engine import (
+    CORE_VALUE_SCALE,
+    MBO_POINTS_SCALE,
+    MBO_THRESHOLD_TABLE,
+    RATING_CODES,
+    ThresholdTable,
+    render_sql_functions,
+    threshold_table,
+)
+from app.core.rating_utils import calculate_source_average, calculate_source_averages, score_to_final_rating
+
+
+MIGRATION = (
+    Path(__file__).resolve().parent.parent
+    / "app/database/migrations/production/033_rating_code_functions.sql"
+)
+
+
+def _linear_rank(score, thresholds):
+    for rank in RATING_CODES:
+        if score >= thresholds[rank]:
+            return rank
+    return RATING_CODES[-1]
+
+
+def test_migration_matches_generated_sql_functions():
+    assert render_sql_functions() in MIGRATION.read_text()
+
+
+@pytest.mark.parametrize(
+    "score,expected",
+    [(7.0, "SS"), (6.5, "SS"), (6.49, "S"), (4.5, "A+"), (3.7, "A"), (2.7, "A-"), (1.7, "B"), (1.0, "C"),
+     (0.99, "D"), (-1.0, "D"), (math.nan, "D")],
+)
+def test_final_rating_boundaries(score, expected):
+    assert score_to_final_rating(score) == expected
+
+
+def test_threshold_table_matches_linear_scan_including_unsorted_settings():
+    settings = {"SS": 6.5, "S": 5.5, "A+": 4.5, "A": 3.7, "A-": 2.7, "B": 1.7, "C": 1.0, "D": 0.1}
+    unsorted = dict(settings, A=5.0)
+    scores = [x / 20 for x in range(-10, 150)]
+
+    for thresholds in (settings, unsorted):
+        table = ThresholdTable(thresholds)
+        assert table.classify_many(scores) == [_linear_rank(s, thresholds) for s in scores]
+    assert not ThresholdTable(unsorted).monotonic
+    assert threshold_table(settings) is threshold_table(dict(settings))
+    assert MBO_THRESHOLD_TABLE.classify(69.99) == "A+"
+    assert MBO_THRESHOLD_TABLE.classify(None) is None
+
+
+def test_batched_source_averages_match_single_calls():
+    dicts = [{"a": "SS", "b": "C"}, {}, None, {"a": "bogus"}, {"a": "D", "b": "A", "c": "A+"}]
+
+    assert calculate_source_averages(dicts) == [calculate_source_average(d) for d in dicts]
+    assert calculate_source_averages(dicts) == [4.0, None, None, None, 3.0]
+    assert MBO_POINTS_SCALE.value_of("A+") == 0.0
+    assert CORE_VALUE_SCALE.value_of("bogus") is None
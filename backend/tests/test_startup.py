@@ -0,0 +1,91 @@
+import asyncio
+import importlib
+import sys
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import startup
+from app.core.startup import DeferredRouterMiddleware, DeferredRouterRegistry, ImportTimer, run_startup_warmup
+
+
+@pytest.fixture
+def module_dir(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    for name in [name for name in sys.modules if name.startswith("startup_fixture_")]:
+        del sys.modules[name]
+
+
+def test_import_timer_records_self_and_cumulative_time(module_dir):
+    (module_dir / "startup_fixture_child.py").write_text("import time\ntime.sleep(0.02)\n")
+    (module_dir / "startup_fixture_parent.py").write_text("import startup_fixture_child\n")
+
+    timer = ImportTimer().install()
+    try:
+        importlib.import_module("startup_fixture_parent")
+    finally:
+        timer.uninstall()
+
+    assert timer.cumulative_ms["startup_fixture_parent"] >= timer.cumulative_ms["startup_fixture_child"] >= 20
+    assert timer.self_ms["startup_fixture_parent"] < timer.self_ms["startup_fixture_child"]
+    assert sys.modules["startup_fixture_child"].__loader__.__class__.__name__ != "_TimedLoader"
+    assert timer not in sys.meta_path
+
+
+def test_deferred_router_is_included_on_first_matching_request(module_dir):
+    (module_dir / "startup_fixture_routes.py").write_text(
+        "from fastapi import APIRouter\n"
+        "router = APIRouter(prefix='/rare')\n"
+        "@router.get('/ping')\n"
+        "async def ping():\n"
+        "    return {'pong': True}\n"
+    )
+    app = FastAPI()
+
+    @app.get("/hot")
+    async def hot():
+        return {"ok": True}
+
+    registry = DeferredRouterRegistry()
+    registry.defer("startup_fixture_routes", "router", r"^/rare(/|$)")
+    app.add_middleware(DeferredRouterMiddleware, fastapi_app=app, registry=registry)
+    client = TestClient(app)
+
+    assert client.get("/hot").status_code == 200
+    assert "startup_fixture_routes" not in sys.modules
+
+    assert client.get("/rare/ping").json() == {"pong": True}
+    assert registry.pending == []
+
+
+@pytest.mark.asyncio
+async def test_warmup_runs_steps_independently(monkeypatch):
+    async def failing_jwks():
+        raise RuntimeError("issuer unreachable")
+
+    async def warm_orgs(session_factory, max_orgs):
+        return max_orgs
+
+    monkeypatch.setattr(startup, "warm_jwks", failing_jwks)
+    monkeypatch.setattr(startup, "warm_organizations", warm_orgs)
+
+    report = await run_startup_warmup(lambda: None, max_orgs=3)
+
+    assert report["timed_out"] is False
+    assert report["steps"]["jwks"]["ok"] is False
+    assert report["steps"]["organizations"] == {"ok": True, "result": 3, "duration_ms": pytest.approx(0, abs=50)}
+
+
+@pytest.mark.asyncio
+async def test_warmup_is_bounded_by_timeout(monkeypatch):
+    async def slow(*args, **kwargs):
+        await asyncio.sleep(5)
+
+    monkeypatch.setattr(startup, "warm_jwks", slow)
+    monkeypatch.setattr(startup, "warm_organizations", slow)
+
+    report = await run_startup_warmup(lambda: None, timeout_seconds=0.05)
+
+    assert report["timed_out"] is True